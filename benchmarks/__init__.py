@@ -0,0 +1,15 @@
+# coding=UTF-8
+"""
+Microbenchmarks for CoolAMQP. Run each as a module, eg. python -m benchmarks.framer
+"""
+from __future__ import absolute_import, division, print_function
+
+import timeit
+import typing as tp
+
+
+def best_of(callable, number, repeat=5):  # type: (tp.Callable[[], None], int, int) -> float
+    """
+    Return the best time, in seconds, that number calls to callable took
+    """
+    return min(timeit.repeat(callable, number=number, repeat=repeat))
@@ -0,0 +1,79 @@
+# coding=UTF-8
+"""
+Measures how many frames and bytes a consumer sends to ack messages it
+processes in order, one by one and with acks batched, and how many acks per
+second it makes. The data is thrown away.
+
+It also measures how much memory tags of messages awaiting an ack take.
+"""
+from __future__ import absolute_import, division, print_function
+
+import tracemalloc
+import typing as tp
+
+from coolamqp.attaches.consumer import Consumer, MessageReceiver
+from coolamqp.attaches.utils import TagRanges
+from coolamqp.framing.definitions import BasicDeliver, Basic
+from coolamqp.framing.frames import AMQPHeaderFrame
+from coolamqp.objects import Queue, NodeDefinition, EMPTY_PROPERTIES
+from coolamqp.uplink.connection import Connection
+from coolamqp.uplink.connection.send_framer import SendingFramer
+
+from benchmarks import best_of
+
+MESSAGES = 10000
+BODY = memoryview(b'{"value": 1}')
+
+
+def ack_all(ack_batch):  # type: (tp.Optional[int]) -> tp.List[bytes]
+    sent = []
+    connection = Connection(NodeDefinition('127.0.0.1', 'guest', 'guest'),
+                            None, {})
+    connection.sendf = SendingFramer(
+        lambda buffers, priority: sent.extend(buffers))
+    consumer = Consumer(Queue(b'benchmark'), lambda message: message.ack(),
+                        no_ack=False, ack_batch=ack_batch)
+    consumer.connection = connection
+    consumer.channel_id = 1
+    receiver = MessageReceiver(consumer)
+    header = AMQPHeaderFrame(1, Basic.INDEX, 0, len(BODY), EMPTY_PROPERTIES)
+
+    for delivery_tag in range(1, MESSAGES + 1):
+        receiver.on_basic_deliver(BasicDeliver(
+            b'amq.ctag-benchmark', delivery_tag, False, b'exchange',
+            b'routing.key'))
+        receiver.on_head(header)
+        receiver.on_body(BODY)
+    receiver.flush_acks()
+    return sent
+
+
+def bytes_per_pending_tag(make_tags):
+    tracemalloc.start()
+    try:
+        tags = make_tags()
+        # in order, as delivered, with every tenth message not acked yet
+        for tag in range(1, MESSAGES + 1):
+            tags.add(tag)
+        for tag in range(1, MESSAGES + 1):
+            if tag % 10:
+                tags.discard(tag)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(tags)
+
+
+if __name__ == '__main__':
+    for name, ack_batch in (('one by one', None), ('batches of 10', 10),
+                            ('batches of 100', 100)):
+        sent = ack_all(ack_batch)
+        took = best_of(lambda: ack_all(ack_batch), 1)
+        # every ack frame is 21 bytes
+        print('%-15s %6d frames, %7d bytes, %8.0f messages/s' % (
+            name, sum(len(data) for data in sent) // 21,
+            sum(len(data) for data in sent), MESSAGES / took))
+
+    for name, make_tags in (('set', set), ('TagRanges', TagRanges)):
+        print('%-15s %6.1f bytes per pending tag' % (
+            name, bytes_per_pending_tag(make_tags)))
@@ -0,0 +1,66 @@
+# coding=UTF-8
+"""
+Measures how much memory a received message takes, when an application keeps
+the messages it got, in ack mode, both when they are handed straight to
+on_message and when they are put into Cluster's events queue. It also
+measures how many of them per second make it from received bytes to there.
+"""
+from __future__ import absolute_import, division, print_function
+
+import tracemalloc
+
+import six
+
+from coolamqp.attaches.consumer import Consumer, MessageReceiver
+from coolamqp.clustering.events import MessageReceived
+from coolamqp.objects import Queue
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+
+from benchmarks import best_of
+from benchmarks.consume import synthesize_traffic, CHUNK_SIZE
+
+MESSAGES = 5000
+
+
+def as_event(messages):
+    queue = six.moves.queue.Queue()
+    return Consumer(Queue(b'benchmark'), queue.put_nowait, no_ack=False,
+                    message_class=MessageReceived), queue.queue
+
+
+def on_message(messages):
+    messages = []
+    return Consumer(Queue(b'benchmark'), messages.append, no_ack=False), \
+        messages
+
+
+def receive(chunks, make_consumer):
+    consumer, messages = make_consumer([])
+    framer = ReceivingFramer()
+    framer.receivers[1] = MessageReceiver(consumer)
+    for chunk in chunks:
+        framer.put(chunk)
+    return messages
+
+
+def bytes_per_message(chunks, make_consumer):
+    # the data received is shared with messages, keep it out of the count
+    received = [bytearray(chunk) for chunk in chunks]
+    tracemalloc.start()
+    try:
+        messages = receive(received, make_consumer)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(messages)
+
+
+if __name__ == '__main__':
+    traffic = synthesize_traffic(MESSAGES)
+    chunks = [traffic[i:i + CHUNK_SIZE]
+              for i in range(0, len(traffic), CHUNK_SIZE)]
+    for name, make_consumer in (('on_message', on_message),
+                                ('events', as_event)):
+        took = best_of(lambda: receive(chunks, make_consumer), number=3) / 3
+        print('%-10s %5.0f bytes kept per message, %8.0f messages/s' % (
+            name, bytes_per_message(chunks, make_consumer), MESSAGES / took))
@@ -0,0 +1,88 @@
+# coding=UTF-8
+"""
+Measures how many small messages per second a number of threads can publish
+without confirms, with and without coalescing. Messages go through a running
+listener thread into a socketpair, whose other end is read and thrown away.
+Also counts the sends that the connection made.
+"""
+from __future__ import absolute_import, division, print_function
+
+import socket
+import threading
+import time
+
+from coolamqp.attaches import Publisher
+from coolamqp.attaches.channeler import ST_ONLINE
+from coolamqp.objects import Message, NodeDefinition
+from coolamqp.uplink import ListenerThread
+from coolamqp.uplink.connection import Connection
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+from coolamqp.uplink.connection.send_framer import SendingFramer
+
+THREADS = 4
+MESSAGES = 5000  # per thread
+MESSAGE_SIZE = 68  # bytes that a message takes on the wire
+
+
+def drain(sock, expected):  # type: (socket.socket, int) -> None
+    received = 0
+    while received < expected:
+        received += len(sock.recv(1048576))
+
+
+def run(coalesce):  # type: (bool) -> tuple
+    listener_thread = ListenerThread(name='benchmark')
+    listener_thread.init()
+    listener_thread.start()
+
+    ours, theirs = socket.socketpair()
+    ours.setblocking(False)
+    connection = Connection(NodeDefinition('127.0.0.1', 'guest', 'guest'),
+                            listener_thread, {})
+    connection.listener_socket = listener_thread.register(ours,
+                                                          ReceivingFramer())
+    sends = [0]
+
+    def on_send(data, priority=False):
+        sends[0] += 1
+        connection.listener_socket.send(data, priority)
+
+    connection.sendf = SendingFramer(on_send)
+    connection.frame_max = 131072
+    listener_thread.activate(connection.listener_socket)
+
+    publisher = Publisher(Publisher.MODE_NOACK, coalesce=coalesce)
+    publisher.attach(connection)
+    publisher.channel_id = 1
+    publisher.state = ST_ONLINE
+
+    message = Message(b'x' * 10)
+
+    def produce():
+        for i in range(MESSAGES):
+            publisher.publish(message, b'', b'routing.key')
+
+    producers = [threading.Thread(target=produce) for i in range(THREADS)]
+    reader = threading.Thread(target=drain, args=(
+        theirs, THREADS * MESSAGES * MESSAGE_SIZE))
+    reader.start()
+    started = time.time()
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    reader.join()
+    took = time.time() - started
+
+    listener_thread.terminate()
+    listener_thread.join()
+    theirs.close()
+    return THREADS * MESSAGES / took, sends[0]
+
+
+if __name__ == '__main__':
+    for coalesce in (False, True):
+        results = [run(coalesce) for i in range(5)]
+        rate, sends = max(results)
+        print('coalesce=%-5s %10.0f messages/s %8d sends' % (coalesce, rate,
+                                                             sends))
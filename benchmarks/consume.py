@@ -0,0 +1,80 @@
+# coding=UTF-8
+"""
+Measures how many small messages per second make it from received bytes to
+a consumer's on_message, with deliveries going through watches (as they do
+when frames are logged) and through the receiver table of ReceivingFramer.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+
+from coolamqp.attaches.consumer import Consumer, MessageReceiver
+from coolamqp.framing.definitions import BasicDeliver, \
+    BasicContentPropertyList
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
+    AMQPBodyFrame
+from coolamqp.objects import Queue
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+from coolamqp.uplink.connection.watch_registry import WatchRegistry
+from coolamqp.uplink.connection.watches import HeaderOrBodyWatch, MethodWatch
+
+from benchmarks import best_of
+
+MESSAGES = 5000
+CHUNK_SIZE = 65536
+
+
+def synthesize_traffic(messages):  # type: (int) -> bytes
+    buf = io.BytesIO()
+    properties = BasicContentPropertyList(content_type=b'application/json')
+    for i in range(messages):
+        body = b'{"value": %d}' % (i,)
+        AMQPMethodFrame(1, BasicDeliver(b'amq.ctag-benchmark', i + 1, False,
+                                        b'exchange', b'routing.key')).write_to(buf)
+        AMQPHeaderFrame(1, 60, 0, len(body), properties).write_to(buf)
+        AMQPBodyFrame(1, body).write_to(buf)
+    return buf.getvalue()
+
+
+def make_receiver():  # type: () -> MessageReceiver
+    consumer = Consumer(Queue(b'benchmark'), lambda message: None)
+    return MessageReceiver(consumer)
+
+
+def through_watches(chunks):
+    receiver = make_receiver()
+    registry = WatchRegistry()
+
+    def on_delivery(sth):
+        if isinstance(sth, BasicDeliver):
+            receiver.on_basic_deliver(sth)
+        elif isinstance(sth, AMQPBodyFrame):
+            receiver.on_body(sth.data)
+        elif isinstance(sth, AMQPHeaderFrame):
+            receiver.on_head(sth)
+
+    registry.add(HeaderOrBodyWatch(1, on_delivery))
+    deliver_watch = MethodWatch(1, BasicDeliver, on_delivery)
+    deliver_watch.oneshot = False
+    registry.add(deliver_watch)
+
+    framer = ReceivingFramer(registry.dispatch)
+    for chunk in chunks:
+        framer.put(chunk)
+
+
+def through_receivers(chunks):
+    framer = ReceivingFramer()
+    framer.receivers[1] = make_receiver()
+    for chunk in chunks:
+        framer.put(chunk)
+
+
+if __name__ == '__main__':
+    traffic = synthesize_traffic(MESSAGES)
+    chunks = [traffic[i:i + CHUNK_SIZE]
+              for i in range(0, len(traffic), CHUNK_SIZE)]
+    for name, path in (('watches', through_watches),
+                       ('receivers', through_receivers)):
+        took = best_of(lambda: path(chunks), number=3) / 3
+        print('%-10s %10.0f messages/s' % (name, MESSAGES / took))
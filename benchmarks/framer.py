@@ -0,0 +1,73 @@
+# coding=UTF-8
+"""
+Measures how many frames per second ReceivingFramer can parse.
+
+Traffic is either read from a file given as the first argument (raw bytes that
+a broker sent, after the AMQP handshake, as captured eg. with tcpflow) or
+synthesized to resemble what a busy consumer receives: deliveries of small
+messages interleaved with heartbeats and an occasional larger message.
+
+The traffic is fed in chunks of different sizes, to show both the case where
+a single read contains many frames and where frames straddle reads.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+import sys
+
+from coolamqp.framing.definitions import BasicDeliver, \
+    BasicContentPropertyList
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
+    AMQPBodyFrame, AMQPHeartbeatFrame
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+
+from benchmarks import best_of
+
+CHUNK_SIZES = (256, 4096, 65536)
+
+
+def synthesize_traffic(messages=2000):  # type: (int) -> bytes
+    buf = io.BytesIO()
+    properties = BasicContentPropertyList(content_type=b'application/json',
+                                          delivery_mode=2)
+    for i in range(messages):
+        body = b'{"value": %d}' % (i,) if i % 100 else b'x' * 20000
+        AMQPMethodFrame(1, BasicDeliver(b'amq.ctag-benchmark', i + 1, False,
+                                        b'exchange', b'routing.key')).write_to(buf)
+        AMQPHeaderFrame(1, 60, 0, len(body), properties).write_to(buf)
+        AMQPBodyFrame(1, body).write_to(buf)
+        if i % 500 == 0:
+            AMQPHeartbeatFrame().write_to(buf)
+    return buf.getvalue()
+
+
+def count_frames(data):  # type: (bytes) -> int
+    frames = []
+    ReceivingFramer(frames.append).put(data)
+    return len(frames)
+
+
+def run(data, chunk_size):  # type: (bytes, int) -> None
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    def parse():
+        framer = ReceivingFramer()
+        for chunk in chunks:
+            framer.put(chunk)
+
+    return best_of(parse, number=5) / 5
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'rb') as f_in:
+            traffic = f_in.read()
+    else:
+        traffic = synthesize_traffic()
+
+    frame_count = count_frames(traffic)
+    print('%s frames, %s bytes' % (frame_count, len(traffic)))
+    for chunk_size in CHUNK_SIZES:
+        took = run(traffic, chunk_size)
+        print('chunks of %6d bytes: %10.0f frames/s, %7.1f MB/s' % (
+            chunk_size, frame_count / took, len(traffic) / took / 1e6))
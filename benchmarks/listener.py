@@ -0,0 +1,97 @@
+# coding=UTF-8
+"""
+Measures how the cost of a listener's loop iteration scales with the number
+of sockets it handles.
+
+One socket ping-pongs small messages with its peer, while the rest of them
+sit idle. The peer pings, and the listener thread answers. Reported is the
+amount of round trips per second, which ideally shouldn't depend on the amount
+of idle sockets.
+
+Pass --level-triggered to use epoll in level-triggered mode.
+"""
+from __future__ import absolute_import, division, print_function
+
+import socket
+import sys
+import threading
+
+from coolamqp.uplink.listener.epoll_listener import EpollListener
+from coolamqp.utils import monotonic
+
+SOCKET_COUNTS = (1, 10, 100, 400)
+DURATION = 1.0
+
+
+class Echo(object):
+    """A receiver that answers every byte received with a byte"""
+
+    def __init__(self):
+        self.buffer = bytearray(1024)
+        self.sock = None
+
+    def get_buffer(self):
+        return memoryview(self.buffer)
+
+    def commit(self, length):
+        self.sock.send([b'x' * length])
+
+
+class Discard(object):
+    def __init__(self):
+        self.buffer = bytearray(1024)
+
+    def get_buffer(self):
+        return memoryview(self.buffer)
+
+    def commit(self, length):
+        pass
+
+
+def run(socket_count, edge_triggered):  # type: (int, bool) -> float
+    listener = EpollListener(edge_triggered=edge_triggered)
+    peers = []
+    sockets = []
+    for i in range(socket_count):
+        ours, theirs = socket.socketpair()
+        ours.setblocking(False)
+        peers.append(theirs)
+        receiver = Echo() if i == 0 else Discard()
+        sock = listener.register(ours, receiver)
+        if i == 0:
+            receiver.sock = sock
+        listener.activate(sock)
+        sockets.append(sock)
+
+    terminating = []
+
+    def loop():
+        while not terminating:
+            listener.wait(timeout=1)
+
+    thread = threading.Thread(target=loop)
+    thread.start()
+
+    round_trips = 0
+    started_at = monotonic()
+    try:
+        while monotonic() - started_at < DURATION:
+            peers[0].sendall(b'p')
+            peers[0].recv(1)
+            round_trips += 1
+    finally:
+        terminating.append(True)
+        listener.wakeup()
+        thread.join()
+        listener.shutdown()
+        for peer in peers:
+            peer.close()
+
+    return round_trips / (monotonic() - started_at)
+
+
+if __name__ == '__main__':
+    edge_triggered = '--level-triggered' not in sys.argv
+    print('epoll, %s' % ('edge-triggered' if edge_triggered else 'level-triggered', ))
+    for count in SOCKET_COUNTS:
+        print('%4d sockets: %8.0f round trips/s' % (count, run(count, edge_triggered)))
@@ -0,0 +1,76 @@
+# coding=UTF-8
+"""
+Measures how long it takes to decode a received method frame, eagerly and
+lazily (see coolamqp.framing.frames.set_lazy_decoding), both when none of its
+arguments are read and when these that a client usually needs are.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+import typing as tp
+
+from coolamqp.framing.definitions import BasicDeliver, BasicAck, BasicNack, \
+    ConnectionStart
+from coolamqp.framing.frames import AMQPMethodFrame, set_lazy_decoding
+
+from benchmarks import best_of
+
+NUMBER = 20000
+REPEAT = 15
+
+# what RabbitMQ sends
+SERVER_PROPERTIES = [
+    (b'capabilities', ([(name, (True, 't')) for name in (
+        b'publisher_confirms', b'exchange_exchange_bindings',
+        b'basic.nack', b'consumer_cancel_notify', b'connection.blocked',
+        b'consumer_priorities', b'authentication_failure_close',
+        b'per_consumer_qos', b'direct_reply_to')], 'F')),
+    (b'cluster_name', (b'rabbit@broker.example.com', 'S')),
+    (b'copyright', (b'Copyright (c) 2007-2020 VMware, Inc. or its affiliates.',
+                    'S')),
+    (b'information', (b'Licensed under the MPL 2.0. Website: '
+                      b'https://rabbitmq.com', 'S')),
+    (b'platform', (b'Erlang/OTP 23.2', 'S')),
+    (b'product', (b'RabbitMQ', 'S')),
+    (b'version', (b'3.8.14', 'S')),
+]
+
+CASES = [
+    (BasicDeliver(b'amq.ctag-benchmark', 1, False, b'exchange', b'routing.key'),
+     ('delivery_tag', 'exchange', 'routing_key')),
+    (BasicAck(1, True), ('delivery_tag', 'multiple')),
+    (BasicNack(1, True, False), ('delivery_tag', 'multiple')),
+    (ConnectionStart(0, 9, SERVER_PROPERTIES, b'AMQPLAIN PLAIN', b'en_US'),
+     ('version_major', 'version_minor', 'mechanisms')),
+]
+
+
+def serialize_payload(payload):  # type: (AMQPMethodPayload) -> memoryview
+    buf = io.BytesIO()
+    buf.write(payload.BINARY_HEADER)
+    payload.write_arguments(buf)
+    return memoryview(buf.getvalue())
+
+
+def measure(data, fields):  # type: (memoryview, tp.Tuple[str, ...]) -> float
+    unserialize = AMQPMethodFrame.unserialize
+
+    def decode():
+        for i in range(NUMBER):
+            payload = unserialize(1, data).payload
+            for field in fields:
+                getattr(payload, field)
+
+    return best_of(decode, number=1, repeat=REPEAT) / NUMBER
+
+
+if __name__ == '__main__':
+    for payload, fields in CASES:
+        data = serialize_payload(payload)
+        for lazy in (False, True):
+            set_lazy_decoding(type(payload), lazy)
+            print('%-16s %-5s %6.0f ns with no arguments read, %6.0f ns with %s' % (
+                payload.NAME, 'lazy' if lazy else 'eager',
+                measure(data, ()) * 1e9, measure(data, fields) * 1e9,
+                ', '.join(fields)))
+        set_lazy_decoding(type(payload), False)
@@ -0,0 +1,62 @@
+# coding=UTF-8
+"""
+Measures how many small messages per second a publisher turns into data for
+the socket, when published one by one, with publish_many and with a prepared
+publish. The connection is never started, the data is thrown away.
+"""
+from __future__ import absolute_import, division, print_function
+
+from coolamqp.attaches import Publisher
+from coolamqp.attaches.channeler import ST_ONLINE
+from coolamqp.attaches.utils import AtomicTagger
+from coolamqp.objects import Message, NodeDefinition
+from coolamqp.uplink.connection import Connection
+from coolamqp.uplink.connection.send_framer import SendingFramer
+
+from benchmarks import best_of
+
+MESSAGES = 5000
+
+
+def make_publisher(mode):  # type: (int) -> Publisher
+    connection = Connection(NodeDefinition('127.0.0.1', 'guest', 'guest'),
+                            None, {})
+    connection.sendf = SendingFramer(lambda buffers, priority: None)
+    connection.frame_max = 131072
+    publisher = Publisher(mode)
+    publisher.connection = connection
+    publisher.channel_id = 1
+    publisher.state = ST_ONLINE
+    publisher.tagger = AtomicTagger()
+    return publisher
+
+
+def one_by_one(publisher, orders, **kwargs):
+    for message, exchange, routing_key in orders:
+        publisher.publish(message, exchange, routing_key, **kwargs)
+
+
+def all_at_once(publisher, orders, **kwargs):
+    publisher.publish_many(orders, **kwargs)
+
+
+def prepared(publisher, orders, **kwargs):
+    handle = publisher.prepare(b'exchange', b'routing.key')
+    for message, exchange, routing_key in orders:
+        handle.send(message.body, **kwargs)
+
+
+if __name__ == '__main__':
+    orders = [(Message(b'{"value": %d}' % (i,)), b'exchange', b'routing.key')
+              for i in range(MESSAGES)]
+    for mode_name, mode, kwargs in (
+            ('noack', Publisher.MODE_NOACK, {}),
+            ('cnpub', Publisher.MODE_CNPUB, {'callback': lambda ok: None})):
+        for name, path in (('publish', one_by_one),
+                           ('publish_many', all_at_once),
+                           ('prepared', prepared)):
+            publisher = make_publisher(mode)
+            took = best_of(lambda: path(publisher, orders, **kwargs),
+                           number=3) / 3
+            print('%-6s %-13s %10.0f messages/s' % (mode_name, name,
+                                                    MESSAGES / took))
@@ -0,0 +1,68 @@
+# coding=UTF-8
+"""
+Measures how long the generated code takes to serialize the arguments of a
+few methods, with write_arguments into a file-like object, with write_into
+a preallocated bytearray, and as a whole frame. Also measures how long they
+take to parse.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+
+from coolamqp.framing.definitions import BasicPublish, BasicDeliver, \
+    BasicAck, BasicNack, BasicConsume, QueueDeclare
+from coolamqp.framing.frames import AMQPMethodFrame
+from coolamqp.uplink.connection.send_framer import GatherWriter
+
+from benchmarks import best_of
+
+NUMBER = 20000
+REPEAT = 15
+
+CASES = [
+    BasicPublish(b'exchange', b'routing.key', False, False),
+    BasicDeliver(b'amq.ctag-benchmark', 1, False, b'exchange', b'routing.key'),
+    BasicAck(1, True),
+    BasicNack(1, True, False),
+    BasicConsume(b'queue', b'amq.ctag-benchmark', False, False, False, False,
+                 [(b'x-priority', (10, 'I'))]),
+    QueueDeclare(b'queue', False, True, False, False, False, []),
+]
+
+
+def write_arguments(payload):
+    writer = GatherWriter()
+    for i in range(NUMBER):
+        payload.write_arguments(writer)
+
+
+def write_into(payload):
+    size = payload.get_size()
+    for i in range(NUMBER):
+        payload.write_into(bytearray(size), 0)
+
+
+def write_frame(payload):
+    frame = AMQPMethodFrame(1, payload)
+    writer = GatherWriter()
+    for i in range(NUMBER):
+        frame.write_to(writer)
+
+
+def from_buffer(payload):
+    buf = io.BytesIO()
+    payload.write_arguments(buf)
+    data = memoryview(buf.getvalue())
+    for i in range(NUMBER):
+        payload.from_buffer(data, 0)
+
+
+if __name__ == '__main__':
+    for payload in CASES:
+        for name, case in (('write_arguments', write_arguments),
+                           ('write_into', write_into),
+                           ('frame write_to', write_frame),
+                           ('from_buffer', from_buffer)):
+            took = best_of(lambda: case(payload), number=1, repeat=REPEAT)
+            print('%-14s %-16s %6.0f ns' % (payload.NAME, name,
+                                            took / NUMBER * 1e9))
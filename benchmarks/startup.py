@@ -0,0 +1,54 @@
+# coding=UTF-8
+"""
+Measures how long a fresh interpreter takes to import CoolAMQP, and to get
+from there to the first message published. The connection is never started,
+the data is thrown away.
+
+Each measurement runs in a new process, so that nothing is imported already.
+"""
+from __future__ import absolute_import, division, print_function
+
+import subprocess
+import sys
+
+REPEAT = 15
+
+IMPORT_DEFINITIONS = '''
+import time
+start = time.time()
+import coolamqp.framing.definitions
+print(time.time() - start)
+'''
+
+IMPORT_CLUSTER = '''
+import time
+start = time.time()
+from coolamqp.clustering import Cluster
+print(time.time() - start)
+'''
+
+FIRST_PUBLISH = '''
+import time
+start = time.time()
+from coolamqp.clustering import Cluster
+from coolamqp.objects import Message
+from benchmarks.publish import make_publisher
+publisher = make_publisher(1)
+publisher.publish(Message(b'{"value": 1}'), b'exchange', b'routing.key',
+                  callback=lambda ok: None)
+print(time.time() - start)
+'''
+
+
+def measure(source):  # type: (str) -> tp.List[float]
+    return sorted(float(subprocess.check_output([sys.executable, '-c', source]))
+                  for i in range(REPEAT))
+
+
+if __name__ == '__main__':
+    for name, source in (('import definitions', IMPORT_DEFINITIONS),
+                         ('import Cluster', IMPORT_CLUSTER),
+                         ('first publish', FIRST_PUBLISH)):
+        took = measure(source)
+        print('%-18s best %6.1f ms, median %6.1f ms' % (
+            name, took[0] * 1000, took[len(took) // 2] * 1000))
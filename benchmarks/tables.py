@@ -0,0 +1,81 @@
+# coding=UTF-8
+"""
+Measures how long it takes to encode, size and decode field tables, such as
+message headers, for a flat table of tracing headers and for a table
+carrying an x-death array of nested tables. Received headers are decoded
+lazily, so this measures also receiving a table and reading one header of
+it, or forwarding it untouched.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+
+from coolamqp.framing.field_table import enframe_table, deframe_table, \
+    frame_table_size, deframe_lazy_table
+
+from benchmarks import best_of
+
+NUMBER = 5000
+REPEAT = 15
+
+TRACING = [
+    (b'traceparent', (b'00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01', 'S')),
+    (b'tracestate', (b'congo=t61rcWkgMzE', 'S')),
+    (b'x-request-id', (b'6e4a2b0c-6a5f-4a8e-9d4b-2c6a2e1d9f10', 'S')),
+    (b'x-attempt', (1, 'I')),
+    (b'x-sent-at', (1700000000, 'T')),
+    (b'x-priority', (5, 'B')),
+    (b'x-sampled', (True, 't')),
+]
+
+X_DEATH = TRACING + [
+    (b'x-death', ([([(b'count', (3, 'L')),
+                     (b'reason', (b'rejected', 'S')),
+                     (b'queue', (b'orders', 'S')),
+                     (b'time', (1700000000, 'T')),
+                     (b'exchange', (b'', 'S')),
+                     (b'routing-keys', ([(b'orders', 'S')], 'A'))], 'F')] * 2,
+                  'A')),
+]
+
+
+def encode(table):
+    for i in range(NUMBER):
+        enframe_table(io.BytesIO(), table)
+
+
+def size(table):
+    for i in range(NUMBER):
+        frame_table_size(table)
+
+
+def decode(data, **kwargs):
+    for i in range(NUMBER):
+        deframe_table(data, 0, **kwargs)
+
+
+def read_one(data):
+    for i in range(NUMBER):
+        deframe_lazy_table(data, 0)[0].get(b'x-request-id')
+
+
+def forward(data):
+    for i in range(NUMBER):
+        enframe_table(io.BytesIO(), deframe_lazy_table(data, 0)[0])
+
+
+if __name__ == '__main__':
+    for name, table in (('tracing', TRACING), ('x-death', X_DEATH)):
+        buf = io.BytesIO()
+        enframe_table(buf, table)
+        data = memoryview(buf.getvalue())
+        for case_name, case in (('encode', lambda: encode(table)),
+                                ('size', lambda: size(table)),
+                                ('decode', lambda: decode(data)),
+                                ('decode as dict',
+                                 lambda: decode(data, as_dict=True)),
+                                ('lazy, read one', lambda: read_one(data)),
+                                ('lazy, forward', lambda: forward(data))):
+            took = best_of(case, number=1, repeat=REPEAT)
+            print('%-8s %-15s %8.2f us' % (name, case_name,
+                                           took / NUMBER * 1e6))
@@ -1,6 +1,7 @@
 from __future__ import division
 
 import collections
+import io
 import math
 import struct
 import subprocess
@@ -10,6 +11,8 @@ import six
 
 from compile_definitions.utilities import f_fmt, to_docstring, pythonify_name, to_code_binary, f_repr, \
     format_method_class_name, name_class, get_size
+from coolamqp.framing.compilation.content_property import \
+    _compile_particular_content_property_list_class
 from coolamqp.framing.compilation.utilities import format_field_name
 from .xml_tags import Constant, Class, Domain
 
@@ -25,6 +28,144 @@ TYPE_TRANSLATOR = {
     'timestamp': '64 bit signed POSIX timestamp (in seconds)',
 }
 
+# Combinations of content properties that are compiled into definitions.py in
+# advance, so that these commonly used don't have to be compiled at runtime.
+# class name => list of tuples of field names, as in keyword arguments
+PRECOMPILED_PROPERTIES = {
+    'basic': [
+        (),
+        ('content_type',),
+        ('delivery_mode',),
+        ('headers',),
+        ('correlation_id',),
+        ('content_type', 'content_encoding'),
+        ('content_type', 'delivery_mode'),
+        ('content_type', 'headers'),
+        ('content_type', 'correlation_id'),
+        ('delivery_mode', 'headers'),
+        ('correlation_id', 'reply_to'),
+        ('content_type', 'content_encoding', 'delivery_mode'),
+        ('content_type', 'content_encoding', 'headers'),
+        ('content_type', 'delivery_mode', 'headers'),
+        ('content_type', 'correlation_id', 'reply_to'),
+        ('content_type', 'content_encoding', 'delivery_mode', 'headers'),
+        ('content_type', 'delivery_mode', 'message_id', 'timestamp'),
+    ],
+}
+
+# Methods received from the broker that also get a lazily decoded class,
+# see coolamqp.framing.frames.set_lazy_decoding. These are the ones that come
+# in bursts. Received methods that carry a table get one as well.
+LAZY_METHODS = [
+    ('basic', 'deliver'),
+    ('basic', 'ack'),
+    ('basic', 'nack'),
+    ('basic', 'return'),
+]
+
+
+def emit_lazy_class(line, structers, full_class_name, amqp_name, fields):
+    """
+    Emit a subclass of a method's class, that keeps the buffer it was
+    received in and decodes the arguments upon first access to any of them.
+    Tables are decoded into LazyTables.
+    """
+    from coolamqp.framing.compilation.textcode_fields import get_from_buffer
+
+    field_names = [format_field_name(field.name) for field in fields
+                   if not field.reserved]
+
+    line('''\nclass %sLazy(%s):
+    """
+    %s, with arguments decoded upon first access to any of them.
+
+    Arguments are read-only. Until they are decoded, this keeps the buffer
+    it was received in.
+    """
+    __slots__ = ('_buf', '_offset', %s)
+
+    @classmethod
+    def from_buffer(cls, buf, start_offset):     # type: (buffer, int) -> %sLazy
+        self = cls.__new__(cls)
+        self._buf = buf
+        self._offset = start_offset
+        return self
+
+    def _decode(self):      # type: () -> None
+        buf = self._buf
+        offset = self._offset
+        self._buf = None
+''', full_class_name, full_class_name, amqp_name,
+         u', '.join(f_repr('_' + name) for name in field_names),
+         full_class_name)
+
+    line_, new_structers = get_from_buffer(fields, 'self._', 2,
+                                           lazy_tables=True)
+    line(line_)
+    structers.update(new_structers)
+
+    for name in field_names:
+        line('''
+    @property
+    def %s(self):
+        if self._buf is not None:
+            self._decode()
+        return self._%s
+''', name, name)
+
+    line('\n')
+
+
+def get_zero_property_flags(names, properties):
+    """
+    Return property flags that mark given fields as present
+
+    :param names: field names, as in keyword arguments
+    :param properties: all properties of the class
+    :return: bytes
+    """
+    names = set(names)
+    groups = []
+    for group_start in range(0, len(properties), 15):
+        group = properties[group_start:group_start + 15]
+        flags = 0
+        for i, prop in enumerate(group):
+            if format_field_name(prop.name) in names:
+                flags |= 1 << (15 - i)
+        if group_start + 15 < len(properties):
+            flags |= 1  # more flags follow
+        groups.append(struct.pack('!H', flags))
+    return b''.join(groups)
+
+
+def emit_precompiled_property_lists(line, structers, cls):
+    """
+    Emit particular content property list classes for combinations of fields
+    listed in PRECOMPILED_PROPERTIES, and register them.
+    """
+    base_name = name_class(cls.name) + 'ContentPropertyList'
+    registrations = []
+    for names in PRECOMPILED_PROPERTIES.get(cls.name, []):
+        zpf = get_zero_property_flags(names, cls.properties)
+        class_name = u'%s_%s' % (base_name, ''.join('%02x' % (byte,) for byte in bytearray(zpf)))
+        source, new_structers = _compile_particular_content_property_list_class(
+            zpf, cls.properties, class_name)
+        structers.update(new_structers)
+        line(u'\n%s\n', source)
+        registrations.append((names, class_name))
+
+    if len(registrations) == 0:
+        return
+
+    line(u'\nfor particular, names in (\n')
+    for names, class_name in registrations:
+        line(u'        (%s, %s),\n', class_name, repr(tuple(str(name) for name in names)))
+    line(u'''):
+    %s.PARTICULAR_CLASSES[particular.ZERO_PROPERTY_FLAGS] = particular
+    %s.FIELDS_TO_CLASSES[frozenset(names)] = particular
+
+''', base_name, base_name)
+
 
 def compile_definitions(xml_file='resources/amqp0-9-1.extended.xml',
                         out_file='coolamqp/framing/definitions.py'):
@@ -62,10 +203,15 @@ import struct
 import collections
 import logging
 import six
+import sys
+import threading
 import typing as tp
+from operator import attrgetter
 
-from coolamqp.framing.base import AMQPClass, AMQPMethodPayload, AMQPContentPropertyList
-from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size
+from coolamqp.framing.base import AMQPClass, AMQPMethodPayload, AMQPContentPropertyList, \
+    LazyDispatchTable
+from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size, \
+    enframe_table_into, deframe_lazy_table
 from coolamqp.framing.compilation import compile_particular_content_property_list_class
 
 logger = logging.getLogger(__name__)
@@ -79,8 +225,33 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
 
 '''.encode('utf8'))
 
+    # method classes are written into a buffer first, see emit_factory
+    sinks = [out]
+
     def line(data, *args, **kwargs):
-        out.write(f_fmt(data, *args, sane=True).encode('utf8'))
+        sinks[-1].write(f_fmt(data, *args, sane=True).encode('utf8'))
+
+    lazy_attributes = []  # names of module attributes that are made on first access
+
+    def emit_factory(name, source, requires=()):
+        """
+        Emit a function that defines a class and returns it.
+
+        :param name: name of the class
+        :param source: source of the class, as emitted at top level
+        :param requires: names of lazy attributes it needs defined first
+        """
+        lazy_attributes.append(name)
+        out.write(u'\ndef _make_%s():\n'.encode('utf8') % (name.encode('utf8'),))
+        for name_required in requires:
+            out.write(u"    %s = _load('%s')\n".encode('utf8') % (
+                name_required.encode('utf8'), name_required.encode('utf8')))
+        for source_line in source.splitlines(True):
+            if source_line.strip():
+                out.write(b'    ' + source_line)
+            else:
+                out.write(source_line)
+        out.write(u'\n    return %s\n\n'.encode('utf8') % (name.encode('utf8'),))
 
     # Output core ones
     FRAME_END = None
@@ -136,6 +307,7 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
     line('}\n')
 
     class_id_to_contentpropertylist = {}
+    lazy_methods = {}  # (class ID, method ID) => name of lazy class
 
     # below are stored as strings!
     methods_that_are_reply_reasons_for = {}  # eg. ConnectionOpenOk: ConnectionOk
@@ -187,6 +359,9 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
     # A dictionary from a zero property list to a class typized with
     # some fields
     PARTICULAR_CLASSES = {}
+    # A dictionary from a frozenset of names of fields to a class typized
+    # with them
+    FIELDS_TO_CLASSES = {}
 \n''',
                  name_class(cls.name))
 
@@ -207,6 +382,15 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
                      format_field_name(property.name),
                      TYPE_TRANSLATOR[property.basic_type], property.basic_type)
             line('        """\n')
+            line(u'''        names = frozenset(kwargs)
+        try:
+            particular = %s.FIELDS_TO_CLASSES[names]
+        except KeyError:
+            pass
+        else:
+            return particular(**kwargs)
+
+'''.replace('%s', name_class(cls.name) + 'ContentPropertyList'))
             zpf_len = int(math.ceil(len(cls.properties) // 15))
 
             first_byte = True  # in 2-byte group
@@ -268,13 +452,16 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
 #
 #       If you do not know in advance what properties you will be using, it is correct to use
 #       this constructor.
-        if zpf in BasicContentPropertyList.PARTICULAR_CLASSES:
-            return %s.PARTICULAR_CLASSES[zpf](**kwargs)
+        if zpf in %s.PARTICULAR_CLASSES:
+            particular = %s.PARTICULAR_CLASSES[zpf]
         else:
             logger.debug('Property field (%s:%d) not seen yet, compiling', repr(zpf))
-            c = compile_particular_content_property_list_class(zpf, %s.FIELDS)
-            %s.PARTICULAR_CLASSES[zpf] = c
-            return c(**kwargs)
+            particular = compile_particular_content_property_list_class(zpf, %s.FIELDS)
+            %s.PARTICULAR_CLASSES[zpf] = particular
+        props = particular(**kwargs)
+        # remember it only if the names turned out valid
+        %s.FIELDS_TO_CLASSES[names] = particular
+        return props
 '''.replace('%s', name_class(cls.name) + 'ContentPropertyList').replace('%d',
                                                                         '%s'))
 
@@ -303,7 +490,7 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
                         if field.reserved or field.basic_type == 'bit':
                             pass  # zero
                         else:
-                            byte_chunk.append(u"int('%s' in kwargs)" % (
+                            byte_chunk.append(u"int('%s' in fields)" % (
                                 format_field_name(field.name),))
                     else:
                         # this is the "do we need moar flags" section
@@ -325,12 +512,13 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
             line(u'''        ])
         zpf = six.binary_type(zpf)
         if zpf in %s.PARTICULAR_CLASSES:
-            return %s.PARTICULAR_CLASSES[zpf]
+            particular = %s.PARTICULAR_CLASSES[zpf]
         else:
             logger.debug('Property field (%s:%d) not seen yet, compiling', repr(zpf))
-            c = compile_particular_content_property_list_class(zpf, %s.FIELDS)
-            %s.PARTICULAR_CLASSES[zpf] = c
-            return c
+            particular = compile_particular_content_property_list_class(zpf, %s.FIELDS)
+            %s.PARTICULAR_CLASSES[zpf] = particular
+        %s.FIELDS_TO_CLASSES[frozenset(fields)] = particular
+        return particular
 '''.replace("%s", name_class(cls.name) + 'ContentPropertyList').replace('%d',
                                                                         '%s'))
 
@@ -361,6 +549,8 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
 '''.replace('%s', name_class(cls.name) + 'ContentPropertyList').replace("%d",
                                                                         "%s"))
 
+            emit_precompiled_property_lists(line, structers, cls)
+
         # ============================================ Do methods for this class
         for method in cls.methods:
             full_class_name = u'%s%s' % (
@@ -388,6 +578,7 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
                     map(lambda f: f_repr(format_field_name(f.name)),
                         non_reserved_fields))) + u', '
 
+            sinks.append(io.BytesIO())
             line('''\nclass %s(AMQPMethodPayload):
     """
     %s
@@ -494,12 +685,18 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
             # end
             if not is_content_static:
                 from coolamqp.framing.compilation.textcode_fields import \
-                    get_serializer, get_counter, get_from_buffer
+                    get_serializer, get_serializer_into, get_counter, \
+                    get_from_buffer
                 line('\n    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None\n')
                 line_, new_structers = get_serializer(method.fields, 'self.', 2)
                 line(line_)
                 structers.update(new_structers)
 
+                line('    def write_into(self, buf, offset):  # type: (bytearray, int) -> int\n')
+                line_, new_structers = get_serializer_into(method.fields, 'self.', 2)
+                line(line_)
+                structers.update(new_structers)
+
                 line('    def get_size(self):       # type: () -> int\n')
                 line(get_counter(method.fields, 'self.', 2))
 
@@ -519,6 +716,19 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
                      not field.reserved))
 
             line('\n\n')
+            emit_factory(full_class_name, sinks.pop().getvalue())
+
+            # SENT_BY_CLIENT means the client implements it, ie. receives it
+            if method.sent_by_client and non_reserved_fields and (
+                    (cls.name, method.name) in LAZY_METHODS or
+                    any(field.basic_type == 'table'
+                        for field in non_reserved_fields)):
+                lazy_methods[(cls.index, method.index)] = full_class_name + 'Lazy'
+                sinks.append(io.BytesIO())
+                emit_lazy_class(line, structers, full_class_name,
+                                cls.name + '.' + method.name, method.fields)
+                emit_factory(full_class_name + 'Lazy', sinks.pop().getvalue(),
+                             requires=(full_class_name,))
 
         # Get me a dict - (classid, methodid) => class of method
         dct = {}
@@ -527,31 +737,26 @@ Field = collections.namedtuple('Field', ('name', 'type', 'basic_type', 'reserved
                 dct[((cls.index, method.index))] = '%s%s' % (
                     name_class(cls.name), format_method_class_name(method.name))
 
-    line('\nIDENT_TO_METHOD = {\n')
-    for k, v in dct.items():
-        line('    %s: %s,\n', repr(k), v)
-    line('}\n\n')
-
-    line('\nBINARY_HEADER_TO_METHOD = {\n')
-    for k, v in dct.items():
-        line('    %s: %s,\n', to_code_binary(struct.pack('!HH', *k)), v)
-    line('}\n\n')
-
-    line('\nCLASS_ID_TO_CONTENT_PROPERTY_LIST = {\n')
-    for k, v in class_id_to_contentpropertylist.items():
-        line('    %s: %s,\n', k, v)
-    line('}\n\n')
+    # these refer to method classes, so they are made on first access too
+    replied_methods = set(methods_that_are_reply_reasons_for.keys()) | \
+        set(methods_that_are_reply_reasons_for.values()) | \
+        set(methods_that_are_replies_for.keys())
+    for v in methods_that_are_replies_for.values():
+        replied_methods.update(v)
+    replied_methods = sorted(replied_methods)
 
+    sinks.append(io.BytesIO())
     line(u'''# Methods that are sent as replies to other methods, ie. ConnectionOpenOk: ConnectionOpen
 # if a method is NOT a reply, it will not be in this dict
 # a method may be a reply for AT MOST one method
 REPLY_REASONS_FOR = {\n''')
     for k, v in methods_that_are_reply_reasons_for.items():
         line(u'    %s: %s,\n' % (k, v))
+    line(u'}\n')
+    emit_factory(u'REPLY_REASONS_FOR', sinks.pop().getvalue(), requires=replied_methods)
 
-    line(u'''}
-
-# Methods that are replies for other, ie. ConnectionOpenOk: ConnectionOpen
+    sinks.append(io.BytesIO())
+    line(u'''# Methods that are replies for other, ie. ConnectionOpenOk: ConnectionOpen
 # a method may be a reply for ONE or NONE other methods
 # if a method has no replies, it will have an empty list as value here
 REPLIES_FOR = {\n''')
@@ -559,11 +764,91 @@ REPLIES_FOR = {\n''')
     for k, v in methods_that_are_replies_for.items():
         line(u'    %s: [%s],\n' % (k, u', '.join(map(str, v))))
     line(u'}\n')
+    emit_factory(u'REPLIES_FOR', sinks.pop().getvalue(), requires=replied_methods)
+
+    line(u'''
+# Method classes and tables that refer to them are made
+# upon first access, so that importing this module is fast
+_FACTORIES = {
+''')
+    for name in lazy_attributes:
+        line(u'    %s: _make_%s,\n', f_repr(name), name)
+    line(u'''}
+_LOAD_LOCK = threading.RLock()
+
+
+def _load(name):    # type: (str) -> tp.Any
+    """
+    Return a lazily made attribute of this module, making it if it's the
+    first access
+
+    :raise KeyError: there's no such attribute
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+
+    factory = _FACTORIES[name]
+    with _LOAD_LOCK:
+        # someone might have beaten us to it
+        if name not in globals():
+            made = factory()
+            if isinstance(made, type):
+                made.__qualname__ = name
+            globals()[name] = made
+        return globals()[name]
+
+
+def __getattr__(name):
+    try:
+        return _load(name)
+    except KeyError:
+        raise AttributeError('module %S has no attribute %S' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_FACTORIES))
+
+
+''')
+
+    line('\nIDENT_TO_METHOD = LazyDispatchTable(_load, {\n')
+    for k, v in dct.items():
+        line('    %s: %s,\n', repr(k), f_repr(v))
+    line('})\n\n')
+
+    line('\nBINARY_HEADER_TO_METHOD = LazyDispatchTable(_load, {\n')
+    for k, v in dct.items():
+        line('    %s: %s,\n', to_code_binary(struct.pack('!HH', *k)), f_repr(v))
+    line('})\n\n')
+
+    line('\nIDENT_TO_LAZY_METHOD = LazyDispatchTable(_load, {\n')
+    for k, v in sorted(lazy_methods.items()):
+        line('    %s: %s,\n', repr(k), f_repr(v))
+    line('})\n\n')
+
+    line('\nCLASS_ID_TO_CONTENT_PROPERTY_LIST = {\n')
+    for k, v in class_id_to_contentpropertylist.items():
+        line('    %s: %s,\n', k, v)
+    line('}\n\n')
 
     # Output structers
     for structer in structers:
         line(u'STRUCT_%s = struct.Struct("!%s")\n' % (structer, structer))
 
+    line(u'''
+# from ... import * has to make the lazy classes too
+__all__ = sorted(_name for _name in set(globals()) | set(_FACTORIES)
+                 if not _name.startswith('_'))
+
+if sys.version_info < (3, 7):
+    # module's __getattr__ is not supported, make everything right now
+    for _name in _FACTORIES:
+        _load(_name)
+
+''')
+
     out.close()
 
 
@@ -3,6 +3,7 @@ from __future__ import absolute_import, division, print_function
 
 import io
 import logging
+import threading
 import typing as tp
 import uuid
 from concurrent.futures import Future
@@ -12,16 +13,18 @@ from coolamqp.exceptions import AMQPError
 from coolamqp.framing.definitions import ChannelOpenOk, BasicConsume, \
     BasicConsumeOk, QueueDeclare, QueueDeclareOk, ExchangeDeclare, \
     ExchangeDeclareOk, \
-    QueueBind, QueueBindOk, ChannelClose, BasicDeliver, BasicCancel, \
+    QueueBind, QueueBindOk, ChannelClose, BasicCancel, \
     BasicAck, BasicReject, RESOURCE_LOCKED, BasicCancelOk, BasicQos, BasicQosOk
-from coolamqp.framing.frames import AMQPBodyFrame, AMQPHeaderFrame
-from coolamqp.objects import Callable
-from coolamqp.uplink import HeaderOrBodyWatch, MethodWatch
+from coolamqp.framing.templates import DeliveryTagTemplate
+from coolamqp.attaches.utils import BytesInterner, TagRanges
+from coolamqp.objects import Callable, ReceivedMessage
 
 logger = logging.getLogger(__name__)
 
 EMPTY_MEMORYVIEW = memoryview(b'')  # for empty messages
 
+ACK_BATCH_DELAY = 1.0  # seconds acks are held for, unless ack_batch says
+
 
 class BodyReceiveMode(object):
     # ZC - zero copy
@@ -33,9 +36,9 @@ class BodyReceiveMode(object):
     # this is C
 
     MEMORYVIEW = 1  # message.body will be returned as a memoryview object
-    # this is ZC for small messages, and C for multi-frame ones
-    # think less than 800B, since 2048 is the buffer for socket recv, and an
-    # AMQP frame (or many frames!) have to fit there
+    # this is ZC for single-frame messages, and C for multi-frame ones
+    # note that the memoryview keeps alive the whole receive slab it points
+    # into, see ReceivingFramer
 
     LIST_OF_MEMORYVIEW = 2  # message.body will be returned as list of
     # memoryview objects these constitute received pieces. this is always ZC
@@ -108,20 +111,37 @@ class Consumer(Channeler):
     :param body_receive_mode: how should message.body be received. This
         has a performance impact
     :type body_receive_mode: a property of BodyReceiveMode
+    :param message_class: class of messages passed to on_message, a subclass
+        of ReceivedMessage
+    :param ack_batch: if given, acks are not sent one by one. They are held
+        until this many messages were acked, and then sent as a single
+        basic.ack with multiple bit set, if possible. It can also be a
+        tuple of (count, seconds) - held acks are sent at most this many
+        seconds after the first one was held, by default 1 second. Held acks
+        are sent before a reject and when the consumer is cancelled. Makes
+        sense only if no_ack is False.
+        The broker stops delivering once prefetch window of qos messages
+        were not acked, held ones included. So held acks are also sent once
+        there are as many of them as prefetch window, and count should be
+        well below it, eg. a half, so that messages keep coming while acks
+        are held.
+    :type ack_batch: int or tuple(int, float)
     """
     __slots__ = ('queue', 'no_ack', 'on_message', 'cancelled', 'receiver',
                  'attache_group', 'channel_close_sent', 'qos', 'qos_update_sent',
                  'future_to_notify', 'future_to_notify_on_dead',
                  'fail_on_first_time_resource_locked', 'cancel_on_failure',
                  'body_receive_mode', 'consumer_tag', 'on_cancel', 'on_broker_cancel',
-                 'hb_watch', 'deliver_watch', 'span')
+                 'span', 'message_class', 'interner', 'ack_batch')
 
     def __init__(self, queue, on_message, span=None,
                  no_ack=True, qos=None,
                  cancel_on_failure=False,
                  future_to_notify=None,
                  fail_on_first_time_resource_locked=False,
-                 body_receive_mode=BodyReceiveMode.BYTES
+                 body_receive_mode=BodyReceiveMode.BYTES,
+                 message_class=ReceivedMessage,
+                 ack_batch=None
                  ):
         """
         Note that if you specify QoS, it is applied before basic.consume is
@@ -152,6 +172,10 @@ class Consumer(Channeler):
         self.fail_on_first_time_resource_locked = fail_on_first_time_resource_locked
         self.cancel_on_failure = cancel_on_failure
         self.body_receive_mode = body_receive_mode
+        self.message_class = message_class
+        # exchange names and routing keys of received messages
+        self.interner = BytesInterner()
+        self.ack_batch = _batchify(ack_batch)
 
         self.consumer_tag = None
 
@@ -172,6 +196,19 @@ class Consumer(Channeler):
             self.method(BasicQos(prefetch_size or 0, prefetch_count, False))
         self.qos = prefetch_size or 0, prefetch_count
 
+    def get_unacked_count(self):  # type: () -> int
+        """
+        Return how many messages received on the current channel were not
+        acked or rejected yet. Messages received before the consumer last
+        went offline are not counted, since these can't be acked anymore.
+
+        With no_ack, this is always zero.
+        """
+        receiver = self.receiver
+        if receiver is None:
+            return 0
+        return len(receiver.acks_pending)
+
     def cancel(self):  # type: () -> Future
         """
         Cancel the customer.
@@ -190,6 +227,11 @@ class Consumer(Channeler):
             self.future_to_notify_on_dead = Future()
             self.future_to_notify_on_dead.set_running_or_notify_cancel()
 
+        # acks made so far should still reach the broker
+        if self.receiver is not None and not self.channel_close_sent and \
+                self.state == ST_ONLINE:
+            self.receiver.flush_acks()
+
         self.cancelled = True
         self.on_cancel()
         # you'll blow up big next time you try to use this consumer if you
@@ -222,8 +264,7 @@ class Consumer(Channeler):
                 self.future_to_notify = None
 
         else:
-            self.hb_watch.cancel()
-            self.deliver_watch.cancel()
+            self.connection.stop_receiving_deliveries(self.channel_id)
             self.receiver.on_gone()
             self.receiver = None
 
@@ -242,6 +283,10 @@ class Consumer(Channeler):
         Note, this can be called multiple times, and eventually with None.
 
         """
+        if isinstance(payload, BasicCancel) and self.receiver is not None:
+            # the channel is still open, so acks made so far can be sent
+            self.receiver.flush_acks()
+
         if self.cancel_on_failure and (not self.cancelled):
             logger.debug(
                 'Consumer is cancel_on_failure and failure seen, True->cancelled')
@@ -253,7 +298,7 @@ class Consumer(Channeler):
             self.on_operational(False)
             self.state = ST_OFFLINE
 
-            # deliver and head/body watch will clean up after themselves
+            # on_operational(False) stopped receiving deliveries
 
         should_retry = False
 
@@ -336,28 +381,6 @@ class Consumer(Channeler):
                 logger.info('Retrying with %s', self.queue.name)
                 self.attach(old_con)
 
-    def on_delivery(self, sth):
-        """
-        Callback for delivery-related shit
-
-        :param sth: AMQPMethodFrame WITH basic-deliver, AMQPHeaderFrame or
-            AMQPBodyFrame
-        """
-
-        if self.receiver is None:
-            # dead, cancelled, whatever
-            return
-
-        if isinstance(sth, BasicDeliver):
-            self.receiver.on_basic_deliver(sth)
-        elif isinstance(sth, AMQPBodyFrame):
-            self.receiver.on_body(sth.data)
-        elif isinstance(sth, AMQPHeaderFrame):
-            self.receiver.on_head(sth)
-
-            # No point in listening for more stuff, that's all the watches
-            # even listen for
-
     def on_setup(self, payload):  # type: (coolamqp.framing.base.AMQPMethodPayload) -> None
         """Called with different kinds of frames - during setup"""
 
@@ -450,17 +473,8 @@ class Consumer(Channeler):
 
             self.on_operational(True)
 
-            # Register watches for receiving shit
-            # this is multi-shot by default
-            self.hb_watch = HeaderOrBodyWatch(self.channel_id,
-                                              self.on_delivery)
-            self.connection.watch(self.hb_watch)
-
-            # multi-shot watches need manual cleanup!
-            self.deliver_watch = MethodWatch(self.channel_id, BasicDeliver,
-                                             self.on_delivery)
-            self.deliver_watch.oneshot = False
-            self.connection.watch(self.deliver_watch)
+            # Deliveries go straight to the receiver
+            self.connection.receive_deliveries(self.channel_id, self.receiver)
 
             self.state = ST_ONLINE
 
@@ -484,6 +498,14 @@ def _qosify(qos):
     return qos
 
 
+def _batchify(ack_batch):
+    if isinstance(ack_batch, int):
+        ack_batch = ack_batch, None
+    if ack_batch is not None and ack_batch[1] is None:
+        ack_batch = ack_batch[0], ACK_BATCH_DELAY
+    return ack_batch
+
+
 class MessageReceiver(object):
     """This is an object that is used to received messages.
 
@@ -497,7 +519,8 @@ class MessageReceiver(object):
     self.consumer.connection.send(None)
     """
     __slots__ = ('consumer', 'state', 'bdeliver', 'header', 'body', 'data_to_go',
-                 'message_size', 'offset', 'acks_pending', 'recv_mode')
+                 'message_size', 'offset', 'acks_pending', 'recv_mode',
+                 'templates', 'acks_held', 'ack_timer', 'lock')
 
     def __init__(self, consumer):  # type: (Consumer) -> None
         self.consumer = consumer
@@ -519,7 +542,18 @@ class MessageReceiver(object):
         self.offset = 0  # used only in MEMORYVIEW mode - pointer to self.body
         #  (which would be a buffer)
 
-        self.acks_pending = set()  # list of things to ack/reject
+        # tags of messages to ack/reject
+        self.acks_pending = TagRanges()
+
+        # if acks are batched, acked tags that were not sent yet
+        self.acks_held = set()  # type: tp.Set[int]
+        self.ack_timer = None  # sends held acks when they were held too long
+        # protects acks_pending and acks_held
+        self.lock = threading.Lock()
+
+        # (success, multiple) => basic.ack or basic.reject serialized in
+        # advance, made on first use
+        self.templates = {}  # type: tp.Dict[tp.Tuple[bool, bool], DeliveryTagTemplate]
 
         self.recv_mode = consumer.body_receive_mode
         # if BYTES, pieces (as mvs) are received into .body and b''.join()ed
@@ -535,38 +569,160 @@ class MessageReceiver(object):
     def on_gone(self):
         """Called by Consumer to inform upon discarding this receiver"""
         self.state = 3
+        with self.lock:
+            if self.ack_timer is not None:
+                self.ack_timer.cancel()
+                self.ack_timer = None
 
-    def confirm(self, delivery_tag, success):  # type: (int, tp.Callable[[], None]) -> None
+    def settle(self, delivery_tag, success):  # type: (int, bool) -> None
         """
-        This crafts a constructor for confirming messages.
-
-        This should return a callable/0, whose calling will ACK or REJECT the
-        message.
-        Calling it multiple times should have no ill effect.
+        ACK or REJECT a message received by this receiver.
 
-        If this receiver is long gone,
+        Calling it multiple times should have no ill effect. If this receiver
+        is long gone, or its consumer was cancelled, this is a no-op.
 
         :param delivery_tag: delivery_tag to ack
         :param success: True if ACK, False if REJECT
-        :return: callable/0
         """
+        if self.state == 3:
+            return  # Gone!
+
+        if self.consumer.cancelled:
+            return  # cancelled!
+
+        ack_batch = self.consumer.ack_batch
+        if ack_batch is None:
+            with self.lock:
+                if not self.acks_pending.discard(delivery_tag):
+                    return  # already confirmed/rejected
+            self._send([(delivery_tag, success, False)])
+            return
 
-        def callable():
-            if self.state == 3:
-                return  # Gone!
-
-            if self.consumer.cancelled:
-                return  # cancelled!
-
+        # Held acks are sent under the lock, so that a basic.ack with multiple
+        # bit never overtakes one for a lower tag
+        with self.lock:
             if delivery_tag not in self.acks_pending:
                 return  # already confirmed/rejected
 
             if success:
-                self.consumer.method(BasicAck(delivery_tag, False))
+                self.acks_pending.discard(delivery_tag)
+                self.acks_held.add(delivery_tag)
+                count = ack_batch[0]
+                qos = self.consumer.qos
+                if qos is not None and qos[1]:
+                    # no more will come until these are sent
+                    count = min(count, qos[1])
+                if len(self.acks_held) < count:
+                    if self.ack_timer is None:
+                        self.ack_timer = self.consumer.connection.watchdog(
+                            ack_batch[1], self.flush_acks)
+                    return
+                settlements = self._take_held_acks()
             else:
-                self.consumer.method(BasicReject(delivery_tag, True))
+                # while still pending, so that it's not acked with the rest
+                settlements = self._take_held_acks()
+                self.acks_pending.discard(delivery_tag)
+                settlements.append((delivery_tag, False, False))
+
+            self._send(settlements)
+
+    def flush_acks(self):  # type: () -> None
+        """
+        Send acks that are held because acks are batched. Called when there
+        are enough of them, when they were held for too long and when the
+        consumer is cancelled.
+        """
+        if self.state == 3:
+            return  # Gone!
 
-        return callable
+        with self.lock:
+            settlements = self._take_held_acks()
+            if settlements:
+                self._send(settlements)
+
+    def _take_held_acks(self):
+        # type: () -> tp.List[tp.Tuple[int, bool, bool]]
+        """
+        Forget held acks and return them as settlements to send - a single
+        ack with multiple bit for tags below the lowest pending one, and
+        single acks for the tags above it. Call with lock.
+
+        :return: a list of (delivery tag, success, multiple)
+        """
+        if self.ack_timer is not None:
+            self.ack_timer.cancel()
+            self.ack_timer = None
+
+        held = self.acks_held
+        if not held:
+            return []
+
+        lowest_pending = self.acks_pending.lowest()
+        if lowest_pending is not None:
+            # no tag below the lowest pending one awaits an ack
+            below = [tag for tag in held if tag < lowest_pending]
+            above = sorted(tag for tag in held if tag > lowest_pending)
+        else:
+            below, above = held, []
+
+        settlements = [(max(below), True, True)] if below else []
+        settlements.extend((tag, True, False) for tag in above)
+        held.clear()
+        return settlements
+
+    def _send(self, settlements):
+        # type: (tp.List[tp.Tuple[int, bool, bool]]) -> None
+        """
+        Send basic.acks and basic.rejects in a single go.
+
+        :param settlements: a list of (delivery tag, success, multiple)
+        """
+        channel_id = self.consumer.channel_id
+        if channel_id is None:
+            return
+
+        connection = self.consumer.connection
+        if connection.log_frames is not None:
+            # templates make no AMQPFrames, and these are needed for logging
+            self.consumer.methods([
+                BasicAck(delivery_tag, multiple) if success else
+                BasicReject(delivery_tag, True)
+                for delivery_tag, success, multiple in settlements])
+            return
+
+        connection.send([
+            self._template_for(channel_id, success, multiple).frame_for(
+                delivery_tag)
+            for delivery_tag, success, multiple in settlements])
+
+    def confirm(self, delivery_tag, success):  # type: (int, bool) -> tp.Callable[[], None]
+        """
+        This crafts a constructor for confirming messages.
+
+        This should return a callable/0, whose calling will ACK or REJECT the
+        message. See settle().
+
+        :param delivery_tag: delivery_tag to ack
+        :param success: True if ACK, False if REJECT
+        :return: callable/0
+        """
+        return lambda: self.settle(delivery_tag, success)
+
+    def _template_for(self, channel_id, success, multiple):
+        # type: (int, bool, bool) -> DeliveryTagTemplate
+        """
+        Return the template of basic.ack with given multiple bit if success,
+        else of basic.reject.
+        """
+        template = self.templates.get((success, multiple))
+        if template is None or template.channel != channel_id:
+            if success:
+                payload = BasicAck(0, multiple)
+            else:
+                payload = BasicReject(0, True)
+            template = self.templates[success, multiple] = \
+                DeliveryTagTemplate(channel_id, payload)
+        return template
 
     def on_head(self, frame):
         assert self.state == 1
@@ -615,9 +771,8 @@ class MessageReceiver(object):
             # Message A-OK!
 
             if ack_expected:
-                self.acks_pending.add(self.bdeliver.delivery_tag)
-
-            from coolamqp.objects import ReceivedMessage
+                with self.lock:
+                    self.acks_pending.add(self.bdeliver.delivery_tag)
 
             # Does body need preprocessing?
             body = self.body
@@ -636,16 +791,15 @@ class MessageReceiver(object):
                     body = bio.getvalue()
             # if MEMORYVIEW, then it's already ok
 
-            rm = ReceivedMessage(
+            bdeliver = self.bdeliver
+            intern = self.consumer.interner.intern
+            rm = self.consumer.message_class(
                 body,
-                self.bdeliver.exchange,
-                self.bdeliver.routing_key,
+                intern(bdeliver.exchange),
+                intern(bdeliver.routing_key),
                 self.header.properties,
-                self.bdeliver.delivery_tag,
-                None if self.consumer.no_ack else self.confirm(
-                    self.bdeliver.delivery_tag, True),
-                None if self.consumer.no_ack else self.confirm(
-                    self.bdeliver.delivery_tag, False),
+                bdeliver.delivery_tag,
+                receiver=self if ack_expected else None,
             )
 
             self.consumer.on_message(rm)
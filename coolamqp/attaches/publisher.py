@@ -20,6 +20,7 @@ from coolamqp.framing.definitions import ChannelOpenOk, BasicPublish, Basic, \
     BasicAck
 from coolamqp.framing.frames import AMQPMethodFrame, AMQPBodyFrame, \
     AMQPHeaderFrame
+from coolamqp.framing.templates import PublishTemplate
 
 try:
     # these extensions will be available
@@ -31,18 +32,80 @@ except ImportError:
 from coolamqp.attaches.channeler import Channeler, ST_ONLINE, ST_OFFLINE
 from coolamqp.uplink import PUBLISHER_CONFIRMS, MethodWatch, FailWatch
 from coolamqp.attaches.utils import AtomicTagger, FutureConfirmableRejectable, \
-    Synchronized
+    CallbackConfirmableRejectable, WindowedConfirmableRejectable, Synchronized
 
 from concurrent.futures import Future
-from coolamqp.objects import Exchange
+from coolamqp.exceptions import PublishWindowFull
+from coolamqp.objects import Exchange, ConfirmWindow, ConfirmBatch, Message, \
+    EMPTY_PROPERTIES
 
 logger = logging.getLogger(__name__)
 
 # for holding messages when MODE_CNPUB and link is down
+# future is None if the message is confirmed through confirmable instead
+# prepared is the PreparedPublish the message was sent with, or None
 CnpubMessageSendOrder = collections.namedtuple('CnpubMessageSendOrder',
                                                ('message', 'exchange_name',
                                                 'routing_key', 'future',
-                                                'parent_span', 'span_enqueued'))
+                                                'confirmable',
+                                                'parent_span', 'span_enqueued',
+                                                'prepared'))
+
+
+# for passing messages to the listener thread when MODE_NOACK and coalescing
+NoackMessageSendOrder = collections.namedtuple('NoackMessageSendOrder',
+                                               ('message', 'exchange_name',
+                                                'routing_key', 'parent_span',
+                                                'span_enqueued', 'prepared'))
+
+
+class PreparedPublish(object):
+    """
+    A handle to publish many messages with the same exchange, routing key and
+    properties. Get it with Publisher.prepare() or Cluster.prepare_publish().
+
+    Frames of these messages are not built one by one. Instead, they are
+    serialized once per channel into a PublishTemplate, and only the sizes
+    are filled in for each message. This isn't done if the message is traced
+    or frames are logged - then it's published as usual.
+    """
+    __slots__ = ('publisher', 'exchange', 'routing_key', 'properties',
+                 'template')
+
+    def __init__(self, publisher,  # type: Publisher
+                 exchange,  # type: bytes
+                 routing_key,  # type: bytes
+                 properties  # type: coolamqp.framing.definitions.BasicContentPropertyList
+                 ):
+        self.publisher = publisher
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.properties = properties
+        self.template = None  # type: tp.Optional[PublishTemplate]
+
+    def template_for(self, channel_id):  # type: (int) -> PublishTemplate
+        """
+        Return the template for given channel, making a new one if the
+        publisher has reconnected on another channel since.
+        """
+        template = self.template
+        if template is None or template.channel != channel_id:
+            template = self.template = PublishTemplate(channel_id, self.exchange,
+                                                       self.routing_key,
+                                                       self.properties)
+        return template
+
+    def send(self, body, span=None, callback=None, batch=None):
+        """
+        Publish a message with this body. See Publisher.publish() for
+        what it returns and raises.
+
+        :param body: message body
+        :type body: bytes
+        """
+        return self.publisher.publish(Message(body, self.properties), self.exchange,
+                                      self.routing_key, span=span, callback=callback,
+                                      batch=batch, prepared=self)
 
 
 # todo what if publisher in MODE_CNPUB fails mid message? they dont seem to be recovered
@@ -71,7 +134,13 @@ class Publisher(Channeler, Synchronized):
          MODE_NOACK - use non-ack mode
          MODE_CNPUB - use consumer publishing mode. A switch to MODE_TXPUB will be made
                       if broker does not support these.
-    :raise ValueError: mode invalid
+    :param window: a ConfirmWindow to limit unconfirmed messages with, MODE_CNPUB only
+    :type window: coolamqp.objects.ConfirmWindow
+    :param coalesce: if True, .publish() called by threads other than the listener thread just puts the
+        message into an inbox, without taking the lock. The listener thread drains the inbox once
+        every loop iteration, and sends everything it found at once. This works only with listeners
+        that can be woken up, ie. epoll - otherwise messages are published as usual.
+    :raise ValueError: mode invalid, or window given in MODE_NOACK
     """
     MODE_NOACK = 0  # no-ack publishing
     MODE_CNPUB = 1  # RabbitMQ publisher confirms extension
@@ -81,14 +150,30 @@ class Publisher(Channeler, Synchronized):
     class UnusablePublisher(Exception):
         """This publisher will never work (eg. MODE_CNPUB on a broker not supporting publisher confirms)"""
 
-    def __init__(self, mode, cluster=None):
+    def __init__(self, mode, cluster=None, window=None, coalesce=False):
         Channeler.__init__(self)
         Synchronized.__init__(self)
 
         if mode not in (Publisher.MODE_NOACK, Publisher.MODE_CNPUB):
             raise ValueError(u'Invalid publisher mode')
 
+        if window is not None and mode != Publisher.MODE_CNPUB:
+            raise ValueError(u'A confirm window needs MODE_CNPUB')
+
         self.mode = mode
+        self.window = window
+
+        self.coalesce = coalesce
+        self.loop = None  # ListenerThread that drains the inbox, if coalescing
+        # Messages published by other threads, waiting for the listener thread.
+        # Appending to and popping from a deque is atomic, so this needs no lock.
+        # tuples of (was the message let into the window already::bool,
+        #            CnpubMessageSendOrder or NoackMessageSendOrder)
+        self.inbox = collections.deque()
+
+        # With ConfirmWindow.QUEUE, messages that didn't fit into the window yet.
+        # Same as .messages
+        self.held = collections.deque()
 
         self.messages = collections.deque()  # Messages to publish. From newest to last.
         # tuple of (Message object, exchange name::str, routing_key::str,
@@ -107,6 +192,14 @@ class Publisher(Channeler, Synchronized):
         Channeler.attach(self, connection)
         connection.watch(FailWatch(self.on_fail))
 
+        if self.coalesce and self.loop is None:
+            if connection.listener_thread.listener.WAKES_UP:
+                self.loop = connection.listener_thread
+                self.loop.add_loop_hook(self._drain_inbox)
+            else:
+                logger.warning(u'This listener cannot be woken up, publishes will not be coalesced')
+                self.coalesce = False
+
     def on_connection_blocked(self, payload):
         if isinstance(payload, ConnectionBlocked):
             self.blocked = True
@@ -134,7 +227,7 @@ class Publisher(Channeler, Synchronized):
         self.state = ST_OFFLINE
 
     def _pub(self, message, exchange_name, routing_key, parent_span=None, span_enqueued=None,
-             dont_close_span=False):
+             dont_close_span=False, frames=None, prepared=None):
         """
         Just send the message. Sends BasicDeliver + header + body.
 
@@ -145,7 +238,21 @@ class Publisher(Channeler, Synchronized):
         :param routing_key: routing key to use
         :type exchange_name: bytes
         :param routing_key: bytes
+        :param frames: if given, a list to append the frames to instead of sending them.
+            Send it with ._send_frames() afterwards.
+        :param prepared: PreparedPublish this message is published with, or None
         """
+        max_body_size = self.connection.frame_max - AMQPBodyFrame.FRAME_SIZE_WITHOUT_PAYLOAD - 16
+
+        if prepared is not None and parent_span is None and self.connection.log_frames is None:
+            frames_to_send = prepared.template_for(self.channel_id).frames_for(message.body,
+                                                                               max_body_size)
+            if frames is not None:
+                frames.extend(frames_to_send)
+            else:
+                self._send_frames(frames_to_send)
+            return
+
         span = None
         if parent_span is not None:
             import opentracing
@@ -157,7 +264,6 @@ class Publisher(Channeler, Synchronized):
         bodies = []
 
         body = memoryview(message.body)
-        max_body_size = self.connection.frame_max - AMQPBodyFrame.FRAME_SIZE_WITHOUT_PAYLOAD - 16
         while len(body) > 0:
             bodies.append(body[:max_body_size])
             body = body[max_body_size:]
@@ -170,7 +276,12 @@ class Publisher(Channeler, Synchronized):
         if len(bodies) == 1:
             frames_to_send.append(AMQPBodyFrame(self.channel_id, bodies[0]))
 
-        if self.content_flow and not self.blocked:
+        if frames is not None:
+            frames.extend(frames_to_send)
+            if len(bodies) > 1:
+                for body in bodies:
+                    frames.append(AMQPBodyFrame(self.channel_id, body))
+        elif self.content_flow and not self.blocked:
             self.connection.send(frames_to_send)
 
             if len(bodies) > 1:
@@ -193,6 +304,16 @@ class Publisher(Channeler, Synchronized):
         if parent_span is not None and not dont_close_span:
             parent_span.finish()
 
+    def _send_frames(self, frames):  # type: (tp.List[AMQPFrame]) -> None
+        """
+        Send frames that ._pub() gathered, all at once. They are held back
+        if the broker doesn't want any content right now.
+        """
+        if self.content_flow and not self.blocked:
+            self.connection.send(frames)
+        else:
+            self.frames_to_send.extend(frames)
+
     def _mode_cnpub_process_deliveries(self):
         """
         Dispatch all frames that are waiting to be sent
@@ -203,26 +324,72 @@ class Publisher(Channeler, Synchronized):
         assert self.mode == Publisher.MODE_CNPUB
         assert self.tagger is not None
 
+        # all of these get a single range of delivery tags, and are sent at once
+        frames = []
+        deposits = []
         while len(self.messages) > 0:
             try:
-                msg, xchg, rk, fut, parent_span, span_enqueued = self.messages.popleft()
+                msg, xchg, rk, fut, confirmable, parent_span, span_enqueued, prepared = \
+                    self.messages.popleft()
             except IndexError:
                 # todo see docs/casefile-0001
                 break
 
+            confirmable = self._confirmable_for(msg, fut, confirmable, parent_span,
+                                                span_enqueued)
+            if confirmable is None:
+                continue  # cancelled
+
+            deposits.append((confirmable, parent_span))
+            self._pub(msg, xchg, rk, parent_span, span_enqueued, dont_close_span=True,
+                      frames=frames, prepared=prepared)
+
+        if len(deposits) > 0:
+            # deposit before sending, so that the confirms find them
+            self.tagger.deposit_range(deposits)
+            self._send_frames(frames)
+
+    def _cnpub_send(self, msg, xchg, rk, fut, confirmable, parent_span,
+                    span_enqueued, prepared):
+        """
+        Deposit a message with the tagger, and send it.
+
+        To be used when mode is MODE_CNPUB and we are ST_ONLINE
+
+        :param fut: Future to notify, or None to notify confirmable
+        """
+        confirmable = self._confirmable_for(msg, fut, confirmable, parent_span, span_enqueued)
+        if confirmable is None:
+            return  # cancelled
+
+        self.tagger.deposit(self.tagger.get_key(), confirmable, parent_span)
+        assert isinstance(xchg, (six.binary_type, six.text_type))
+        self._pub(msg, xchg, rk, parent_span, span_enqueued, dont_close_span=True,
+                  prepared=prepared)
+
+    def _confirmable_for(self, msg, fut, confirmable, parent_span, span_enqueued):
+        """
+        Return the ConfirmableRejectable to deposit with the tagger for a message
+        that is about to be sent, or None if it's Future was cancelled.
+
+        :param fut: Future to notify, or None to notify confirmable
+        """
+        if fut is not None:
             if not fut.set_running_or_notify_cancel():
                 if span_enqueued is not None:
                     from opentracing import logs
                     span_enqueued.log_kv({logs.EVENT: 'Cancelled'})
                     span_enqueued.finish()
                     parent_span.finish()
-                continue  # cancelled
+                if self.window is not None:
+                    self.window.release(len(msg.body))
+                return None
+            confirmable = FutureConfirmableRejectable(fut)
 
-            self.tagger.deposit(self.tagger.get_key(),
-                                FutureConfirmableRejectable(fut),
-                                parent_span)
-            assert isinstance(xchg, (six.binary_type, six.text_type))
-            self._pub(msg, xchg, rk, parent_span, span_enqueued, dont_close_span=True)
+        if self.window is not None:
+            confirmable = WindowedConfirmableRejectable(confirmable, self.window,
+                                                        len(msg.body))
+        return confirmable
 
     def _on_cnpub_delivery(self, payload):  # type: (AMQPMethodPayload) -> None
         """
@@ -235,8 +402,37 @@ class Publisher(Channeler, Synchronized):
         elif isinstance(payload, BasicNack):
             self.tagger.nack(payload.delivery_tag, payload.multiple)
 
-    @Synchronized.synchronized
-    def publish(self, message, exchange=b'', routing_key=b'', span=None):
+        if len(self.held) > 0:
+            with self.get_monitor_lock():
+                self._admit_held()
+
+    def _admit_held(self):
+        """
+        Move messages that were held back into the window, for as long as
+        they fit, and send them if possible.
+
+        To be used with ConfirmWindow.QUEUE. Call with the monitor lock.
+        """
+        while len(self.held) > 0 and \
+                self.window.acquire(len(self.held[0].message.body)):
+            self.messages.append(self.held.popleft())
+
+        if self.state == ST_ONLINE:
+            self._mode_cnpub_process_deliveries()
+
+    def _forget_unconfirmed(self, tagger):  # type: (AtomicTagger) -> None
+        """
+        Release the window from messages that the broker won't confirm
+        anymore, because the channel they were sent on is gone.
+        """
+        with tagger.lock:
+            leftovers = list(six.itervalues(tagger.tags))
+        for confirmable, span in leftovers:
+            if isinstance(confirmable, WindowedConfirmableRejectable):
+                self.window.release(confirmable.size)
+
+    def publish(self, message, exchange=b'', routing_key=b'', span=None,
+                callback=None, batch=None, prepared=None):
         """
         Schedule to have a message published.
 
@@ -247,6 +443,15 @@ class Publisher(Channeler, Synchronized):
 
             Returned Future can be cancelled - this will prevent from sending the message, if it hasn't commenced yet.
 
+            If you pass callback or batch, no Future is made and None is returned. Instead, callback
+            will be called with True when the message is ACKed or with False when it's NACKed, or the
+            batch will take this into account. Use these if you publish a lot, since a Future per message
+            is comparatively expensive. Callback is called by the listener thread, so it better be quick.
+
+            If this publisher has a ConfirmWindow that is full, depending on it's policy this will wait
+            for room (without holding the publisher's lock), raise PublishWindowFull, or hold the
+            message back to be sent once there's room.
+
         If mode is MODE_NOACK:
             this function returns None. Messages are dropped on the floor if there's no connection.
 
@@ -255,13 +460,21 @@ class Publisher(Channeler, Synchronized):
         :type exchange: bytes, str or Exchange instance
         :param routing_key: routing key to use
         :param span: optional span, if opentracing is installed
+        :param callback: callable(bool) to call instead of completing a Future, MODE_CNPUB only
+        :param batch: a ConfirmBatch this message belongs to, instead of making a Future, MODE_CNPUB only
+        :type batch: coolamqp.objects.ConfirmBatch
+        :param prepared: PreparedPublish that sends this message, for internal use
         :return: a Future instance, or None
         :raise Publisher.UnusablePublisher: this publisher will never work (eg. MODE_CNPUB on Non-RabbitMQ)
+        :raise ValueError: callback or batch given in MODE_NOACK, both of them given, or the batch is full
+        :raise PublishWindowFull: the confirm window is full, and it's policy is FAIL, or BLOCK
+                                  and there was no room within it's timeout
         """
-        if span is not None:
-            span_enqueued = self.cluster.tracer.start_span('Enqueued', child_of=span)
-        else:
-            span_enqueued = None
+        if callback is not None or batch is not None:
+            if self.mode != Publisher.MODE_CNPUB:
+                raise ValueError(u'Confirming needs MODE_CNPUB')
+            if callback is not None and batch is not None:
+                raise ValueError(u'Pass either callback or batch, not both')
 
         if isinstance(exchange, Exchange):
             exchange = exchange.name.encode('utf8')
@@ -270,6 +483,131 @@ class Publisher(Channeler, Synchronized):
 
         assert isinstance(exchange, six.binary_type)
 
+        window = self.window
+        admitted = False
+        if window is not None and window.policy != ConfirmWindow.QUEUE:
+            # wait before taking the lock, so that the listener thread can
+            # confirm messages in the meantime
+            size = len(message.body)
+            if window.policy == ConfirmWindow.BLOCK:
+                admitted = window.acquire(size, window.timeout)
+            else:
+                admitted = window.acquire(size)
+            if not admitted:
+                raise PublishWindowFull()
+
+        try:
+            if self.loop is not None and not self.loop.is_loop_thread():
+                return self._enqueue(message, exchange, routing_key, span,
+                                     callback, batch, admitted, prepared)
+            return self._publish(message, exchange, routing_key, span,
+                                 callback, batch, admitted, prepared)
+        except BaseException:
+            if admitted:
+                window.release(size)
+            raise
+
+    def _order_for(self, message, exchange, routing_key, span, callback, batch,
+                   prepared=None):
+        """
+        Make a CnpubMessageSendOrder for a message to publish, along with a Future,
+        or with a ConfirmableRejectable to confirm it with.
+
+        :raise ValueError: the batch is full
+        """
+        if span is not None:
+            span_enqueued = self.cluster.tracer.start_span('Enqueued', child_of=span)
+        else:
+            span_enqueued = None
+
+        if batch is not None:
+            batch.add()
+            fut, confirmable = None, batch
+        elif callback is not None:
+            fut, confirmable = None, CallbackConfirmableRejectable(callback)
+        else:
+            fut, confirmable = Future(), None
+
+        return CnpubMessageSendOrder(message, exchange, routing_key, fut, confirmable,
+                                     span, span_enqueued, prepared)
+
+    def _enqueue(self, message, exchange, routing_key, span, callback, batch, admitted,
+                 prepared):
+        """
+        Put the message into the inbox, for the listener thread to send.
+        See .publish()
+
+        :param admitted: whether the message was let into the window already
+        """
+        if self.mode == Publisher.MODE_NOACK:
+            if self.state != ST_ONLINE:
+                logger.debug(u'Publish request, but not connected - dropping the message')
+                return None
+
+            if span is not None:
+                span_enqueued = self.cluster.tracer.start_span('Enqueued', child_of=span)
+            else:
+                span_enqueued = None
+            order = NoackMessageSendOrder(message, exchange, routing_key, span,
+                                          span_enqueued, prepared)
+        else:
+            order = self._order_for(message, exchange, routing_key, span, callback, batch,
+                                    prepared)
+
+        self.inbox.append((admitted, order))
+        self.loop.wakeup()
+        return order.future if self.mode == Publisher.MODE_CNPUB else None
+
+    def _drain_inbox(self):
+        """
+        Send everything that other threads put into the inbox.
+
+        Called by the listener thread once every loop iteration.
+        """
+        if len(self.inbox) == 0:
+            return
+
+        drained = []
+        try:
+            while True:
+                drained.append(self.inbox.popleft())
+        except IndexError:
+            pass
+
+        with self.get_monitor_lock():
+            if self.mode == Publisher.MODE_NOACK:
+                if self.state != ST_ONLINE:
+                    logger.debug(u'Publish request, but not connected - dropping %s messages',
+                                 len(drained))
+                    return
+                frames = []
+                for admitted, order in drained:
+                    self._pub(order.message, order.exchange_name, order.routing_key,
+                              order.parent_span, order.span_enqueued, frames=frames,
+                              prepared=order.prepared)
+                self._send_frames(frames)
+                return
+
+            for admitted, order in drained:
+                if self.window is not None and not admitted:
+                    # ConfirmWindow.QUEUE
+                    self.held.append(order)
+                else:
+                    self.messages.append(order)
+
+            if len(self.held) > 0:
+                self._admit_held()
+            elif self.state == ST_ONLINE:
+                self._mode_cnpub_process_deliveries()
+
+    @Synchronized.synchronized
+    def _publish(self, message, exchange, routing_key, span, callback, batch,
+                 admitted, prepared):
+        """
+        Do the publishing. See .publish()
+
+        :param admitted: whether the message was let into the window already
+        """
         # Formulate the request
         if self.mode == Publisher.MODE_NOACK:
             # If we are not connected right now, drop the message on the floor and log it with DEBUG
@@ -277,21 +615,183 @@ class Publisher(Channeler, Synchronized):
                 logger.debug(
                     u'Publish request, but not connected - dropping the message')
             else:
-                self._pub(message, exchange, routing_key, span, span_enqueued)
+                if span is not None:
+                    span_enqueued = self.cluster.tracer.start_span('Enqueued', child_of=span)
+                else:
+                    span_enqueued = None
+                self._pub(message, exchange, routing_key, span, span_enqueued,
+                          prepared=prepared)
 
         elif self.mode == Publisher.MODE_CNPUB:
-            fut = Future()
+            order = self._order_for(message, exchange, routing_key, span, callback, batch,
+                                    prepared)
+
+            if self.window is not None and not admitted:
+                # ConfirmWindow.QUEUE. Get in line, and check for room only
+                # afterwards, so that a confirm can't slip in between
+                self.held.append(order)
+                self._admit_held()
+            elif self.state == ST_ONLINE and len(self.messages) == 0:
+                # nothing is waiting to be sent before this
+                self._cnpub_send(*order)
+            else:
+                self.messages.append(order)
+
+                if self.state == ST_ONLINE:
+                    self._mode_cnpub_process_deliveries()
 
-            # todo can optimize this not to create an object if ST_ONLINE already
-            cnpo = CnpubMessageSendOrder(message, exchange, routing_key, fut, span, span_enqueued)
-            self.messages.append(cnpo)
+            return order.future
+        else:
+            raise Exception(u'Invalid mode')
+
+    def prepare(self, exchange=b'', routing_key=b'', properties=None):
+        """
+        Prepare to publish many messages with the same exchange, routing key
+        and properties. This is faster than calling .publish() for each.
 
+        :param exchange: exchange name to use. Can also be an Exchange object.
+        :type exchange: bytes, str or Exchange instance
+        :param routing_key: routing key to use
+        :type routing_key: bytes or str
+        :param properties: properties of the messages, empty by default
+        :type properties: MessageProperties instance, None or a dict
+        :return: a PreparedPublish, call it's .send(body) to publish
+        """
+        if isinstance(exchange, Exchange):
+            exchange = exchange.name.encode('utf8')
+        elif isinstance(exchange, six.text_type):
+            exchange = exchange.encode('utf8')
+        if isinstance(routing_key, six.text_type):
+            routing_key = routing_key.encode('utf8')
+        if isinstance(properties, dict):
+            properties = Message.Properties(**properties)
+        elif properties is None:
+            properties = EMPTY_PROPERTIES
+        return PreparedPublish(self, exchange, routing_key, properties)
+
+    def publish_many(self, messages, callback=None, batch=None):
+        """
+        Schedule to have a number of messages published.
+
+        This works like calling .publish() for each of them, but the lock is taken once, and all of the
+        frames are handed to the connection at once, so it's a lot faster for many small messages.
+        Tracing spans are not made for these.
+
+        If mode is MODE_CNPUB, a list of Futures, one per message, is returned. If you pass a callback,
+        it's called for each message, and None is returned. If you pass a batch, that is a ConfirmBatch
+        or True to make one for exactly these messages, it's future is returned.
+
+        If this publisher has a ConfirmWindow with a BLOCK or FAIL policy, messages are sent in parts
+        that fit into it. If some message doesn't fit within the timeout, PublishWindowFull is raised,
+        and the messages before it are sent anyway. The exception tells how many were sent, and
+        carries their Futures or batch. A batch made for these messages is shrunk to them.
+
+        :param messages: iterable of (Message, exchange, routing_key). Exchange can be bytes, str or
+            an Exchange, routing key can be bytes or str.
+        :param callback: callable(bool) to call for each message, MODE_CNPUB only
+        :param batch: a ConfirmBatch, or True, MODE_CNPUB only
+        :return: a list of Futures, a Future, or None
+        :raise ValueError: callback or batch given in MODE_NOACK, both of them given, or the batch
+            is too small
+        :raise PublishWindowFull: the confirm window is full, see .publish()
+        """
+        if callback is not None or batch is not None:
+            if self.mode != Publisher.MODE_CNPUB:
+                raise ValueError(u'Confirming needs MODE_CNPUB')
+            if callback is not None and batch is not None:
+                raise ValueError(u'Pass either callback or batch, not both')
+
+        orders = []
+        for message, exchange, routing_key in messages:
+            if isinstance(exchange, Exchange):
+                exchange = exchange.name.encode('utf8')
+            elif isinstance(exchange, six.text_type):
+                exchange = exchange.encode('utf8')
+            if isinstance(routing_key, six.text_type):
+                routing_key = routing_key.encode('utf8')
+            orders.append((message, exchange, routing_key))
+
+        made_batch = batch is True
+        if made_batch:
+            batch = ConfirmBatch(len(orders))
+        elif batch is not None and batch.published + len(orders) > batch.size:
+            raise ValueError(u'This batch is too small')
+
+        window = self.window
+        if window is None or window.policy == ConfirmWindow.QUEUE:
+            futures = self._publish_many(orders, callback, batch, False)
+        else:
+            futures = []
+            admitted_from = 0  # orders before this were sent already
+            for i, (message, exchange, routing_key) in enumerate(orders):
+                size = len(message.body)
+                if window.acquire(size):
+                    continue
+
+                # send what fits before waiting for more room
+                if i > admitted_from:
+                    futures.extend(self._publish_many(orders[admitted_from:i], callback, batch,
+                                                      True))
+                    admitted_from = i
+
+                if window.policy != ConfirmWindow.BLOCK or \
+                        not window.acquire(size, window.timeout):
+                    if made_batch:
+                        batch.seal()
+                    raise PublishWindowFull(i, futures, batch)
+
+            futures.extend(self._publish_many(orders[admitted_from:], callback, batch, True))
+
+        if self.mode == Publisher.MODE_NOACK or callback is not None:
+            return None
+        elif batch is not None:
+            return batch.future
+        else:
+            return futures
+
+    @Synchronized.synchronized
+    def _publish_many(self, orders, callback, batch, admitted):
+        """
+        Do the publishing. See .publish_many()
+
+        :param orders: list of (Message, exchange name::bytes, routing key::bytes)
+        :param admitted: whether the messages were let into the window already
+        :return: list of Futures made
+        """
+        if self.mode == Publisher.MODE_NOACK:
+            if self.state != ST_ONLINE:
+                logger.debug(u'Publish request, but not connected - dropping the messages')
+            else:
+                frames = []
+                for message, exchange, routing_key in orders:
+                    self._pub(message, exchange, routing_key, frames=frames)
+                self._send_frames(frames)
+            return []
+
+        send_orders = []
+        try:
+            for message, exchange, routing_key in orders:
+                send_orders.append(self._order_for(message, exchange, routing_key, None,
+                                                   callback, batch))
+        except ValueError:
+            # none of them will be sent
+            if batch is not None:
+                batch.discard(len(send_orders))
+            if admitted:
+                for message, exchange, routing_key in orders:
+                    self.window.release(len(message.body))
+            raise
+
+        if self.window is not None and not admitted:
+            # ConfirmWindow.QUEUE
+            self.held.extend(send_orders)
+            self._admit_held()
+        else:
+            self.messages.extend(send_orders)
             if self.state == ST_ONLINE:
                 self._mode_cnpub_process_deliveries()
 
-            return fut
-        else:
-            raise Exception(u'Invalid mode')
+        return [order.future for order in send_orders if order.future is not None]
 
     def on_operational(self, operational):      # type: (bool) -> None
         state = {True: u'up', False: u'down'}[operational]
@@ -336,6 +836,8 @@ class Publisher(Channeler, Synchronized):
         elif (self.mode == Publisher.MODE_CNPUB) and isinstance(payload, ConfirmSelectOk):
             # Because only in this case it makes sense to check for MODE_CNPUB
             # A-OK! Boot it.
+            if self.tagger is not None and self.window is not None:
+                self._forget_unconfirmed(self.tagger)
             self.tagger = AtomicTagger()
             self.state = ST_ONLINE
             self.on_operational(True)
@@ -352,3 +854,7 @@ class Publisher(Channeler, Synchronized):
             mw.oneshot = False
             self.connection.watch(mw)
             self._mode_cnpub_process_deliveries()
+
+            if len(self.held) > 0:
+                with self.get_monitor_lock():
+                    self._admit_held()
@@ -1,11 +1,17 @@
 # coding=UTF-8
 from __future__ import print_function, absolute_import, division
 
+import bisect
+import collections
 import functools
+import itertools
 import logging
 import threading
+import typing as tp
 from concurrent.futures import Future
 
+import six
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,6 +74,177 @@ class FutureConfirmableRejectable(ConfirmableRejectable):
         self.future.set_exception(Exception())
 
 
+class CallbackConfirmableRejectable(ConfirmableRejectable):
+    """
+    A ConfirmableRejectable that calls a callable with True when it's ACK'd,
+    or with False when it's REJECT'd/NACK'd
+    """
+    __slots__ = ('callback',)
+
+    def __init__(self, callback):  # type: (tp.Callable[[bool], None]) -> None
+        self.callback = callback
+
+    def confirm(self):  # type: () -> None
+        self.callback(True)
+
+    def reject(self):  # type: () -> None
+        self.callback(False)
+
+
+class WindowedConfirmableRejectable(ConfirmableRejectable):
+    """
+    Wraps a ConfirmableRejectable of a message that was let into
+    a ConfirmWindow, and lets it out of the window once it's confirmed or
+    rejected.
+    """
+    __slots__ = ('confirmable', 'window', 'size')
+
+    def __init__(self, confirmable,  # type: ConfirmableRejectable
+                 window,  # type: coolamqp.objects.ConfirmWindow
+                 size  # type: int
+                 ):
+        self.confirmable = confirmable
+        self.window = window
+        self.size = size
+
+    def confirm(self):  # type: () -> None
+        try:
+            self.confirmable.confirm()
+        finally:
+            self.window.release(self.size)
+
+    def reject(self):  # type: () -> None
+        try:
+            self.confirmable.reject()
+        finally:
+            self.window.release(self.size)
+
+
+class BytesInterner(object):
+    """
+    A small LRU cache of short byte strings, such as routing keys of
+    received messages, so that equal ones are the same bytes object.
+
+    Not thread safe.
+
+    :param capacity: how many of them to remember
+    """
+    __slots__ = ('capacity', 'cache')
+
+    def __init__(self, capacity=64):  # type: (int) -> None
+        self.capacity = capacity
+        self.cache = collections.OrderedDict()  # type: tp.Dict[bytes, bytes]
+
+    def intern(self, data):  # type: (tp.Union[bytes, memoryview]) -> bytes
+        """
+        :param data: bytes or a memoryview
+        :return: bytes equal to data, the same object for equal data
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            interned = self.cache.pop(data)
+        except KeyError:
+            interned = data
+            if len(self.cache) >= self.capacity:
+                self.cache.popitem(last=False)
+        self.cache[interned] = interned
+        return interned
+
+
+class TagRanges(object):
+    """
+    A set of delivery tags, kept as sorted ranges of consecutive tags.
+
+    Tags of messages that await an ack are mostly consecutive, so this takes
+    just a few ranges. Adding a tag higher than the rest, and discarding the
+    lowest one, are O(1). Other tags are found by bisection.
+
+    Not thread safe.
+    """
+    __slots__ = ('starts', 'stops', 'count')
+
+    def __init__(self):
+        # tags in range(starts[i], stops[i]) are there, ranges don't touch
+        self.starts = []  # type: tp.List[int]
+        self.stops = []  # type: tp.List[int]
+        self.count = 0
+
+    def add(self, tag):  # type: (int) -> None
+        starts, stops = self.starts, self.stops
+        if stops and stops[-1] == tag:
+            stops[-1] += 1  # common case, tags come in order
+        elif not stops or tag > stops[-1]:
+            starts.append(tag)
+            stops.append(tag + 1)
+        else:
+            i = bisect.bisect_right(starts, tag) - 1
+            if i >= 0 and tag < stops[i]:
+                return  # already there
+            joins_left = i >= 0 and stops[i] == tag
+            joins_right = starts[i + 1] == tag + 1
+            if joins_left and joins_right:
+                stops[i] = stops[i + 1]
+                del starts[i + 1]
+                del stops[i + 1]
+            elif joins_left:
+                stops[i] += 1
+            elif joins_right:
+                starts[i + 1] = tag
+            else:
+                starts.insert(i + 1, tag)
+                stops.insert(i + 1, tag + 1)
+        self.count += 1
+
+    def discard(self, tag):  # type: (int) -> bool
+        """
+        :return: whether the tag was there
+        """
+        starts, stops = self.starts, self.stops
+        i = 0 if starts and starts[0] == tag else \
+            bisect.bisect_right(starts, tag) - 1
+        if i < 0 or tag >= stops[i]:
+            return False
+
+        start, stop = starts[i], stops[i]
+        if stop - start == 1:
+            del starts[i]
+            del stops[i]
+        elif tag == start:
+            starts[i] += 1
+        elif tag == stop - 1:
+            stops[i] -= 1
+        else:
+            stops[i] = tag
+            starts.insert(i + 1, tag + 1)
+            stops.insert(i + 1, stop)
+        self.count -= 1
+        return True
+
+    def lowest(self):  # type: () -> tp.Optional[int]
+        """
+        :return: the lowest tag, or None if there are none
+        """
+        return self.starts[0] if self.starts else None
+
+    def __contains__(self, tag):  # type: (int) -> bool
+        i = bisect.bisect_right(self.starts, tag) - 1
+        return i >= 0 and tag < self.stops[i]
+
+    def __iter__(self):  # type: () -> tp.Iterator[int]
+        for start, stop in list(zip(self.starts, self.stops)):
+            for tag in six.moves.range(start, stop):
+                yield tag
+
+    def __len__(self):  # type: () -> int
+        return self.count
+
+    def __repr__(self):  # type: () -> str
+        return 'TagRanges(%s)' % (', '.join(
+            '%d-%d' % (start, stop - 1)
+            for start, stop in zip(self.starts, self.stops)),)
+
+
 class AtomicTagger(object):
     """
     This implements a thread-safe dictionary of (integer=>ConfirmableRejectable | None),
@@ -99,19 +276,25 @@ class AtomicTagger(object):
 
     Note that key/delivery_tag of 0 has special meaning of "everything so far".
 
-    This has to be fast for most common cases. Corner cases will be resolved correctly,
-    but maybe not fast.
+    Tags are kept in a dictionary, so single acks/nacks take O(1). Everything
+    below the low watermark is known to be acked/nacked already, so a multiple
+    ack/nack looks up only the tags between the watermark and the one given,
+    and moves the watermark past it. Since delivery tags are handed out in
+    order, each tag is looked up this way at most once.
     """
-    __slots__ = ('lock', 'next_tag', 'tags')
+    __slots__ = ('lock', 'next_tag', 'tags', 'low_watermark', 'high_watermark')
 
     def __init__(self):
         self.lock = threading.RLock()
 
         # Protected by lock
         self.next_tag = 1  # 0 is AMQP-reserved to mean "everything so far"
-        self.tags = []  # a list of (tag, ConfirmableRejectable)
+        self.tags = {}  # tag => (ConfirmableRejectable, span)
         # they remain to be acked/nacked
-        # invariant: FOR EACH i, j: (i>j) => (tags[i][0] > tags[j][0])
+        # invariant: every tag in self.tags is in
+        # [low_watermark, high_watermark]
+        self.low_watermark = 1
+        self.high_watermark = 0
 
     def deposit(self, tag, obj, span=None):
         """
@@ -125,80 +308,82 @@ class AtomicTagger(object):
                     until you call .ack() or .nack().
         """
         assert tag >= 0
-        opt = (tag, obj, span)
 
         with self.lock:
-            if len(self.tags) == 0:
-                self.tags.append(opt)
-            elif self.tags[-1][0] < tag:
-                self.tags.append(opt)
-            else:
-                # Insert a value at place where it makes sense. Iterate from the end, because
-                # values will usually land there...
-                i = len(self.tags) - 1  # start index
-
-                while i > 0:  # this will terminate at i=0
-                    if self.tags[i][0] > tag:  # this means we should insert it here...
-                        break
-                    i -= 1  # previousl index
+            self.tags[tag] = (obj, span)
+            if tag > self.high_watermark:
+                self.high_watermark = tag
+            if tag < self.low_watermark:
+                self.low_watermark = tag
+
+    def deposit_range(self, items):
+        # type: (tp.List[tp.Tuple[ConfirmableRejectable, tp.Any]]) -> int
+        """
+        Requisition as many consecutive keys as there are items, and deposit
+        the items with them, in order.
 
-                self.tags.insert(i, opt)
+        :param items: list of (ConfirmableRejectable, span or None)
+        :return: the first key used
+        """
+        with self.lock:
+            first = self.next_tag
+            self.next_tag += len(items)
+            self.tags.update(six.moves.zip(
+                six.moves.range(first, self.next_tag), items))
+            if len(items) > 0:
+                self.high_watermark = self.next_tag - 1
+                if first < self.low_watermark:
+                    self.low_watermark = first
+        return first
 
     def __acknack(self, tag, multiple, ack):
         """
         :param tag: Note that 0 means "everything"
         :param ack: True to ack, False to nack
         """
-        # Compute limits - they go from 0 to somewhere
         with self.lock:
-            start = 0
-            # start and stop will signify the PYTHON SLICE parameters
-
-            if tag > 0:
-
-                if multiple:
-                    # Compute the ranges
-                    for stop, opt in enumerate(self.tags):
-                        if opt[0] == tag:
-                            stop += 1  # this is exactly this tag. Adjust stop to end one further (Python slicing) and stop
-                            break
-                        if opt[0] > tag:
-                            break  # We went too far, but it's OK, we don't need to bother with adjusting stop
-                    else:
-                        # List finished without breaking? That would mean the entire range!
-                        stop = len(self.tags)
-                else:
-                    # Just find that piece
-                    for index, opt in enumerate(self.tags):
-                        if opt[0] == tag:
-                            stop = index + 1
-                            break
-                    else:
-                        return  # not found!
-
-                if not multiple:
-                    start = stop - 1
+            tags = self.tags
+            if tag == 0:
+                items = [tags[t] for t in sorted(tags)]
+                tags.clear()
+                self.low_watermark = self.high_watermark + 1
+            elif multiple:
+                stop = min(tag, self.high_watermark) + 1
+                # tags that were acked/nacked singly are gone already
+                items = list(six.moves.filter(None, six.moves.map(
+                    tags.pop, six.moves.range(self.low_watermark, stop),
+                    itertools.repeat(None))))
+                self.low_watermark = max(self.low_watermark, stop)
             else:
-                # Oh, I know the range!
-                stop = len(self.tags)
-
-            items = self.tags[start:stop]
-            del self.tags[start:stop]
-
-        for tag, cr, span in items:
+                try:
+                    items = [tags.pop(tag)]
+                except KeyError:
+                    return  # not found!
+
+                if tag == self.low_watermark:
+                    # advance past whatever was confirmed out of order
+                    low = tag + 1
+                    while low <= self.high_watermark and low not in tags:
+                        low += 1
+                    self.low_watermark = low
+
+        for cr, span in items:
             if span is not None:
                 from opentracing import logs
 
-            if ack:
-                cr.confirm()
-                if span is not None:
-                    span.log_kv({logs.EVENT: 'Ack'})
-                    span.finish()
-            else:
-                cr.reject()
-                if span is not None:
-                    span.log_kv({logs.EVENT: 'Nack'})
-                    span.finish()
+            # a failing callback must not keep the other ones from being called
+            try:
+                if ack:
+                    cr.confirm()
+                else:
+                    cr.reject()
+            except Exception:
+                logger.exception('Callback of a %s message failed',
+                                 'confirmed' if ack else 'rejected')
+
+            if span is not None:
+                span.log_kv({logs.EVENT: 'Ack' if ack else 'Nack'})
+                span.finish()
 
     def ack(self, tag, multiple):
         """
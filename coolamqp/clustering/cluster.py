@@ -15,7 +15,9 @@ from coolamqp.clustering.events import ConnectionLost, MessageReceived, \
     NothingMuch, Event
 from coolamqp.clustering.single import SingleNodeReconnector
 from coolamqp.exceptions import ConnectionDead
-from coolamqp.objects import Exchange, Message, Queue, QueueBind
+from coolamqp.framing.compilation.utilities import format_field_name
+from coolamqp.objects import Exchange, Message, Queue, QueueBind, \
+    ConfirmWindow, ConfirmBatch
 from coolamqp.uplink import ListenerThread
 from coolamqp.utils import monotonic
 
@@ -23,6 +25,8 @@ logger = logging.getLogger(__name__)
 
 nothing_much = NothingMuch()
 
+PROPERTY_NAMES = frozenset(format_field_name(field.name) for field in Message.Properties.FIELDS)
+
 
 # If any spans are spawn here, it's Cluster's job to finish them, except for publish()
 class Cluster(object):
@@ -47,6 +51,17 @@ class Cluster(object):
     :param on_blocked: callable to call when ConnectionBlocked/ConnectionUnblocked is received. It will be
         called with a value of True if connection becomes blocked, and False upon an unblock
     :param tracer: tracer, if opentracing is installed
+    :param confirm_window: a ConfirmWindow that limits how many messages published with confirm=True
+        may wait for the broker to confirm them
+    :type confirm_window: tp.Optional[:class:`coolamqp.objects.ConfirmWindow`]
+    :param coalesce_publishes: if True, messages that other threads publish are passed to the listener
+        thread without locking, and it sends all of them at once every loop iteration. Use this if many
+        threads publish at once. See the coalesce parameter of :class:`coolamqp.attaches.Publisher`
+    :param prewarm_properties: combinations of message properties you are going to use, each an
+        iterable of names of Message.Properties keyword arguments. Classes for these are compiled at
+        .start(), so that it doesn't happen when publishing or receiving. The most common ones are
+        compiled in advance anyway.
+    :raise ValueError: unknown property name in prewarm_properties
     """
 
     # Events you can be informed about
@@ -60,7 +75,10 @@ class Cluster(object):
                  log_frames=None,
                  name=None,  # type: tp.Optional[str]
                  on_blocked=None,  # type: tp.Callable[[bool], None],
-                 tracer=None  # type: opentracing.Traccer
+                 tracer=None,  # type: opentracing.Traccer
+                 confirm_window=None,  # type: tp.Optional[ConfirmWindow]
+                 coalesce_publishes=False,  # type: bool
+                 prewarm_properties=None  # type: tp.Optional[tp.Iterable[tp.Iterable[str]]]
                  ):
         from coolamqp.objects import NodeDefinition
         if isinstance(nodes, NodeDefinition):
@@ -82,6 +100,13 @@ class Cluster(object):
         self.extra_properties = extra_properties
         self.log_frames = log_frames
         self.on_blocked = on_blocked    # type: tp.Optional[tp.Callable[[bool], None]]
+        self.confirm_window = confirm_window    # type: tp.Optional[ConfirmWindow]
+        self.coalesce_publishes = coalesce_publishes    # type: bool
+        self.prewarm_properties = [tuple(names) for names in prewarm_properties or ()]
+        for names in self.prewarm_properties:
+            for name in names:
+                if name not in PROPERTY_NAMES:
+                    raise ValueError(u'Unknown message property %s' % (name,))
         self.connected = False          # type: bool
         self.listener = None            # type: BaseListener
         self.attache_group = None       # type: AttacheGroup
@@ -195,8 +220,10 @@ class Cluster(object):
             child_span = None
         fut = Future()
         fut.set_running_or_notify_cancel()  # it's running right now
-        on_message = on_message or (
-            lambda msg: self.events.put_nowait(MessageReceived(msg)))
+        if on_message is None:
+            # receive them as events right away
+            on_message = self.events.put_nowait
+            kwargs.setdefault('message_class', MessageReceived)
         con = Consumer(queue, on_message, future_to_notify=fut, span=span, *args,
                        **kwargs)
         self.attache_group.add(con)
@@ -231,7 +258,9 @@ class Cluster(object):
                 tx=None,  # type: tp.Optional[bool]
                 confirm=None,  # type: tp.Optional[bool]
                 span=None,  # type: tp.Optional[opentracing.Span]
-                dont_trace=False    # type: bool
+                dont_trace=False,    # type: bool
+                callback=None,  # type: tp.Optional[tp.Callable[[bool], None]]
+                batch=None  # type: tp.Optional[ConfirmBatch]
                 ):  # type: (...) -> tp.Optional[Future]
         """
         Publish a message.
@@ -247,7 +276,16 @@ class Cluster(object):
         :param tx: deprecated, alias for confirm
         :param span: optionally, current span, if opentracing is installed
         :param dont_trace: if set to True, a span won't be generated
-        :return: Future to be finished on completion or None, is confirm/tx was not chosen
+        :param callback: callable(bool) to be called with True when the broker confirms this
+                         message, or with False when it rejects it, instead of finishing a Future.
+                         It's called by the listener thread. Implies confirm=True.
+        :param batch: a ConfirmBatch this message belongs to. It gets notified instead of a
+                      Future per message. Implies confirm=True.
+        :return: Future to be finished on completion or None, is confirm/tx was not chosen,
+                 or callback or batch was given
+        :raise ValueError: callback or batch given with confirm=False, or both of them given,
+                           or batch is full
+        :raise PublishWindowFull: confirm_window is full, see ConfirmWindow
         """
         if self.tracer is not None and not dont_trace:
             span = self._make_span('publish', span)
@@ -271,18 +309,99 @@ class Cluster(object):
         elif confirm is not None:
             tx = confirm
         else:
-            tx = False
+            tx = callback is not None or batch is not None
+
+        if not tx and (callback is not None or batch is not None):
+            raise ValueError(u'callback and batch require confirm=True')
 
         try:
             if tx:
                 clb = self.pub_tr
             else:
                 clb = self.pub_na
-            return clb.publish(message, exchange, routing_key, span)
+            return clb.publish(message, exchange, routing_key, span,
+                               callback=callback, batch=batch)
         except Publisher.UnusablePublisher:
             raise NotImplementedError(
                 u'Sorry, this functionality is not yet implemented!')
 
+    def publish_many(self, messages,  # type: tp.Iterable[tp.Tuple[Message, tp.Union[Exchange, str, bytes], tp.Union[str, bytes]]]
+                     confirm=None,  # type: tp.Optional[bool]
+                     callback=None,  # type: tp.Optional[tp.Callable[[bool], None]]
+                     batch=None  # type: tp.Optional[tp.Union[ConfirmBatch, bool]]
+                     ):  # type: (...) -> tp.Optional[tp.Union[Future, tp.List[Future]]]
+        """
+        Publish a number of messages at once.
+
+        This is a lot faster than calling .publish() for each of them, since they are handed
+        to the connection all at once. No spans are made for these.
+
+        :param messages: iterable of (message, exchange, routing_key). Exchange can be None,
+                         for the default exchange.
+        :param confirm: Whether to publish them using confirms. If you choose so, and pass
+                        neither callback nor batch, you will receive a list of Futures,
+                        one for each message.
+        :param callback: callable(bool) to be called for each message, see .publish().
+                         Implies confirm=True.
+        :param batch: a ConfirmBatch these messages belong to, or True to make one for exactly
+                      these messages. It's future is returned. Implies confirm=True.
+        :return: a list of Futures, a Future or None
+        :raise ValueError: callback or batch given with confirm=False, or both of them given,
+                           or batch is too small
+        :raise PublishWindowFull: confirm_window is full, see ConfirmWindow. Messages before
+                                  the one that didn't fit are published anyway, see
+                                  PublishWindowFull for how to track them.
+        """
+        if confirm is None:
+            confirm = callback is not None or batch is not None
+        elif not confirm and (callback is not None or batch is not None):
+            raise ValueError(u'callback and batch require confirm=True')
+
+        messages = ((message, b'' if exchange is None else exchange, routing_key)
+                    for message, exchange, routing_key in messages)
+
+        if confirm:
+            return self.pub_tr.publish_many(messages, callback=callback, batch=batch)
+        else:
+            return self.pub_na.publish_many(messages)
+
+    def prepare_publish(self, exchange=None,  # type: tp.Union[Exchange, str, bytes]
+                        routing_key=u'',  # type: tp.Union[str, bytes]
+                        properties=None,  # type: tp.Optional[tp.Union[Message.Properties, dict]]
+                        confirm=False  # type: bool
+                        ):  # type: (...) -> coolamqp.attaches.publisher.PreparedPublish
+        """
+        Prepare to publish many messages with the same exchange, routing key and properties.
+
+        Frames for these messages are serialized once, and for every message only it's size is
+        filled in, so this is a lot faster than calling .publish() for each of them.
+        No spans are made for these. Call it after .start().
+
+        .. code-block:: python
+
+            handle = cluster.prepare_publish(u'', u'my_queue', Message.Properties(...))
+            handle.send(b'hello world')
+
+        :param exchange: exchange to use. Default is the "direct" empty-name exchange.
+        :param routing_key: routing key to use
+        :param properties: properties of the messages, empty by default
+        :param confirm: whether to publish using confirms. If so, .send() of the handle
+                        accepts callback and batch, and returns what .publish() does.
+        :return: a PreparedPublish, whose .send(body) publishes a message
+        """
+        if exchange is None:
+            exchange = b''
+
+        if confirm:
+            return self.pub_tr.prepare(exchange, routing_key, properties)
+        else:
+            return self.pub_na.prepare(exchange, routing_key, properties)
+
+    def _prewarm(self):  # type: () -> None
+        """Compile the property list classes given in prewarm_properties"""
+        for names in self.prewarm_properties:
+            Message.Properties.typize(*names)
+
     def start(self, wait=True, timeout=10.0):  # type: (bool, float, bool) -> None
         """
         Connect to broker. Initialize Cluster.
@@ -300,6 +419,8 @@ class Cluster(object):
             raise RuntimeError(u'[%s] This was already called!' % (self.name,))
         self.started = True
 
+        self._prewarm()
+
         self.listener = ListenerThread(name=self.name)
 
         self.attache_group = AttacheGroup()
@@ -317,8 +438,11 @@ class Cluster(object):
             self.snr.on_blocked.add(self.on_blocked)
 
         # Spawn a transactional publisher and a noack publisher
-        self.pub_tr = Publisher(Publisher.MODE_CNPUB, self)
-        self.pub_na = Publisher(Publisher.MODE_NOACK, self)
+        self.pub_tr = Publisher(Publisher.MODE_CNPUB, self,
+                                window=self.confirm_window,
+                                coalesce=self.coalesce_publishes)
+        self.pub_na = Publisher(Publisher.MODE_NOACK, self,
+                                coalesce=self.coalesce_publishes)
         self.decl = Declarer(self)
 
         self.attache_group.add(self.pub_tr)
@@ -44,14 +44,25 @@ class ConnectionLost(Event):
 
 class MessageReceived(ReceivedMessage, Event):
     """
-    Something that works as an ersatz ReceivedMessage, but is an event
+    Something that works as an ersatz ReceivedMessage, but is an event.
+
+    Cluster.consume makes its consumers receive messages as this class
+    straight away, if they are to be put into the events queue.
+    To make one from a ReceivedMessage, use MessageReceived.from_message,
+    or, as before, MessageReceived(msg).
     """
     __slots__ = ()
 
-    def __init__(self, msg):  # type: (ReceivedMessage) -> None
-        """:type msg: ReceivedMessage"""
-        ReceivedMessage.__init__(self, msg.body, msg.exchange_name,
-                                 msg.routing_key,
-                                 properties=msg.properties,
-                                 delivery_tag=msg.delivery_tag,
-                                 ack=msg.ack, nack=msg.nack)
+    def __init__(self, *args, **kwargs):
+        """
+        Takes either the arguments of ReceivedMessage, or a single
+        ReceivedMessage to copy, the way MessageReceived.from_message does.
+        """
+        if len(args) == 1 and not kwargs:
+            msg, = args  # type: ReceivedMessage
+            ReceivedMessage.__init__(self, msg.body, msg.exchange_name,
+                                     msg.routing_key, msg.properties,
+                                     msg.delivery_tag, receiver=msg.receiver)
+            self.acked = msg.acked
+        else:
+            ReceivedMessage.__init__(self, *args, **kwargs)
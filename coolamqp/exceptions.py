@@ -1,9 +1,12 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
+import typing as tp
+
 from coolamqp.framing.definitions import HARD_ERRORS, RESOURCE_LOCKED
 
-__all__ = ['HARD_ERRORS', 'RESOURCE_LOCKED', 'CoolAMQPError', 'ConnectionDead', 'AMQPError']
+__all__ = ['HARD_ERRORS', 'RESOURCE_LOCKED', 'CoolAMQPError', 'ConnectionDead', 'AMQPError',
+           'PublishWindowFull']
 
 
 class CoolAMQPError(Exception):
@@ -17,6 +20,29 @@ class ConnectionDead(CoolAMQPError):
     """
 
 
+class PublishWindowFull(CoolAMQPError):
+    """
+    The message could not be published, because too many messages wait for
+    the broker to confirm them. See ConfirmWindow.
+
+    If publish_many() raises it, the messages before the one that didn't fit
+    were published anyway. Then:
+
+    :ivar sent: number of messages that were published
+    :ivar futures: Futures of these messages, if publish_many() was to
+        return Futures, else an empty list
+    :ivar batch: the ConfirmBatch they were published with, or None. If
+        publish_many() made it, it's shrunk to these messages.
+    """
+
+    def __init__(self, sent=0, futures=None, batch=None):
+        # type: (int, tp.Optional[tp.List[Future]], tp.Optional[coolamqp.objects.ConfirmBatch]) -> None
+        super(PublishWindowFull, self).__init__()
+        self.sent = sent
+        self.futures = futures or []
+        self.batch = batch
+
+
 class AMQPError(CoolAMQPError):
     """
     Base class for errors received from AMQP server
@@ -1,6 +1,7 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
+import io
 import typing as tp
 
 AMQP_HELLO_HEADER = b'AMQP\x00\x00\x09\x01'
@@ -88,6 +89,70 @@ class AMQPClass(object):
     __slots__ = ()
 
 
+class LazyDispatchTable(dict):
+    """
+    A dictionary of classes that are made upon first lookup.
+
+    It's given names of the classes, and a callable that makes a class given
+    it's name. Lookups, membership tests and iteration all behave as if the
+    classes were made in advance.
+
+    :param load: callable(name) that returns the class
+    :param names: dictionary of key => name of the class
+    """
+    __slots__ = ('load', 'names')
+
+    def __init__(self, load, names):
+        # type: (tp.Callable[[str], type], tp.Dict[tp.Any, str]) -> None
+        super(LazyDispatchTable, self).__init__()
+        self.load = load
+        self.names = names
+
+    def __missing__(self, key):
+        value = self[key] = self.load(self.names[key])
+        return value
+
+    def __contains__(self, key):
+        return key in self.names or dict.__contains__(self, key)
+
+    def __len__(self):  # type: () -> int
+        return len(self.load_all())
+
+    def __iter__(self):
+        return iter(self.load_all())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.load_all().keys()
+
+    def values(self):
+        return self.load_all().values()
+
+    def items(self):
+        return self.load_all().items()
+
+    def copy(self):  # type: () -> LazyDispatchTable
+        table = LazyDispatchTable(self.load, dict(self.names))
+        dict.update(table, dict.items(self))
+        return table
+
+    def load_all(self):  # type: () -> dict
+        """
+        Make all the classes that were not made yet.
+
+        :return: a plain dictionary of them
+        """
+        for key in self.names:
+            if not dict.__contains__(self, key):
+                self[key]
+        return dict(dict.items(self))
+
+
 class AMQPContentPropertyList(object):
     """
     A class is intmately bound with content and content properties.
@@ -95,16 +160,19 @@ class AMQPContentPropertyList(object):
     WARNING: BE PREPARED that if you receive a content from the network,
     string values will be memoryviews. Use .tobytes() to correct that.
     If YOU create a property list, they will be bytes all right.
+
+    Property lists are immutable, and serialize themselves only once. Their
+    fields can't be set, and a table (ie. headers) must not be changed after
+    it's been passed here.
     """
     PROPERTIES = []
     __slots__ = ()
 
-    # todo they are immutable, so they could just serialize themselves...
-
     def __str__(self):  # type: () -> str
         values = {}
-        for field_name in self.__class__.__slots__:
-            values[field_name] = getattr(self, field_name)
+        for slot in self.__class__.__slots__:
+            if slot != '_serialized':
+                values[slot[1:]] = getattr(self, slot)
         return '<AMQPContentPropertyList (%s)>' % (values, )
 
     def get(self, property_name, default=None):
@@ -134,8 +202,22 @@ class AMQPContentPropertyList(object):
         # possible bit field
         return property_flags
 
+    def serialize(self):  # type: () -> bytes
+        """
+        Return flags + values serialized. This is done only on the first call.
+        """
+        if self._serialized is None:
+            buf = io.BytesIO()
+            self.write_fields_to(buf)
+            self._serialized = buf.getvalue()
+        return self._serialized
+
     def write_to(self, buf):
         """Serialize itself (flags + values) to a buffer"""
+        buf.write(self.serialize())
+
+    def write_fields_to(self, buf):
+        """Serialize flags + values to a buffer, without caching them"""
         raise Exception(u'This is an abstract method')
 
     @staticmethod
@@ -155,7 +237,7 @@ class AMQPContentPropertyList(object):
 
         :return: int
         """
-        raise Exception(u'This is an abstract method')
+        return len(self.serialize())
 
 
 class AMQPMethodPayload(AMQPPayload):
@@ -191,6 +273,18 @@ class AMQPMethodPayload(AMQPPayload):
         """
         raise NotImplementedError()
 
+    def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+        """
+        Write the argument portion of this frame into a bytearray.
+
+        :param buf: bytearray to write to, at least get_size() bytes long
+            past offset
+        :param offset: where to start writing
+        :return: offset just past the arguments
+        :raise ValueError: some field here is invalid!
+        """
+        raise NotImplementedError()
+
     @classmethod
     def from_buffer(cls, buf, offset):  # type: (buffer, int) -> AMQPMethodPayload
         """
@@ -1,14 +1,16 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
-from coolamqp.framing.field_table import deframe_table
+from coolamqp.framing.field_table import deframe_table, enframe_table, \
+    deframe_lazy_table
 
 """Generate serializers/unserializers/length getters for given property_flags"""
+import operator
 import six
 import struct
 import logging
-from coolamqp.framing.compilation.textcode_fields import get_counter, \
-    get_from_buffer, get_serializer
+from coolamqp.framing.compilation.textcode_fields import get_from_buffer, \
+    get_serializer
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +18,10 @@ INIT_I = u'\n    def __init__(self, %s):\n'
 SLOTS_I = u'\n    __slots__ = (%s)\n'
 FROM_BUFFER_1 = u'    def from_buffer(cls, buf, start_offset):\n        ' \
                 u'offset = start_offset + %s\n'
-ASSIGN_A = u'        self.%s = %s\n'
-STARTER = u'''from coolamqp.framing.base import AMQPContentPropertyList
-
-class ParticularContentTypeList(AMQPContentPropertyList):
+ASSIGN_A = u'        self._%s = %s\n'
+PROPERTY_A = u"    %s = property(attrgetter('_%s'))\n"
+STARTER = u'''
+class %s(AMQPContentPropertyList):
     """
     For fields:
 '''
@@ -29,22 +31,24 @@ ZPF_S = u'''
 '''
 NB = u"raise NotImplementedError('I don't support bits in properties')"
 INTER_X = u'    * %s::%s'
-BUF_WRITE_A = u'\n    def write_to(self, buf):\n        buf.write('
+BUF_WRITE_A = u'\n    def write_fields_to(self, buf):\n        buf.write('
 RESERVED = u' (reserved)'
 UNICO = u"u'%s'"
 SPACER = u'''
     """
 '''
-GET_SIZE_HEADER = u'\n    def get_size(self):\n'
 
 
-def _compile_particular_content_property_list_class(zpf, fields):
+def _compile_particular_content_property_list_class(zpf, fields,
+                                                    class_name=u'ParticularContentTypeList'):
     """
     Compile a particular content property list.
 
     Particularity stems from
     :param zpf: zero property list, as bytearray
     :param fields: list of all possible fields in this content property
+    :param class_name: name of the class to define
+    :return: tuple of (source of the class, structers it needs)
     """
     from coolamqp.framing.compilation.utilities import format_field_name
 
@@ -73,7 +77,7 @@ def _compile_particular_content_property_list_class(zpf, fields):
     zpf_bits = [zpf_bit or field.type == 'bit' for zpf_bit, field in
                 zip(zpf_bits, fields)]
 
-    mod = [STARTER]
+    mod = [STARTER % (class_name,)]
 
     for field in fields:
         mod.append(
@@ -91,25 +95,31 @@ def _compile_particular_content_property_list_class(zpf, fields):
 
     mod.append(SPACER)
 
-    if len(present_fields) == 0:
-        slots = u''
-    else:
-        slots = (u', '.join(
-            (UNICO % format_field_name(field.name) for field in
-             present_fields))) + u', '
+    # values are kept in underscored slots, and exposed read-only, so that
+    # the serialized form can be cached
+    slots = u''.join((UNICO % (u'_' + format_field_name(field.name),)) + u', '
+                     for field in present_fields) + UNICO % (u'_serialized',) + u', '
 
     mod.append(SLOTS_I % slots)
 
     mod.append(ZPF_S % (x,))
 
+    if len(present_fields) > 0:
+        mod.append(u'\n')
+    for field in present_fields:
+        mod.append(PROPERTY_A.replace(u'%s', format_field_name(field.name)))
+
     FFN = u', '.join(format_field_name(field.name) for field in present_fields)
 
     if len(present_fields) > 0:
         mod.append(INIT_I % (FFN,))
+    else:
+        mod.append(u'\n    def __init__(self):\n')
 
     for field in present_fields:
         mod.append(ASSIGN_A.replace(u'%s', format_field_name(
             field.name)))
+    mod.append(u'        self._serialized = None\n')
 
     # Let's do write_to
     mod.append(BUF_WRITE_A)
@@ -119,7 +129,7 @@ def _compile_particular_content_property_list_class(zpf, fields):
     mod.append(repred_zpf)
     mod.append(u')\n')
 
-    line, new_structers = get_serializer(present_fields, prefix=u'self.', indent_level=2)
+    line, new_structers = get_serializer(present_fields, prefix=u'self._', indent_level=2)
     structers.update(new_structers)
     mod.append(line)
 
@@ -131,17 +141,11 @@ def _compile_particular_content_property_list_class(zpf, fields):
             zpf_length,))
     line, new_structers = get_from_buffer(
         present_fields
-        , prefix='', indent_level=2)
+        , prefix='', indent_level=2, lazy_tables=True)
     structers.update(new_structers)
     mod.append(line)
     mod.append(u'        return cls(%s)\n' % (FFN,))
 
-    # get_size
-    mod.append(GET_SIZE_HEADER)
-    mod.append(get_counter(present_fields, prefix=u'self.', indent_level=2)[
-               :-1])  # skip eol
-    mod.append(u' + %s\n' % (zpf_length,))  # account for pf length
-
     return u''.join(mod), structers
 
 
@@ -153,9 +157,13 @@ def compile_particular_content_property_list_class(zpf, fields):
     global STRUCTERS_FOR_NOW
 
     q, structers = _compile_particular_content_property_list_class(zpf, fields)
+    # the source needs no imports, everything is provided here
     locals_ = {
         'AMQPContentPropertyList': AMQPContentPropertyList,
         'deframe_table': deframe_table,
+        'enframe_table': enframe_table,
+        'deframe_lazy_table': deframe_lazy_table,
+        'attrgetter': operator.attrgetter,
     }
     for structer in structers:
         if structer not in STRUCTERS_FOR_NOW:
@@ -10,7 +10,8 @@ a module that has following ok:
     * indent_level is in multiple of fours
     * following imports exists:
         * import struct
-        * from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size
+        * from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size,
+          enframe_table_into, deframe_lazy_table
     * local variables buf and offset exist
     * local variable start_offset can be created
 
@@ -18,6 +19,8 @@ a module that has following ok:
 from __future__ import absolute_import, division, print_function
 
 import math
+import struct
+import typing as tp
 
 from coolamqp.framing.base import BASIC_TYPES
 from coolamqp.framing.compilation.utilities import format_field_name
@@ -70,10 +73,12 @@ def get_counter(fields, prefix=u'', indent_level=2):
 
 
 # type: (...) -> tp.Tuple[str, dict]
-def get_from_buffer(fields, prefix='', indent_level=2, remark=False):
+def get_from_buffer(fields, prefix='', indent_level=2, remark=False,
+                    lazy_tables=False):
     """
     Emit code that collects values from buf:offset, updating offset as progressing.
     :param remark: BE FUCKING VERBOSE! #DEBUG
+    :param lazy_tables: read tables as LazyTables, with deframe_lazy_table
     """
     code = []
     structers = {}
@@ -103,12 +108,12 @@ def get_from_buffer(fields, prefix='', indent_level=2, remark=False):
             emit('offset += 1')
         else:
             to_struct.append(('_bit', 'B'))
+            ln['ln'] += 1
             emit_structures(dont_do_bits=True)
 
             for multiplier, bit in enumerate(bits):
                 if bit != '_':
-                    emit("%s = bool(_bit >> %s)", bit, multiplier)
-            emit('offset += 1')
+                    emit("%s = bool(_bit & %s)", bit, 1 << multiplier)
 
         del bits[:]
 
@@ -158,7 +163,8 @@ def get_from_buffer(fields, prefix='', indent_level=2, remark=False):
             assert len(bits) == 0
             assert len(to_struct) == 0
 
-            emit("%s, delta = deframe_table(buf, offset)", fieldname)
+            emit("%s, delta = %s(buf, offset)", fieldname,
+                 'deframe_lazy_table' if lazy_tables else 'deframe_table')
             emit("offset += delta")
         else:  # longstr or shortstr
             f_q, f_l = ('L', 4) if field.basic_type == u'longstr' else ('B', 1)
@@ -180,36 +186,35 @@ def get_from_buffer(fields, prefix='', indent_level=2, remark=False):
     return u''.join(code), structers
 
 
-def get_serializer(fields, prefix='', indent_level=2):  # type: (list, str) -> str, dict
+def _get_serialization_steps(fields, prefix):
+    # type: (list, str) -> tp.List[tuple]
     """
-    Emit code that serializes the fields into buf at offset
+    Plan how to serialize the fields.
 
-    :param fields: list of Field instances
-    :param prefix: pass "self." is inside a class
-    :return: block of code that does that, dictionary of struct-ers
-    """
-    code = []
-    structers = {}
-
-    def emit(fmt, *args):
-        args = list(args)
-        code.append(u'    ' * indent_level)
-        while len(args) > 0:
-            fmt = fmt.replace('%s', args[0], 1)
-            del args[0]
-        code.append(fmt)
-        code.append('\n')
+    Consecutive fixed-width fields, bits, reserved fields and the length
+    prefix of a string that follows them are fused into a single struct.
 
+    :return: a list of steps, each being one of:
+        ('struct', format, list of arguments as code),
+        ('bytes', value as code),
+        ('table', value as code)
+    """
+    steps = []
     formats = []
     format_args = []
     bits = []
 
+    def add_pad(length):
+        if formats and formats[-1].endswith('x'):
+            length += int(formats.pop()[:-1])
+        formats.append('%sx' % (length,))
+
     def emit_bits():
-        p = []
-        formats.append('B')
         if all(bit_name == 'False' for bit_name in bits):
-            format_args.append('0')
+            add_pad(1)
         else:
+            formats.append('B')
+            p = []
             for bit_name, modif in zip(bits, range(8)):
                 if bit_name != 'False':
                     p.append('(' + bit_name + ' << %s)' % (
@@ -218,11 +223,8 @@ def get_serializer(fields, prefix='', indent_level=2):  # type: (list, str) -> s
         del bits[:]
 
     def emit_single_struct_pack():
-        formats_str = u''.join(formats)
-        if formats_str not in structers:
-            structers[formats_str] = formats_str
-        emit("buf.write(STRUCT_%s.pack(%s))", formats_str,
-             u', '.join(format_args))
+        if formats:
+            steps.append(('struct', u''.join(formats), list(format_args)))
         del formats[:]
         del format_args[:]
 
@@ -238,28 +240,117 @@ def get_serializer(fields, prefix='', indent_level=2):  # type: (list, str) -> s
             else:
                 bits.append(nam)
         elif field.reserved:
-            # Just pasta
-            emit('buf.write(%s)', BASIC_TYPES[field.basic_type][2])
+            # Just zeroes
+            add_pad(BASIC_TYPES[field.basic_type][3])
+        elif field.basic_type in ('shortstr', 'longstr'):
+            formats.append('B' if field.basic_type == 'shortstr' else 'I')
+            format_args.append('len(' + nam + ')')
+            emit_single_struct_pack()
+            steps.append(('bytes', nam))
+        elif field.basic_type == 'table':
+            emit_single_struct_pack()
+            steps.append(('table', nam))
         else:
-            if field.basic_type in ('shortstr', 'longstr'):
-                formats.append('B' if field.basic_type == 'shortstr' else 'I')
-                format_args.append('len(' + nam + ')')
-                emit_single_struct_pack()
-                emit('buf.write(%s)', nam)
-            elif field.basic_type == 'table':
-                if len(bits) > 0:
-                    emit_bits()
-                if len(formats) > 0:
-                    emit_single_struct_pack()
-                emit('enframe_table(buf, %s)', nam)
-            else:
-                formats.append(BASIC_TYPES[field.basic_type][1])
-                format_args.append(nam)
+            formats.append(BASIC_TYPES[field.basic_type][1])
+            format_args.append(nam)
 
     if len(bits) > 0:
         emit_bits()
-    if len(formats) > 0:
-        emit_single_struct_pack()
+    emit_single_struct_pack()
+    return steps
+
+
+def get_serializer(fields, prefix='', indent_level=2):  # type: (list, str) -> str, dict
+    """
+    Emit code that serializes the fields into buf, a file-like object.
+
+    Everything up to the next table is written with a single buf.write.
+
+    :param fields: list of Field instances
+    :param prefix: pass "self." is inside a class
+    :return: block of code that does that, dictionary of struct-ers
+    """
+    code = []
+    structers = {}
+    parts = []
+
+    def emit(fmt, *args):
+        code.append(u'    ' * indent_level)
+        code.append(fmt % args)
+        code.append('\n')
+
+    def emit_write():
+        if len(parts) == 1:
+            emit('buf.write(%s)', parts[0])
+        elif len(parts) > 1:
+            emit('buf.write(b"".join((%s)))', u', '.join(parts))
+        del parts[:]
+
+    for step in _get_serialization_steps(fields, prefix):
+        if step[0] == 'struct':
+            kind, fmt, args = step
+            if args:
+                structers[fmt] = fmt
+                parts.append(u'STRUCT_%s.pack(%s)' % (fmt, u', '.join(args)))
+            else:
+                parts.append(repr(struct.pack('!' + fmt)))
+        elif step[0] == 'bytes':
+            parts.append(step[1])
+        else:
+            emit_write()
+            emit('enframe_table(buf, %s)', step[1])
+    emit_write()
+
+    emit('')  # eol
+
+    return u''.join(code), structers
+
+
+def get_serializer_into(fields, prefix='', indent_level=2):
+    # type: (list, str) -> str, dict
+    """
+    Emit code that serializes the fields into buf, a bytearray, starting at
+    offset, and returns the offset just past them.
+
+    :param fields: list of Field instances
+    :param prefix: pass "self." is inside a class
+    :return: block of code that does that, dictionary of struct-ers
+    """
+    code = []
+    structers = {}
+
+    def emit(fmt, *args):
+        code.append(u'    ' * indent_level)
+        code.append(fmt % args)
+        code.append('\n')
+
+    steps = _get_serialization_steps(fields, prefix)
+    for i, step in enumerate(steps):
+        last = i == len(steps) - 1
+        if step[0] == 'struct':
+            kind, fmt, args = step
+            if not last and steps[i + 1][0] == 'bytes':
+                # the length prefix of the string that follows
+                emit('ln = %s', args[-1])
+                args = args[:-1] + ['ln']
+            structers[fmt] = fmt
+            emit('STRUCT_%s.pack_into(%s)', fmt,
+                 u', '.join(['buf', 'offset'] + args))
+            if last:
+                emit('return offset + %s', struct.calcsize('!' + fmt))
+            else:
+                emit('offset += %s', struct.calcsize('!' + fmt))
+        elif step[0] == 'bytes':
+            emit('buf[offset:offset + ln] = %s', step[1])
+            emit('return offset + ln' if last else 'offset += ln')
+        else:
+            if last:
+                emit('return enframe_table_into(buf, offset, %s)', step[1])
+            else:
+                emit('offset = enframe_table_into(buf, offset, %s)', step[1])
+
+    if not steps:
+        emit('return offset')
 
     emit('')  # eol
 
@@ -27,10 +27,13 @@ import struct
 import collections
 import logging
 import six
+import sys
+import threading
 import typing as tp
+from operator import attrgetter
 
-from coolamqp.framing.base import AMQPClass, AMQPMethodPayload, AMQPContentPropertyList
-from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size
+from coolamqp.framing.base import AMQPClass, AMQPMethodPayload, AMQPContentPropertyList, LazyDispatchTable
+from coolamqp.framing.field_table import enframe_table, deframe_table, frame_table_size, enframe_table_into, deframe_lazy_table
 from coolamqp.framing.compilation import compile_particular_content_property_list_class
 
 logger = logging.getLogger(__name__)
@@ -208,1870 +211,2223 @@ class Connection(AMQPClass):
     INDEX = 10
 
 
-class ConnectionBlocked(AMQPMethodPayload):
-    """
-    This method indicates that a connection has been blocked
-    
-    and does not accept new publishes.
-
-    :type reason: binary type (max length 255) (shortstr in AMQP)
-    """
-    __slots__ = (u'reason', )
+def _make_ConnectionBlocked():
 
-    NAME = u'connection.blocked'
-
-    INDEX = (10, 60)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x3C'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+    class ConnectionBlocked(AMQPMethodPayload):
+        """
+        This method indicates that a connection has been blocked
+    
+        and does not accept new publishes.
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        :type reason: binary type (max length 255) (shortstr in AMQP)
+        """
+        __slots__ = (u'reason', )
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reason', u'shortstr', u'shortstr', reserved=False),
-    ]
+        NAME = u'connection.blocked'
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        INDEX = (10, 60)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x3C'  # CLASS ID + METHOD ID
 
-        :return: Python string representation
-        """
-        return 'ConnectionBlocked(%s)' % (', '.join(map(
-            to_repr, [self.reason])))
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    def __init__(self, reason):
-        """
-        Create frame connection.blocked
-        """
-        self.reason = reason
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.reason)))
-        buf.write(self.reason)
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reason', u'shortstr', u'shortstr', reserved=False),
+        ]
 
-    def get_size(self):  # type: () -> int
-        return 1 + len(self.reason)
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionBlocked
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        reason = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(reason)
+            :return: Python string representation
+            """
+            return 'ConnectionBlocked(%s)' % (', '.join(
+                map(to_repr, [self.reason])))
 
+        def __init__(self, reason):
+            """
+            Create frame connection.blocked
+            """
+            self.reason = reason
 
-class ConnectionClose(AMQPMethodPayload):
-    """
-    Request a connection close
-    
-    This method indicates that the sender wants to close the
-    connection. This may be
-    due to internal conditions (e.g. a forced shut-down) or due to
-    an error handling
-    a specific method, i.e. an exception. When a close is due to an
-    exception, the
-    sender provides the class and method id of the method which
-    caused the exception.
-
-    :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
-    :type reply_text: binary type (max length 255) (reply-text in AMQP)
-    :param class_id: Failing method class
-            When the close is provoked by a method exception, this is
-            the class of the
-            method.
-    :type class_id: int, 16 bit unsigned (class-id in AMQP)
-    :param method_id: Failing method id
-            When the close is provoked by a method exception, this is
-            the ID of the method.
-    :type method_id: int, 16 bit unsigned (method-id in AMQP)
-    """
-    __slots__ = (
-        u'reply_code',
-        u'reply_text',
-        u'class_id',
-        u'method_id',
-    )
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join((STRUCT_B.pack(len(self.reason)), self.reason)))
 
-    NAME = u'connection.close'
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.reason)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.reason
+            return offset + ln
 
-    INDEX = (10, 50)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x32'  # CLASS ID + METHOD ID
+        def get_size(self):  # type: () -> int
+            return 1 + len(self.reason)
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionBlocked
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            reason = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(reason)
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    return ConnectionBlocked
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reply-code', u'reply-code', u'short', reserved=False),
-        Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
-        Field(u'class-id', u'class-id', u'short', reserved=False),
-        Field(u'method-id', u'method-id', u'short', reserved=False),
-    ]
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+def _make_ConnectionClose():
 
-        :return: Python string representation
+    class ConnectionClose(AMQPMethodPayload):
         """
-        return 'ConnectionClose(%s)' % (', '.join(
-            map(to_repr, [
-                self.reply_code, self.reply_text, self.class_id, self.method_id
-            ])))
+        Request a connection close
+    
+        This method indicates that the sender wants to close the
+        connection. This may be
+        due to internal conditions (e.g. a forced shut-down) or due to
+        an error handling
+        a specific method, i.e. an exception. When a close is due to an
+        exception, the
+        sender provides the class and method id of the method which
+        caused the exception.
+
+        :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
+        :type reply_text: binary type (max length 255) (reply-text in AMQP)
+        :param class_id: Failing method class
+                When the close is provoked by a method exception, this is
+                the class of the
+                method.
+        :type class_id: int, 16 bit unsigned (class-id in AMQP)
+        :param method_id: Failing method id
+                When the close is provoked by a method exception, this is
+                the ID of the method.
+        :type method_id: int, 16 bit unsigned (method-id in AMQP)
+        """
+        __slots__ = (
+            u'reply_code',
+            u'reply_text',
+            u'class_id',
+            u'method_id',
+        )
+
+        NAME = u'connection.close'
+
+        INDEX = (10, 50)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x32'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reply-code', u'reply-code', u'short', reserved=False),
+            Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
+            Field(u'class-id', u'class-id', u'short', reserved=False),
+            Field(u'method-id', u'method-id', u'short', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionClose(%s)' % (', '.join(
+                map(to_repr, [
+                    self.reply_code, self.reply_text, self.class_id,
+                    self.method_id
+                ])))
+
+        def __init__(self, reply_code, reply_text, class_id, method_id):
+            """
+            Create frame connection.close
+            """
+            self.reply_code = reply_code
+            self.reply_text = reply_text
+            self.class_id = class_id
+            self.method_id = method_id
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_HB.pack(self.reply_code,
+                                len(self.reply_text)), self.reply_text,
+                 STRUCT_HH.pack(self.class_id, self.method_id))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.reply_text)
+            STRUCT_HB.pack_into(buf, offset, self.reply_code, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.reply_text
+            offset += ln
+            STRUCT_HH.pack_into(buf, offset, self.class_id, self.method_id)
+            return offset + 4
+
+        def get_size(self):  # type: () -> int
+            return 7 + len(self.reply_text)
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionClose
+            offset = start_offset
+            reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
+            offset += 3
+            reply_text = buf[offset:offset + s_len]
+            offset += s_len
+            class_id, method_id, = STRUCT_HH.unpack_from(buf, offset)
+            offset += 4
+            return cls(reply_code, reply_text, class_id, method_id)
+
+    return ConnectionClose
+
+
+def _make_ConnectionCloseOk():
+
+    class ConnectionCloseOk(AMQPMethodPayload):
+        """
+        Confirm a connection close
+    
+        This method confirms a Connection.Close method and tells the
+        recipient that it is
+        safe to release resources for the connection and close the
+        socket.
 
-    def __init__(self, reply_code, reply_text, class_id, method_id):
-        """
-        Create frame connection.close
         """
-        self.reply_code = reply_code
-        self.reply_text = reply_text
-        self.class_id = class_id
-        self.method_id = method_id
+        __slots__ = ()
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_HB.pack(self.reply_code, len(self.reply_text)))
-        buf.write(self.reply_text)
-        buf.write(STRUCT_HH.pack(self.class_id, self.method_id))
+        NAME = u'connection.close-ok'
 
-    def get_size(self):  # type: () -> int
-        return 7 + len(self.reply_text)
+        INDEX = (10, 51)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x33'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionClose
-        offset = start_offset
-        reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
-        offset += 3
-        reply_text = buf[offset:offset + s_len]
-        offset += s_len
-        class_id, method_id, = STRUCT_HH.unpack_from(buf, offset)
-        offset += 4
-        return cls(reply_code, reply_text, class_id, method_id)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-class ConnectionCloseOk(AMQPMethodPayload):
-    """
-    Confirm a connection close
-    
-    This method confirms a Connection.Close method and tells the
-    recipient that it is
-    safe to release resources for the connection and close the
-    socket.
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    """
-    __slots__ = ()
+            :return: Python string representation
+            """
+            return 'ConnectionCloseOk(%s)' % (', '.join(map(to_repr, [])))
 
-    NAME = u'connection.close-ok'
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionCloseOk
+            offset = start_offset
+            return cls()
 
-    INDEX = (10, 51)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x33'  # CLASS ID + METHOD ID
+    return ConnectionCloseOk
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+def _make_ConnectionOpen():
 
-    def __repr__(self):  # type: () -> str
+    class ConnectionOpen(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Open connection to virtual host
+    
+        This method opens a connection to a virtual host, which is a
+        collection of
+        resources, and acts to separate multiple application domains
+        within a server.
+        The server may apply arbitrary limits per virtual host, such as
+        the number
+        of each type of entity that may be used, per connection and/or
+        in total.
+
+        :param virtual_host: Virtual host name
+                The name of the virtual host to work with.
+        :type virtual_host: binary type (max length 255) (path in AMQP)
+        """
+        __slots__ = (u'virtual_host', )
+
+        NAME = u'connection.open'
+
+        INDEX = (10, 40)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x28'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'virtual-host', u'path', u'shortstr', reserved=False),
+            Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
+            Field(u'reserved-2', u'bit', u'bit', reserved=True),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionOpen(%s)' % (', '.join(
+                map(to_repr, [self.virtual_host])))
+
+        def __init__(self, virtual_host):
+            """
+            Create frame connection.open
+            """
+            self.virtual_host = virtual_host
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join((STRUCT_B.pack(len(self.virtual_host)),
+                                self.virtual_host, b'\x00\x00')))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.virtual_host)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.virtual_host
+            offset += ln
+            STRUCT_2x.pack_into(buf, offset)
+            return offset + 2
+
+        def get_size(self):  # type: () -> int
+            return 3 + len(self.virtual_host)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ConnectionOpen
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            virtual_host = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            offset += s_len  # reserved field!
+            offset += 1
+            return cls(virtual_host)
+
+    return ConnectionOpen
+
+
+def _make_ConnectionOpenOk():
+
+    class ConnectionOpenOk(AMQPMethodPayload):
+        """
+        Signal that connection is ready
+    
+        This method signals to the client that the connection is ready
+        for use.
 
-        :return: Python string representation
         """
-        return 'ConnectionCloseOk(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionCloseOk
-        offset = start_offset
-        return cls()
+        NAME = u'connection.open-ok'
 
+        INDEX = (10, 41)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x29'  # CLASS ID + METHOD ID
 
-class ConnectionOpen(AMQPMethodPayload):
-    """
-    Open connection to virtual host
-    
-    This method opens a connection to a virtual host, which is a
-    collection of
-    resources, and acts to separate multiple application domains
-    within a server.
-    The server may apply arbitrary limits per virtual host, such as
-    the number
-    of each type of entity that may be used, per connection and/or
-    in total.
-
-    :param virtual_host: Virtual host name
-            The name of the virtual host to work with.
-    :type virtual_host: binary type (max length 255) (path in AMQP)
-    """
-    __slots__ = (u'virtual_host', )
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    NAME = u'connection.open'
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x29\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    INDEX = (10, 40)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x28'  # CLASS ID + METHOD ID
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
+        ]
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+            :return: Python string representation
+            """
+            return 'ConnectionOpenOk(%s)' % (', '.join(map(to_repr, [])))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'virtual-host', u'path', u'shortstr', reserved=False),
-        Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
-        Field(u'reserved-2', u'bit', u'bit', reserved=True),
-    ]
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionOpenOk
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            offset += s_len  # reserved field!
+            return cls()
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    return ConnectionOpenOk
 
-        :return: Python string representation
-        """
-        return 'ConnectionOpen(%s)' % (', '.join(
-            map(to_repr, [self.virtual_host])))
 
-    def __init__(self, virtual_host):
+def _make_ConnectionStart():
+
+    class ConnectionStart(AMQPMethodPayload):
         """
-        Create frame connection.open
+        Start connection negotiation
+    
+        This method starts the connection negotiation process by telling
+        the client the
+        protocol version that the server proposes, along with a list of
+        security mechanisms
+        which the client can use for authentication.
+
+        :param version_major: Protocol major version
+                The major version number can take any value from 0 to 99 as
+                defined in the
+                AMQP specification.
+        :type version_major: int, 8 bit unsigned (octet in AMQP)
+        :param version_minor: Protocol minor version
+                The minor version number can take any value from 0 to 99 as
+                defined in the
+                AMQP specification.
+        :type version_minor: int, 8 bit unsigned (octet in AMQP)
+        :param server_properties: Server properties
+                The properties SHOULD contain at least these fields:
+                "host", specifying the
+                server host name or address, "product", giving the name
+                of the server product,
+                "version", giving the name of the server version,
+                "platform", giving the name
+                of the operating system, "copyright", if appropriate,
+                and "information", giving
+                other general information.
+        :type server_properties: table. See coolamqp.uplink.framing.field_table (peer-properties in AMQP)
+        :param mechanisms: Available security mechanisms
+                A list of the security mechanisms that the server supports,
+                delimited by spaces.
+        :type mechanisms: binary type (longstr in AMQP)
+        :param locales: Available message locales
+                A list of the message locales that the server supports,
+                delimited by spaces. The
+                locale defines the language in which the server will send
+                reply texts.
+        :type locales: binary type (longstr in AMQP)
+        """
+        __slots__ = (
+            u'version_major',
+            u'version_minor',
+            u'server_properties',
+            u'mechanisms',
+            u'locales',
+        )
+
+        NAME = u'connection.start'
+
+        INDEX = (10, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x0A'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'version-major', u'octet', u'octet', reserved=False),
+            Field(u'version-minor', u'octet', u'octet', reserved=False),
+            Field(u'server-properties',
+                  u'peer-properties',
+                  u'table',
+                  reserved=False),
+            Field(u'mechanisms', u'longstr', u'longstr', reserved=False),
+            Field(u'locales', u'longstr', u'longstr', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionStart(%s)' % (', '.join(
+                map(to_repr, [
+                    self.version_major, self.version_minor,
+                    self.server_properties, self.mechanisms, self.locales
+                ])))
+
+        def __init__(self, version_major, version_minor, server_properties,
+                     mechanisms, locales):
+            """
+            Create frame connection.start
+            """
+            self.version_major = version_major
+            self.version_minor = version_minor
+            self.server_properties = server_properties
+            self.mechanisms = mechanisms
+            self.locales = locales
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_BB.pack(self.version_major, self.version_minor))
+            enframe_table(buf, self.server_properties)
+            buf.write(b"".join(
+                (STRUCT_I.pack(len(self.mechanisms)), self.mechanisms,
+                 STRUCT_I.pack(len(self.locales)), self.locales)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_BB.pack_into(buf, offset, self.version_major,
+                                self.version_minor)
+            offset += 2
+            offset = enframe_table_into(buf, offset, self.server_properties)
+            ln = len(self.mechanisms)
+            STRUCT_I.pack_into(buf, offset, ln)
+            offset += 4
+            buf[offset:offset + ln] = self.mechanisms
+            offset += ln
+            ln = len(self.locales)
+            STRUCT_I.pack_into(buf, offset, ln)
+            offset += 4
+            buf[offset:offset + ln] = self.locales
+            return offset + ln
+
+        def get_size(self):  # type: () -> int
+            return 10 + frame_table_size(self.server_properties) + len(
+                self.mechanisms) + len(self.locales)
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionStart
+            offset = start_offset
+            version_major, version_minor, = STRUCT_BB.unpack_from(buf, offset)
+            offset += 2
+            server_properties, delta = deframe_table(buf, offset)
+            offset += delta
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            mechanisms = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            locales = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(version_major, version_minor, server_properties,
+                       mechanisms, locales)
+
+    return ConnectionStart
+
+
+def _make_ConnectionStartLazy():
+    ConnectionStart = _load('ConnectionStart')
+
+    class ConnectionStartLazy(ConnectionStart):
+        """
+        connection.start, with arguments decoded upon first access to any of them.
+
+        Arguments are read-only. Until they are decoded, this keeps the buffer
+        it was received in.
+        """
+        __slots__ = ('_buf', '_offset', u'_version_major', u'_version_minor',
+                     u'_server_properties', u'_mechanisms', u'_locales')
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionStartLazy
+            self = cls.__new__(cls)
+            self._buf = buf
+            self._offset = start_offset
+            return self
+
+        def _decode(self):  # type: () -> None
+            buf = self._buf
+            offset = self._offset
+            self._buf = None
+            self._version_major, self._version_minor, = STRUCT_BB.unpack_from(
+                buf, offset)
+            offset += 2
+            self._server_properties, delta = deframe_lazy_table(buf, offset)
+            offset += delta
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            self._mechanisms = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            self._locales = buf[offset:offset + s_len]
+            offset += s_len
+
+        @property
+        def version_major(self):
+            if self._buf is not None:
+                self._decode()
+            return self._version_major
+
+        @property
+        def version_minor(self):
+            if self._buf is not None:
+                self._decode()
+            return self._version_minor
+
+        @property
+        def server_properties(self):
+            if self._buf is not None:
+                self._decode()
+            return self._server_properties
+
+        @property
+        def mechanisms(self):
+            if self._buf is not None:
+                self._decode()
+            return self._mechanisms
+
+        @property
+        def locales(self):
+            if self._buf is not None:
+                self._decode()
+            return self._locales
+
+    return ConnectionStartLazy
+
+
+def _make_ConnectionSecure():
+
+    class ConnectionSecure(AMQPMethodPayload):
+        """
+        Security mechanism challenge
+    
+        The SASL protocol works by exchanging challenges and responses
+        until both peers have
+        received sufficient information to authenticate each other. This
+        method challenges
+        the client to provide more information.
+
+        :param challenge: Security challenge data
+                Challenge information, a block of opaque binary data passed
+                to the security
+                mechanism.
+        :type challenge: binary type (longstr in AMQP)
         """
-        self.virtual_host = virtual_host
+        __slots__ = (u'challenge', )
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.virtual_host)))
-        buf.write(self.virtual_host)
-        buf.write(b'\x00')
-        buf.write(STRUCT_B.pack(0))
+        NAME = u'connection.secure'
 
-    def get_size(self):  # type: () -> int
-        return 3 + len(self.virtual_host)
+        INDEX = (10, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x14'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionOpen
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        virtual_host = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        offset += s_len  # reserved field!
-        offset += 1
-        return cls(virtual_host)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-class ConnectionOpenOk(AMQPMethodPayload):
-    """
-    Signal that connection is ready
-    
-    This method signals to the client that the connection is ready
-    for use.
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'challenge', u'longstr', u'longstr', reserved=False),
+        ]
 
-    """
-    __slots__ = ()
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'connection.open-ok'
+            :return: Python string representation
+            """
+            return 'ConnectionSecure(%s)' % (', '.join(
+                map(to_repr, [self.challenge])))
 
-    INDEX = (10, 41)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x29'  # CLASS ID + METHOD ID
+        def __init__(self, challenge):
+            """
+            Create frame connection.secure
+            """
+            self.challenge = challenge
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_I.pack(len(self.challenge)), self.challenge)))
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x29\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.challenge)
+            STRUCT_I.pack_into(buf, offset, ln)
+            offset += 4
+            buf[offset:offset + ln] = self.challenge
+            return offset + ln
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
-    ]
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.challenge)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionSecure
+            offset = start_offset
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            challenge = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(challenge)
 
-        :return: Python string representation
-        """
-        return 'ConnectionOpenOk(%s)' % (', '.join(map(to_repr, [])))
+    return ConnectionSecure
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionOpenOk
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        offset += s_len  # reserved field!
-        return cls()
 
+def _make_ConnectionStartOk():
 
-class ConnectionStart(AMQPMethodPayload):
-    """
-    Start connection negotiation
+    class ConnectionStartOk(AMQPMethodPayload):
+        """
+        Select security mechanism and locale
     
-    This method starts the connection negotiation process by telling
-    the client the
-    protocol version that the server proposes, along with a list of
-    security mechanisms
-    which the client can use for authentication.
-
-    :param version_major: Protocol major version
-            The major version number can take any value from 0 to 99 as
-            defined in the
-            AMQP specification.
-    :type version_major: int, 8 bit unsigned (octet in AMQP)
-    :param version_minor: Protocol minor version
-            The minor version number can take any value from 0 to 99 as
-            defined in the
-            AMQP specification.
-    :type version_minor: int, 8 bit unsigned (octet in AMQP)
-    :param server_properties: Server properties
-            The properties SHOULD contain at least these fields:
-            "host", specifying the
-            server host name or address, "product", giving the name
-            of the server product,
-            "version", giving the name of the server version,
-            "platform", giving the name
-            of the operating system, "copyright", if appropriate,
-            and "information", giving
-            other general information.
-    :type server_properties: table. See coolamqp.uplink.framing.field_table (peer-properties in AMQP)
-    :param mechanisms: Available security mechanisms
-            A list of the security mechanisms that the server supports,
-            delimited by spaces.
-    :type mechanisms: binary type (longstr in AMQP)
-    :param locales: Available message locales
-            A list of the message locales that the server supports,
-            delimited by spaces. The
-            locale defines the language in which the server will send
-            reply texts.
-    :type locales: binary type (longstr in AMQP)
-    """
-    __slots__ = (
-        u'version_major',
-        u'version_minor',
-        u'server_properties',
-        u'mechanisms',
-        u'locales',
-    )
-
-    NAME = u'connection.start'
-
-    INDEX = (10, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x0A'  # CLASS ID + METHOD ID
+        This method selects a SASL security mechanism.
+
+        :param client_properties: Client properties
+                The properties SHOULD contain at least these fields:
+                "product", giving the name
+                of the client product, "version", giving the name of the
+                client version, "platform",
+                giving the name of the operating system, "copyright", if
+                appropriate, and
+                "information", giving other general information.
+        :type client_properties: table. See coolamqp.uplink.framing.field_table (peer-properties in AMQP)
+        :param mechanism: Selected security mechanism
+                A single security mechanisms selected by the client, which
+                must be one of those
+                specified by the server.
+        :type mechanism: binary type (max length 255) (shortstr in AMQP)
+        :param response: Security response data
+                A block of opaque data passed to the security mechanism. The
+                contents of this
+                data are defined by the SASL security mechanism.
+        :type response: binary type (longstr in AMQP)
+        :param locale: Selected message locale
+                A single message locale selected by the client, which must
+                be one of those
+                specified by the server.
+        :type locale: binary type (max length 255) (shortstr in AMQP)
+        """
+        __slots__ = (
+            u'client_properties',
+            u'mechanism',
+            u'response',
+            u'locale',
+        )
+
+        NAME = u'connection.start-ok'
+
+        INDEX = (10, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x0B'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'client-properties',
+                  u'peer-properties',
+                  u'table',
+                  reserved=False),
+            Field(u'mechanism', u'shortstr', u'shortstr', reserved=False),
+            Field(u'response', u'longstr', u'longstr', reserved=False),
+            Field(u'locale', u'shortstr', u'shortstr', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionStartOk(%s)' % (', '.join(
+                map(to_repr, [
+                    self.client_properties, self.mechanism, self.response,
+                    self.locale
+                ])))
+
+        def __init__(self, client_properties, mechanism, response, locale):
+            """
+            Create frame connection.start-ok
+            """
+            self.client_properties = client_properties
+            self.mechanism = mechanism
+            self.response = response
+            self.locale = locale
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            enframe_table(buf, self.client_properties)
+            buf.write(b"".join(
+                (STRUCT_B.pack(len(self.mechanism)), self.mechanism,
+                 STRUCT_I.pack(len(self.response)), self.response,
+                 STRUCT_B.pack(len(self.locale)), self.locale)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            offset = enframe_table_into(buf, offset, self.client_properties)
+            ln = len(self.mechanism)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.mechanism
+            offset += ln
+            ln = len(self.response)
+            STRUCT_I.pack_into(buf, offset, ln)
+            offset += 4
+            buf[offset:offset + ln] = self.response
+            offset += ln
+            ln = len(self.locale)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.locale
+            return offset + ln
+
+        def get_size(self):  # type: () -> int
+            return 6 + frame_table_size(self.client_properties) + len(
+                self.mechanism) + len(self.response) + len(self.locale)
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionStartOk
+            offset = start_offset
+            client_properties, delta = deframe_table(buf, offset)
+            offset += delta
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            mechanism = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            response = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            locale = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(client_properties, mechanism, response, locale)
+
+    return ConnectionStartOk
+
+
+def _make_ConnectionSecureOk():
+
+    class ConnectionSecureOk(AMQPMethodPayload):
+        """
+        Security mechanism response
+    
+        This method attempts to authenticate, passing a block of SASL
+        data for the security
+        mechanism at the server side.
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        :param response: Security response data
+                A block of opaque data passed to the security mechanism. The
+                contents of this
+                data are defined by the SASL security mechanism.
+        :type response: binary type (longstr in AMQP)
+        """
+        __slots__ = (u'response', )
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        NAME = u'connection.secure-ok'
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'version-major', u'octet', u'octet', reserved=False),
-        Field(u'version-minor', u'octet', u'octet', reserved=False),
-        Field(u'server-properties',
-              u'peer-properties',
-              u'table',
-              reserved=False),
-        Field(u'mechanisms', u'longstr', u'longstr', reserved=False),
-        Field(u'locales', u'longstr', u'longstr', reserved=False),
-    ]
+        INDEX = (10, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x15'  # CLASS ID + METHOD ID
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-        :return: Python string representation
-        """
-        return 'ConnectionStart(%s)' % (', '.join(
-            map(to_repr, [
-                self.version_major, self.version_minor, self.server_properties,
-                self.mechanisms, self.locales
-            ])))
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    def __init__(self, version_major, version_minor, server_properties,
-                 mechanisms, locales):
-        """
-        Create frame connection.start
-        """
-        self.version_major = version_major
-        self.version_minor = version_minor
-        self.server_properties = server_properties
-        self.mechanisms = mechanisms
-        self.locales = locales
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'response', u'longstr', u'longstr', reserved=False),
+        ]
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_BB.pack(self.version_major, self.version_minor))
-        enframe_table(buf, self.server_properties)
-        buf.write(STRUCT_I.pack(len(self.mechanisms)))
-        buf.write(self.mechanisms)
-        buf.write(STRUCT_I.pack(len(self.locales)))
-        buf.write(self.locales)
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    def get_size(self):  # type: () -> int
-        return 10 + frame_table_size(self.server_properties) + len(
-            self.mechanisms) + len(self.locales)
+            :return: Python string representation
+            """
+            return 'ConnectionSecureOk(%s)' % (', '.join(
+                map(to_repr, [self.response])))
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionStart
-        offset = start_offset
-        version_major, version_minor, = STRUCT_BB.unpack_from(buf, offset)
-        offset += 2
-        server_properties, delta = deframe_table(buf, offset)
-        offset += delta
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        mechanisms = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        locales = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(version_major, version_minor, server_properties, mechanisms,
-                   locales)
+        def __init__(self, response):
+            """
+            Create frame connection.secure-ok
+            """
+            self.response = response
 
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_I.pack(len(self.response)), self.response)))
 
-class ConnectionSecure(AMQPMethodPayload):
-    """
-    Security mechanism challenge
-    
-    The SASL protocol works by exchanging challenges and responses
-    until both peers have
-    received sufficient information to authenticate each other. This
-    method challenges
-    the client to provide more information.
-
-    :param challenge: Security challenge data
-            Challenge information, a block of opaque binary data passed
-            to the security
-            mechanism.
-    :type challenge: binary type (longstr in AMQP)
-    """
-    __slots__ = (u'challenge', )
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.response)
+            STRUCT_I.pack_into(buf, offset, ln)
+            offset += 4
+            buf[offset:offset + ln] = self.response
+            return offset + ln
 
-    NAME = u'connection.secure'
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.response)
 
-    INDEX = (10, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x14'  # CLASS ID + METHOD ID
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionSecureOk
+            offset = start_offset
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            response = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(response)
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+    return ConnectionSecureOk
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'challenge', u'longstr', u'longstr', reserved=False),
-    ]
+def _make_ConnectionTune():
 
-    def __repr__(self):  # type: () -> str
+    class ConnectionTune(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Propose connection tuning parameters
+    
+        This method proposes a set of connection configuration values to
+        the client. The
+        client can accept and/or adjust these.
+
+        :param channel_max: Proposed maximum channels
+                Specifies highest channel number that the server permits.
+                Usable channel numbers
+                are in the range 1..channel-max. Zero indicates no specified
+                limit.
+        :type channel_max: int, 16 bit unsigned (short in AMQP)
+        :param frame_max: Proposed maximum frame size
+                The largest frame size that the server proposes for the
+                connection, including
+                frame header and end-byte. The client can negotiate a lower
+                value. Zero means
+                that the server does not impose any specific limit but may
+                reject very large
+                frames if it cannot allocate resources for them.
+        :type frame_max: int, 32 bit unsigned (long in AMQP)
+        :param heartbeat: Desired heartbeat delay
+                The delay, in seconds, of the connection heartbeat that the
+                server wants.
+                Zero means the server does not want a heartbeat.
+        :type heartbeat: int, 16 bit unsigned (short in AMQP)
+        """
+        __slots__ = (
+            u'channel_max',
+            u'frame_max',
+            u'heartbeat',
+        )
+
+        NAME = u'connection.tune'
+
+        INDEX = (10, 30)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x1E'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'channel-max', u'short', u'short', reserved=False),
+            Field(u'frame-max', u'long', u'long', reserved=False),
+            Field(u'heartbeat', u'short', u'short', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionTune(%s)' % (', '.join(
+                map(to_repr,
+                    [self.channel_max, self.frame_max, self.heartbeat])))
+
+        def __init__(self, channel_max, frame_max, heartbeat):
+            """
+            Create frame connection.tune
+            """
+            self.channel_max = channel_max
+            self.frame_max = frame_max
+            self.heartbeat = heartbeat
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(
+                STRUCT_HIH.pack(self.channel_max, self.frame_max,
+                                self.heartbeat))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_HIH.pack_into(buf, offset, self.channel_max, self.frame_max,
+                                 self.heartbeat)
+            return offset + 8
+
+        def get_size(self):  # type: () -> int
+            return 8
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ConnectionTune
+            offset = start_offset
+            channel_max, frame_max, heartbeat, = STRUCT_HIH.unpack_from(
+                buf, offset)
+            offset += 8
+            return cls(channel_max, frame_max, heartbeat)
+
+    return ConnectionTune
+
+
+def _make_ConnectionTuneOk():
+
+    class ConnectionTuneOk(AMQPMethodPayload):
+        """
+        Negotiate connection tuning parameters
+    
+        This method sends the client's connection tuning parameters to
+        the server.
+        Certain fields are negotiated, others provide capability
+        information.
+
+        :param channel_max: Negotiated maximum channels
+                The maximum total number of channels that the client will
+                use per connection.
+        :type channel_max: int, 16 bit unsigned (short in AMQP)
+        :param frame_max: Negotiated maximum frame size
+                The largest frame size that the client and server will use
+                for the connection.
+                Zero means that the client does not impose any specific
+                limit but may reject
+                very large frames if it cannot allocate resources for them.
+                Note that the
+                frame-max limit applies principally to content frames, where
+                large contents can
+                be broken into frames of arbitrary size.
+        :type frame_max: int, 32 bit unsigned (long in AMQP)
+        :param heartbeat: Desired heartbeat delay
+                The delay, in seconds, of the connection heartbeat that the
+                client wants. Zero
+                means the client does not want a heartbeat.
+        :type heartbeat: int, 16 bit unsigned (short in AMQP)
+        """
+        __slots__ = (
+            u'channel_max',
+            u'frame_max',
+            u'heartbeat',
+        )
+
+        NAME = u'connection.tune-ok'
+
+        INDEX = (10, 31)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x1F'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'channel-max', u'short', u'short', reserved=False),
+            Field(u'frame-max', u'long', u'long', reserved=False),
+            Field(u'heartbeat', u'short', u'short', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConnectionTuneOk(%s)' % (', '.join(
+                map(to_repr,
+                    [self.channel_max, self.frame_max, self.heartbeat])))
+
+        def __init__(self, channel_max, frame_max, heartbeat):
+            """
+            Create frame connection.tune-ok
+            """
+            self.channel_max = channel_max
+            self.frame_max = frame_max
+            self.heartbeat = heartbeat
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(
+                STRUCT_HIH.pack(self.channel_max, self.frame_max,
+                                self.heartbeat))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_HIH.pack_into(buf, offset, self.channel_max, self.frame_max,
+                                 self.heartbeat)
+            return offset + 8
+
+        def get_size(self):  # type: () -> int
+            return 8
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionTuneOk
+            offset = start_offset
+            channel_max, frame_max, heartbeat, = STRUCT_HIH.unpack_from(
+                buf, offset)
+            offset += 8
+            return cls(channel_max, frame_max, heartbeat)
+
+    return ConnectionTuneOk
+
+
+def _make_ConnectionUnblocked():
+
+    class ConnectionUnblocked(AMQPMethodPayload):
+        """
+        This method indicates that a connection has been unblocked
+    
+        and now accepts publishes.
 
-        :return: Python string representation
         """
-        return 'ConnectionSecure(%s)' % (', '.join(
-            map(to_repr, [self.challenge])))
+        __slots__ = ()
 
-    def __init__(self, challenge):
-        """
-        Create frame connection.secure
-        """
-        self.challenge = challenge
+        NAME = u'connection.unblocked'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_I.pack(len(self.challenge)))
-        buf.write(self.challenge)
+        INDEX = (10, 61)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x0A\x00\x3D'  # CLASS ID + METHOD ID
 
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.challenge)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionSecure
-        offset = start_offset
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        challenge = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(challenge)
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x3D\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-class ConnectionStartOk(AMQPMethodPayload):
-    """
-    Select security mechanism and locale
-    
-    This method selects a SASL security mechanism.
-
-    :param client_properties: Client properties
-            The properties SHOULD contain at least these fields:
-            "product", giving the name
-            of the client product, "version", giving the name of the
-            client version, "platform",
-            giving the name of the operating system, "copyright", if
-            appropriate, and
-            "information", giving other general information.
-    :type client_properties: table. See coolamqp.uplink.framing.field_table (peer-properties in AMQP)
-    :param mechanism: Selected security mechanism
-            A single security mechanisms selected by the client, which
-            must be one of those
-            specified by the server.
-    :type mechanism: binary type (max length 255) (shortstr in AMQP)
-    :param response: Security response data
-            A block of opaque data passed to the security mechanism. The
-            contents of this
-            data are defined by the SASL security mechanism.
-    :type response: binary type (longstr in AMQP)
-    :param locale: Selected message locale
-            A single message locale selected by the client, which must
-            be one of those
-            specified by the server.
-    :type locale: binary type (max length 255) (shortstr in AMQP)
-    """
-    __slots__ = (
-        u'client_properties',
-        u'mechanism',
-        u'response',
-        u'locale',
-    )
+            :return: Python string representation
+            """
+            return 'ConnectionUnblocked(%s)' % (', '.join(map(to_repr, [])))
 
-    NAME = u'connection.start-ok'
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConnectionUnblocked
+            offset = start_offset
+            return cls()
 
-    INDEX = (10, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x0B'  # CLASS ID + METHOD ID
+    return ConnectionUnblocked
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+class Channel(AMQPClass):
+    """
+    The channel class provides methods for a client to establish a
+    
+    channel to a
+    server and for both peers to operate the channel thereafter.
+    """
+    NAME = u'channel'
+    INDEX = 20
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'client-properties',
-              u'peer-properties',
-              u'table',
-              reserved=False),
-        Field(u'mechanism', u'shortstr', u'shortstr', reserved=False),
-        Field(u'response', u'longstr', u'longstr', reserved=False),
-        Field(u'locale', u'shortstr', u'shortstr', reserved=False),
-    ]
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+def _make_ChannelClose():
 
-        :return: Python string representation
+    class ChannelClose(AMQPMethodPayload):
         """
-        return 'ConnectionStartOk(%s)' % (', '.join(
-            map(to_repr, [
-                self.client_properties, self.mechanism, self.response,
-                self.locale
-            ])))
+        Request a channel close
+    
+        This method indicates that the sender wants to close the
+        channel. This may be due to
+        internal conditions (e.g. a forced shut-down) or due to an error
+        handling a specific
+        method, i.e. an exception. When a close is due to an exception,
+        the sender provides
+        the class and method id of the method which caused the
+        exception.
+
+        :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
+        :type reply_text: binary type (max length 255) (reply-text in AMQP)
+        :param class_id: Failing method class
+                When the close is provoked by a method exception, this is
+                the class of the
+                method.
+        :type class_id: int, 16 bit unsigned (class-id in AMQP)
+        :param method_id: Failing method id
+                When the close is provoked by a method exception, this is
+                the ID of the method.
+        :type method_id: int, 16 bit unsigned (method-id in AMQP)
+        """
+        __slots__ = (
+            u'reply_code',
+            u'reply_text',
+            u'class_id',
+            u'method_id',
+        )
+
+        NAME = u'channel.close'
+
+        INDEX = (20, 40)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x28'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reply-code', u'reply-code', u'short', reserved=False),
+            Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
+            Field(u'class-id', u'class-id', u'short', reserved=False),
+            Field(u'method-id', u'method-id', u'short', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ChannelClose(%s)' % (', '.join(
+                map(to_repr, [
+                    self.reply_code, self.reply_text, self.class_id,
+                    self.method_id
+                ])))
+
+        def __init__(self, reply_code, reply_text, class_id, method_id):
+            """
+            Create frame channel.close
+            """
+            self.reply_code = reply_code
+            self.reply_text = reply_text
+            self.class_id = class_id
+            self.method_id = method_id
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_HB.pack(self.reply_code,
+                                len(self.reply_text)), self.reply_text,
+                 STRUCT_HH.pack(self.class_id, self.method_id))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.reply_text)
+            STRUCT_HB.pack_into(buf, offset, self.reply_code, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.reply_text
+            offset += ln
+            STRUCT_HH.pack_into(buf, offset, self.class_id, self.method_id)
+            return offset + 4
+
+        def get_size(self):  # type: () -> int
+            return 7 + len(self.reply_text)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelClose
+            offset = start_offset
+            reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
+            offset += 3
+            reply_text = buf[offset:offset + s_len]
+            offset += s_len
+            class_id, method_id, = STRUCT_HH.unpack_from(buf, offset)
+            offset += 4
+            return cls(reply_code, reply_text, class_id, method_id)
+
+    return ChannelClose
+
+
+def _make_ChannelCloseOk():
+
+    class ChannelCloseOk(AMQPMethodPayload):
+        """
+        Confirm a channel close
+    
+        This method confirms a Channel.Close method and tells the
+        recipient that it is safe
+        to release resources for the channel.
 
-    def __init__(self, client_properties, mechanism, response, locale):
-        """
-        Create frame connection.start-ok
         """
-        self.client_properties = client_properties
-        self.mechanism = mechanism
-        self.response = response
-        self.locale = locale
+        __slots__ = ()
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        enframe_table(buf, self.client_properties)
-        buf.write(STRUCT_B.pack(len(self.mechanism)))
-        buf.write(self.mechanism)
-        buf.write(STRUCT_I.pack(len(self.response)))
-        buf.write(self.response)
-        buf.write(STRUCT_B.pack(len(self.locale)))
-        buf.write(self.locale)
+        NAME = u'channel.close-ok'
 
-    def get_size(self):  # type: () -> int
-        return 6 + frame_table_size(self.client_properties) + len(
-            self.mechanism) + len(self.response) + len(self.locale)
+        INDEX = (20, 41)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x29'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionStartOk
-        offset = start_offset
-        client_properties, delta = deframe_table(buf, offset)
-        offset += delta
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        mechanism = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        response = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        locale = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(client_properties, mechanism, response, locale)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x14\x00\x29\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-class ConnectionSecureOk(AMQPMethodPayload):
-    """
-    Security mechanism response
-    
-    This method attempts to authenticate, passing a block of SASL
-    data for the security
-    mechanism at the server side.
-
-    :param response: Security response data
-            A block of opaque data passed to the security mechanism. The
-            contents of this
-            data are defined by the SASL security mechanism.
-    :type response: binary type (longstr in AMQP)
-    """
-    __slots__ = (u'response', )
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'connection.secure-ok'
+            :return: Python string representation
+            """
+            return 'ChannelCloseOk(%s)' % (', '.join(map(to_repr, [])))
 
-    INDEX = (10, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x15'  # CLASS ID + METHOD ID
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelCloseOk
+            offset = start_offset
+            return cls()
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    return ChannelCloseOk
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'response', u'longstr', u'longstr', reserved=False),
-    ]
+def _make_ChannelFlow():
 
-    def __repr__(self):  # type: () -> str
+    class ChannelFlow(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Enable/disable flow from peer
+    
+        This method asks the peer to pause or restart the flow of
+        content data sent by
+        a consumer. This is a simple flow-control mechanism that a peer
+        can use to avoid
+        overflowing its queues or otherwise finding itself receiving
+        more messages than
+        it can process. Note that this method is not intended for window
+        control. It does
+        not affect contents returned by Basic.Get-Ok methods.
 
-        :return: Python string representation
+        :param active: Start/stop content frames
+                If 1, the peer starts sending content frames. If 0, the peer
+                stops sending
+                content frames.
+        :type active: bool (bit in AMQP)
         """
-        return 'ConnectionSecureOk(%s)' % (', '.join(
-            map(to_repr, [self.response])))
+        __slots__ = (u'active', )
 
-    def __init__(self, response):
-        """
-        Create frame connection.secure-ok
-        """
-        self.response = response
+        NAME = u'channel.flow'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_I.pack(len(self.response)))
-        buf.write(self.response)
+        INDEX = (20, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x14'  # CLASS ID + METHOD ID
 
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.response)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionSecureOk
-        offset = start_offset
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        response = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(response)
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'active', u'bit', u'bit', reserved=False),
+        ]
 
-class ConnectionTune(AMQPMethodPayload):
-    """
-    Propose connection tuning parameters
-    
-    This method proposes a set of connection configuration values to
-    the client. The
-    client can accept and/or adjust these.
-
-    :param channel_max: Proposed maximum channels
-            Specifies highest channel number that the server permits.
-            Usable channel numbers
-            are in the range 1..channel-max. Zero indicates no specified
-            limit.
-    :type channel_max: int, 16 bit unsigned (short in AMQP)
-    :param frame_max: Proposed maximum frame size
-            The largest frame size that the server proposes for the
-            connection, including
-            frame header and end-byte. The client can negotiate a lower
-            value. Zero means
-            that the server does not impose any specific limit but may
-            reject very large
-            frames if it cannot allocate resources for them.
-    :type frame_max: int, 32 bit unsigned (long in AMQP)
-    :param heartbeat: Desired heartbeat delay
-            The delay, in seconds, of the connection heartbeat that the
-            server wants.
-            Zero means the server does not want a heartbeat.
-    :type heartbeat: int, 16 bit unsigned (short in AMQP)
-    """
-    __slots__ = (
-        u'channel_max',
-        u'frame_max',
-        u'heartbeat',
-    )
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'connection.tune'
+            :return: Python string representation
+            """
+            return 'ChannelFlow(%s)' % (', '.join(map(to_repr, [self.active])))
 
-    INDEX = (10, 30)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x1E'  # CLASS ID + METHOD ID
+        def __init__(self, active):
+            """
+            Create frame channel.flow
+            """
+            self.active = active
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_B.pack((self.active << 0)))
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_B.pack_into(buf, offset, (self.active << 0))
+            return offset + 1
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'channel-max', u'short', u'short', reserved=False),
-        Field(u'frame-max', u'long', u'long', reserved=False),
-        Field(u'heartbeat', u'short', u'short', reserved=False),
-    ]
+        def get_size(self):  # type: () -> int
+            return 1
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelFlow
+            offset = start_offset
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            active = bool(_bit & 1)
+            return cls(active)
 
-        :return: Python string representation
-        """
-        return 'ConnectionTune(%s)' % (', '.join(
-            map(to_repr, [self.channel_max, self.frame_max, self.heartbeat])))
+    return ChannelFlow
 
-    def __init__(self, channel_max, frame_max, heartbeat):
-        """
-        Create frame connection.tune
-        """
-        self.channel_max = channel_max
-        self.frame_max = frame_max
-        self.heartbeat = heartbeat
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(
-            STRUCT_HIH.pack(self.channel_max, self.frame_max, self.heartbeat))
+def _make_ChannelFlowOk():
 
-    def get_size(self):  # type: () -> int
-        return 8
+    class ChannelFlowOk(AMQPMethodPayload):
+        """
+        Confirm a flow method
+    
+        Confirms to the peer that a flow command was received and
+        processed.
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionTune
-        offset = start_offset
-        channel_max, frame_max, heartbeat, = STRUCT_HIH.unpack_from(
-            buf, offset)
-        offset += 8
-        return cls(channel_max, frame_max, heartbeat)
+        :param active: Current flow setting
+                Confirms the setting of the processed flow method: 1 means
+                the peer will start
+                sending or continue to send content frames; 0 means it will
+                not.
+        :type active: bool (bit in AMQP)
+        """
+        __slots__ = (u'active', )
 
+        NAME = u'channel.flow-ok'
 
-class ConnectionTuneOk(AMQPMethodPayload):
-    """
-    Negotiate connection tuning parameters
-    
-    This method sends the client's connection tuning parameters to
-    the server.
-    Certain fields are negotiated, others provide capability
-    information.
-
-    :param channel_max: Negotiated maximum channels
-            The maximum total number of channels that the client will
-            use per connection.
-    :type channel_max: int, 16 bit unsigned (short in AMQP)
-    :param frame_max: Negotiated maximum frame size
-            The largest frame size that the client and server will use
-            for the connection.
-            Zero means that the client does not impose any specific
-            limit but may reject
-            very large frames if it cannot allocate resources for them.
-            Note that the
-            frame-max limit applies principally to content frames, where
-            large contents can
-            be broken into frames of arbitrary size.
-    :type frame_max: int, 32 bit unsigned (long in AMQP)
-    :param heartbeat: Desired heartbeat delay
-            The delay, in seconds, of the connection heartbeat that the
-            client wants. Zero
-            means the client does not want a heartbeat.
-    :type heartbeat: int, 16 bit unsigned (short in AMQP)
-    """
-    __slots__ = (
-        u'channel_max',
-        u'frame_max',
-        u'heartbeat',
-    )
+        INDEX = (20, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x15'  # CLASS ID + METHOD ID
 
-    NAME = u'connection.tune-ok'
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    INDEX = (10, 31)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x1F'  # CLASS ID + METHOD ID
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'active', u'bit', u'bit', reserved=False),
+        ]
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'channel-max', u'short', u'short', reserved=False),
-        Field(u'frame-max', u'long', u'long', reserved=False),
-        Field(u'heartbeat', u'short', u'short', reserved=False),
-    ]
+            :return: Python string representation
+            """
+            return 'ChannelFlowOk(%s)' % (', '.join(map(
+                to_repr, [self.active])))
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def __init__(self, active):
+            """
+            Create frame channel.flow-ok
+            """
+            self.active = active
 
-        :return: Python string representation
-        """
-        return 'ConnectionTuneOk(%s)' % (', '.join(
-            map(to_repr, [self.channel_max, self.frame_max, self.heartbeat])))
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_B.pack((self.active << 0)))
 
-    def __init__(self, channel_max, frame_max, heartbeat):
-        """
-        Create frame connection.tune-ok
-        """
-        self.channel_max = channel_max
-        self.frame_max = frame_max
-        self.heartbeat = heartbeat
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_B.pack_into(buf, offset, (self.active << 0))
+            return offset + 1
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(
-            STRUCT_HIH.pack(self.channel_max, self.frame_max, self.heartbeat))
+        def get_size(self):  # type: () -> int
+            return 1
 
-    def get_size(self):  # type: () -> int
-        return 8
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelFlowOk
+            offset = start_offset
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            active = bool(_bit & 1)
+            return cls(active)
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConnectionTuneOk
-        offset = start_offset
-        channel_max, frame_max, heartbeat, = STRUCT_HIH.unpack_from(
-            buf, offset)
-        offset += 8
-        return cls(channel_max, frame_max, heartbeat)
+    return ChannelFlowOk
 
 
-class ConnectionUnblocked(AMQPMethodPayload):
-    """
-    This method indicates that a connection has been unblocked
+def _make_ChannelOpen():
+
+    class ChannelOpen(AMQPMethodPayload):
+        """
+        Open a channel for use
     
-    and now accepts publishes.
+        This method opens a channel to the server.
 
-    """
-    __slots__ = ()
+        """
+        __slots__ = ()
 
-    NAME = u'connection.unblocked'
+        NAME = u'channel.open'
 
-    INDEX = (10, 61)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x0A\x00\x3D'  # CLASS ID + METHOD ID
+        INDEX = (20, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x0A'  # CLASS ID + METHOD ID
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x0A\x00\x3D\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x05\x00\x14\x00\x0A\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
+        ]
 
-        :return: Python string representation
-        """
-        return 'ConnectionUnblocked(%s)' % (', '.join(map(to_repr, [])))
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    @classmethod
-    def from_buffer(
-            cls, buf,
-            start_offset):  # type: (buffer, int) -> ConnectionUnblocked
-        offset = start_offset
-        return cls()
+            :return: Python string representation
+            """
+            return 'ChannelOpen(%s)' % (', '.join(map(to_repr, [])))
 
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelOpen
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            offset += s_len  # reserved field!
+            return cls()
 
-class Channel(AMQPClass):
-    """
-    The channel class provides methods for a client to establish a
-    
-    channel to a
-    server and for both peers to operate the channel thereafter.
-    """
-    NAME = u'channel'
-    INDEX = 20
+    return ChannelOpen
 
 
-class ChannelClose(AMQPMethodPayload):
-    """
-    Request a channel close
-    
-    This method indicates that the sender wants to close the
-    channel. This may be due to
-    internal conditions (e.g. a forced shut-down) or due to an error
-    handling a specific
-    method, i.e. an exception. When a close is due to an exception,
-    the sender provides
-    the class and method id of the method which caused the
-    exception.
-
-    :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
-    :type reply_text: binary type (max length 255) (reply-text in AMQP)
-    :param class_id: Failing method class
-            When the close is provoked by a method exception, this is
-            the class of the
-            method.
-    :type class_id: int, 16 bit unsigned (class-id in AMQP)
-    :param method_id: Failing method id
-            When the close is provoked by a method exception, this is
-            the ID of the method.
-    :type method_id: int, 16 bit unsigned (method-id in AMQP)
-    """
-    __slots__ = (
-        u'reply_code',
-        u'reply_text',
-        u'class_id',
-        u'method_id',
-    )
+def _make_ChannelOpenOk():
 
-    NAME = u'channel.close'
+    class ChannelOpenOk(AMQPMethodPayload):
+        """
+        Signal that the channel is ready
+    
+        This method signals to the client that the channel is ready for
+        use.
 
-    INDEX = (20, 40)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x28'  # CLASS ID + METHOD ID
+        """
+        __slots__ = ()
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+        NAME = u'channel.open-ok'
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        INDEX = (20, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x14\x00\x0B'  # CLASS ID + METHOD ID
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reply-code', u'reply-code', u'short', reserved=False),
-        Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
-        Field(u'class-id', u'class-id', u'short', reserved=False),
-        Field(u'method-id', u'method-id', u'short', reserved=False),
-    ]
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x05\x00\x14\x00\x0B\x00\x00\x00\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-        :return: Python string representation
-        """
-        return 'ChannelClose(%s)' % (', '.join(
-            map(to_repr, [
-                self.reply_code, self.reply_text, self.class_id, self.method_id
-            ])))
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'longstr', u'longstr', reserved=True),
+        ]
 
-    def __init__(self, reply_code, reply_text, class_id, method_id):
-        """
-        Create frame channel.close
-        """
-        self.reply_code = reply_code
-        self.reply_text = reply_text
-        self.class_id = class_id
-        self.method_id = method_id
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_HB.pack(self.reply_code, len(self.reply_text)))
-        buf.write(self.reply_text)
-        buf.write(STRUCT_HH.pack(self.class_id, self.method_id))
+            :return: Python string representation
+            """
+            return 'ChannelOpenOk(%s)' % (', '.join(map(to_repr, [])))
 
-    def get_size(self):  # type: () -> int
-        return 7 + len(self.reply_text)
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ChannelOpenOk
+            offset = start_offset
+            s_len, = STRUCT_L.unpack_from(buf, offset)
+            offset += 4
+            offset += s_len  # reserved field!
+            return cls()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelClose
-        offset = start_offset
-        reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
-        offset += 3
-        reply_text = buf[offset:offset + s_len]
-        offset += s_len
-        class_id, method_id, = STRUCT_HH.unpack_from(buf, offset)
-        offset += 4
-        return cls(reply_code, reply_text, class_id, method_id)
+    return ChannelOpenOk
 
 
-class ChannelCloseOk(AMQPMethodPayload):
+class Exchange(AMQPClass):
     """
-    Confirm a channel close
+    Exchanges match and distribute messages across queues. exchanges can
     
-    This method confirms a Channel.Close method and tells the
-    recipient that it is safe
-    to release resources for the channel.
-
+    be configured in
+    the server or declared at runtime.
     """
-    __slots__ = ()
-
-    NAME = u'channel.close-ok'
-
-    INDEX = (20, 41)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x29'  # CLASS ID + METHOD ID
+    NAME = u'exchange'
+    INDEX = 40
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x14\x00\x29\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+def _make_ExchangeBind():
 
-    def __repr__(self):  # type: () -> str
+    class ExchangeBind(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Bind exchange to an exchange
+    
+        This method binds an exchange to an exchange.
+
+        :param destination: Name of the destination exchange to bind to
+                Specifies the name of the destination exchange to bind.
+        :type destination: binary type (max length 255) (exchange-name in AMQP)
+        :param source: Name of the source exchange to bind to
+                Specifies the name of the source exchange to bind.
+        :type source: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key for the binding. The routing key
+                is used for routing messages depending on the exchange
+                configuration. Not all exchanges use a routing key - refer
+                to the specific exchange documentation.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments for binding
+                A set of arguments for the binding. The syntax and semantics
+                of these arguments depends on the exchange class.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'destination',
+            u'source',
+            u'routing_key',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'exchange.bind'
+
+        INDEX = (40, 30)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x1E'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'destination',
+                  u'exchange-name',
+                  u'shortstr',
+                  reserved=False),
+            Field(u'source', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ExchangeBind(%s)' % (', '.join(
+                map(to_repr, [
+                    self.destination, self.source, self.routing_key,
+                    self.no_wait, self.arguments
+                ])))
+
+        def __init__(self, destination, source, routing_key, no_wait,
+                     arguments):
+            """
+            Create frame exchange.bind
+            """
+            self.destination = destination
+            self.source = source
+            self.routing_key = routing_key
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.destination)), self.destination,
+                 STRUCT_B.pack(len(self.source)), self.source,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key,
+                 STRUCT_B.pack((self.no_wait << 0)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.destination)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.destination
+            offset += ln
+            ln = len(self.source)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.source
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_wait << 0))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 6 + len(self.destination) + len(self.source) + len(
+                self.routing_key) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ExchangeBind
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            destination = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            source = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_wait = bool(_bit & 1)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(destination, source, routing_key, no_wait, arguments)
+
+    return ExchangeBind
+
+
+def _make_ExchangeBindOk():
+
+    class ExchangeBindOk(AMQPMethodPayload):
+        """
+        Confirm bind successful
+    
+        This method confirms that the bind was successful.
 
-        :return: Python string representation
         """
-        return 'ChannelCloseOk(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelCloseOk
-        offset = start_offset
-        return cls()
+        NAME = u'exchange.bind-ok'
 
+        INDEX = (40, 31)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x1F'  # CLASS ID + METHOD ID
 
-class ChannelFlow(AMQPMethodPayload):
-    """
-    Enable/disable flow from peer
-    
-    This method asks the peer to pause or restart the flow of
-    content data sent by
-    a consumer. This is a simple flow-control mechanism that a peer
-    can use to avoid
-    overflowing its queues or otherwise finding itself receiving
-    more messages than
-    it can process. Note that this method is not intended for window
-    control. It does
-    not affect contents returned by Basic.Get-Ok methods.
-
-    :param active: Start/stop content frames
-            If 1, the peer starts sending content frames. If 0, the peer
-            stops sending
-            content frames.
-    :type active: bool (bit in AMQP)
-    """
-    __slots__ = (u'active', )
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    NAME = u'channel.flow'
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x1F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    INDEX = (20, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x14'  # CLASS ID + METHOD ID
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+            :return: Python string representation
+            """
+            return 'ExchangeBindOk(%s)' % (', '.join(map(to_repr, [])))
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ExchangeBindOk
+            offset = start_offset
+            return cls()
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'active', u'bit', u'bit', reserved=False),
-    ]
+    return ExchangeBindOk
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'ChannelFlow(%s)' % (', '.join(map(to_repr, [self.active])))
+def _make_ExchangeDeclare():
 
-    def __init__(self, active):
+    class ExchangeDeclare(AMQPMethodPayload):
         """
-        Create frame channel.flow
-        """
-        self.active = active
+        Verify exchange exists, create if needed
+    
+        This method creates an exchange if it does not already exist,
+        and if the exchange
+        exists, verifies that it is of the correct and expected class.
+
+        :param exchange: Exchange names starting with "amq." are reserved for
+                pre-declared and
+                standardised exchanges. The client MAY declare an
+                exchange starting with
+                "amq." if the passive option is set, or the exchange
+                already exists.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param type_: Exchange type
+                Each exchange belongs to one of a set of exchange types
+                implemented by the
+                server. The exchange types define the functionality of the
+                exchange - i.e. how
+                messages are routed through it. It is not valid or
+                meaningful to attempt to
+                change the type of an existing exchange.
+        :type type_: binary type (max length 255) (shortstr in AMQP)
+        :param passive: Do not create exchange
+                If set, the server will reply with Declare-Ok if the
+                exchange already
+                exists with the same name, and raise an error if not. The
+                client can
+                use this to check whether an exchange exists without
+                modifying the
+                server state. When set, all other method fields except name
+                and no-wait
+                are ignored. A declare with both passive and no-wait has no
+                effect.
+                Arguments are compared for semantic equivalence.
+        :type passive: bool (bit in AMQP)
+        :param durable: Request a durable exchange
+                If set when creating a new exchange, the exchange will be
+                marked as durable.
+                Durable exchanges remain active when a server restarts.
+                Non-durable exchanges
+                (transient exchanges) are purged if/when a server restarts.
+        :type durable: bool (bit in AMQP)
+        :param auto_delete: Auto-delete when unused
+                If set, the exchange is deleted when all queues have
+                finished using it.
+        :type auto_delete: bool (bit in AMQP)
+        :param internal: Create internal exchange
+                If set, the exchange may not be used directly by publishers,
+                but only when bound to other exchanges. Internal exchanges
+                are used to construct wiring that is not visible to
+                applications.
+        :type internal: bool (bit in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments for declaration
+                A set of arguments for the declaration. The syntax and
+                semantics of these
+                arguments depends on the server implementation.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'exchange',
+            u'type_',
+            u'passive',
+            u'durable',
+            u'auto_delete',
+            u'internal',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'exchange.declare'
+
+        INDEX = (40, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x0A'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'type', u'shortstr', u'shortstr', reserved=False),
+            Field(u'passive', u'bit', u'bit', reserved=False),
+            Field(u'durable', u'bit', u'bit', reserved=False),
+            Field(u'auto-delete', u'bit', u'bit', reserved=False),
+            Field(u'internal', u'bit', u'bit', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ExchangeDeclare(%s)' % (', '.join(
+                map(to_repr, [
+                    self.exchange, self.type_, self.passive, self.durable,
+                    self.auto_delete, self.internal, self.no_wait,
+                    self.arguments
+                ])))
+
+        def __init__(self, exchange, type_, passive, durable, auto_delete,
+                     internal, no_wait, arguments):
+            """
+            Create frame exchange.declare
+            """
+            self.exchange = exchange
+            self.type_ = type_
+            self.passive = passive
+            self.durable = durable
+            self.auto_delete = auto_delete
+            self.internal = internal
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.type_)), self.type_,
+                 STRUCT_B.pack((self.passive << 0) | (self.durable << 1)
+                               | (self.auto_delete << 2) | (self.internal << 3)
+                               | (self.no_wait << 4)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.exchange)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.type_)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.type_
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.passive << 0) |
+                               (self.durable << 1) | (self.auto_delete << 2) |
+                               (self.internal << 3) | (self.no_wait << 4))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 5 + len(self.exchange) + len(self.type_) + frame_table_size(
+                self.arguments)
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ExchangeDeclare
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            type_ = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            passive = bool(_bit & 1)
+            durable = bool(_bit & 2)
+            auto_delete = bool(_bit & 4)
+            internal = bool(_bit & 8)
+            no_wait = bool(_bit & 16)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(exchange, type_, passive, durable, auto_delete,
+                       internal, no_wait, arguments)
+
+    return ExchangeDeclare
+
+
+def _make_ExchangeDelete():
+
+    class ExchangeDelete(AMQPMethodPayload):
+        """
+        Delete an exchange
+    
+        This method deletes an exchange. When an exchange is deleted all
+        queue bindings on
+        the exchange are cancelled.
+
+        :param exchange: The client must not attempt to delete an exchange that
+                does not exist.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param if_unused: Delete only if unused
+                If set, the server will only delete the exchange if it has
+                no queue bindings. If
+                the exchange has queue bindings the server does not delete
+                it but raises a
+                channel exception instead.
+        :type if_unused: bool (bit in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        """
+        __slots__ = (
+            u'exchange',
+            u'if_unused',
+            u'no_wait',
+        )
+
+        NAME = u'exchange.delete'
+
+        INDEX = (40, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x14'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'if-unused', u'bit', u'bit', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ExchangeDelete(%s)' % (', '.join(
+                map(to_repr, [self.exchange, self.if_unused, self.no_wait])))
+
+        def __init__(self, exchange, if_unused, no_wait):
+            """
+            Create frame exchange.delete
+            """
+            self.exchange = exchange
+            self.if_unused = if_unused
+            self.no_wait = no_wait
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack((self.if_unused << 0) | (self.no_wait << 1)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.exchange)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            STRUCT_B.pack_into(buf, offset,
+                               (self.if_unused << 0) | (self.no_wait << 1))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.exchange)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ExchangeDelete
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            if_unused = bool(_bit & 1)
+            no_wait = bool(_bit & 2)
+            return cls(exchange, if_unused, no_wait)
+
+    return ExchangeDelete
+
+
+def _make_ExchangeDeclareOk():
+
+    class ExchangeDeclareOk(AMQPMethodPayload):
+        """
+        Confirm exchange declaration
+    
+        This method confirms a Declare method and confirms the name of
+        the exchange,
+        essential for automatically-named exchanges.
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack((self.active << 0)))
+        """
+        __slots__ = ()
 
-    def get_size(self):  # type: () -> int
-        return 1
+        NAME = u'exchange.declare-ok'
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelFlow
-        offset = start_offset
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        active = bool(_bit >> 0)
-        offset += 1
-        return cls(active)
+        INDEX = (40, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x0B'  # CLASS ID + METHOD ID
 
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-class ChannelFlowOk(AMQPMethodPayload):
-    """
-    Confirm a flow method
-    
-    Confirms to the peer that a flow command was received and
-    processed.
-
-    :param active: Current flow setting
-            Confirms the setting of the processed flow method: 1 means
-            the peer will start
-            sending or continue to send content frames; 0 means it will
-            not.
-    :type active: bool (bit in AMQP)
-    """
-    __slots__ = (u'active', )
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    NAME = u'channel.flow-ok'
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    INDEX = (20, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x15'  # CLASS ID + METHOD ID
+            :return: Python string representation
+            """
+            return 'ExchangeDeclareOk(%s)' % (', '.join(map(to_repr, [])))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ExchangeDeclareOk
+            offset = start_offset
+            return cls()
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    return ExchangeDeclareOk
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'active', u'bit', u'bit', reserved=False),
-    ]
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+def _make_ExchangeDeleteOk():
 
-        :return: Python string representation
+    class ExchangeDeleteOk(AMQPMethodPayload):
         """
-        return 'ChannelFlowOk(%s)' % (', '.join(map(to_repr, [self.active])))
+        Confirm deletion of an exchange
+    
+        This method confirms the deletion of an exchange.
 
-    def __init__(self, active):
         """
-        Create frame channel.flow-ok
-        """
-        self.active = active
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack((self.active << 0)))
+        __slots__ = ()
 
-    def get_size(self):  # type: () -> int
-        return 1
+        NAME = u'exchange.delete-ok'
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelFlowOk
-        offset = start_offset
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        active = bool(_bit >> 0)
-        offset += 1
-        return cls(active)
+        INDEX = (40, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x15'  # CLASS ID + METHOD ID
 
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-class ChannelOpen(AMQPMethodPayload):
-    """
-    Open a channel for use
-    
-    This method opens a channel to the server.
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    """
-    __slots__ = ()
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'channel.open'
+            :return: Python string representation
+            """
+            return 'ExchangeDeleteOk(%s)' % (', '.join(map(to_repr, [])))
 
-    INDEX = (20, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x0A'  # CLASS ID + METHOD ID
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ExchangeDeleteOk
+            offset = start_offset
+            return cls()
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    return ExchangeDeleteOk
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x05\x00\x14\x00\x0A\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
-    ]
+def _make_ExchangeUnbind():
 
-    def __repr__(self):  # type: () -> str
+    class ExchangeUnbind(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Unbind an exchange from an exchange
+    
+        This method unbinds an exchange from an exchange.
+
+        :param destination: Specifies the name of the destination exchange to unbind.
+        :type destination: binary type (max length 255) (exchange-name in AMQP)
+        :param source: Specifies the name of the source exchange to unbind.
+        :type source: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Routing key of binding
+                Specifies the routing key of the binding to unbind.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments of binding
+                Specifies the arguments of the binding to unbind.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'destination',
+            u'source',
+            u'routing_key',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'exchange.unbind'
+
+        INDEX = (40, 40)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x28'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'destination',
+                  u'exchange-name',
+                  u'shortstr',
+                  reserved=False),
+            Field(u'source', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ExchangeUnbind(%s)' % (', '.join(
+                map(to_repr, [
+                    self.destination, self.source, self.routing_key,
+                    self.no_wait, self.arguments
+                ])))
+
+        def __init__(self, destination, source, routing_key, no_wait,
+                     arguments):
+            """
+            Create frame exchange.unbind
+            """
+            self.destination = destination
+            self.source = source
+            self.routing_key = routing_key
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.destination)), self.destination,
+                 STRUCT_B.pack(len(self.source)), self.source,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key,
+                 STRUCT_B.pack((self.no_wait << 0)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.destination)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.destination
+            offset += ln
+            ln = len(self.source)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.source
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_wait << 0))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 6 + len(self.destination) + len(self.source) + len(
+                self.routing_key) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ExchangeUnbind
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            destination = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            source = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_wait = bool(_bit & 1)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(destination, source, routing_key, no_wait, arguments)
+
+    return ExchangeUnbind
+
+
+def _make_ExchangeUnbindOk():
+
+    class ExchangeUnbindOk(AMQPMethodPayload):
+        """
+        Confirm unbind successful
+    
+        This method confirms that the unbind was successful.
 
-        :return: Python string representation
         """
-        return 'ChannelOpen(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelOpen
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        offset += s_len  # reserved field!
-        return cls()
+        NAME = u'exchange.unbind-ok'
 
+        INDEX = (40, 51)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x28\x00\x33'  # CLASS ID + METHOD ID
 
-class ChannelOpenOk(AMQPMethodPayload):
-    """
-    Signal that the channel is ready
-    
-    This method signals to the client that the channel is ready for
-    use.
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    """
-    __slots__ = ()
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    NAME = u'channel.open-ok'
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    INDEX = (20, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x14\x00\x0B'  # CLASS ID + METHOD ID
+            :return: Python string representation
+            """
+            return 'ExchangeUnbindOk(%s)' % (', '.join(map(to_repr, [])))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ExchangeUnbindOk
+            offset = start_offset
+            return cls()
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x05\x00\x14\x00\x0B\x00\x00\x00\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'longstr', u'longstr', reserved=True),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ChannelOpenOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ChannelOpenOk
-        offset = start_offset
-        s_len, = STRUCT_L.unpack_from(buf, offset)
-        offset += 4
-        offset += s_len  # reserved field!
-        return cls()
-
-
-class Exchange(AMQPClass):
-    """
-    Exchanges match and distribute messages across queues. exchanges can
-    
-    be configured in
-    the server or declared at runtime.
-    """
-    NAME = u'exchange'
-    INDEX = 40
-
-
-class ExchangeBind(AMQPMethodPayload):
-    """
-    Bind exchange to an exchange
-    
-    This method binds an exchange to an exchange.
-
-    :param destination: Name of the destination exchange to bind to
-            Specifies the name of the destination exchange to bind.
-    :type destination: binary type (max length 255) (exchange-name in AMQP)
-    :param source: Name of the source exchange to bind to
-            Specifies the name of the source exchange to bind.
-    :type source: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key for the binding. The routing key
-            is used for routing messages depending on the exchange
-            configuration. Not all exchanges use a routing key - refer
-            to the specific exchange documentation.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments for binding
-            A set of arguments for the binding. The syntax and semantics
-            of these arguments depends on the exchange class.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'destination',
-        u'source',
-        u'routing_key',
-        u'no_wait',
-        u'arguments',
-    )
-
-    NAME = u'exchange.bind'
-
-    INDEX = (40, 30)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x1E'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'destination', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'source', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeBind(%s)' % (', '.join(
-            map(to_repr, [
-                self.destination, self.source, self.routing_key, self.no_wait,
-                self.arguments
-            ])))
-
-    def __init__(self, destination, source, routing_key, no_wait, arguments):
-        """
-        Create frame exchange.bind
-        """
-        self.destination = destination
-        self.source = source
-        self.routing_key = routing_key
-        self.no_wait = no_wait
-        self.arguments = arguments
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.destination)))
-        buf.write(self.destination)
-        buf.write(STRUCT_B.pack(len(self.source)))
-        buf.write(self.source)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        buf.write(STRUCT_B.pack((self.no_wait << 0)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 6 + len(self.destination) + len(self.source) + len(
-            self.routing_key) + frame_table_size(self.arguments)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeBind
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        destination = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        source = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_wait = bool(_bit >> 0)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(destination, source, routing_key, no_wait, arguments)
-
-
-class ExchangeBindOk(AMQPMethodPayload):
-    """
-    Confirm bind successful
-    
-    This method confirms that the bind was successful.
-
-    """
-    __slots__ = ()
-
-    NAME = u'exchange.bind-ok'
-
-    INDEX = (40, 31)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x1F'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x1F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeBindOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeBindOk
-        offset = start_offset
-        return cls()
-
-
-class ExchangeDeclare(AMQPMethodPayload):
-    """
-    Verify exchange exists, create if needed
-    
-    This method creates an exchange if it does not already exist,
-    and if the exchange
-    exists, verifies that it is of the correct and expected class.
-
-    :param exchange: Exchange names starting with "amq." are reserved for
-            pre-declared and
-            standardised exchanges. The client MAY declare an
-            exchange starting with
-            "amq." if the passive option is set, or the exchange
-            already exists.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param type_: Exchange type
-            Each exchange belongs to one of a set of exchange types
-            implemented by the
-            server. The exchange types define the functionality of the
-            exchange - i.e. how
-            messages are routed through it. It is not valid or
-            meaningful to attempt to
-            change the type of an existing exchange.
-    :type type_: binary type (max length 255) (shortstr in AMQP)
-    :param passive: Do not create exchange
-            If set, the server will reply with Declare-Ok if the
-            exchange already
-            exists with the same name, and raise an error if not. The
-            client can
-            use this to check whether an exchange exists without
-            modifying the
-            server state. When set, all other method fields except name
-            and no-wait
-            are ignored. A declare with both passive and no-wait has no
-            effect.
-            Arguments are compared for semantic equivalence.
-    :type passive: bool (bit in AMQP)
-    :param durable: Request a durable exchange
-            If set when creating a new exchange, the exchange will be
-            marked as durable.
-            Durable exchanges remain active when a server restarts.
-            Non-durable exchanges
-            (transient exchanges) are purged if/when a server restarts.
-    :type durable: bool (bit in AMQP)
-    :param auto_delete: Auto-delete when unused
-            If set, the exchange is deleted when all queues have
-            finished using it.
-    :type auto_delete: bool (bit in AMQP)
-    :param internal: Create internal exchange
-            If set, the exchange may not be used directly by publishers,
-            but only when bound to other exchanges. Internal exchanges
-            are used to construct wiring that is not visible to
-            applications.
-    :type internal: bool (bit in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments for declaration
-            A set of arguments for the declaration. The syntax and
-            semantics of these
-            arguments depends on the server implementation.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'exchange',
-        u'type_',
-        u'passive',
-        u'durable',
-        u'auto_delete',
-        u'internal',
-        u'no_wait',
-        u'arguments',
-    )
-
-    NAME = u'exchange.declare'
-
-    INDEX = (40, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x0A'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'type', u'shortstr', u'shortstr', reserved=False),
-        Field(u'passive', u'bit', u'bit', reserved=False),
-        Field(u'durable', u'bit', u'bit', reserved=False),
-        Field(u'auto-delete', u'bit', u'bit', reserved=False),
-        Field(u'internal', u'bit', u'bit', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeDeclare(%s)' % (', '.join(
-            map(to_repr, [
-                self.exchange, self.type_, self.passive, self.durable,
-                self.auto_delete, self.internal, self.no_wait, self.arguments
-            ])))
-
-    def __init__(self, exchange, type_, passive, durable, auto_delete,
-                 internal, no_wait, arguments):
-        """
-        Create frame exchange.declare
-        """
-        self.exchange = exchange
-        self.type_ = type_
-        self.passive = passive
-        self.durable = durable
-        self.auto_delete = auto_delete
-        self.internal = internal
-        self.no_wait = no_wait
-        self.arguments = arguments
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.type_)))
-        buf.write(self.type_)
-        buf.write(
-            STRUCT_B.pack((self.passive << 0) | (self.durable << 1)
-                          | (self.auto_delete << 2) | (self.internal << 3)
-                          | (self.no_wait << 4)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 5 + len(self.exchange) + len(self.type_) + frame_table_size(
-            self.arguments)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeDeclare
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        type_ = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        passive = bool(_bit >> 0)
-        durable = bool(_bit >> 1)
-        auto_delete = bool(_bit >> 2)
-        internal = bool(_bit >> 3)
-        no_wait = bool(_bit >> 4)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(exchange, type_, passive, durable, auto_delete, internal,
-                   no_wait, arguments)
-
-
-class ExchangeDelete(AMQPMethodPayload):
-    """
-    Delete an exchange
-    
-    This method deletes an exchange. When an exchange is deleted all
-    queue bindings on
-    the exchange are cancelled.
-
-    :param exchange: The client must not attempt to delete an exchange that
-            does not exist.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param if_unused: Delete only if unused
-            If set, the server will only delete the exchange if it has
-            no queue bindings. If
-            the exchange has queue bindings the server does not delete
-            it but raises a
-            channel exception instead.
-    :type if_unused: bool (bit in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    """
-    __slots__ = (
-        u'exchange',
-        u'if_unused',
-        u'no_wait',
-    )
-
-    NAME = u'exchange.delete'
-
-    INDEX = (40, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x14'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'if-unused', u'bit', u'bit', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeDelete(%s)' % (', '.join(
-            map(to_repr, [self.exchange, self.if_unused, self.no_wait])))
-
-    def __init__(self, exchange, if_unused, no_wait):
-        """
-        Create frame exchange.delete
-        """
-        self.exchange = exchange
-        self.if_unused = if_unused
-        self.no_wait = no_wait
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack((self.if_unused << 0) | (self.no_wait << 1)))
-
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.exchange)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeDelete
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        if_unused = bool(_bit >> 0)
-        no_wait = bool(_bit >> 1)
-        offset += 1
-        return cls(exchange, if_unused, no_wait)
-
-
-class ExchangeDeclareOk(AMQPMethodPayload):
-    """
-    Confirm exchange declaration
-    
-    This method confirms a Declare method and confirms the name of
-    the exchange,
-    essential for automatically-named exchanges.
-
-    """
-    __slots__ = ()
-
-    NAME = u'exchange.declare-ok'
-
-    INDEX = (40, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x0B'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeDeclareOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeDeclareOk
-        offset = start_offset
-        return cls()
-
-
-class ExchangeDeleteOk(AMQPMethodPayload):
-    """
-    Confirm deletion of an exchange
-    
-    This method confirms the deletion of an exchange.
-
-    """
-    __slots__ = ()
-
-    NAME = u'exchange.delete-ok'
-
-    INDEX = (40, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x15'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeDeleteOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeDeleteOk
-        offset = start_offset
-        return cls()
-
-
-class ExchangeUnbind(AMQPMethodPayload):
-    """
-    Unbind an exchange from an exchange
-    
-    This method unbinds an exchange from an exchange.
-
-    :param destination: Specifies the name of the destination exchange to unbind.
-    :type destination: binary type (max length 255) (exchange-name in AMQP)
-    :param source: Specifies the name of the source exchange to unbind.
-    :type source: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Routing key of binding
-            Specifies the routing key of the binding to unbind.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments of binding
-            Specifies the arguments of the binding to unbind.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'destination',
-        u'source',
-        u'routing_key',
-        u'no_wait',
-        u'arguments',
-    )
-
-    NAME = u'exchange.unbind'
-
-    INDEX = (40, 40)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x28'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'destination', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'source', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeUnbind(%s)' % (', '.join(
-            map(to_repr, [
-                self.destination, self.source, self.routing_key, self.no_wait,
-                self.arguments
-            ])))
-
-    def __init__(self, destination, source, routing_key, no_wait, arguments):
-        """
-        Create frame exchange.unbind
-        """
-        self.destination = destination
-        self.source = source
-        self.routing_key = routing_key
-        self.no_wait = no_wait
-        self.arguments = arguments
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.destination)))
-        buf.write(self.destination)
-        buf.write(STRUCT_B.pack(len(self.source)))
-        buf.write(self.source)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        buf.write(STRUCT_B.pack((self.no_wait << 0)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 6 + len(self.destination) + len(self.source) + len(
-            self.routing_key) + frame_table_size(self.arguments)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeUnbind
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        destination = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        source = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_wait = bool(_bit >> 0)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(destination, source, routing_key, no_wait, arguments)
-
-
-class ExchangeUnbindOk(AMQPMethodPayload):
-    """
-    Confirm unbind successful
-    
-    This method confirms that the unbind was successful.
-
-    """
-    __slots__ = ()
-
-    NAME = u'exchange.unbind-ok'
-
-    INDEX = (40, 51)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x28\x00\x33'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x28\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'ExchangeUnbindOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ExchangeUnbindOk
-        offset = start_offset
-        return cls()
+    return ExchangeUnbindOk
 
 
 class Queue(AMQPClass):
@@ -2082,831 +2438,944 @@ class Queue(AMQPClass):
     runtime. Queues must be attached to at least one exchange in order
     to receive messages
     from publishers.
-    """
-    NAME = u'queue'
-    INDEX = 50
-
-
-class QueueBind(AMQPMethodPayload):
-    """
-    Bind queue to an exchange
-    
-    This method binds a queue to an exchange. Until a queue is bound
-    it will not
-    receive any messages. In a classic messaging model,
-    store-and-forward queues
-    are bound to a direct exchange and subscription queues are bound
-    to a topic
-    exchange.
-
-    :param queue: Specifies the name of the queue to bind.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :param exchange: Name of the exchange to bind to
-            A client MUST NOT be allowed to bind a queue to a
-            non-existent exchange.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key for the binding. The routing key
-            is used for routing
-            messages depending on the exchange configuration. Not all
-            exchanges use a
-            routing key - refer to the specific exchange documentation.
-            If the queue name
-            is empty, the server uses the last queue declared on the
-            channel. If the
-            routing key is also empty, the server uses this queue name
-            for the routing
-            key as well. If the queue name is provided but the routing
-            key is empty, the
-            server does the binding with that empty routing key. The
-            meaning of empty
-            routing keys depends on the exchange implementation.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments for binding
-            A set of arguments for the binding. The syntax and semantics
-            of these arguments
-            depends on the exchange class.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'exchange',
-        u'routing_key',
-        u'no_wait',
-        u'arguments',
-    )
-
-    NAME = u'queue.bind'
-
-    INDEX = (50, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x14'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'QueueBind(%s)' % (', '.join(
-            map(to_repr, [
-                self.queue, self.exchange, self.routing_key, self.no_wait,
-                self.arguments
-            ])))
-
-    def __init__(self, queue, exchange, routing_key, no_wait, arguments):
-        """
-        Create frame queue.bind
-        """
-        self.queue = queue
-        self.exchange = exchange
-        self.routing_key = routing_key
-        self.no_wait = no_wait
-        self.arguments = arguments
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        buf.write(STRUCT_B.pack((self.no_wait << 0)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 6 + len(self.queue) + len(self.exchange) + len(
-            self.routing_key) + frame_table_size(self.arguments)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueBind
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_wait = bool(_bit >> 0)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(queue, exchange, routing_key, no_wait, arguments)
-
-
-class QueueBindOk(AMQPMethodPayload):
-    """
-    Confirm bind successful
-    
-    This method confirms that the bind was successful.
-
-    """
-    __slots__ = ()
-
-    NAME = u'queue.bind-ok'
-
-    INDEX = (50, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x15'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x32\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'QueueBindOk(%s)' % (', '.join(map(to_repr, [])))
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueBindOk
-        offset = start_offset
-        return cls()
-
-
-class QueueDeclare(AMQPMethodPayload):
-    """
-    Declare queue, create if needed
-    
-    This method creates or checks a queue. When creating a new queue
-    the client can
-    specify various properties that control the durability of the
-    queue and its
-    contents, and the level of sharing for the queue.
-
-    :param queue: The queue name may be empty, in which case the server
-            MUST create a new
-            queue with a unique generated name and return this to
-            the client in the
-            Declare-Ok method.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :param passive: Do not create queue
-            If set, the server will reply with Declare-Ok if the queue
-            already
-            exists with the same name, and raise an error if not. The
-            client can
-            use this to check whether a queue exists without modifying
-            the
-            server state. When set, all other method fields except name
-            and no-wait
-            are ignored. A declare with both passive and no-wait has no
-            effect.
-            Arguments are compared for semantic equivalence.
-    :type passive: bool (bit in AMQP)
-    :param durable: Request a durable queue
-            If set when creating a new queue, the queue will be marked
-            as durable. Durable
-            queues remain active when a server restarts. Non-durable
-            queues (transient
-            queues) are purged if/when a server restarts. Note that
-            durable queues do not
-            necessarily hold persistent messages, although it does not
-            make sense to send
-            persistent messages to a transient queue.
-    :type durable: bool (bit in AMQP)
-    :param exclusive: Request an exclusive queue
-            Exclusive queues may only be accessed by the current
-            connection, and are
-            deleted when that connection closes. Passive declaration of
-            an exclusive
-            queue by other connections are not allowed.
-    :type exclusive: bool (bit in AMQP)
-    :param auto_delete: Auto-delete queue when unused
-            If set, the queue is deleted when all consumers have
-            finished using it. The last
-            consumer can be cancelled either explicitly or because its
-            channel is closed. If
-            there was no consumer ever on the queue, it won't be
-            deleted. Applications can
-            explicitly delete auto-delete queues using the Delete method
-            as normal.
-    :type auto_delete: bool (bit in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments for declaration
-            A set of arguments for the declaration. The syntax and
-            semantics of these
-            arguments depends on the server implementation.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'passive',
-        u'durable',
-        u'exclusive',
-        u'auto_delete',
-        u'no_wait',
-        u'arguments',
-    )
-
-    NAME = u'queue.declare'
-
-    INDEX = (50, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x0A'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'passive', u'bit', u'bit', reserved=False),
-        Field(u'durable', u'bit', u'bit', reserved=False),
-        Field(u'exclusive', u'bit', u'bit', reserved=False),
-        Field(u'auto-delete', u'bit', u'bit', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'QueueDeclare(%s)' % (', '.join(
-            map(to_repr, [
-                self.queue, self.passive, self.durable, self.exclusive,
-                self.auto_delete, self.no_wait, self.arguments
-            ])))
-
-    def __init__(self, queue, passive, durable, exclusive, auto_delete,
-                 no_wait, arguments):
-        """
-        Create frame queue.declare
-        """
-        self.queue = queue
-        self.passive = passive
-        self.durable = durable
-        self.exclusive = exclusive
-        self.auto_delete = auto_delete
-        self.no_wait = no_wait
-        self.arguments = arguments
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(
-            STRUCT_B.pack((self.passive << 0) | (self.durable << 1)
-                          | (self.exclusive << 2) | (self.auto_delete << 3)
-                          | (self.no_wait << 4)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.queue) + frame_table_size(self.arguments)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueDeclare
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        passive = bool(_bit >> 0)
-        durable = bool(_bit >> 1)
-        exclusive = bool(_bit >> 2)
-        auto_delete = bool(_bit >> 3)
-        no_wait = bool(_bit >> 4)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(queue, passive, durable, exclusive, auto_delete, no_wait,
-                   arguments)
-
-
-class QueueDelete(AMQPMethodPayload):
-    """
-    Delete a queue
-    
-    This method deletes a queue. When a queue is deleted any pending
-    messages are sent
-    to a dead-letter queue if this is defined in the server
-    configuration, and all
-    consumers on the queue are cancelled.
-
-    :param queue: Specifies the name of the queue to delete.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :param if_unused: Delete only if unused
-            If set, the server will only delete the queue if it has no
-            consumers. If the
-            queue has consumers the server does does not delete it but
-            raises a channel
-            exception instead.
-    :type if_unused: bool (bit in AMQP)
-    :param if_empty: Delete only if empty
-            If set, the server will only delete the queue if it has no
-            messages.
-    :type if_empty: bool (bit in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'if_unused',
-        u'if_empty',
-        u'no_wait',
-    )
-
-    NAME = u'queue.delete'
-
-    INDEX = (50, 40)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x28'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'if-unused', u'bit', u'bit', reserved=False),
-        Field(u'if-empty', u'bit', u'bit', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'QueueDelete(%s)' % (', '.join(
-            map(to_repr,
-                [self.queue, self.if_unused, self.if_empty, self.no_wait])))
-
-    def __init__(self, queue, if_unused, if_empty, no_wait):
-        """
-        Create frame queue.delete
-        """
-        self.queue = queue
-        self.if_unused = if_unused
-        self.if_empty = if_empty
-        self.no_wait = no_wait
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(
-            STRUCT_B.pack((self.if_unused << 0) | (self.if_empty << 1)
-                          | (self.no_wait << 2)))
-
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.queue)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueDelete
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        if_unused = bool(_bit >> 0)
-        if_empty = bool(_bit >> 1)
-        no_wait = bool(_bit >> 2)
-        offset += 1
-        return cls(queue, if_unused, if_empty, no_wait)
-
-
-class QueueDeclareOk(AMQPMethodPayload):
-    """
-    Confirms a queue definition
-    
-    This method confirms a Declare method and confirms the name of
-    the queue, essential
-    for automatically-named queues.
-
-    :param queue: Reports the name of the queue. if the server generated a
-            queue name, this field
-            contains that name.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :type message_count: int, 32 bit unsigned (message-count in AMQP)
-    :param consumer_count: Number of consumers
-            Reports the number of active consumers for the queue. Note
-            that consumers can
-            suspend activity (Channel.Flow) in which case they do not
-            appear in this count.
-    :type consumer_count: int, 32 bit unsigned (long in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'message_count',
-        u'consumer_count',
-    )
-
-    NAME = u'queue.declare-ok'
-
-    INDEX = (50, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x0B'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'message-count', u'message-count', u'long', reserved=False),
-        Field(u'consumer-count', u'long', u'long', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
-        """
-        return 'QueueDeclareOk(%s)' % (', '.join(
-            map(to_repr,
-                [self.queue, self.message_count, self.consumer_count])))
-
-    def __init__(self, queue, message_count, consumer_count):
-        """
-        Create frame queue.declare-ok
-        """
-        self.queue = queue
-        self.message_count = message_count
-        self.consumer_count = consumer_count
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_II.pack(self.message_count, self.consumer_count))
-
-    def get_size(self):  # type: () -> int
-        return 9 + len(self.queue)
-
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueDeclareOk
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        message_count, consumer_count, = STRUCT_II.unpack_from(buf, offset)
-        offset += 8
-        return cls(queue, message_count, consumer_count)
-
-
-class QueueDeleteOk(AMQPMethodPayload):
-    """
-    Confirm deletion of a queue
-    
-    This method confirms the deletion of a queue.
-
-    :param message_count: Reports the number of messages deleted.
-    :type message_count: int, 32 bit unsigned (message-count in AMQP)
-    """
-    __slots__ = (u'message_count', )
-
-    NAME = u'queue.delete-ok'
-
-    INDEX = (50, 41)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x29'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    """
+    NAME = u'queue'
+    INDEX = 50
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'message-count', u'message-count', u'long', reserved=False),
-    ]
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+def _make_QueueBind():
 
-        :return: Python string representation
+    class QueueBind(AMQPMethodPayload):
         """
-        return 'QueueDeleteOk(%s)' % (', '.join(
-            map(to_repr, [self.message_count])))
+        Bind queue to an exchange
+    
+        This method binds a queue to an exchange. Until a queue is bound
+        it will not
+        receive any messages. In a classic messaging model,
+        store-and-forward queues
+        are bound to a direct exchange and subscription queues are bound
+        to a topic
+        exchange.
+
+        :param queue: Specifies the name of the queue to bind.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :param exchange: Name of the exchange to bind to
+                A client MUST NOT be allowed to bind a queue to a
+                non-existent exchange.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key for the binding. The routing key
+                is used for routing
+                messages depending on the exchange configuration. Not all
+                exchanges use a
+                routing key - refer to the specific exchange documentation.
+                If the queue name
+                is empty, the server uses the last queue declared on the
+                channel. If the
+                routing key is also empty, the server uses this queue name
+                for the routing
+                key as well. If the queue name is provided but the routing
+                key is empty, the
+                server does the binding with that empty routing key. The
+                meaning of empty
+                routing keys depends on the exchange implementation.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments for binding
+                A set of arguments for the binding. The syntax and semantics
+                of these arguments
+                depends on the exchange class.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'exchange',
+            u'routing_key',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'queue.bind'
+
+        INDEX = (50, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x14'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueueBind(%s)' % (', '.join(
+                map(to_repr, [
+                    self.queue, self.exchange, self.routing_key, self.no_wait,
+                    self.arguments
+                ])))
+
+        def __init__(self, queue, exchange, routing_key, no_wait, arguments):
+            """
+            Create frame queue.bind
+            """
+            self.queue = queue
+            self.exchange = exchange
+            self.routing_key = routing_key
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.queue)), self.queue,
+                 STRUCT_B.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key,
+                 STRUCT_B.pack((self.no_wait << 0)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            ln = len(self.exchange)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_wait << 0))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 6 + len(self.queue) + len(self.exchange) + len(
+                self.routing_key) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueBind
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_wait = bool(_bit & 1)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(queue, exchange, routing_key, no_wait, arguments)
+
+    return QueueBind
+
+
+def _make_QueueBindOk():
+
+    class QueueBindOk(AMQPMethodPayload):
+        """
+        Confirm bind successful
+    
+        This method confirms that the bind was successful.
 
-    def __init__(self, message_count):
         """
-        Create frame queue.delete-ok
-        """
-        self.message_count = message_count
-
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_I.pack(self.message_count))
+        __slots__ = ()
 
-    def get_size(self):  # type: () -> int
-        return 4
+        NAME = u'queue.bind-ok'
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueDeleteOk
-        offset = start_offset
-        message_count, = STRUCT_I.unpack_from(buf, offset)
-        offset += 4
-        return cls(message_count)
+        INDEX = (50, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x15'  # CLASS ID + METHOD ID
 
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-class QueuePurge(AMQPMethodPayload):
-    """
-    Purge a queue
-    
-    This method removes all messages from a queue which are not
-    awaiting
-    acknowledgment.
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x32\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    :param queue: Specifies the name of the queue to purge.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'no_wait',
-    )
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'queue.purge'
+            :return: Python string representation
+            """
+            return 'QueueBindOk(%s)' % (', '.join(map(to_repr, [])))
 
-    INDEX = (50, 30)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x1E'  # CLASS ID + METHOD ID
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueBindOk
+            offset = start_offset
+            return cls()
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    return QueueBindOk
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-    ]
+def _make_QueueDeclare():
 
-    def __repr__(self):  # type: () -> str
+    class QueueDeclare(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Declare queue, create if needed
+    
+        This method creates or checks a queue. When creating a new queue
+        the client can
+        specify various properties that control the durability of the
+        queue and its
+        contents, and the level of sharing for the queue.
+
+        :param queue: The queue name may be empty, in which case the server
+                MUST create a new
+                queue with a unique generated name and return this to
+                the client in the
+                Declare-Ok method.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :param passive: Do not create queue
+                If set, the server will reply with Declare-Ok if the queue
+                already
+                exists with the same name, and raise an error if not. The
+                client can
+                use this to check whether a queue exists without modifying
+                the
+                server state. When set, all other method fields except name
+                and no-wait
+                are ignored. A declare with both passive and no-wait has no
+                effect.
+                Arguments are compared for semantic equivalence.
+        :type passive: bool (bit in AMQP)
+        :param durable: Request a durable queue
+                If set when creating a new queue, the queue will be marked
+                as durable. Durable
+                queues remain active when a server restarts. Non-durable
+                queues (transient
+                queues) are purged if/when a server restarts. Note that
+                durable queues do not
+                necessarily hold persistent messages, although it does not
+                make sense to send
+                persistent messages to a transient queue.
+        :type durable: bool (bit in AMQP)
+        :param exclusive: Request an exclusive queue
+                Exclusive queues may only be accessed by the current
+                connection, and are
+                deleted when that connection closes. Passive declaration of
+                an exclusive
+                queue by other connections are not allowed.
+        :type exclusive: bool (bit in AMQP)
+        :param auto_delete: Auto-delete queue when unused
+                If set, the queue is deleted when all consumers have
+                finished using it. The last
+                consumer can be cancelled either explicitly or because its
+                channel is closed. If
+                there was no consumer ever on the queue, it won't be
+                deleted. Applications can
+                explicitly delete auto-delete queues using the Delete method
+                as normal.
+        :type auto_delete: bool (bit in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments for declaration
+                A set of arguments for the declaration. The syntax and
+                semantics of these
+                arguments depends on the server implementation.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'passive',
+            u'durable',
+            u'exclusive',
+            u'auto_delete',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'queue.declare'
+
+        INDEX = (50, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x0A'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'passive', u'bit', u'bit', reserved=False),
+            Field(u'durable', u'bit', u'bit', reserved=False),
+            Field(u'exclusive', u'bit', u'bit', reserved=False),
+            Field(u'auto-delete', u'bit', u'bit', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueueDeclare(%s)' % (', '.join(
+                map(to_repr, [
+                    self.queue, self.passive, self.durable, self.exclusive,
+                    self.auto_delete, self.no_wait, self.arguments
+                ])))
+
+        def __init__(self, queue, passive, durable, exclusive, auto_delete,
+                     no_wait, arguments):
+            """
+            Create frame queue.declare
+            """
+            self.queue = queue
+            self.passive = passive
+            self.durable = durable
+            self.exclusive = exclusive
+            self.auto_delete = auto_delete
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.queue)), self.queue,
+                 STRUCT_B.pack((self.passive << 0) | (self.durable << 1)
+                               | (self.exclusive << 2)
+                               | (self.auto_delete << 3)
+                               | (self.no_wait << 4)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.passive << 0) |
+                               (self.durable << 1) | (self.exclusive << 2) |
+                               (self.auto_delete << 3) | (self.no_wait << 4))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.queue) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueDeclare
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            passive = bool(_bit & 1)
+            durable = bool(_bit & 2)
+            exclusive = bool(_bit & 4)
+            auto_delete = bool(_bit & 8)
+            no_wait = bool(_bit & 16)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(queue, passive, durable, exclusive, auto_delete,
+                       no_wait, arguments)
+
+    return QueueDeclare
+
+
+def _make_QueueDelete():
+
+    class QueueDelete(AMQPMethodPayload):
+        """
+        Delete a queue
+    
+        This method deletes a queue. When a queue is deleted any pending
+        messages are sent
+        to a dead-letter queue if this is defined in the server
+        configuration, and all
+        consumers on the queue are cancelled.
+
+        :param queue: Specifies the name of the queue to delete.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :param if_unused: Delete only if unused
+                If set, the server will only delete the queue if it has no
+                consumers. If the
+                queue has consumers the server does does not delete it but
+                raises a channel
+                exception instead.
+        :type if_unused: bool (bit in AMQP)
+        :param if_empty: Delete only if empty
+                If set, the server will only delete the queue if it has no
+                messages.
+        :type if_empty: bool (bit in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'if_unused',
+            u'if_empty',
+            u'no_wait',
+        )
+
+        NAME = u'queue.delete'
+
+        INDEX = (50, 40)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x28'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'if-unused', u'bit', u'bit', reserved=False),
+            Field(u'if-empty', u'bit', u'bit', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueueDelete(%s)' % (', '.join(
+                map(to_repr,
+                    [self.queue, self.if_unused, self.if_empty, self.no_wait
+                     ])))
+
+        def __init__(self, queue, if_unused, if_empty, no_wait):
+            """
+            Create frame queue.delete
+            """
+            self.queue = queue
+            self.if_unused = if_unused
+            self.if_empty = if_empty
+            self.no_wait = no_wait
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.queue)), self.queue,
+                 STRUCT_B.pack((self.if_unused << 0) | (self.if_empty << 1)
+                               | (self.no_wait << 2)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.if_unused << 0) |
+                               (self.if_empty << 1) | (self.no_wait << 2))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.queue)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueDelete
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            if_unused = bool(_bit & 1)
+            if_empty = bool(_bit & 2)
+            no_wait = bool(_bit & 4)
+            return cls(queue, if_unused, if_empty, no_wait)
+
+    return QueueDelete
+
+
+def _make_QueueDeclareOk():
+
+    class QueueDeclareOk(AMQPMethodPayload):
+        """
+        Confirms a queue definition
+    
+        This method confirms a Declare method and confirms the name of
+        the queue, essential
+        for automatically-named queues.
+
+        :param queue: Reports the name of the queue. if the server generated a
+                queue name, this field
+                contains that name.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :type message_count: int, 32 bit unsigned (message-count in AMQP)
+        :param consumer_count: Number of consumers
+                Reports the number of active consumers for the queue. Note
+                that consumers can
+                suspend activity (Channel.Flow) in which case they do not
+                appear in this count.
+        :type consumer_count: int, 32 bit unsigned (long in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'message_count',
+            u'consumer_count',
+        )
+
+        NAME = u'queue.declare-ok'
+
+        INDEX = (50, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x0B'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'message-count', u'message-count', u'long', reserved=False),
+            Field(u'consumer-count', u'long', u'long', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueueDeclareOk(%s)' % (', '.join(
+                map(to_repr,
+                    [self.queue, self.message_count, self.consumer_count])))
+
+        def __init__(self, queue, message_count, consumer_count):
+            """
+            Create frame queue.declare-ok
+            """
+            self.queue = queue
+            self.message_count = message_count
+            self.consumer_count = consumer_count
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join((STRUCT_B.pack(len(self.queue)), self.queue,
+                                STRUCT_II.pack(self.message_count,
+                                               self.consumer_count))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            STRUCT_II.pack_into(buf, offset, self.message_count,
+                                self.consumer_count)
+            return offset + 8
+
+        def get_size(self):  # type: () -> int
+            return 9 + len(self.queue)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueDeclareOk
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            message_count, consumer_count, = STRUCT_II.unpack_from(buf, offset)
+            offset += 8
+            return cls(queue, message_count, consumer_count)
+
+    return QueueDeclareOk
+
+
+def _make_QueueDeleteOk():
+
+    class QueueDeleteOk(AMQPMethodPayload):
+        """
+        Confirm deletion of a queue
+    
+        This method confirms the deletion of a queue.
 
-        :return: Python string representation
+        :param message_count: Reports the number of messages deleted.
+        :type message_count: int, 32 bit unsigned (message-count in AMQP)
         """
-        return 'QueuePurge(%s)' % (', '.join(
-            map(to_repr, [self.queue, self.no_wait])))
+        __slots__ = (u'message_count', )
 
-    def __init__(self, queue, no_wait):
-        """
-        Create frame queue.purge
-        """
-        self.queue = queue
-        self.no_wait = no_wait
+        NAME = u'queue.delete-ok'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_B.pack((self.no_wait << 0)))
+        INDEX = (50, 41)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x29'  # CLASS ID + METHOD ID
 
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.queue)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueuePurge
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_wait = bool(_bit >> 0)
-        offset += 1
-        return cls(queue, no_wait)
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'message-count', u'message-count', u'long', reserved=False),
+        ]
 
-class QueuePurgeOk(AMQPMethodPayload):
-    """
-    Confirms a queue purge
-    
-    This method confirms the purge of a queue.
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    :param message_count: Reports the number of messages purged.
-    :type message_count: int, 32 bit unsigned (message-count in AMQP)
-    """
-    __slots__ = (u'message_count', )
+            :return: Python string representation
+            """
+            return 'QueueDeleteOk(%s)' % (', '.join(
+                map(to_repr, [self.message_count])))
 
-    NAME = u'queue.purge-ok'
+        def __init__(self, message_count):
+            """
+            Create frame queue.delete-ok
+            """
+            self.message_count = message_count
 
-    INDEX = (50, 31)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x1F'  # CLASS ID + METHOD ID
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_I.pack(self.message_count))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_I.pack_into(buf, offset, self.message_count)
+            return offset + 4
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def get_size(self):  # type: () -> int
+            return 4
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'message-count', u'message-count', u'long', reserved=False),
-    ]
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueDeleteOk
+            offset = start_offset
+            message_count, = STRUCT_I.unpack_from(buf, offset)
+            offset += 4
+            return cls(message_count)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    return QueueDeleteOk
 
-        :return: Python string representation
-        """
-        return 'QueuePurgeOk(%s)' % (', '.join(
-            map(to_repr, [self.message_count])))
 
-    def __init__(self, message_count):
-        """
-        Create frame queue.purge-ok
+def _make_QueuePurge():
+
+    class QueuePurge(AMQPMethodPayload):
         """
-        self.message_count = message_count
+        Purge a queue
+    
+        This method removes all messages from a queue which are not
+        awaiting
+        acknowledgment.
+
+        :param queue: Specifies the name of the queue to purge.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'no_wait',
+        )
+
+        NAME = u'queue.purge'
+
+        INDEX = (50, 30)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x1E'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueuePurge(%s)' % (', '.join(
+                map(to_repr, [self.queue, self.no_wait])))
+
+        def __init__(self, queue, no_wait):
+            """
+            Create frame queue.purge
+            """
+            self.queue = queue
+            self.no_wait = no_wait
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join((STRUCT_2xB.pack(len(self.queue)), self.queue,
+                                STRUCT_B.pack((self.no_wait << 0)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_wait << 0))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.queue)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueuePurge
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_wait = bool(_bit & 1)
+            return cls(queue, no_wait)
+
+    return QueuePurge
+
+
+def _make_QueuePurgeOk():
+
+    class QueuePurgeOk(AMQPMethodPayload):
+        """
+        Confirms a queue purge
+    
+        This method confirms the purge of a queue.
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_I.pack(self.message_count))
+        :param message_count: Reports the number of messages purged.
+        :type message_count: int, 32 bit unsigned (message-count in AMQP)
+        """
+        __slots__ = (u'message_count', )
 
-    def get_size(self):  # type: () -> int
-        return 4
+        NAME = u'queue.purge-ok'
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueuePurgeOk
-        offset = start_offset
-        message_count, = STRUCT_I.unpack_from(buf, offset)
-        offset += 4
-        return cls(message_count)
+        INDEX = (50, 31)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x1F'  # CLASS ID + METHOD ID
 
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-class QueueUnbind(AMQPMethodPayload):
-    """
-    Unbind a queue from an exchange
-    
-    This method unbinds a queue from an exchange.
-
-    :param queue: Specifies the name of the queue to unbind.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :param exchange: The name of the exchange to unbind from.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Routing key of binding
-            Specifies the routing key of the binding to unbind.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :param arguments: Arguments of binding
-            Specifies the arguments of the binding to unbind.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
-    """
-    __slots__ = (
-        u'queue',
-        u'exchange',
-        u'routing_key',
-        u'arguments',
-    )
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    NAME = u'queue.unbind'
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'message-count', u'message-count', u'long', reserved=False),
+        ]
 
-    INDEX = (50, 50)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x32'  # CLASS ID + METHOD ID
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+            :return: Python string representation
+            """
+            return 'QueuePurgeOk(%s)' % (', '.join(
+                map(to_repr, [self.message_count])))
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def __init__(self, message_count):
+            """
+            Create frame queue.purge-ok
+            """
+            self.message_count = message_count
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_I.pack(self.message_count))
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_I.pack_into(buf, offset, self.message_count)
+            return offset + 4
 
-        :return: Python string representation
-        """
-        return 'QueueUnbind(%s)' % (', '.join(
-            map(to_repr,
-                [self.queue, self.exchange, self.routing_key, self.arguments
-                 ])))
+        def get_size(self):  # type: () -> int
+            return 4
 
-    def __init__(self, queue, exchange, routing_key, arguments):
-        """
-        Create frame queue.unbind
-        """
-        self.queue = queue
-        self.exchange = exchange
-        self.routing_key = routing_key
-        self.arguments = arguments
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueuePurgeOk
+            offset = start_offset
+            message_count, = STRUCT_I.unpack_from(buf, offset)
+            offset += 4
+            return cls(message_count)
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 5 + len(self.queue) + len(self.exchange) + len(
-            self.routing_key) + frame_table_size(self.arguments)
+    return QueuePurgeOk
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueUnbind
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        arguments, delta = deframe_table(buf, offset)
-        offset += delta
-        return cls(queue, exchange, routing_key, arguments)
 
+def _make_QueueUnbind():
 
-class QueueUnbindOk(AMQPMethodPayload):
-    """
-    Confirm unbind successful
+    class QueueUnbind(AMQPMethodPayload):
+        """
+        Unbind a queue from an exchange
     
-    This method confirms that the unbind was successful.
+        This method unbinds a queue from an exchange.
+
+        :param queue: Specifies the name of the queue to unbind.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :param exchange: The name of the exchange to unbind from.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Routing key of binding
+                Specifies the routing key of the binding to unbind.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :param arguments: Arguments of binding
+                Specifies the arguments of the binding to unbind.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'exchange',
+            u'routing_key',
+            u'arguments',
+        )
+
+        NAME = u'queue.unbind'
+
+        INDEX = (50, 50)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x32'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'QueueUnbind(%s)' % (', '.join(
+                map(to_repr, [
+                    self.queue, self.exchange, self.routing_key, self.arguments
+                ])))
+
+        def __init__(self, queue, exchange, routing_key, arguments):
+            """
+            Create frame queue.unbind
+            """
+            self.queue = queue
+            self.exchange = exchange
+            self.routing_key = routing_key
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.queue)), self.queue,
+                 STRUCT_B.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key)))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            ln = len(self.exchange)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 5 + len(self.queue) + len(self.exchange) + len(
+                self.routing_key) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueUnbind
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(queue, exchange, routing_key, arguments)
+
+    return QueueUnbind
+
+
+def _make_QueueUnbindOk():
+
+    class QueueUnbindOk(AMQPMethodPayload):
+        """
+        Confirm unbind successful
+    
+        This method confirms that the unbind was successful.
 
-    """
-    __slots__ = ()
+        """
+        __slots__ = ()
 
-    NAME = u'queue.unbind-ok'
+        NAME = u'queue.unbind-ok'
 
-    INDEX = (50, 51)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x32\x00\x33'  # CLASS ID + METHOD ID
+        INDEX = (50, 51)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x32\x00\x33'  # CLASS ID + METHOD ID
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x32\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x32\x00\x33\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'QueueUnbindOk(%s)' % (', '.join(map(to_repr, [])))
+            :return: Python string representation
+            """
+            return 'QueueUnbindOk(%s)' % (', '.join(map(to_repr, [])))
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> QueueUnbindOk
-        offset = start_offset
-        return cls()
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> QueueUnbindOk
+            offset = start_offset
+            return cls()
+
+    return QueueUnbindOk
 
 
 class Basic(AMQPClass):
@@ -2944,6 +3413,9 @@ class BasicContentPropertyList(AMQPContentPropertyList):
     # A dictionary from a zero property list to a class typized with
     # some fields
     PARTICULAR_CLASSES = {}
+    # A dictionary from a frozenset of names of fields to a class typized
+    # with them
+    FIELDS_TO_CLASSES = {}
 
     def __new__(self, **kwargs):
         """
@@ -2977,6 +3449,14 @@ class BasicContentPropertyList(AMQPContentPropertyList):
         :param reserved: reserved, must be empty
         :type reserved: binary type (max length 255) (AMQP as shortstr)
         """
+        names = frozenset(kwargs)
+        try:
+            particular = BasicContentPropertyList.FIELDS_TO_CLASSES[names]
+        except KeyError:
+            pass
+        else:
+            return particular(**kwargs)
+
         zpf = bytearray([
             (('content_type' in kwargs) << 7) |
             (('content_encoding' in kwargs) << 6) |
@@ -3007,15 +3487,18 @@ class BasicContentPropertyList(AMQPContentPropertyList):
         #       If you do not know in advance what properties you will be using, it is correct to use
         #       this constructor.
         if zpf in BasicContentPropertyList.PARTICULAR_CLASSES:
-            return BasicContentPropertyList.PARTICULAR_CLASSES[zpf](**kwargs)
+            particular = BasicContentPropertyList.PARTICULAR_CLASSES[zpf]
         else:
             logger.debug(
                 'Property field (BasicContentPropertyList:%s) not seen yet, compiling',
                 repr(zpf))
-            c = compile_particular_content_property_list_class(
+            particular = compile_particular_content_property_list_class(
                 zpf, BasicContentPropertyList.FIELDS)
-            BasicContentPropertyList.PARTICULAR_CLASSES[zpf] = c
-            return c(**kwargs)
+            BasicContentPropertyList.PARTICULAR_CLASSES[zpf] = particular
+        props = particular(**kwargs)
+        # remember it only if the names turned out valid
+        BasicContentPropertyList.FIELDS_TO_CLASSES[names] = particular
+        return props
 
     @staticmethod
     def typize(*fields):  # type: (*str) -> type
@@ -3024,22 +3507,24 @@ class BasicContentPropertyList(AMQPContentPropertyList):
             (('content_encoding' in fields) << 6) |
             (('headers' in fields) << 5) | (('delivery_mode' in fields) << 4) |
             (('priority' in fields) << 3) | (('correlation_id' in fields) << 2)
-            | (('reply_to' in fields) << 1) | int('expiration' in kwargs),
+            | (('reply_to' in fields) << 1) | int('expiration' in fields),
             (('message_id' in fields) << 7) | (('timestamp' in fields) << 6) |
             (('type_' in fields) << 5) | (('user_id' in fields) << 4) |
             (('app_id' in fields) << 3) | (('reserved' in fields) << 2)
         ])
         zpf = six.binary_type(zpf)
         if zpf in BasicContentPropertyList.PARTICULAR_CLASSES:
-            return BasicContentPropertyList.PARTICULAR_CLASSES[zpf]
+            particular = BasicContentPropertyList.PARTICULAR_CLASSES[zpf]
         else:
             logger.debug(
                 'Property field (BasicContentPropertyList:%s) not seen yet, compiling',
                 repr(zpf))
-            c = compile_particular_content_property_list_class(
+            particular = compile_particular_content_property_list_class(
                 zpf, BasicContentPropertyList.FIELDS)
-            BasicContentPropertyList.PARTICULAR_CLASSES[zpf] = c
-            return c
+            BasicContentPropertyList.PARTICULAR_CLASSES[zpf] = particular
+        BasicContentPropertyList.FIELDS_TO_CLASSES[frozenset(
+            fields)] = particular
+        return particular
 
     @staticmethod
     def from_buffer(buf,
@@ -3071,1454 +3556,2898 @@ class BasicContentPropertyList(AMQPContentPropertyList):
             return c.from_buffer(buf, offset)
 
 
-class BasicAck(AMQPMethodPayload):
+class BasicContentPropertyList_0000(AMQPContentPropertyList):
     """
-    Acknowledge one or more messages
-    
-    When sent by the client, this method acknowledges one or more
-    messages delivered via the Deliver or Get-Ok methods.
-    When sent by server, this method acknowledges one or more
-    messages published with the Publish method on a channel in
-    confirm mode.
-    The acknowledgement can be for a single message or a set of
-    messages up to and including a specific message.
-
-    :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
-    :param multiple: Acknowledge multiple messages
-            If set to 1, the delivery tag is treated as "up to and
-            including", so that multiple messages can be acknowledged
-            with a single method. If set to zero, the delivery tag
-            refers to a single message. If the multiple field is 1, and
-            the delivery tag is zero, this indicates acknowledgement of
-            all outstanding messages.
-    :type multiple: bool (bit in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
-    __slots__ = (
-        u'delivery_tag',
-        u'multiple',
-    )
 
-    NAME = u'basic.ack'
+    __slots__ = (u'_serialized', )
 
-    INDEX = (60, 80)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x50'  # CLASS ID + METHOD ID
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x00\x00'
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+    def __init__(self):
+        self._serialized = None
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'\x00\x00')
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'delivery-tag', u'delivery-tag', u'longlong', reserved=False),
-        Field(u'multiple', u'bit', u'bit', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        return cls()
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicAck(%s)' % (', '.join(
-            map(to_repr, [self.delivery_tag, self.multiple])))
+class BasicContentPropertyList_8000(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __init__(self, delivery_tag, multiple):
-        """
-        Create frame basic.ack
-        """
-        self.delivery_tag = delivery_tag
-        self.multiple = multiple
+    """
+
+    __slots__ = (
+        u'_content_type',
+        u'_serialized',
+    )
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_QB.pack(self.delivery_tag, (self.multiple << 0)))
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x80\x00'
 
-    def get_size(self):  # type: () -> int
-        return 9
+    content_type = property(attrgetter('_content_type'))
+
+    def __init__(self, content_type):
+        self._content_type = content_type
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\x80\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type)))
 
     @classmethod
-    def from_buffer(cls, buf, start_offset):  # type: (buffer, int) -> BasicAck
-        offset = start_offset
-        delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
-        offset += 8
-        multiple = bool(_bit >> 0)
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        return cls(delivery_tag, multiple)
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        return cls(content_type)
 
 
-class BasicConsume(AMQPMethodPayload):
+class BasicContentPropertyList_1000(AMQPContentPropertyList):
     """
-    Start a queue consumer
-    
-    This method asks the server to start a "consumer", which is a
-    transient request for
-    messages from a specific queue. Consumers last as long as the
-    channel they were
-    declared on, or until the client cancels them.
-
-    :param queue: Specifies the name of the queue to consume from.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :param consumer_tag: Specifies the identifier for the consumer. the consumer tag
-            is local to a
-            channel, so two clients can use the same consumer tags. If
-            this field is
-            empty the server will generate a unique tag.
-    :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
-    :type no_local: bool (no-local in AMQP)
-    :type no_ack: bool (no-ack in AMQP)
-    :param exclusive: Request exclusive access
-            Request exclusive consumer access, meaning only this
-            consumer can access the
-            queue.
-    :type exclusive: bool (bit in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
-    :param arguments: Arguments for declaration
-            A set of arguments for the consume. The syntax and semantics
-            of these
-            arguments depends on the server implementation.
-    :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'queue',
-        u'consumer_tag',
-        u'no_local',
-        u'no_ack',
-        u'exclusive',
-        u'no_wait',
-        u'arguments',
+        u'_delivery_mode',
+        u'_serialized',
     )
 
-    NAME = u'basic.consume'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x10\x00'
 
-    INDEX = (60, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x14'  # CLASS ID + METHOD ID
+    delivery_mode = property(attrgetter('_delivery_mode'))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    def __init__(self, delivery_mode):
+        self._delivery_mode = delivery_mode
+        self._serialized = None
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'\x10\x00')
+        buf.write(STRUCT_B.pack(self._delivery_mode))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'consumer-tag', u'consumer-tag', u'shortstr', reserved=False),
-        Field(u'no-local', u'no-local', u'bit', reserved=False),
-        Field(u'no-ack', u'no-ack', u'bit', reserved=False),
-        Field(u'exclusive', u'bit', u'bit', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-        Field(u'arguments', u'table', u'table', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(delivery_mode)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicConsume(%s)' % (', '.join(
-            map(to_repr, [
-                self.queue, self.consumer_tag, self.no_local, self.no_ack,
-                self.exclusive, self.no_wait, self.arguments
-            ])))
+class BasicContentPropertyList_2000(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __init__(self, queue, consumer_tag, no_local, no_ack, exclusive,
-                 no_wait, arguments):
-        """
-        Create frame basic.consume
-        """
-        self.queue = queue
-        self.consumer_tag = consumer_tag
-        self.no_local = no_local
-        self.no_ack = no_ack
-        self.exclusive = exclusive
-        self.no_wait = no_wait
-        self.arguments = arguments
+    """
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_B.pack(len(self.consumer_tag)))
-        buf.write(self.consumer_tag)
-        buf.write(
-            STRUCT_B.pack((self.no_local << 0) | (self.no_ack << 1)
-                          | (self.exclusive << 2) | (self.no_wait << 3)))
-        enframe_table(buf, self.arguments)
-
-    def get_size(self):  # type: () -> int
-        return 5 + len(self.queue) + len(self.consumer_tag) + frame_table_size(
-            self.arguments)
+    __slots__ = (
+        u'_headers',
+        u'_serialized',
+    )
+
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b' \x00'
+
+    headers = property(attrgetter('_headers'))
+
+    def __init__(self, headers):
+        self._headers = headers
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b' \x00')
+        enframe_table(buf, self._headers)
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicConsume
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        consumer_tag = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_local = bool(_bit >> 0)
-        no_ack = bool(_bit >> 1)
-        exclusive = bool(_bit >> 2)
-        no_wait = bool(_bit >> 3)
-        offset += 1
-        arguments, delta = deframe_table(buf, offset)
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        headers, delta = deframe_lazy_table(buf, offset)
         offset += delta
-        return cls(queue, consumer_tag, no_local, no_ack, exclusive, no_wait,
-                   arguments)
+        return cls(headers)
 
 
-class BasicCancel(AMQPMethodPayload):
+class BasicContentPropertyList_0400(AMQPContentPropertyList):
     """
-    End a queue consumer
-    
-    This method cancels a consumer. This does not affect already
-    delivered
-    messages, but it does mean the server will not send any more
-    messages for
-    that consumer. The client may receive an arbitrary number of
-    messages in
-    between sending the cancel method and receiving the cancel-ok
-    reply.
-    It may also be sent from the server to the client in the event
-    of the consumer being unexpectedly cancelled (i.e. cancelled
-    for any reason other than the server receiving the
-    corresponding basic.cancel from the client). This allows
-    clients to be notified of the loss of consumers due to events
-    such as queue deletion. Note that as it is not a MUST for
-    clients to accept this method from the server, it is advisable
-    for the broker to be able to identify those clients that are
-    capable of accepting the method, through some means of
-    capability negotiation.
-
-    :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
-    :type no_wait: bool (no-wait in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'consumer_tag',
-        u'no_wait',
+        u'_correlation_id',
+        u'_serialized',
     )
 
-    NAME = u'basic.cancel'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x04\x00'
 
-    INDEX = (60, 30)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x1E'  # CLASS ID + METHOD ID
+    correlation_id = property(attrgetter('_correlation_id'))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+    def __init__(self, correlation_id):
+        self._correlation_id = correlation_id
+        self._serialized = None
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'\x04\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._correlation_id)), self._correlation_id)))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'consumer-tag', u'consumer-tag', u'shortstr', reserved=False),
-        Field(u'no-wait', u'no-wait', u'bit', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        correlation_id = buf[offset:offset + s_len]
+        offset += s_len
+        return cls(correlation_id)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicCancel(%s)' % (', '.join(
-            map(to_repr, [self.consumer_tag, self.no_wait])))
+class BasicContentPropertyList_c000(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __init__(self, consumer_tag, no_wait):
-        """
-        Create frame basic.cancel
-        """
-        self.consumer_tag = consumer_tag
-        self.no_wait = no_wait
+    """
+
+    __slots__ = (
+        u'_content_type',
+        u'_content_encoding',
+        u'_serialized',
+    )
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.consumer_tag)))
-        buf.write(self.consumer_tag)
-        buf.write(STRUCT_B.pack((self.no_wait << 0)))
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xc0\x00'
 
-    def get_size(self):  # type: () -> int
-        return 2 + len(self.consumer_tag)
+    content_type = property(attrgetter('_content_type'))
+    content_encoding = property(attrgetter('_content_encoding'))
+
+    def __init__(self, content_type, content_encoding):
+        self._content_type = content_type
+        self._content_encoding = content_encoding
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\xc0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._content_encoding)),
+             self._content_encoding)))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicCancel
-        offset = start_offset
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        consumer_tag = buf[offset:offset + s_len]
+        content_type = buf[offset:offset + s_len]
         offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_wait = bool(_bit >> 0)
+        s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        return cls(consumer_tag, no_wait)
+        content_encoding = buf[offset:offset + s_len]
+        offset += s_len
+        return cls(content_type, content_encoding)
 
 
-class BasicConsumeOk(AMQPMethodPayload):
+class BasicContentPropertyList_9000(AMQPContentPropertyList):
     """
-    Confirm a new consumer
-    
-    The server provides the client with a consumer tag, which is
-    used by the client
-    for methods called on the consumer at a later stage.
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    :param consumer_tag: Holds the consumer tag specified by the client or provided
-            by the server.
-    :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
     """
-    __slots__ = (u'consumer_tag', )
-
-    NAME = u'basic.consume-ok'
-
-    INDEX = (60, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x15'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
-
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'consumer-tag', u'consumer-tag', u'shortstr', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    __slots__ = (
+        u'_content_type',
+        u'_delivery_mode',
+        u'_serialized',
+    )
 
-        :return: Python string representation
-        """
-        return 'BasicConsumeOk(%s)' % (', '.join(
-            map(to_repr, [self.consumer_tag])))
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x90\x00'
 
-    def __init__(self, consumer_tag):
-        """
-        Create frame basic.consume-ok
-        """
-        self.consumer_tag = consumer_tag
+    content_type = property(attrgetter('_content_type'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.consumer_tag)))
-        buf.write(self.consumer_tag)
+    def __init__(self, content_type, delivery_mode):
+        self._content_type = content_type
+        self._delivery_mode = delivery_mode
+        self._serialized = None
 
-    def get_size(self):  # type: () -> int
-        return 1 + len(self.consumer_tag)
+    def write_fields_to(self, buf):
+        buf.write(b'\x90\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(self._delivery_mode))))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicConsumeOk
-        offset = start_offset
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        consumer_tag = buf[offset:offset + s_len]
+        content_type = buf[offset:offset + s_len]
         offset += s_len
-        return cls(consumer_tag)
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(content_type, delivery_mode)
 
 
-class BasicCancelOk(AMQPMethodPayload):
+class BasicContentPropertyList_a000(AMQPContentPropertyList):
     """
-    Confirm a cancelled consumer
-    
-    This method confirms that the cancellation was completed.
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
     """
-    __slots__ = (u'consumer_tag', )
 
-    NAME = u'basic.cancel-ok'
+    __slots__ = (
+        u'_content_type',
+        u'_headers',
+        u'_serialized',
+    )
 
-    INDEX = (60, 31)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x1F'  # CLASS ID + METHOD ID
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xa0\x00'
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+    content_type = property(attrgetter('_content_type'))
+    headers = property(attrgetter('_headers'))
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def __init__(self, content_type, headers):
+        self._content_type = content_type
+        self._headers = headers
+        self._serialized = None
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'consumer-tag', u'consumer-tag', u'shortstr', reserved=False),
-    ]
+    def write_fields_to(self, buf):
+        buf.write(b'\xa0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type)))
+        enframe_table(buf, self._headers)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        headers, delta = deframe_lazy_table(buf, offset)
+        offset += delta
+        return cls(content_type, headers)
 
-        :return: Python string representation
-        """
-        return 'BasicCancelOk(%s)' % (', '.join(
-            map(to_repr, [self.consumer_tag])))
 
-    def __init__(self, consumer_tag):
-        """
-        Create frame basic.cancel-ok
-        """
-        self.consumer_tag = consumer_tag
+class BasicContentPropertyList_8400(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
+    """
+
+    __slots__ = (
+        u'_content_type',
+        u'_correlation_id',
+        u'_serialized',
+    )
+
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x84\x00'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.consumer_tag)))
-        buf.write(self.consumer_tag)
+    content_type = property(attrgetter('_content_type'))
+    correlation_id = property(attrgetter('_correlation_id'))
 
-    def get_size(self):  # type: () -> int
-        return 1 + len(self.consumer_tag)
+    def __init__(self, content_type, correlation_id):
+        self._content_type = content_type
+        self._correlation_id = correlation_id
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\x84\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._correlation_id)), self._correlation_id)))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicCancelOk
-        offset = start_offset
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        consumer_tag = buf[offset:offset + s_len]
+        correlation_id = buf[offset:offset + s_len]
         offset += s_len
-        return cls(consumer_tag)
+        return cls(content_type, correlation_id)
 
 
-class BasicDeliver(AMQPMethodPayload):
+class BasicContentPropertyList_3000(AMQPContentPropertyList):
     """
-    Notify the client of a consumer message
-    
-    This method delivers a message to the client, via a consumer. In
-    the asynchronous
-    message delivery model, the client starts a consumer using the
-    Consume method, then
-    the server responds with Deliver methods as and when messages
-    arrive for that
-    consumer.
-
-    :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
-    :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
-    :type redelivered: bool (redelivered in AMQP)
-    :param exchange: Specifies the name of the exchange that the message was
-            originally published to.
-            May be empty, indicating the default exchange.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key name specified when the message
-            was published.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'consumer_tag',
-        u'delivery_tag',
-        u'redelivered',
-        u'exchange',
-        u'routing_key',
+        u'_headers',
+        u'_delivery_mode',
+        u'_serialized',
     )
 
-    NAME = u'basic.deliver'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'0\x00'
 
-    INDEX = (60, 60)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x3C'  # CLASS ID + METHOD ID
+    headers = property(attrgetter('_headers'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+    def __init__(self, headers, delivery_mode):
+        self._headers = headers
+        self._delivery_mode = delivery_mode
+        self._serialized = None
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'0\x00')
+        enframe_table(buf, self._headers)
+        buf.write(STRUCT_B.pack(self._delivery_mode))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'consumer-tag', u'consumer-tag', u'shortstr', reserved=False),
-        Field(u'delivery-tag', u'delivery-tag', u'longlong', reserved=False),
-        Field(u'redelivered', u'redelivered', u'bit', reserved=False),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        headers, delta = deframe_lazy_table(buf, offset)
+        offset += delta
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(headers, delivery_mode)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicDeliver(%s)' % (', '.join(
-            map(to_repr, [
-                self.consumer_tag, self.delivery_tag, self.redelivered,
-                self.exchange, self.routing_key
-            ])))
+class BasicContentPropertyList_0600(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __init__(self, consumer_tag, delivery_tag, redelivered, exchange,
-                 routing_key):
-        """
-        Create frame basic.deliver
-        """
-        self.consumer_tag = consumer_tag
-        self.delivery_tag = delivery_tag
-        self.redelivered = redelivered
-        self.exchange = exchange
-        self.routing_key = routing_key
+    """
+
+    __slots__ = (
+        u'_correlation_id',
+        u'_reply_to',
+        u'_serialized',
+    )
+
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x06\x00'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack(len(self.consumer_tag)))
-        buf.write(self.consumer_tag)
-        buf.write(
-            STRUCT_QBB.pack(self.delivery_tag, (self.redelivered << 0),
-                            len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
+    correlation_id = property(attrgetter('_correlation_id'))
+    reply_to = property(attrgetter('_reply_to'))
 
-    def get_size(self):  # type: () -> int
-        return 12 + len(self.consumer_tag) + len(self.exchange) + len(
-            self.routing_key)
+    def __init__(self, correlation_id, reply_to):
+        self._correlation_id = correlation_id
+        self._reply_to = reply_to
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\x06\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._correlation_id)), self._correlation_id,
+             STRUCT_B.pack(len(self._reply_to)), self._reply_to)))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicDeliver
-        offset = start_offset
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        consumer_tag = buf[offset:offset + s_len]
-        offset += s_len
-        delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
-        offset += 8
-        redelivered = bool(_bit >> 0)
-        offset += 1
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        exchange = buf[offset:offset + s_len]
+        correlation_id = buf[offset:offset + s_len]
         offset += s_len
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        routing_key = buf[offset:offset + s_len]
+        reply_to = buf[offset:offset + s_len]
         offset += s_len
-        return cls(consumer_tag, delivery_tag, redelivered, exchange,
-                   routing_key)
+        return cls(correlation_id, reply_to)
 
 
-class BasicGet(AMQPMethodPayload):
+class BasicContentPropertyList_d000(AMQPContentPropertyList):
     """
-    Direct access to a queue
-    
-    This method provides a direct access to the messages in a queue
-    using a synchronous
-    dialogue that is designed for specific types of application
-    where synchronous
-    functionality is more important than performance.
-
-    :param queue: Specifies the name of the queue to get a message from.
-    :type queue: binary type (max length 255) (queue-name in AMQP)
-    :type no_ack: bool (no-ack in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'queue',
-        u'no_ack',
+        u'_content_type',
+        u'_content_encoding',
+        u'_delivery_mode',
+        u'_serialized',
     )
 
-    NAME = u'basic.get'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xd0\x00'
 
-    INDEX = (60, 70)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x46'  # CLASS ID + METHOD ID
+    content_type = property(attrgetter('_content_type'))
+    content_encoding = property(attrgetter('_content_encoding'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    def __init__(self, content_type, content_encoding, delivery_mode):
+        self._content_type = content_type
+        self._content_encoding = content_encoding
+        self._delivery_mode = delivery_mode
+        self._serialized = None
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'\xd0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._content_encoding)),
+             self._content_encoding, STRUCT_B.pack(self._delivery_mode))))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'queue', u'queue-name', u'shortstr', reserved=False),
-        Field(u'no-ack', u'no-ack', u'bit', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_encoding = buf[offset:offset + s_len]
+        offset += s_len
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(content_type, content_encoding, delivery_mode)
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicGet(%s)' % (', '.join(
-            map(to_repr, [self.queue, self.no_ack])))
+class BasicContentPropertyList_e000(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __init__(self, queue, no_ack):
-        """
-        Create frame basic.get
-        """
-        self.queue = queue
-        self.no_ack = no_ack
+    """
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.queue)))
-        buf.write(self.queue)
-        buf.write(STRUCT_B.pack((self.no_ack << 0)))
+    __slots__ = (
+        u'_content_type',
+        u'_content_encoding',
+        u'_headers',
+        u'_serialized',
+    )
+
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xe0\x00'
+
+    content_type = property(attrgetter('_content_type'))
+    content_encoding = property(attrgetter('_content_encoding'))
+    headers = property(attrgetter('_headers'))
 
-    def get_size(self):  # type: () -> int
-        return 4 + len(self.queue)
+    def __init__(self, content_type, content_encoding, headers):
+        self._content_type = content_type
+        self._content_encoding = content_encoding
+        self._headers = headers
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\xe0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._content_encoding)),
+             self._content_encoding)))
+        enframe_table(buf, self._headers)
 
     @classmethod
-    def from_buffer(cls, buf, start_offset):  # type: (buffer, int) -> BasicGet
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        queue = buf[offset:offset + s_len]
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
         offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        no_ack = bool(_bit >> 0)
+        s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        return cls(queue, no_ack)
+        content_encoding = buf[offset:offset + s_len]
+        offset += s_len
+        headers, delta = deframe_lazy_table(buf, offset)
+        offset += delta
+        return cls(content_type, content_encoding, headers)
 
 
-class BasicGetOk(AMQPMethodPayload):
+class BasicContentPropertyList_b000(AMQPContentPropertyList):
     """
-    Provide client with a message
-    
-    This method delivers a message to the client following a get
-    method. A message
-    delivered by 'get-ok' must be acknowledged unless the no-ack
-    option was set in the
-    get method.
-
-    :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
-    :type redelivered: bool (redelivered in AMQP)
-    :param exchange: Specifies the name of the exchange that the message was
-            originally published to.
-            If empty, the message was published to the default exchange.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key name specified when the message
-            was published.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :type message_count: int, 32 bit unsigned (message-count in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'delivery_tag',
-        u'redelivered',
-        u'exchange',
-        u'routing_key',
-        u'message_count',
+        u'_content_type',
+        u'_headers',
+        u'_delivery_mode',
+        u'_serialized',
     )
 
-    NAME = u'basic.get-ok'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xb0\x00'
 
-    INDEX = (60, 71)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x47'  # CLASS ID + METHOD ID
+    content_type = property(attrgetter('_content_type'))
+    headers = property(attrgetter('_headers'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+    def __init__(self, content_type, headers, delivery_mode):
+        self._content_type = content_type
+        self._headers = headers
+        self._delivery_mode = delivery_mode
+        self._serialized = None
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    def write_fields_to(self, buf):
+        buf.write(b'\xb0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type)))
+        enframe_table(buf, self._headers)
+        buf.write(STRUCT_B.pack(self._delivery_mode))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'delivery-tag', u'delivery-tag', u'longlong', reserved=False),
-        Field(u'redelivered', u'redelivered', u'bit', reserved=False),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'message-count', u'message-count', u'long', reserved=False),
-    ]
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        headers, delta = deframe_lazy_table(buf, offset)
+        offset += delta
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(content_type, headers, delivery_mode)
+
+
+class BasicContentPropertyList_8600(AMQPContentPropertyList):
+    """
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    """
 
-        :return: Python string representation
-        """
-        return 'BasicGetOk(%s)' % (', '.join(
-            map(to_repr, [
-                self.delivery_tag, self.redelivered, self.exchange,
-                self.routing_key, self.message_count
-            ])))
+    __slots__ = (
+        u'_content_type',
+        u'_correlation_id',
+        u'_reply_to',
+        u'_serialized',
+    )
 
-    def __init__(self, delivery_tag, redelivered, exchange, routing_key,
-                 message_count):
-        """
-        Create frame basic.get-ok
-        """
-        self.delivery_tag = delivery_tag
-        self.redelivered = redelivered
-        self.exchange = exchange
-        self.routing_key = routing_key
-        self.message_count = message_count
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x86\x00'
+
+    content_type = property(attrgetter('_content_type'))
+    correlation_id = property(attrgetter('_correlation_id'))
+    reply_to = property(attrgetter('_reply_to'))
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(
-            STRUCT_QBB.pack(self.delivery_tag, (self.redelivered << 0),
-                            len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        buf.write(STRUCT_I.pack(self.message_count))
+    def __init__(self, content_type, correlation_id, reply_to):
+        self._content_type = content_type
+        self._correlation_id = correlation_id
+        self._reply_to = reply_to
+        self._serialized = None
 
-    def get_size(self):  # type: () -> int
-        return 15 + len(self.exchange) + len(self.routing_key)
+    def write_fields_to(self, buf):
+        buf.write(b'\x86\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._correlation_id)), self._correlation_id,
+             STRUCT_B.pack(len(self._reply_to)), self._reply_to)))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicGetOk
-        offset = start_offset
-        delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
-        offset += 8
-        redelivered = bool(_bit >> 0)
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        exchange = buf[offset:offset + s_len]
+        correlation_id = buf[offset:offset + s_len]
         offset += s_len
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        routing_key = buf[offset:offset + s_len]
+        reply_to = buf[offset:offset + s_len]
         offset += s_len
-        message_count, = STRUCT_I.unpack_from(buf, offset)
-        offset += 4
-        return cls(delivery_tag, redelivered, exchange, routing_key,
-                   message_count)
+        return cls(content_type, correlation_id, reply_to)
 
 
-class BasicGetEmpty(AMQPMethodPayload):
+class BasicContentPropertyList_f000(AMQPContentPropertyList):
     """
-    Indicate no messages available
-    
-    This method tells the client that the queue has no messages
-    available for the
-    client.
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
 
     """
-    __slots__ = ()
-
-    NAME = u'basic.get-empty'
-
-    INDEX = (60, 72)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x48'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
-
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x0D\x00\x3C\x00\x48\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    __slots__ = (
+        u'_content_type',
+        u'_content_encoding',
+        u'_headers',
+        u'_delivery_mode',
+        u'_serialized',
+    )
 
-        :return: Python string representation
-        """
-        return 'BasicGetEmpty(%s)' % (', '.join(map(to_repr, [])))
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\xf0\x00'
+
+    content_type = property(attrgetter('_content_type'))
+    content_encoding = property(attrgetter('_content_encoding'))
+    headers = property(attrgetter('_headers'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
+
+    def __init__(self, content_type, content_encoding, headers, delivery_mode):
+        self._content_type = content_type
+        self._content_encoding = content_encoding
+        self._headers = headers
+        self._delivery_mode = delivery_mode
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\xf0\x00')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_B.pack(len(self._content_encoding)),
+             self._content_encoding)))
+        enframe_table(buf, self._headers)
+        buf.write(STRUCT_B.pack(self._delivery_mode))
 
     @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicGetEmpty
-        offset = start_offset
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
         s_len, = STRUCT_B.unpack_from(buf, offset)
         offset += 1
-        offset += s_len  # reserved field!
-        return cls()
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_encoding = buf[offset:offset + s_len]
+        offset += s_len
+        headers, delta = deframe_lazy_table(buf, offset)
+        offset += delta
+        delivery_mode, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        return cls(content_type, content_encoding, headers, delivery_mode)
 
 
-class BasicNack(AMQPMethodPayload):
+class BasicContentPropertyList_90c0(AMQPContentPropertyList):
     """
-    Reject one or more incoming messages
-    
-    This method allows a client to reject one or more incoming
-    messages. It can be
-    used to interrupt and cancel large incoming messages, or return
-    untreatable
-    messages to their original queue.
-    This method is also used by the server to inform publishers on
-    channels in
-    confirm mode of unhandled messages. If a publisher receives this
-    method, it
-    probably needs to republish the offending messages.
-
-    :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
-    :param multiple: Reject multiple messages
-            If set to 1, the delivery tag is treated as "up to and
-            including", so that multiple messages can be rejected
-            with a single method. If set to zero, the delivery tag
-            refers to a single message. If the multiple field is 1, and
-            the delivery tag is zero, this indicates rejection of
-            all outstanding messages.
-    :type multiple: bool (bit in AMQP)
-    :param requeue: Requeue the message
-            If requeue is true, the server will attempt to requeue the
-            message. If requeue
-            is false or the requeue attempt fails the messages are
-            discarded or dead-lettered.
-            Clients receiving the Nack methods should ignore this flag.
-    :type requeue: bool (bit in AMQP)
+    For fields:
+    * content_type::shortstr
+    * content_encoding::shortstr
+    * headers::table
+    * delivery_mode::octet
+    * priority::octet
+    * correlation_id::shortstr
+    * reply_to::shortstr
+    * expiration::shortstr
+    * message_id::shortstr
+    * timestamp::timestamp
+    * type_::shortstr
+    * user_id::shortstr
+    * app_id::shortstr
+    * reserved::shortstr
+
     """
+
     __slots__ = (
-        u'delivery_tag',
-        u'multiple',
-        u'requeue',
+        u'_content_type',
+        u'_delivery_mode',
+        u'_message_id',
+        u'_timestamp',
+        u'_serialized',
     )
 
-    NAME = u'basic.nack'
+    # A value for property flags that is used, assuming all bit fields are FALSE (0)
+    ZERO_PROPERTY_FLAGS = b'\x90\xc0'
+
+    content_type = property(attrgetter('_content_type'))
+    delivery_mode = property(attrgetter('_delivery_mode'))
+    message_id = property(attrgetter('_message_id'))
+    timestamp = property(attrgetter('_timestamp'))
+
+    def __init__(self, content_type, delivery_mode, message_id, timestamp):
+        self._content_type = content_type
+        self._delivery_mode = delivery_mode
+        self._message_id = message_id
+        self._timestamp = timestamp
+        self._serialized = None
+
+    def write_fields_to(self, buf):
+        buf.write(b'\x90\xc0')
+        buf.write(b"".join(
+            (STRUCT_B.pack(len(self._content_type)), self._content_type,
+             STRUCT_BB.pack(self._delivery_mode,
+                            len(self._message_id)), self._message_id,
+             STRUCT_Q.pack(self._timestamp))))
 
-    INDEX = (60, 120)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x78'  # CLASS ID + METHOD ID
+    @classmethod
+    def from_buffer(cls, buf, start_offset):
+        offset = start_offset + 2
+        s_len, = STRUCT_B.unpack_from(buf, offset)
+        offset += 1
+        content_type = buf[offset:offset + s_len]
+        offset += s_len
+        delivery_mode, s_len, = STRUCT_BB.unpack_from(buf, offset)
+        offset += 2
+        message_id = buf[offset:offset + s_len]
+        offset += s_len
+        timestamp, = STRUCT_Q.unpack_from(buf, offset)
+        offset += 8
+        return cls(content_type, delivery_mode, message_id, timestamp)
+
+
+for particular, names in (
+    (BasicContentPropertyList_0000, ()),
+    (BasicContentPropertyList_8000, ('content_type', )),
+    (BasicContentPropertyList_1000, ('delivery_mode', )),
+    (BasicContentPropertyList_2000, ('headers', )),
+    (BasicContentPropertyList_0400, ('correlation_id', )),
+    (BasicContentPropertyList_c000, ('content_type', 'content_encoding')),
+    (BasicContentPropertyList_9000, ('content_type', 'delivery_mode')),
+    (BasicContentPropertyList_a000, ('content_type', 'headers')),
+    (BasicContentPropertyList_8400, ('content_type', 'correlation_id')),
+    (BasicContentPropertyList_3000, ('delivery_mode', 'headers')),
+    (BasicContentPropertyList_0600, ('correlation_id', 'reply_to')),
+    (BasicContentPropertyList_d000, ('content_type', 'content_encoding',
+                                     'delivery_mode')),
+    (BasicContentPropertyList_e000, ('content_type', 'content_encoding',
+                                     'headers')),
+    (BasicContentPropertyList_b000, ('content_type', 'delivery_mode',
+                                     'headers')),
+    (BasicContentPropertyList_8600, ('content_type', 'correlation_id',
+                                     'reply_to')),
+    (BasicContentPropertyList_f000, ('content_type', 'content_encoding',
+                                     'delivery_mode', 'headers')),
+    (BasicContentPropertyList_90c0, ('content_type', 'delivery_mode',
+                                     'message_id', 'timestamp')),
+):
+    BasicContentPropertyList.PARTICULAR_CLASSES[
+        particular.ZERO_PROPERTY_FLAGS] = particular
+    BasicContentPropertyList.FIELDS_TO_CLASSES[frozenset(names)] = particular
+
+
+def _make_BasicAck():
+
+    class BasicAck(AMQPMethodPayload):
+        """
+        Acknowledge one or more messages
+    
+        When sent by the client, this method acknowledges one or more
+        messages delivered via the Deliver or Get-Ok methods.
+        When sent by server, this method acknowledges one or more
+        messages published with the Publish method on a channel in
+        confirm mode.
+        The acknowledgement can be for a single message or a set of
+        messages up to and including a specific message.
+
+        :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
+        :param multiple: Acknowledge multiple messages
+                If set to 1, the delivery tag is treated as "up to and
+                including", so that multiple messages can be acknowledged
+                with a single method. If set to zero, the delivery tag
+                refers to a single message. If the multiple field is 1, and
+                the delivery tag is zero, this indicates acknowledgement of
+                all outstanding messages.
+        :type multiple: bool (bit in AMQP)
+        """
+        __slots__ = (
+            u'delivery_tag',
+            u'multiple',
+        )
+
+        NAME = u'basic.ack'
+
+        INDEX = (60, 80)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x50'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'delivery-tag',
+                  u'delivery-tag',
+                  u'longlong',
+                  reserved=False),
+            Field(u'multiple', u'bit', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicAck(%s)' % (', '.join(
+                map(to_repr, [self.delivery_tag, self.multiple])))
+
+        def __init__(self, delivery_tag, multiple):
+            """
+            Create frame basic.ack
+            """
+            self.delivery_tag = delivery_tag
+            self.multiple = multiple
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_QB.pack(self.delivery_tag, (self.multiple << 0)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_QB.pack_into(buf, offset, self.delivery_tag,
+                                (self.multiple << 0))
+            return offset + 9
+
+        def get_size(self):  # type: () -> int
+            return 9
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicAck
+            offset = start_offset
+            delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            multiple = bool(_bit & 1)
+            return cls(delivery_tag, multiple)
+
+    return BasicAck
+
+
+def _make_BasicAckLazy():
+    BasicAck = _load('BasicAck')
+
+    class BasicAckLazy(BasicAck):
+        """
+        basic.ack, with arguments decoded upon first access to any of them.
+
+        Arguments are read-only. Until they are decoded, this keeps the buffer
+        it was received in.
+        """
+        __slots__ = ('_buf', '_offset', u'_delivery_tag', u'_multiple')
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicAckLazy
+            self = cls.__new__(cls)
+            self._buf = buf
+            self._offset = start_offset
+            return self
+
+        def _decode(self):  # type: () -> None
+            buf = self._buf
+            offset = self._offset
+            self._buf = None
+            self._delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            self._multiple = bool(_bit & 1)
+
+        @property
+        def delivery_tag(self):
+            if self._buf is not None:
+                self._decode()
+            return self._delivery_tag
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+        @property
+        def multiple(self):
+            if self._buf is not None:
+                self._decode()
+            return self._multiple
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+    return BasicAckLazy
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'delivery-tag', u'delivery-tag', u'longlong', reserved=False),
-        Field(u'multiple', u'bit', u'bit', reserved=False),
-        Field(u'requeue', u'bit', u'bit', reserved=False),
-    ]
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+def _make_BasicConsume():
 
-        :return: Python string representation
+    class BasicConsume(AMQPMethodPayload):
         """
-        return 'BasicNack(%s)' % (', '.join(
-            map(to_repr, [self.delivery_tag, self.multiple, self.requeue])))
+        Start a queue consumer
+    
+        This method asks the server to start a "consumer", which is a
+        transient request for
+        messages from a specific queue. Consumers last as long as the
+        channel they were
+        declared on, or until the client cancels them.
+
+        :param queue: Specifies the name of the queue to consume from.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :param consumer_tag: Specifies the identifier for the consumer. the consumer tag
+                is local to a
+                channel, so two clients can use the same consumer tags. If
+                this field is
+                empty the server will generate a unique tag.
+        :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
+        :type no_local: bool (no-local in AMQP)
+        :type no_ack: bool (no-ack in AMQP)
+        :param exclusive: Request exclusive access
+                Request exclusive consumer access, meaning only this
+                consumer can access the
+                queue.
+        :type exclusive: bool (bit in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        :param arguments: Arguments for declaration
+                A set of arguments for the consume. The syntax and semantics
+                of these
+                arguments depends on the server implementation.
+        :type arguments: table. See coolamqp.uplink.framing.field_table (table in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'consumer_tag',
+            u'no_local',
+            u'no_ack',
+            u'exclusive',
+            u'no_wait',
+            u'arguments',
+        )
+
+        NAME = u'basic.consume'
+
+        INDEX = (60, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x14'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'consumer-tag',
+                  u'consumer-tag',
+                  u'shortstr',
+                  reserved=False),
+            Field(u'no-local', u'no-local', u'bit', reserved=False),
+            Field(u'no-ack', u'no-ack', u'bit', reserved=False),
+            Field(u'exclusive', u'bit', u'bit', reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+            Field(u'arguments', u'table', u'table', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicConsume(%s)' % (', '.join(
+                map(to_repr, [
+                    self.queue, self.consumer_tag, self.no_local, self.no_ack,
+                    self.exclusive, self.no_wait, self.arguments
+                ])))
+
+        def __init__(self, queue, consumer_tag, no_local, no_ack, exclusive,
+                     no_wait, arguments):
+            """
+            Create frame basic.consume
+            """
+            self.queue = queue
+            self.consumer_tag = consumer_tag
+            self.no_local = no_local
+            self.no_ack = no_ack
+            self.exclusive = exclusive
+            self.no_wait = no_wait
+            self.arguments = arguments
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.queue)), self.queue,
+                 STRUCT_B.pack(len(self.consumer_tag)), self.consumer_tag,
+                 STRUCT_B.pack((self.no_local << 0) | (self.no_ack << 1)
+                               | (self.exclusive << 2)
+                               | (self.no_wait << 3)))))
+            enframe_table(buf, self.arguments)
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            ln = len(self.consumer_tag)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.consumer_tag
+            offset += ln
+            STRUCT_B.pack_into(buf, offset,
+                               (self.no_local << 0) | (self.no_ack << 1) |
+                               (self.exclusive << 2) | (self.no_wait << 3))
+            offset += 1
+            return enframe_table_into(buf, offset, self.arguments)
+
+        def get_size(self):  # type: () -> int
+            return 5 + len(self.queue) + len(
+                self.consumer_tag) + frame_table_size(self.arguments)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicConsume
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_local = bool(_bit & 1)
+            no_ack = bool(_bit & 2)
+            exclusive = bool(_bit & 4)
+            no_wait = bool(_bit & 8)
+            arguments, delta = deframe_table(buf, offset)
+            offset += delta
+            return cls(queue, consumer_tag, no_local, no_ack, exclusive,
+                       no_wait, arguments)
+
+    return BasicConsume
+
+
+def _make_BasicCancel():
+
+    class BasicCancel(AMQPMethodPayload):
+        """
+        End a queue consumer
+    
+        This method cancels a consumer. This does not affect already
+        delivered
+        messages, but it does mean the server will not send any more
+        messages for
+        that consumer. The client may receive an arbitrary number of
+        messages in
+        between sending the cancel method and receiving the cancel-ok
+        reply.
+        It may also be sent from the server to the client in the event
+        of the consumer being unexpectedly cancelled (i.e. cancelled
+        for any reason other than the server receiving the
+        corresponding basic.cancel from the client). This allows
+        clients to be notified of the loss of consumers due to events
+        such as queue deletion. Note that as it is not a MUST for
+        clients to accept this method from the server, it is advisable
+        for the broker to be able to identify those clients that are
+        capable of accepting the method, through some means of
+        capability negotiation.
+
+        :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
+        :type no_wait: bool (no-wait in AMQP)
+        """
+        __slots__ = (
+            u'consumer_tag',
+            u'no_wait',
+        )
+
+        NAME = u'basic.cancel'
+
+        INDEX = (60, 30)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x1E'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'consumer-tag',
+                  u'consumer-tag',
+                  u'shortstr',
+                  reserved=False),
+            Field(u'no-wait', u'no-wait', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicCancel(%s)' % (', '.join(
+                map(to_repr, [self.consumer_tag, self.no_wait])))
+
+        def __init__(self, consumer_tag, no_wait):
+            """
+            Create frame basic.cancel
+            """
+            self.consumer_tag = consumer_tag
+            self.no_wait = no_wait
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_B.pack(len(self.consumer_tag)), self.consumer_tag,
+                 STRUCT_B.pack((self.no_wait << 0)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.consumer_tag)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.consumer_tag
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_wait << 0))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 2 + len(self.consumer_tag)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicCancel
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_wait = bool(_bit & 1)
+            return cls(consumer_tag, no_wait)
+
+    return BasicCancel
+
+
+def _make_BasicConsumeOk():
+
+    class BasicConsumeOk(AMQPMethodPayload):
+        """
+        Confirm a new consumer
+    
+        The server provides the client with a consumer tag, which is
+        used by the client
+        for methods called on the consumer at a later stage.
 
-    def __init__(self, delivery_tag, multiple, requeue):
-        """
-        Create frame basic.nack
+        :param consumer_tag: Holds the consumer tag specified by the client or provided
+                by the server.
+        :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
         """
-        self.delivery_tag = delivery_tag
-        self.multiple = multiple
-        self.requeue = requeue
+        __slots__ = (u'consumer_tag', )
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(
-            STRUCT_QB.pack(self.delivery_tag,
-                           (self.multiple << 0) | (self.requeue << 1)))
+        NAME = u'basic.consume-ok'
 
-    def get_size(self):  # type: () -> int
-        return 9
+        INDEX = (60, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x15'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicNack
-        offset = start_offset
-        delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
-        offset += 8
-        multiple = bool(_bit >> 0)
-        requeue = bool(_bit >> 1)
-        offset += 1
-        return cls(delivery_tag, multiple, requeue)
-
-
-class BasicPublish(AMQPMethodPayload):
-    """
-    Publish a message
-    
-    This method publishes a message to a specific exchange. The
-    message will be routed
-    to queues as defined by the exchange configuration and
-    distributed to any active
-    consumers when the transaction, if any, is committed.
-
-    :param exchange: Specifies the name of the exchange to publish to. the
-            exchange name can be
-            empty, meaning the default exchange. If the exchange name is
-            specified, and that
-            exchange does not exist, the server will raise a channel
-            exception.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key for the message. The routing key
-            is used for routing
-            messages depending on the exchange configuration.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    :param mandatory: Indicate mandatory routing
-            This flag tells the server how to react if the message
-            cannot be routed to a
-            queue. If this flag is set, the server will return an
-            unroutable message with a
-            Return method. If this flag is zero, the server silently
-            drops the message.
-    :type mandatory: bool (bit in AMQP)
-    :param immediate: Request immediate delivery
-            This flag tells the server how to react if the message
-            cannot be routed to a
-            queue consumer immediately. If this flag is set, the server
-            will return an
-            undeliverable message with a Return method. If this flag is
-            zero, the server
-            will queue the message, but with no guarantee that it will
-            ever be consumed.
-    :type immediate: bool (bit in AMQP)
-    """
-    __slots__ = (
-        u'exchange',
-        u'routing_key',
-        u'mandatory',
-        u'immediate',
-    )
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    NAME = u'basic.publish'
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    INDEX = (60, 40)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x28'  # CLASS ID + METHOD ID
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'consumer-tag',
+                  u'consumer-tag',
+                  u'shortstr',
+                  reserved=False),
+        ]
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+            :return: Python string representation
+            """
+            return 'BasicConsumeOk(%s)' % (', '.join(
+                map(to_repr, [self.consumer_tag])))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reserved-1', u'short', u'short', reserved=True),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-        Field(u'mandatory', u'bit', u'bit', reserved=False),
-        Field(u'immediate', u'bit', u'bit', reserved=False),
-    ]
+        def __init__(self, consumer_tag):
+            """
+            Create frame basic.consume-ok
+            """
+            self.consumer_tag = consumer_tag
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_B.pack(len(self.consumer_tag)), self.consumer_tag)))
 
-        :return: Python string representation
-        """
-        return 'BasicPublish(%s)' % (', '.join(
-            map(to_repr, [
-                self.exchange, self.routing_key, self.mandatory, self.immediate
-            ])))
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.consumer_tag)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.consumer_tag
+            return offset + ln
 
-    def __init__(self, exchange, routing_key, mandatory, immediate):
-        """
-        Create frame basic.publish
-        """
-        self.exchange = exchange
-        self.routing_key = routing_key
-        self.mandatory = mandatory
-        self.immediate = immediate
+        def get_size(self):  # type: () -> int
+            return 1 + len(self.consumer_tag)
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(b'\x00\x00')
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
-        buf.write(STRUCT_B.pack((self.mandatory << 0) | (self.immediate << 1)))
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicConsumeOk
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(consumer_tag)
 
-    def get_size(self):  # type: () -> int
-        return 5 + len(self.exchange) + len(self.routing_key)
+    return BasicConsumeOk
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicPublish
-        offset = start_offset
-        s_len, = STRUCT_2xB.unpack_from(buf, offset)
-        offset += 3
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        mandatory = bool(_bit >> 0)
-        immediate = bool(_bit >> 1)
-        offset += 1
-        return cls(exchange, routing_key, mandatory, immediate)
 
+def _make_BasicCancelOk():
 
-class BasicQos(AMQPMethodPayload):
-    """
-    Specify quality of service
+    class BasicCancelOk(AMQPMethodPayload):
+        """
+        Confirm a cancelled consumer
     
-    This method requests a specific quality of service. The QoS can
-    be specified for the
-    current channel or for all channels on the connection. The
-    particular properties and
-    semantics of a qos method always depend on the content class
-    semantics. Though the
-    qos method could in principle apply to both peers, it is
-    currently meaningful only
-    for the server.
-
-    :param prefetch_size: Prefetch window in octets
-            The client can request that messages be sent in advance so
-            that when the client
-            finishes processing a message, the following message is
-            already held locally,
-            rather than needing to be sent down the channel. Prefetching
-            gives a performance
-            improvement. This field specifies the prefetch window size
-            in octets. The server
-            will send a message in advance if it is equal to or smaller
-            in size than the
-            available prefetch size (and also falls into other prefetch
-            limits). May be set
-            to zero, meaning "no specific limit", although other
-            prefetch limits may still
-            apply. The prefetch-size is ignored if the no-ack option is
-            set.
-    :type prefetch_size: int, 32 bit unsigned (long in AMQP)
-    :param prefetch_count: Prefetch window in messages
-            Specifies a prefetch window in terms of whole messages. This
-            field may be used
-            in combination with the prefetch-size field; a message will
-            only be sent in
-            advance if both prefetch windows (and those at the channel
-            and connection level)
-            allow it. The prefetch-count is ignored if the no-ack option
-            is set.
-    :type prefetch_count: int, 16 bit unsigned (short in AMQP)
-    :param global_: Apply to entire connection
-            RabbitMQ has reinterpreted this field. The original
-            specification said: "By default the QoS settings apply to
-            the current channel only. If this field is set, they are
-            applied to the entire connection." Instead, RabbitMQ takes
-            global=false to mean that the QoS settings should apply
-            per-consumer (for new consumers on the channel; existing
-            ones being unaffected) and global=true to mean that the QoS
-            settings should apply per-channel.
-    :type global_: bool (bit in AMQP)
-    """
-    __slots__ = (
-        u'prefetch_size',
-        u'prefetch_count',
-        u'global_',
-    )
+        This method confirms that the cancellation was completed.
 
-    NAME = u'basic.qos'
-
-    INDEX = (60, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x0A'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
+        """
+        __slots__ = (u'consumer_tag', )
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        NAME = u'basic.cancel-ok'
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'prefetch-size', u'long', u'long', reserved=False),
-        Field(u'prefetch-count', u'short', u'short', reserved=False),
-        Field(u'global', u'bit', u'bit', reserved=False),
-    ]
+        INDEX = (60, 31)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x1F'  # CLASS ID + METHOD ID
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
 
-        :return: Python string representation
-        """
-        return 'BasicQos(%s)' % (', '.join(
-            map(to_repr,
-                [self.prefetch_size, self.prefetch_count, self.global_])))
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    def __init__(self, prefetch_size, prefetch_count, global_):
-        """
-        Create frame basic.qos
-        """
-        self.prefetch_size = prefetch_size
-        self.prefetch_count = prefetch_count
-        self.global_ = global_
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'consumer-tag',
+                  u'consumer-tag',
+                  u'shortstr',
+                  reserved=False),
+        ]
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(
-            STRUCT_IHB.pack(self.prefetch_size, self.prefetch_count,
-                            (self.global_ << 0)))
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    def get_size(self):  # type: () -> int
-        return 7
+            :return: Python string representation
+            """
+            return 'BasicCancelOk(%s)' % (', '.join(
+                map(to_repr, [self.consumer_tag])))
 
-    @classmethod
-    def from_buffer(cls, buf, start_offset):  # type: (buffer, int) -> BasicQos
-        offset = start_offset
-        prefetch_size, prefetch_count, _bit, = STRUCT_IHB.unpack_from(
-            buf, offset)
-        offset += 6
-        global_ = bool(_bit >> 0)
-        offset += 1
-        return cls(prefetch_size, prefetch_count, global_)
+        def __init__(self, consumer_tag):
+            """
+            Create frame basic.cancel-ok
+            """
+            self.consumer_tag = consumer_tag
 
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_B.pack(len(self.consumer_tag)), self.consumer_tag)))
 
-class BasicQosOk(AMQPMethodPayload):
-    """
-    Confirm the requested qos
-    
-    This method tells the client that the requested QoS levels could
-    be handled by the
-    server. The requested QoS applies to all active consumers until
-    a new QoS is
-    defined.
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.consumer_tag)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.consumer_tag
+            return offset + ln
 
-    """
-    __slots__ = ()
+        def get_size(self):  # type: () -> int
+            return 1 + len(self.consumer_tag)
 
-    NAME = u'basic.qos-ok'
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicCancelOk
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(consumer_tag)
 
-    INDEX = (60, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x0B'  # CLASS ID + METHOD ID
+    return BasicCancelOk
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x3C\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+def _make_BasicDeliver():
 
-    def __repr__(self):  # type: () -> str
+    class BasicDeliver(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Notify the client of a consumer message
+    
+        This method delivers a message to the client, via a consumer. In
+        the asynchronous
+        message delivery model, the client starts a consumer using the
+        Consume method, then
+        the server responds with Deliver methods as and when messages
+        arrive for that
+        consumer.
+
+        :type consumer_tag: binary type (max length 255) (consumer-tag in AMQP)
+        :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
+        :type redelivered: bool (redelivered in AMQP)
+        :param exchange: Specifies the name of the exchange that the message was
+                originally published to.
+                May be empty, indicating the default exchange.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key name specified when the message
+                was published.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        """
+        __slots__ = (
+            u'consumer_tag',
+            u'delivery_tag',
+            u'redelivered',
+            u'exchange',
+            u'routing_key',
+        )
+
+        NAME = u'basic.deliver'
+
+        INDEX = (60, 60)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x3C'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'consumer-tag',
+                  u'consumer-tag',
+                  u'shortstr',
+                  reserved=False),
+            Field(u'delivery-tag',
+                  u'delivery-tag',
+                  u'longlong',
+                  reserved=False),
+            Field(u'redelivered', u'redelivered', u'bit', reserved=False),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicDeliver(%s)' % (', '.join(
+                map(to_repr, [
+                    self.consumer_tag, self.delivery_tag, self.redelivered,
+                    self.exchange, self.routing_key
+                ])))
+
+        def __init__(self, consumer_tag, delivery_tag, redelivered, exchange,
+                     routing_key):
+            """
+            Create frame basic.deliver
+            """
+            self.consumer_tag = consumer_tag
+            self.delivery_tag = delivery_tag
+            self.redelivered = redelivered
+            self.exchange = exchange
+            self.routing_key = routing_key
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_B.pack(len(self.consumer_tag)), self.consumer_tag,
+                 STRUCT_QBB.pack(self.delivery_tag, (self.redelivered << 0),
+                                 len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.consumer_tag)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.consumer_tag
+            offset += ln
+            ln = len(self.exchange)
+            STRUCT_QBB.pack_into(buf, offset, self.delivery_tag,
+                                 (self.redelivered << 0), ln)
+            offset += 10
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            return offset + ln
+
+        def get_size(self):  # type: () -> int
+            return 12 + len(self.consumer_tag) + len(self.exchange) + len(
+                self.routing_key)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicDeliver
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            redelivered = bool(_bit & 1)
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(consumer_tag, delivery_tag, redelivered, exchange,
+                       routing_key)
+
+    return BasicDeliver
+
+
+def _make_BasicDeliverLazy():
+    BasicDeliver = _load('BasicDeliver')
+
+    class BasicDeliverLazy(BasicDeliver):
+        """
+        basic.deliver, with arguments decoded upon first access to any of them.
+
+        Arguments are read-only. Until they are decoded, this keeps the buffer
+        it was received in.
+        """
+        __slots__ = ('_buf', '_offset', u'_consumer_tag', u'_delivery_tag',
+                     u'_redelivered', u'_exchange', u'_routing_key')
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> BasicDeliverLazy
+            self = cls.__new__(cls)
+            self._buf = buf
+            self._offset = start_offset
+            return self
+
+        def _decode(self):  # type: () -> None
+            buf = self._buf
+            offset = self._offset
+            self._buf = None
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            self._consumer_tag = buf[offset:offset + s_len]
+            offset += s_len
+            self._delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            self._redelivered = bool(_bit & 1)
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            self._exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            self._routing_key = buf[offset:offset + s_len]
+            offset += s_len
+
+        @property
+        def consumer_tag(self):
+            if self._buf is not None:
+                self._decode()
+            return self._consumer_tag
+
+        @property
+        def delivery_tag(self):
+            if self._buf is not None:
+                self._decode()
+            return self._delivery_tag
+
+        @property
+        def redelivered(self):
+            if self._buf is not None:
+                self._decode()
+            return self._redelivered
+
+        @property
+        def exchange(self):
+            if self._buf is not None:
+                self._decode()
+            return self._exchange
+
+        @property
+        def routing_key(self):
+            if self._buf is not None:
+                self._decode()
+            return self._routing_key
+
+    return BasicDeliverLazy
+
+
+def _make_BasicGet():
+
+    class BasicGet(AMQPMethodPayload):
+        """
+        Direct access to a queue
+    
+        This method provides a direct access to the messages in a queue
+        using a synchronous
+        dialogue that is designed for specific types of application
+        where synchronous
+        functionality is more important than performance.
+
+        :param queue: Specifies the name of the queue to get a message from.
+        :type queue: binary type (max length 255) (queue-name in AMQP)
+        :type no_ack: bool (no-ack in AMQP)
+        """
+        __slots__ = (
+            u'queue',
+            u'no_ack',
+        )
+
+        NAME = u'basic.get'
+
+        INDEX = (60, 70)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x46'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'queue', u'queue-name', u'shortstr', reserved=False),
+            Field(u'no-ack', u'no-ack', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicGet(%s)' % (', '.join(
+                map(to_repr, [self.queue, self.no_ack])))
+
+        def __init__(self, queue, no_ack):
+            """
+            Create frame basic.get
+            """
+            self.queue = queue
+            self.no_ack = no_ack
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join((STRUCT_2xB.pack(len(self.queue)), self.queue,
+                                STRUCT_B.pack((self.no_ack << 0)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.queue)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.queue
+            offset += ln
+            STRUCT_B.pack_into(buf, offset, (self.no_ack << 0))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 4 + len(self.queue)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicGet
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            queue = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            no_ack = bool(_bit & 1)
+            return cls(queue, no_ack)
+
+    return BasicGet
+
+
+def _make_BasicGetOk():
+
+    class BasicGetOk(AMQPMethodPayload):
+        """
+        Provide client with a message
+    
+        This method delivers a message to the client following a get
+        method. A message
+        delivered by 'get-ok' must be acknowledged unless the no-ack
+        option was set in the
+        get method.
+
+        :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
+        :type redelivered: bool (redelivered in AMQP)
+        :param exchange: Specifies the name of the exchange that the message was
+                originally published to.
+                If empty, the message was published to the default exchange.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key name specified when the message
+                was published.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :type message_count: int, 32 bit unsigned (message-count in AMQP)
+        """
+        __slots__ = (
+            u'delivery_tag',
+            u'redelivered',
+            u'exchange',
+            u'routing_key',
+            u'message_count',
+        )
+
+        NAME = u'basic.get-ok'
+
+        INDEX = (60, 71)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x47'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'delivery-tag',
+                  u'delivery-tag',
+                  u'longlong',
+                  reserved=False),
+            Field(u'redelivered', u'redelivered', u'bit', reserved=False),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'message-count', u'message-count', u'long', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicGetOk(%s)' % (', '.join(
+                map(to_repr, [
+                    self.delivery_tag, self.redelivered, self.exchange,
+                    self.routing_key, self.message_count
+                ])))
+
+        def __init__(self, delivery_tag, redelivered, exchange, routing_key,
+                     message_count):
+            """
+            Create frame basic.get-ok
+            """
+            self.delivery_tag = delivery_tag
+            self.redelivered = redelivered
+            self.exchange = exchange
+            self.routing_key = routing_key
+            self.message_count = message_count
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_QBB.pack(self.delivery_tag, (self.redelivered << 0),
+                                 len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key,
+                 STRUCT_I.pack(self.message_count))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.exchange)
+            STRUCT_QBB.pack_into(buf, offset, self.delivery_tag,
+                                 (self.redelivered << 0), ln)
+            offset += 10
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            STRUCT_I.pack_into(buf, offset, self.message_count)
+            return offset + 4
+
+        def get_size(self):  # type: () -> int
+            return 15 + len(self.exchange) + len(self.routing_key)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicGetOk
+            offset = start_offset
+            delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            redelivered = bool(_bit & 1)
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            message_count, = STRUCT_I.unpack_from(buf, offset)
+            offset += 4
+            return cls(delivery_tag, redelivered, exchange, routing_key,
+                       message_count)
+
+    return BasicGetOk
+
+
+def _make_BasicGetEmpty():
+
+    class BasicGetEmpty(AMQPMethodPayload):
+        """
+        Indicate no messages available
+    
+        This method tells the client that the queue has no messages
+        available for the
+        client.
 
-        :return: Python string representation
         """
-        return 'BasicQosOk(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicQosOk
-        offset = start_offset
-        return cls()
+        NAME = u'basic.get-empty'
 
+        INDEX = (60, 72)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x48'  # CLASS ID + METHOD ID
 
-class BasicReturn(AMQPMethodPayload):
-    """
-    Return a failed message
-    
-    This method returns an undeliverable message that was published
-    with the "immediate"
-    flag set, or an unroutable message published with the
-    "mandatory" flag set. The
-    reply code and text provide information about the reason that
-    the message was
-    undeliverable.
-
-    :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
-    :type reply_text: binary type (max length 255) (reply-text in AMQP)
-    :param exchange: Specifies the name of the exchange that the message was
-            originally published
-            to. May be empty, meaning the default exchange.
-    :type exchange: binary type (max length 255) (exchange-name in AMQP)
-    :param routing_key: Message routing key
-            Specifies the routing key name specified when the message
-            was published.
-    :type routing_key: binary type (max length 255) (shortstr in AMQP)
-    """
-    __slots__ = (
-        u'reply_code',
-        u'reply_text',
-        u'exchange',
-        u'routing_key',
-    )
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    NAME = u'basic.return'
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x0D\x00\x3C\x00\x48\x00\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    INDEX = (60, 50)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x32'  # CLASS ID + METHOD ID
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'shortstr', u'shortstr', reserved=True),
+        ]
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    IS_SIZE_STATIC = False  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+            :return: Python string representation
+            """
+            return 'BasicGetEmpty(%s)' % (', '.join(map(to_repr, [])))
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'reply-code', u'reply-code', u'short', reserved=False),
-        Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
-        Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
-        Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
-    ]
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicGetEmpty
+            offset = start_offset
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            offset += s_len  # reserved field!
+            return cls()
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+    return BasicGetEmpty
 
-        :return: Python string representation
-        """
-        return 'BasicReturn(%s)' % (', '.join(
-            map(to_repr, [
-                self.reply_code, self.reply_text, self.exchange,
-                self.routing_key
-            ])))
 
-    def __init__(self, reply_code, reply_text, exchange, routing_key):
+def _make_BasicNack():
+
+    class BasicNack(AMQPMethodPayload):
         """
-        Create frame basic.return
+        Reject one or more incoming messages
+    
+        This method allows a client to reject one or more incoming
+        messages. It can be
+        used to interrupt and cancel large incoming messages, or return
+        untreatable
+        messages to their original queue.
+        This method is also used by the server to inform publishers on
+        channels in
+        confirm mode of unhandled messages. If a publisher receives this
+        method, it
+        probably needs to republish the offending messages.
+
+        :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
+        :param multiple: Reject multiple messages
+                If set to 1, the delivery tag is treated as "up to and
+                including", so that multiple messages can be rejected
+                with a single method. If set to zero, the delivery tag
+                refers to a single message. If the multiple field is 1, and
+                the delivery tag is zero, this indicates rejection of
+                all outstanding messages.
+        :type multiple: bool (bit in AMQP)
+        :param requeue: Requeue the message
+                If requeue is true, the server will attempt to requeue the
+                message. If requeue
+                is false or the requeue attempt fails the messages are
+                discarded or dead-lettered.
+                Clients receiving the Nack methods should ignore this flag.
+        :type requeue: bool (bit in AMQP)
+        """
+        __slots__ = (
+            u'delivery_tag',
+            u'multiple',
+            u'requeue',
+        )
+
+        NAME = u'basic.nack'
+
+        INDEX = (60, 120)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x78'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, True
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'delivery-tag',
+                  u'delivery-tag',
+                  u'longlong',
+                  reserved=False),
+            Field(u'multiple', u'bit', u'bit', reserved=False),
+            Field(u'requeue', u'bit', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicNack(%s)' % (', '.join(
+                map(to_repr,
+                    [self.delivery_tag, self.multiple, self.requeue])))
+
+        def __init__(self, delivery_tag, multiple, requeue):
+            """
+            Create frame basic.nack
+            """
+            self.delivery_tag = delivery_tag
+            self.multiple = multiple
+            self.requeue = requeue
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(
+                STRUCT_QB.pack(self.delivery_tag,
+                               (self.multiple << 0) | (self.requeue << 1)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_QB.pack_into(buf, offset, self.delivery_tag,
+                                (self.multiple << 0) | (self.requeue << 1))
+            return offset + 9
+
+        def get_size(self):  # type: () -> int
+            return 9
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicNack
+            offset = start_offset
+            delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            multiple = bool(_bit & 1)
+            requeue = bool(_bit & 2)
+            return cls(delivery_tag, multiple, requeue)
+
+    return BasicNack
+
+
+def _make_BasicNackLazy():
+    BasicNack = _load('BasicNack')
+
+    class BasicNackLazy(BasicNack):
+        """
+        basic.nack, with arguments decoded upon first access to any of them.
+
+        Arguments are read-only. Until they are decoded, this keeps the buffer
+        it was received in.
+        """
+        __slots__ = ('_buf', '_offset', u'_delivery_tag', u'_multiple',
+                     u'_requeue')
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicNackLazy
+            self = cls.__new__(cls)
+            self._buf = buf
+            self._offset = start_offset
+            return self
+
+        def _decode(self):  # type: () -> None
+            buf = self._buf
+            offset = self._offset
+            self._buf = None
+            self._delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            self._multiple = bool(_bit & 1)
+            self._requeue = bool(_bit & 2)
+
+        @property
+        def delivery_tag(self):
+            if self._buf is not None:
+                self._decode()
+            return self._delivery_tag
+
+        @property
+        def multiple(self):
+            if self._buf is not None:
+                self._decode()
+            return self._multiple
+
+        @property
+        def requeue(self):
+            if self._buf is not None:
+                self._decode()
+            return self._requeue
+
+    return BasicNackLazy
+
+
+def _make_BasicPublish():
+
+    class BasicPublish(AMQPMethodPayload):
+        """
+        Publish a message
+    
+        This method publishes a message to a specific exchange. The
+        message will be routed
+        to queues as defined by the exchange configuration and
+        distributed to any active
+        consumers when the transaction, if any, is committed.
+
+        :param exchange: Specifies the name of the exchange to publish to. the
+                exchange name can be
+                empty, meaning the default exchange. If the exchange name is
+                specified, and that
+                exchange does not exist, the server will raise a channel
+                exception.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key for the message. The routing key
+                is used for routing
+                messages depending on the exchange configuration.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        :param mandatory: Indicate mandatory routing
+                This flag tells the server how to react if the message
+                cannot be routed to a
+                queue. If this flag is set, the server will return an
+                unroutable message with a
+                Return method. If this flag is zero, the server silently
+                drops the message.
+        :type mandatory: bool (bit in AMQP)
+        :param immediate: Request immediate delivery
+                This flag tells the server how to react if the message
+                cannot be routed to a
+                queue consumer immediately. If this flag is set, the server
+                will return an
+                undeliverable message with a Return method. If this flag is
+                zero, the server
+                will queue the message, but with no guarantee that it will
+                ever be consumed.
+        :type immediate: bool (bit in AMQP)
+        """
+        __slots__ = (
+            u'exchange',
+            u'routing_key',
+            u'mandatory',
+            u'immediate',
+        )
+
+        NAME = u'basic.publish'
+
+        INDEX = (60, 40)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x28'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reserved-1', u'short', u'short', reserved=True),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+            Field(u'mandatory', u'bit', u'bit', reserved=False),
+            Field(u'immediate', u'bit', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicPublish(%s)' % (', '.join(
+                map(to_repr, [
+                    self.exchange, self.routing_key, self.mandatory,
+                    self.immediate
+                ])))
+
+        def __init__(self, exchange, routing_key, mandatory, immediate):
+            """
+            Create frame basic.publish
+            """
+            self.exchange = exchange
+            self.routing_key = routing_key
+            self.mandatory = mandatory
+            self.immediate = immediate
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_2xB.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key,
+                 STRUCT_B.pack((self.mandatory << 0)
+                               | (self.immediate << 1)))))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.exchange)
+            STRUCT_2xB.pack_into(buf, offset, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            offset += ln
+            STRUCT_B.pack_into(buf, offset,
+                               (self.mandatory << 0) | (self.immediate << 1))
+            return offset + 1
+
+        def get_size(self):  # type: () -> int
+            return 5 + len(self.exchange) + len(self.routing_key)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicPublish
+            offset = start_offset
+            s_len, = STRUCT_2xB.unpack_from(buf, offset)
+            offset += 3
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            mandatory = bool(_bit & 1)
+            immediate = bool(_bit & 2)
+            return cls(exchange, routing_key, mandatory, immediate)
+
+    return BasicPublish
+
+
+def _make_BasicQos():
+
+    class BasicQos(AMQPMethodPayload):
+        """
+        Specify quality of service
+    
+        This method requests a specific quality of service. The QoS can
+        be specified for the
+        current channel or for all channels on the connection. The
+        particular properties and
+        semantics of a qos method always depend on the content class
+        semantics. Though the
+        qos method could in principle apply to both peers, it is
+        currently meaningful only
+        for the server.
+
+        :param prefetch_size: Prefetch window in octets
+                The client can request that messages be sent in advance so
+                that when the client
+                finishes processing a message, the following message is
+                already held locally,
+                rather than needing to be sent down the channel. Prefetching
+                gives a performance
+                improvement. This field specifies the prefetch window size
+                in octets. The server
+                will send a message in advance if it is equal to or smaller
+                in size than the
+                available prefetch size (and also falls into other prefetch
+                limits). May be set
+                to zero, meaning "no specific limit", although other
+                prefetch limits may still
+                apply. The prefetch-size is ignored if the no-ack option is
+                set.
+        :type prefetch_size: int, 32 bit unsigned (long in AMQP)
+        :param prefetch_count: Prefetch window in messages
+                Specifies a prefetch window in terms of whole messages. This
+                field may be used
+                in combination with the prefetch-size field; a message will
+                only be sent in
+                advance if both prefetch windows (and those at the channel
+                and connection level)
+                allow it. The prefetch-count is ignored if the no-ack option
+                is set.
+        :type prefetch_count: int, 16 bit unsigned (short in AMQP)
+        :param global_: Apply to entire connection
+                RabbitMQ has reinterpreted this field. The original
+                specification said: "By default the QoS settings apply to
+                the current channel only. If this field is set, they are
+                applied to the entire connection." Instead, RabbitMQ takes
+                global=false to mean that the QoS settings should apply
+                per-consumer (for new consumers on the channel; existing
+                ones being unaffected) and global=true to mean that the QoS
+                settings should apply per-channel.
+        :type global_: bool (bit in AMQP)
+        """
+        __slots__ = (
+            u'prefetch_size',
+            u'prefetch_count',
+            u'global_',
+        )
+
+        NAME = u'basic.qos'
+
+        INDEX = (60, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x0A'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'prefetch-size', u'long', u'long', reserved=False),
+            Field(u'prefetch-count', u'short', u'short', reserved=False),
+            Field(u'global', u'bit', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicQos(%s)' % (', '.join(
+                map(to_repr,
+                    [self.prefetch_size, self.prefetch_count, self.global_])))
+
+        def __init__(self, prefetch_size, prefetch_count, global_):
+            """
+            Create frame basic.qos
+            """
+            self.prefetch_size = prefetch_size
+            self.prefetch_count = prefetch_count
+            self.global_ = global_
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(
+                STRUCT_IHB.pack(self.prefetch_size, self.prefetch_count,
+                                (self.global_ << 0)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_IHB.pack_into(buf, offset, self.prefetch_size,
+                                 self.prefetch_count, (self.global_ << 0))
+            return offset + 7
+
+        def get_size(self):  # type: () -> int
+            return 7
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicQos
+            offset = start_offset
+            prefetch_size, prefetch_count, _bit, = STRUCT_IHB.unpack_from(
+                buf, offset)
+            offset += 7
+            global_ = bool(_bit & 1)
+            return cls(prefetch_size, prefetch_count, global_)
+
+    return BasicQos
+
+
+def _make_BasicQosOk():
+
+    class BasicQosOk(AMQPMethodPayload):
+        """
+        Confirm the requested qos
+    
+        This method tells the client that the requested QoS levels could
+        be handled by the
+        server. The requested QoS applies to all active consumers until
+        a new QoS is
+        defined.
+
         """
-        self.reply_code = reply_code
-        self.reply_text = reply_text
-        self.exchange = exchange
-        self.routing_key = routing_key
+        __slots__ = ()
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_HB.pack(self.reply_code, len(self.reply_text)))
-        buf.write(self.reply_text)
-        buf.write(STRUCT_B.pack(len(self.exchange)))
-        buf.write(self.exchange)
-        buf.write(STRUCT_B.pack(len(self.routing_key)))
-        buf.write(self.routing_key)
+        NAME = u'basic.qos-ok'
 
-    def get_size(self):  # type: () -> int
-        return 5 + len(self.reply_text) + len(self.exchange) + len(
-            self.routing_key)
+        INDEX = (60, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x0B'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicReturn
-        offset = start_offset
-        reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
-        offset += 3
-        reply_text = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        exchange = buf[offset:offset + s_len]
-        offset += s_len
-        s_len, = STRUCT_B.unpack_from(buf, offset)
-        offset += 1
-        routing_key = buf[offset:offset + s_len]
-        offset += s_len
-        return cls(reply_code, reply_text, exchange, routing_key)
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x3C\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-class BasicReject(AMQPMethodPayload):
-    """
-    Reject an incoming message
-    
-    This method allows a client to reject a message. It can be used
-    to interrupt and
-    cancel large incoming messages, or return untreatable messages
-    to their original
-    queue.
-
-    :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
-    :param requeue: Requeue the message
-            If requeue is true, the server will attempt to requeue the
-            message. If requeue
-            is false or the requeue attempt fails the messages are
-            discarded or dead-lettered.
-    :type requeue: bool (bit in AMQP)
-    """
-    __slots__ = (
-        u'delivery_tag',
-        u'requeue',
-    )
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'basic.reject'
+            :return: Python string representation
+            """
+            return 'BasicQosOk(%s)' % (', '.join(map(to_repr, [])))
 
-    INDEX = (60, 90)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x5A'  # CLASS ID + METHOD ID
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicQosOk
+            offset = start_offset
+            return cls()
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+    return BasicQosOk
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'delivery-tag', u'delivery-tag', u'longlong', reserved=False),
-        Field(u'requeue', u'bit', u'bit', reserved=False),
-    ]
+def _make_BasicReturn():
 
-    def __repr__(self):  # type: () -> str
+    class BasicReturn(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Return a failed message
+    
+        This method returns an undeliverable message that was published
+        with the "immediate"
+        flag set, or an unroutable message published with the
+        "mandatory" flag set. The
+        reply code and text provide information about the reason that
+        the message was
+        undeliverable.
+
+        :type reply_code: int, 16 bit unsigned (reply-code in AMQP)
+        :type reply_text: binary type (max length 255) (reply-text in AMQP)
+        :param exchange: Specifies the name of the exchange that the message was
+                originally published
+                to. May be empty, meaning the default exchange.
+        :type exchange: binary type (max length 255) (exchange-name in AMQP)
+        :param routing_key: Message routing key
+                Specifies the routing key name specified when the message
+                was published.
+        :type routing_key: binary type (max length 255) (shortstr in AMQP)
+        """
+        __slots__ = (
+            u'reply_code',
+            u'reply_text',
+            u'exchange',
+            u'routing_key',
+        )
+
+        NAME = u'basic.return'
+
+        INDEX = (60, 50)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x32'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = False  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'reply-code', u'reply-code', u'short', reserved=False),
+            Field(u'reply-text', u'reply-text', u'shortstr', reserved=False),
+            Field(u'exchange', u'exchange-name', u'shortstr', reserved=False),
+            Field(u'routing-key', u'shortstr', u'shortstr', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicReturn(%s)' % (', '.join(
+                map(to_repr, [
+                    self.reply_code, self.reply_text, self.exchange,
+                    self.routing_key
+                ])))
+
+        def __init__(self, reply_code, reply_text, exchange, routing_key):
+            """
+            Create frame basic.return
+            """
+            self.reply_code = reply_code
+            self.reply_text = reply_text
+            self.exchange = exchange
+            self.routing_key = routing_key
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(b"".join(
+                (STRUCT_HB.pack(self.reply_code,
+                                len(self.reply_text)), self.reply_text,
+                 STRUCT_B.pack(len(self.exchange)), self.exchange,
+                 STRUCT_B.pack(len(self.routing_key)), self.routing_key)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            ln = len(self.reply_text)
+            STRUCT_HB.pack_into(buf, offset, self.reply_code, ln)
+            offset += 3
+            buf[offset:offset + ln] = self.reply_text
+            offset += ln
+            ln = len(self.exchange)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.exchange
+            offset += ln
+            ln = len(self.routing_key)
+            STRUCT_B.pack_into(buf, offset, ln)
+            offset += 1
+            buf[offset:offset + ln] = self.routing_key
+            return offset + ln
+
+        def get_size(self):  # type: () -> int
+            return 5 + len(self.reply_text) + len(self.exchange) + len(
+                self.routing_key)
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicReturn
+            offset = start_offset
+            reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
+            offset += 3
+            reply_text = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            routing_key = buf[offset:offset + s_len]
+            offset += s_len
+            return cls(reply_code, reply_text, exchange, routing_key)
+
+    return BasicReturn
+
+
+def _make_BasicReturnLazy():
+    BasicReturn = _load('BasicReturn')
+
+    class BasicReturnLazy(BasicReturn):
+        """
+        basic.return, with arguments decoded upon first access to any of them.
+
+        Arguments are read-only. Until they are decoded, this keeps the buffer
+        it was received in.
+        """
+        __slots__ = ('_buf', '_offset', u'_reply_code', u'_reply_text',
+                     u'_exchange', u'_routing_key')
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> BasicReturnLazy
+            self = cls.__new__(cls)
+            self._buf = buf
+            self._offset = start_offset
+            return self
+
+        def _decode(self):  # type: () -> None
+            buf = self._buf
+            offset = self._offset
+            self._buf = None
+            self._reply_code, s_len, = STRUCT_HB.unpack_from(buf, offset)
+            offset += 3
+            self._reply_text = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            self._exchange = buf[offset:offset + s_len]
+            offset += s_len
+            s_len, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            self._routing_key = buf[offset:offset + s_len]
+            offset += s_len
+
+        @property
+        def reply_code(self):
+            if self._buf is not None:
+                self._decode()
+            return self._reply_code
+
+        @property
+        def reply_text(self):
+            if self._buf is not None:
+                self._decode()
+            return self._reply_text
+
+        @property
+        def exchange(self):
+            if self._buf is not None:
+                self._decode()
+            return self._exchange
+
+        @property
+        def routing_key(self):
+            if self._buf is not None:
+                self._decode()
+            return self._routing_key
+
+    return BasicReturnLazy
+
+
+def _make_BasicReject():
+
+    class BasicReject(AMQPMethodPayload):
+        """
+        Reject an incoming message
+    
+        This method allows a client to reject a message. It can be used
+        to interrupt and
+        cancel large incoming messages, or return untreatable messages
+        to their original
+        queue.
+
+        :type delivery_tag: int, 64 bit unsigned (delivery-tag in AMQP)
+        :param requeue: Requeue the message
+                If requeue is true, the server will attempt to requeue the
+                message. If requeue
+                is false or the requeue attempt fails the messages are
+                discarded or dead-lettered.
+        :type requeue: bool (bit in AMQP)
+        """
+        __slots__ = (
+            u'delivery_tag',
+            u'requeue',
+        )
+
+        NAME = u'basic.reject'
+
+        INDEX = (60, 90)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x5A'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'delivery-tag',
+                  u'delivery-tag',
+                  u'longlong',
+                  reserved=False),
+            Field(u'requeue', u'bit', u'bit', reserved=False),
+        ]
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'BasicReject(%s)' % (', '.join(
+                map(to_repr, [self.delivery_tag, self.requeue])))
+
+        def __init__(self, delivery_tag, requeue):
+            """
+            Create frame basic.reject
+            """
+            self.delivery_tag = delivery_tag
+            self.requeue = requeue
+
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_QB.pack(self.delivery_tag, (self.requeue << 0)))
+
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_QB.pack_into(buf, offset, self.delivery_tag,
+                                (self.requeue << 0))
+            return offset + 9
+
+        def get_size(self):  # type: () -> int
+            return 9
+
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicReject
+            offset = start_offset
+            delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
+            offset += 9
+            requeue = bool(_bit & 1)
+            return cls(delivery_tag, requeue)
+
+    return BasicReject
+
+
+def _make_BasicRecoverAsync():
+
+    class BasicRecoverAsync(AMQPMethodPayload):
+        """
+        Redeliver unacknowledged messages
+    
+        This method asks the server to redeliver all unacknowledged
+        messages on a
+        specified channel. Zero or more messages may be redelivered.
+        This method
+        is deprecated in favour of the synchronous Recover/Recover-Ok.
 
-        :return: Python string representation
+        :param requeue: Requeue the message
+                If this field is zero, the message will be redelivered to
+                the original
+                recipient. If this bit is 1, the server will attempt to
+                requeue the message,
+                potentially then delivering it to an alternative subscriber.
+        :type requeue: bool (bit in AMQP)
         """
-        return 'BasicReject(%s)' % (', '.join(
-            map(to_repr, [self.delivery_tag, self.requeue])))
+        __slots__ = (u'requeue', )
 
-    def __init__(self, delivery_tag, requeue):
-        """
-        Create frame basic.reject
-        """
-        self.delivery_tag = delivery_tag
-        self.requeue = requeue
+        NAME = u'basic.recover-async'
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_QB.pack(self.delivery_tag, (self.requeue << 0)))
+        INDEX = (60, 100)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x64'  # CLASS ID + METHOD ID
 
-    def get_size(self):  # type: () -> int
-        return 9
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicReject
-        offset = start_offset
-        delivery_tag, _bit, = STRUCT_QB.unpack_from(buf, offset)
-        offset += 8
-        requeue = bool(_bit >> 0)
-        offset += 1
-        return cls(delivery_tag, requeue)
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'requeue', u'bit', u'bit', reserved=False),
+        ]
 
-class BasicRecoverAsync(AMQPMethodPayload):
-    """
-    Redeliver unacknowledged messages
-    
-    This method asks the server to redeliver all unacknowledged
-    messages on a
-    specified channel. Zero or more messages may be redelivered.
-    This method
-    is deprecated in favour of the synchronous Recover/Recover-Ok.
-
-    :param requeue: Requeue the message
-            If this field is zero, the message will be redelivered to
-            the original
-            recipient. If this bit is 1, the server will attempt to
-            requeue the message,
-            potentially then delivering it to an alternative subscriber.
-    :type requeue: bool (bit in AMQP)
-    """
-    __slots__ = (u'requeue', )
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'basic.recover-async'
+            :return: Python string representation
+            """
+            return 'BasicRecoverAsync(%s)' % (', '.join(
+                map(to_repr, [self.requeue])))
 
-    INDEX = (60, 100)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x64'  # CLASS ID + METHOD ID
+        def __init__(self, requeue):
+            """
+            Create frame basic.recover-async
+            """
+            self.requeue = requeue
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_B.pack((self.requeue << 0)))
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_B.pack_into(buf, offset, (self.requeue << 0))
+            return offset + 1
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'requeue', u'bit', u'bit', reserved=False),
-    ]
+        def get_size(self):  # type: () -> int
+            return 1
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> BasicRecoverAsync
+            offset = start_offset
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            requeue = bool(_bit & 1)
+            return cls(requeue)
 
-        :return: Python string representation
-        """
-        return 'BasicRecoverAsync(%s)' % (', '.join(
-            map(to_repr, [self.requeue])))
+    return BasicRecoverAsync
 
-    def __init__(self, requeue):
-        """
-        Create frame basic.recover-async
-        """
-        self.requeue = requeue
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack((self.requeue << 0)))
+def _make_BasicRecover():
 
-    def get_size(self):  # type: () -> int
-        return 1
+    class BasicRecover(AMQPMethodPayload):
+        """
+        Redeliver unacknowledged messages
+    
+        This method asks the server to redeliver all unacknowledged
+        messages on a
+        specified channel. Zero or more messages may be redelivered.
+        This method
+        replaces the asynchronous Recover.
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicRecoverAsync
-        offset = start_offset
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        requeue = bool(_bit >> 0)
-        offset += 1
-        return cls(requeue)
+        :param requeue: Requeue the message
+                If this field is zero, the message will be redelivered to
+                the original
+                recipient. If this bit is 1, the server will attempt to
+                requeue the message,
+                potentially then delivering it to an alternative subscriber.
+        :type requeue: bool (bit in AMQP)
+        """
+        __slots__ = (u'requeue', )
 
+        NAME = u'basic.recover'
 
-class BasicRecover(AMQPMethodPayload):
-    """
-    Redeliver unacknowledged messages
-    
-    This method asks the server to redeliver all unacknowledged
-    messages on a
-    specified channel. Zero or more messages may be redelivered.
-    This method
-    replaces the asynchronous Recover.
-
-    :param requeue: Requeue the message
-            If this field is zero, the message will be redelivered to
-            the original
-            recipient. If this bit is 1, the server will attempt to
-            requeue the message,
-            potentially then delivering it to an alternative subscriber.
-    :type requeue: bool (bit in AMQP)
-    """
-    __slots__ = (u'requeue', )
+        INDEX = (60, 110)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x6E'  # CLASS ID + METHOD ID
 
-    NAME = u'basic.recover'
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    INDEX = (60, 110)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x6E'  # CLASS ID + METHOD ID
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'requeue', u'bit', u'bit', reserved=False),
+        ]
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'requeue', u'bit', u'bit', reserved=False),
-    ]
+            :return: Python string representation
+            """
+            return 'BasicRecover(%s)' % (', '.join(map(to_repr,
+                                                       [self.requeue])))
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def __init__(self, requeue):
+            """
+            Create frame basic.recover
+            """
+            self.requeue = requeue
 
-        :return: Python string representation
-        """
-        return 'BasicRecover(%s)' % (', '.join(map(to_repr, [self.requeue])))
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_B.pack((self.requeue << 0)))
 
-    def __init__(self, requeue):
-        """
-        Create frame basic.recover
-        """
-        self.requeue = requeue
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_B.pack_into(buf, offset, (self.requeue << 0))
+            return offset + 1
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack((self.requeue << 0)))
+        def get_size(self):  # type: () -> int
+            return 1
 
-    def get_size(self):  # type: () -> int
-        return 1
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicRecover
+            offset = start_offset
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            requeue = bool(_bit & 1)
+            return cls(requeue)
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicRecover
-        offset = start_offset
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        requeue = bool(_bit >> 0)
-        offset += 1
-        return cls(requeue)
+    return BasicRecover
 
 
-class BasicRecoverOk(AMQPMethodPayload):
-    """
-    Confirm recovery
+def _make_BasicRecoverOk():
+
+    class BasicRecoverOk(AMQPMethodPayload):
+        """
+        Confirm recovery
     
-    This method acknowledges a Basic.Recover method.
+        This method acknowledges a Basic.Recover method.
 
-    """
-    __slots__ = ()
+        """
+        __slots__ = ()
 
-    NAME = u'basic.recover-ok'
+        NAME = u'basic.recover-ok'
 
-    INDEX = (60, 111)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x3C\x00\x6F'  # CLASS ID + METHOD ID
+        INDEX = (60, 111)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x3C\x00\x6F'  # CLASS ID + METHOD ID
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x3C\x00\x6F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x3C\x00\x6F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'BasicRecoverOk(%s)' % (', '.join(map(to_repr, [])))
+            :return: Python string representation
+            """
+            return 'BasicRecoverOk(%s)' % (', '.join(map(to_repr, [])))
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> BasicRecoverOk
-        offset = start_offset
-        return cls()
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> BasicRecoverOk
+            offset = start_offset
+            return cls()
+
+    return BasicRecoverOk
 
 
 class Tx(AMQPClass):
@@ -4545,230 +6474,256 @@ class Tx(AMQPClass):
     INDEX = 90
 
 
-class TxCommit(AMQPMethodPayload):
-    """
-    Commit the current transaction
+def _make_TxCommit():
+
+    class TxCommit(AMQPMethodPayload):
+        """
+        Commit the current transaction
     
-    This method commits all message publications and acknowledgments
-    performed in
-    the current transaction. A new transaction starts immediately
-    after a commit.
+        This method commits all message publications and acknowledgments
+        performed in
+        the current transaction. A new transaction starts immediately
+        after a commit.
 
-    """
-    __slots__ = ()
+        """
+        __slots__ = ()
+
+        NAME = u'tx.commit'
+
+        INDEX = (90, 20)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x14'  # CLASS ID + METHOD ID
 
-    NAME = u'tx.commit'
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    INDEX = (90, 20)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x14'  # CLASS ID + METHOD ID
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x14\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x14\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+            :return: Python string representation
+            """
+            return 'TxCommit(%s)' % (', '.join(map(to_repr, [])))
 
-    def __repr__(self):  # type: () -> str
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxCommit
+            offset = start_offset
+            return cls()
+
+    return TxCommit
+
+
+def _make_TxCommitOk():
+
+    class TxCommitOk(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Confirm a successful commit
+    
+        This method confirms to the client that the commit succeeded.
+        Note that if a commit
+        fails, the server raises a channel exception.
 
-        :return: Python string representation
         """
-        return 'TxCommit(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf, start_offset):  # type: (buffer, int) -> TxCommit
-        offset = start_offset
-        return cls()
+        NAME = u'tx.commit-ok'
 
+        INDEX = (90, 21)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x15'  # CLASS ID + METHOD ID
 
-class TxCommitOk(AMQPMethodPayload):
-    """
-    Confirm a successful commit
-    
-    This method confirms to the client that the commit succeeded.
-    Note that if a commit
-    fails, the server raises a channel exception.
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    """
-    __slots__ = ()
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'TxCommitOk(%s)' % (', '.join(map(to_repr, [])))
 
-    NAME = u'tx.commit-ok'
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxCommitOk
+            offset = start_offset
+            return cls()
 
-    INDEX = (90, 21)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x15'  # CLASS ID + METHOD ID
+    return TxCommitOk
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x15\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+def _make_TxRollback():
 
-    def __repr__(self):  # type: () -> str
+    class TxRollback(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Abandon the current transaction
+    
+        This method abandons all message publications and
+        acknowledgments performed in
+        the current transaction. A new transaction starts immediately
+        after a rollback.
+        Note that unacked messages will not be automatically redelivered
+        by rollback;
+        if that is required an explicit recover call should be issued.
 
-        :return: Python string representation
         """
-        return 'TxCommitOk(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> TxCommitOk
-        offset = start_offset
-        return cls()
+        NAME = u'tx.rollback'
 
+        INDEX = (90, 30)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x1E'  # CLASS ID + METHOD ID
 
-class TxRollback(AMQPMethodPayload):
-    """
-    Abandon the current transaction
-    
-    This method abandons all message publications and
-    acknowledgments performed in
-    the current transaction. A new transaction starts immediately
-    after a rollback.
-    Note that unacked messages will not be automatically redelivered
-    by rollback;
-    if that is required an explicit recover call should be issued.
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    """
-    __slots__ = ()
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x1E\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'TxRollback(%s)' % (', '.join(map(to_repr, [])))
 
-    NAME = u'tx.rollback'
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxRollback
+            offset = start_offset
+            return cls()
 
-    INDEX = (90, 30)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x1E'  # CLASS ID + METHOD ID
+    return TxRollback
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x1E\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+def _make_TxRollbackOk():
 
-    def __repr__(self):  # type: () -> str
+    class TxRollbackOk(AMQPMethodPayload):
         """
-        Convert the frame to a Python-representable string
+        Confirm successful rollback
+    
+        This method confirms to the client that the rollback succeeded.
+        Note that if an
+        rollback fails, the server raises a channel exception.
 
-        :return: Python string representation
         """
-        return 'TxRollback(%s)' % (', '.join(map(to_repr, [])))
+        __slots__ = ()
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> TxRollback
-        offset = start_offset
-        return cls()
+        NAME = u'tx.rollback-ok'
 
+        INDEX = (90, 31)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x1F'  # CLASS ID + METHOD ID
 
-class TxRollbackOk(AMQPMethodPayload):
-    """
-    Confirm successful rollback
-    
-    This method confirms to the client that the rollback succeeded.
-    Note that if an
-    rollback fails, the server raises a channel exception.
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    """
-    __slots__ = ()
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x1F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    NAME = u'tx.rollback-ok'
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    INDEX = (90, 31)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x1F'  # CLASS ID + METHOD ID
+            :return: Python string representation
+            """
+            return 'TxRollbackOk(%s)' % (', '.join(map(to_repr, [])))
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxRollbackOk
+            offset = start_offset
+            return cls()
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x1F\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+    return TxRollbackOk
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'TxRollbackOk(%s)' % (', '.join(map(to_repr, [])))
+def _make_TxSelect():
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> TxRollbackOk
-        offset = start_offset
-        return cls()
+    class TxSelect(AMQPMethodPayload):
+        """
+        Select standard transaction mode
+    
+        This method sets the channel to use standard transactions. The
+        client must use this
+        method at least once on a channel before using the Commit or
+        Rollback methods.
 
+        """
+        __slots__ = ()
 
-class TxSelect(AMQPMethodPayload):
-    """
-    Select standard transaction mode
-    
-    This method sets the channel to use standard transactions. The
-    client must use this
-    method at least once on a channel before using the Commit or
-    Rollback methods.
+        NAME = u'tx.select'
 
-    """
-    __slots__ = ()
+        INDEX = (90, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x0A'  # CLASS ID + METHOD ID
 
-    NAME = u'tx.select'
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
-    INDEX = (90, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x0A'  # CLASS ID + METHOD ID
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x0A\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x0A\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+            :return: Python string representation
+            """
+            return 'TxSelect(%s)' % (', '.join(map(to_repr, [])))
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxSelect
+            offset = start_offset
+            return cls()
 
-        :return: Python string representation
-        """
-        return 'TxSelect(%s)' % (', '.join(map(to_repr, [])))
+    return TxSelect
 
-    @classmethod
-    def from_buffer(cls, buf, start_offset):  # type: (buffer, int) -> TxSelect
-        offset = start_offset
-        return cls()
 
+def _make_TxSelectOk():
 
-class TxSelectOk(AMQPMethodPayload):
-    """
-    Confirm transaction mode
+    class TxSelectOk(AMQPMethodPayload):
+        """
+        Confirm transaction mode
     
-    This method confirms to the client that the channel was
-    successfully set to use
-    standard transactions.
+        This method confirms to the client that the channel was
+        successfully set to use
+        standard transactions.
 
-    """
-    __slots__ = ()
+        """
+        __slots__ = ()
 
-    NAME = u'tx.select-ok'
+        NAME = u'tx.select-ok'
 
-    INDEX = (90, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x5A\x00\x0B'  # CLASS ID + METHOD ID
+        INDEX = (90, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x5A\x00\x0B'  # CLASS ID + METHOD ID
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x5A\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-        :return: Python string representation
-        """
-        return 'TxSelectOk(%s)' % (', '.join(map(to_repr, [])))
+            :return: Python string representation
+            """
+            return 'TxSelectOk(%s)' % (', '.join(map(to_repr, [])))
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> TxSelectOk
-        offset = start_offset
-        return cls()
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> TxSelectOk
+            offset = start_offset
+            return cls()
+
+    return TxSelectOk
 
 
 class Confirm(AMQPClass):
@@ -4796,346 +6751,625 @@ class Confirm(AMQPClass):
     INDEX = 85
 
 
-class ConfirmSelect(AMQPMethodPayload):
-    """
-    This method sets the channel to use publisher acknowledgements.
-    
-    The client can only use this method on a non-transactional
-    channel.
-
-    :param nowait: If set, the server will not respond to the method. the
-            client should
-            not wait for a reply method. If the server could not
-            complete the
-            method it will raise a channel or connection exception.
-    :type nowait: bool (bit in AMQP)
-    """
-    __slots__ = (u'nowait', )
-
-    NAME = u'confirm.select'
-
-    INDEX = (85, 10)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x55\x00\x0A'  # CLASS ID + METHOD ID
-
-    SENT_BY_CLIENT, SENT_BY_SERVER = False, True
-
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = False  # this means that argument part has always the same content
+def _make_ConfirmSelect():
 
-    # See constructor pydoc for details
-    FIELDS = [
-        Field(u'nowait', u'bit', u'bit', reserved=False),
-    ]
-
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
-
-        :return: Python string representation
+    class ConfirmSelect(AMQPMethodPayload):
         """
-        return 'ConfirmSelect(%s)' % (', '.join(map(to_repr, [self.nowait])))
+        This method sets the channel to use publisher acknowledgements.
+    
+        The client can only use this method on a non-transactional
+        channel.
 
-    def __init__(self, nowait):
+        :param nowait: If set, the server will not respond to the method. the
+                client should
+                not wait for a reply method. If the server could not
+                complete the
+                method it will raise a channel or connection exception.
+        :type nowait: bool (bit in AMQP)
         """
-        Create frame confirm.select
-        """
-        self.nowait = nowait
+        __slots__ = (u'nowait', )
 
-    def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
-        buf.write(STRUCT_B.pack((self.nowait << 0)))
+        NAME = u'confirm.select'
 
-    def get_size(self):  # type: () -> int
-        return 1
+        INDEX = (85, 10)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x55\x00\x0A'  # CLASS ID + METHOD ID
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConfirmSelect
-        offset = start_offset
-        _bit, = STRUCT_B.unpack_from(buf, offset)
-        offset += 0
-        nowait = bool(_bit >> 0)
-        offset += 1
-        return cls(nowait)
+        SENT_BY_CLIENT, SENT_BY_SERVER = False, True
 
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = False  # this means that argument part has always the same content
 
-class ConfirmSelectOk(AMQPMethodPayload):
-    """
-    This method confirms to the client that the channel was
-    
-    successfully
-    set to use publisher acknowledgements.
+        # See constructor pydoc for details
+        FIELDS = [
+            Field(u'nowait', u'bit', u'bit', reserved=False),
+        ]
 
-    """
-    __slots__ = ()
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
 
-    NAME = u'confirm.select-ok'
+            :return: Python string representation
+            """
+            return 'ConfirmSelect(%s)' % (', '.join(map(
+                to_repr, [self.nowait])))
 
-    INDEX = (85, 11)  # (Class ID, Method ID)
-    BINARY_HEADER = b'\x00\x55\x00\x0B'  # CLASS ID + METHOD ID
+        def __init__(self, nowait):
+            """
+            Create frame confirm.select
+            """
+            self.nowait = nowait
 
-    SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+        def write_arguments(self, buf):  # type: (tp.BinaryIO) -> None
+            buf.write(STRUCT_B.pack((self.nowait << 0)))
 
-    IS_SIZE_STATIC = True  # this means that argument part has always the same length
-    IS_CONTENT_STATIC = True  # this means that argument part has always the same content
-    STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x55\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+        def write_into(self, buf, offset):  # type: (bytearray, int) -> int
+            STRUCT_B.pack_into(buf, offset, (self.nowait << 0))
+            return offset + 1
 
-    def __repr__(self):  # type: () -> str
-        """
-        Convert the frame to a Python-representable string
+        def get_size(self):  # type: () -> int
+            return 1
 
-        :return: Python string representation
-        """
-        return 'ConfirmSelectOk(%s)' % (', '.join(map(to_repr, [])))
+        @classmethod
+        def from_buffer(cls, buf,
+                        start_offset):  # type: (buffer, int) -> ConfirmSelect
+            offset = start_offset
+            _bit, = STRUCT_B.unpack_from(buf, offset)
+            offset += 1
+            nowait = bool(_bit & 1)
+            return cls(nowait)
 
-    @classmethod
-    def from_buffer(cls, buf,
-                    start_offset):  # type: (buffer, int) -> ConfirmSelectOk
-        offset = start_offset
-        return cls()
+    return ConfirmSelect
 
 
-IDENT_TO_METHOD = {
-    (10, 60): ConnectionBlocked,
-    (10, 50): ConnectionClose,
-    (10, 51): ConnectionCloseOk,
-    (10, 40): ConnectionOpen,
-    (10, 41): ConnectionOpenOk,
-    (10, 10): ConnectionStart,
-    (10, 20): ConnectionSecure,
-    (10, 11): ConnectionStartOk,
-    (10, 21): ConnectionSecureOk,
-    (10, 30): ConnectionTune,
-    (10, 31): ConnectionTuneOk,
-    (10, 61): ConnectionUnblocked,
-    (20, 40): ChannelClose,
-    (20, 41): ChannelCloseOk,
-    (20, 20): ChannelFlow,
-    (20, 21): ChannelFlowOk,
-    (20, 10): ChannelOpen,
-    (20, 11): ChannelOpenOk,
-    (40, 30): ExchangeBind,
-    (40, 31): ExchangeBindOk,
-    (40, 10): ExchangeDeclare,
-    (40, 20): ExchangeDelete,
-    (40, 11): ExchangeDeclareOk,
-    (40, 21): ExchangeDeleteOk,
-    (40, 40): ExchangeUnbind,
-    (40, 51): ExchangeUnbindOk,
-    (50, 20): QueueBind,
-    (50, 21): QueueBindOk,
-    (50, 10): QueueDeclare,
-    (50, 40): QueueDelete,
-    (50, 11): QueueDeclareOk,
-    (50, 41): QueueDeleteOk,
-    (50, 30): QueuePurge,
-    (50, 31): QueuePurgeOk,
-    (50, 50): QueueUnbind,
-    (50, 51): QueueUnbindOk,
-    (60, 80): BasicAck,
-    (60, 20): BasicConsume,
-    (60, 30): BasicCancel,
-    (60, 21): BasicConsumeOk,
-    (60, 31): BasicCancelOk,
-    (60, 60): BasicDeliver,
-    (60, 70): BasicGet,
-    (60, 71): BasicGetOk,
-    (60, 72): BasicGetEmpty,
-    (60, 120): BasicNack,
-    (60, 40): BasicPublish,
-    (60, 10): BasicQos,
-    (60, 11): BasicQosOk,
-    (60, 50): BasicReturn,
-    (60, 90): BasicReject,
-    (60, 100): BasicRecoverAsync,
-    (60, 110): BasicRecover,
-    (60, 111): BasicRecoverOk,
-    (90, 20): TxCommit,
-    (90, 21): TxCommitOk,
-    (90, 30): TxRollback,
-    (90, 31): TxRollbackOk,
-    (90, 10): TxSelect,
-    (90, 11): TxSelectOk,
-    (85, 10): ConfirmSelect,
-    (85, 11): ConfirmSelectOk,
-}
+def _make_ConfirmSelectOk():
 
-BINARY_HEADER_TO_METHOD = {
-    b'\x00\x0A\x00\x3C': ConnectionBlocked,
-    b'\x00\x0A\x00\x32': ConnectionClose,
-    b'\x00\x0A\x00\x33': ConnectionCloseOk,
-    b'\x00\x0A\x00\x28': ConnectionOpen,
-    b'\x00\x0A\x00\x29': ConnectionOpenOk,
-    b'\x00\x0A\x00\x0A': ConnectionStart,
-    b'\x00\x0A\x00\x14': ConnectionSecure,
-    b'\x00\x0A\x00\x0B': ConnectionStartOk,
-    b'\x00\x0A\x00\x15': ConnectionSecureOk,
-    b'\x00\x0A\x00\x1E': ConnectionTune,
-    b'\x00\x0A\x00\x1F': ConnectionTuneOk,
-    b'\x00\x0A\x00\x3D': ConnectionUnblocked,
-    b'\x00\x14\x00\x28': ChannelClose,
-    b'\x00\x14\x00\x29': ChannelCloseOk,
-    b'\x00\x14\x00\x14': ChannelFlow,
-    b'\x00\x14\x00\x15': ChannelFlowOk,
-    b'\x00\x14\x00\x0A': ChannelOpen,
-    b'\x00\x14\x00\x0B': ChannelOpenOk,
-    b'\x00\x28\x00\x1E': ExchangeBind,
-    b'\x00\x28\x00\x1F': ExchangeBindOk,
-    b'\x00\x28\x00\x0A': ExchangeDeclare,
-    b'\x00\x28\x00\x14': ExchangeDelete,
-    b'\x00\x28\x00\x0B': ExchangeDeclareOk,
-    b'\x00\x28\x00\x15': ExchangeDeleteOk,
-    b'\x00\x28\x00\x28': ExchangeUnbind,
-    b'\x00\x28\x00\x33': ExchangeUnbindOk,
-    b'\x00\x32\x00\x14': QueueBind,
-    b'\x00\x32\x00\x15': QueueBindOk,
-    b'\x00\x32\x00\x0A': QueueDeclare,
-    b'\x00\x32\x00\x28': QueueDelete,
-    b'\x00\x32\x00\x0B': QueueDeclareOk,
-    b'\x00\x32\x00\x29': QueueDeleteOk,
-    b'\x00\x32\x00\x1E': QueuePurge,
-    b'\x00\x32\x00\x1F': QueuePurgeOk,
-    b'\x00\x32\x00\x32': QueueUnbind,
-    b'\x00\x32\x00\x33': QueueUnbindOk,
-    b'\x00\x3C\x00\x50': BasicAck,
-    b'\x00\x3C\x00\x14': BasicConsume,
-    b'\x00\x3C\x00\x1E': BasicCancel,
-    b'\x00\x3C\x00\x15': BasicConsumeOk,
-    b'\x00\x3C\x00\x1F': BasicCancelOk,
-    b'\x00\x3C\x00\x3C': BasicDeliver,
-    b'\x00\x3C\x00\x46': BasicGet,
-    b'\x00\x3C\x00\x47': BasicGetOk,
-    b'\x00\x3C\x00\x48': BasicGetEmpty,
-    b'\x00\x3C\x00\x78': BasicNack,
-    b'\x00\x3C\x00\x28': BasicPublish,
-    b'\x00\x3C\x00\x0A': BasicQos,
-    b'\x00\x3C\x00\x0B': BasicQosOk,
-    b'\x00\x3C\x00\x32': BasicReturn,
-    b'\x00\x3C\x00\x5A': BasicReject,
-    b'\x00\x3C\x00\x64': BasicRecoverAsync,
-    b'\x00\x3C\x00\x6E': BasicRecover,
-    b'\x00\x3C\x00\x6F': BasicRecoverOk,
-    b'\x00\x5A\x00\x14': TxCommit,
-    b'\x00\x5A\x00\x15': TxCommitOk,
-    b'\x00\x5A\x00\x1E': TxRollback,
-    b'\x00\x5A\x00\x1F': TxRollbackOk,
-    b'\x00\x5A\x00\x0A': TxSelect,
-    b'\x00\x5A\x00\x0B': TxSelectOk,
-    b'\x00\x55\x00\x0A': ConfirmSelect,
-    b'\x00\x55\x00\x0B': ConfirmSelectOk,
+    class ConfirmSelectOk(AMQPMethodPayload):
+        """
+        This method confirms to the client that the channel was
+    
+        successfully
+        set to use publisher acknowledgements.
+
+        """
+        __slots__ = ()
+
+        NAME = u'confirm.select-ok'
+
+        INDEX = (85, 11)  # (Class ID, Method ID)
+        BINARY_HEADER = b'\x00\x55\x00\x0B'  # CLASS ID + METHOD ID
+
+        SENT_BY_CLIENT, SENT_BY_SERVER = True, False
+
+        IS_SIZE_STATIC = True  # this means that argument part has always the same length
+        IS_CONTENT_STATIC = True  # this means that argument part has always the same content
+        STATIC_CONTENT = b'\x00\x00\x00\x04\x00\x55\x00\x0B\xCE'  # spans LENGTH, CLASS ID, METHOD ID, ....., FRAME_END
+
+        def __repr__(self):  # type: () -> str
+            """
+            Convert the frame to a Python-representable string
+
+            :return: Python string representation
+            """
+            return 'ConfirmSelectOk(%s)' % (', '.join(map(to_repr, [])))
+
+        @classmethod
+        def from_buffer(
+                cls, buf,
+                start_offset):  # type: (buffer, int) -> ConfirmSelectOk
+            offset = start_offset
+            return cls()
+
+    return ConfirmSelectOk
+
+
+def _make_REPLY_REASONS_FOR():
+    BasicAck = _load('BasicAck')
+    BasicCancel = _load('BasicCancel')
+    BasicCancelOk = _load('BasicCancelOk')
+    BasicConsume = _load('BasicConsume')
+    BasicConsumeOk = _load('BasicConsumeOk')
+    BasicDeliver = _load('BasicDeliver')
+    BasicGet = _load('BasicGet')
+    BasicGetEmpty = _load('BasicGetEmpty')
+    BasicGetOk = _load('BasicGetOk')
+    BasicNack = _load('BasicNack')
+    BasicPublish = _load('BasicPublish')
+    BasicQos = _load('BasicQos')
+    BasicQosOk = _load('BasicQosOk')
+    BasicRecover = _load('BasicRecover')
+    BasicRecoverAsync = _load('BasicRecoverAsync')
+    BasicRecoverOk = _load('BasicRecoverOk')
+    BasicReject = _load('BasicReject')
+    BasicReturn = _load('BasicReturn')
+    ChannelClose = _load('ChannelClose')
+    ChannelCloseOk = _load('ChannelCloseOk')
+    ChannelFlow = _load('ChannelFlow')
+    ChannelFlowOk = _load('ChannelFlowOk')
+    ChannelOpen = _load('ChannelOpen')
+    ChannelOpenOk = _load('ChannelOpenOk')
+    ConfirmSelect = _load('ConfirmSelect')
+    ConfirmSelectOk = _load('ConfirmSelectOk')
+    ConnectionBlocked = _load('ConnectionBlocked')
+    ConnectionClose = _load('ConnectionClose')
+    ConnectionCloseOk = _load('ConnectionCloseOk')
+    ConnectionOpen = _load('ConnectionOpen')
+    ConnectionOpenOk = _load('ConnectionOpenOk')
+    ConnectionSecure = _load('ConnectionSecure')
+    ConnectionSecureOk = _load('ConnectionSecureOk')
+    ConnectionStart = _load('ConnectionStart')
+    ConnectionStartOk = _load('ConnectionStartOk')
+    ConnectionTune = _load('ConnectionTune')
+    ConnectionTuneOk = _load('ConnectionTuneOk')
+    ConnectionUnblocked = _load('ConnectionUnblocked')
+    ExchangeBind = _load('ExchangeBind')
+    ExchangeBindOk = _load('ExchangeBindOk')
+    ExchangeDeclare = _load('ExchangeDeclare')
+    ExchangeDeclareOk = _load('ExchangeDeclareOk')
+    ExchangeDelete = _load('ExchangeDelete')
+    ExchangeDeleteOk = _load('ExchangeDeleteOk')
+    ExchangeUnbind = _load('ExchangeUnbind')
+    ExchangeUnbindOk = _load('ExchangeUnbindOk')
+    QueueBind = _load('QueueBind')
+    QueueBindOk = _load('QueueBindOk')
+    QueueDeclare = _load('QueueDeclare')
+    QueueDeclareOk = _load('QueueDeclareOk')
+    QueueDelete = _load('QueueDelete')
+    QueueDeleteOk = _load('QueueDeleteOk')
+    QueuePurge = _load('QueuePurge')
+    QueuePurgeOk = _load('QueuePurgeOk')
+    QueueUnbind = _load('QueueUnbind')
+    QueueUnbindOk = _load('QueueUnbindOk')
+    TxCommit = _load('TxCommit')
+    TxCommitOk = _load('TxCommitOk')
+    TxRollback = _load('TxRollback')
+    TxRollbackOk = _load('TxRollbackOk')
+    TxSelect = _load('TxSelect')
+    TxSelectOk = _load('TxSelectOk')
+    # Methods that are sent as replies to other methods, ie. ConnectionOpenOk: ConnectionOpen
+    # if a method is NOT a reply, it will not be in this dict
+    # a method may be a reply for AT MOST one method
+    REPLY_REASONS_FOR = {
+        ConnectionCloseOk: ConnectionClose,
+        ConnectionOpenOk: ConnectionOpen,
+        ConnectionStartOk: ConnectionStart,
+        ConnectionSecureOk: ConnectionSecure,
+        ConnectionTuneOk: ConnectionTune,
+        ChannelCloseOk: ChannelClose,
+        ChannelFlowOk: ChannelFlow,
+        ChannelOpenOk: ChannelOpen,
+        ExchangeBindOk: ExchangeBind,
+        ExchangeDeclareOk: ExchangeDeclare,
+        ExchangeDeleteOk: ExchangeDelete,
+        ExchangeUnbindOk: ExchangeUnbind,
+        QueueBindOk: QueueBind,
+        QueueDeclareOk: QueueDeclare,
+        QueueDeleteOk: QueueDelete,
+        QueuePurgeOk: QueuePurge,
+        QueueUnbindOk: QueueUnbind,
+        BasicConsumeOk: BasicConsume,
+        BasicCancelOk: BasicCancel,
+        BasicGetOk: BasicGet,
+        BasicGetEmpty: BasicGet,
+        BasicQosOk: BasicQos,
+        TxCommitOk: TxCommit,
+        TxRollbackOk: TxRollback,
+        TxSelectOk: TxSelect,
+        ConfirmSelectOk: ConfirmSelect,
+    }
+
+    return REPLY_REASONS_FOR
+
+
+def _make_REPLIES_FOR():
+    BasicAck = _load('BasicAck')
+    BasicCancel = _load('BasicCancel')
+    BasicCancelOk = _load('BasicCancelOk')
+    BasicConsume = _load('BasicConsume')
+    BasicConsumeOk = _load('BasicConsumeOk')
+    BasicDeliver = _load('BasicDeliver')
+    BasicGet = _load('BasicGet')
+    BasicGetEmpty = _load('BasicGetEmpty')
+    BasicGetOk = _load('BasicGetOk')
+    BasicNack = _load('BasicNack')
+    BasicPublish = _load('BasicPublish')
+    BasicQos = _load('BasicQos')
+    BasicQosOk = _load('BasicQosOk')
+    BasicRecover = _load('BasicRecover')
+    BasicRecoverAsync = _load('BasicRecoverAsync')
+    BasicRecoverOk = _load('BasicRecoverOk')
+    BasicReject = _load('BasicReject')
+    BasicReturn = _load('BasicReturn')
+    ChannelClose = _load('ChannelClose')
+    ChannelCloseOk = _load('ChannelCloseOk')
+    ChannelFlow = _load('ChannelFlow')
+    ChannelFlowOk = _load('ChannelFlowOk')
+    ChannelOpen = _load('ChannelOpen')
+    ChannelOpenOk = _load('ChannelOpenOk')
+    ConfirmSelect = _load('ConfirmSelect')
+    ConfirmSelectOk = _load('ConfirmSelectOk')
+    ConnectionBlocked = _load('ConnectionBlocked')
+    ConnectionClose = _load('ConnectionClose')
+    ConnectionCloseOk = _load('ConnectionCloseOk')
+    ConnectionOpen = _load('ConnectionOpen')
+    ConnectionOpenOk = _load('ConnectionOpenOk')
+    ConnectionSecure = _load('ConnectionSecure')
+    ConnectionSecureOk = _load('ConnectionSecureOk')
+    ConnectionStart = _load('ConnectionStart')
+    ConnectionStartOk = _load('ConnectionStartOk')
+    ConnectionTune = _load('ConnectionTune')
+    ConnectionTuneOk = _load('ConnectionTuneOk')
+    ConnectionUnblocked = _load('ConnectionUnblocked')
+    ExchangeBind = _load('ExchangeBind')
+    ExchangeBindOk = _load('ExchangeBindOk')
+    ExchangeDeclare = _load('ExchangeDeclare')
+    ExchangeDeclareOk = _load('ExchangeDeclareOk')
+    ExchangeDelete = _load('ExchangeDelete')
+    ExchangeDeleteOk = _load('ExchangeDeleteOk')
+    ExchangeUnbind = _load('ExchangeUnbind')
+    ExchangeUnbindOk = _load('ExchangeUnbindOk')
+    QueueBind = _load('QueueBind')
+    QueueBindOk = _load('QueueBindOk')
+    QueueDeclare = _load('QueueDeclare')
+    QueueDeclareOk = _load('QueueDeclareOk')
+    QueueDelete = _load('QueueDelete')
+    QueueDeleteOk = _load('QueueDeleteOk')
+    QueuePurge = _load('QueuePurge')
+    QueuePurgeOk = _load('QueuePurgeOk')
+    QueueUnbind = _load('QueueUnbind')
+    QueueUnbindOk = _load('QueueUnbindOk')
+    TxCommit = _load('TxCommit')
+    TxCommitOk = _load('TxCommitOk')
+    TxRollback = _load('TxRollback')
+    TxRollbackOk = _load('TxRollbackOk')
+    TxSelect = _load('TxSelect')
+    TxSelectOk = _load('TxSelectOk')
+    # Methods that are replies for other, ie. ConnectionOpenOk: ConnectionOpen
+    # a method may be a reply for ONE or NONE other methods
+    # if a method has no replies, it will have an empty list as value here
+    REPLIES_FOR = {
+        ConnectionBlocked: [],
+        ConnectionClose: [ConnectionCloseOk],
+        ConnectionCloseOk: [],
+        ConnectionOpen: [ConnectionOpenOk],
+        ConnectionOpenOk: [],
+        ConnectionStart: [ConnectionStartOk],
+        ConnectionSecure: [ConnectionSecureOk],
+        ConnectionStartOk: [],
+        ConnectionSecureOk: [],
+        ConnectionTune: [ConnectionTuneOk],
+        ConnectionTuneOk: [],
+        ConnectionUnblocked: [],
+        ChannelClose: [ChannelCloseOk],
+        ChannelCloseOk: [],
+        ChannelFlow: [ChannelFlowOk],
+        ChannelFlowOk: [],
+        ChannelOpen: [ChannelOpenOk],
+        ChannelOpenOk: [],
+        ExchangeBind: [ExchangeBindOk],
+        ExchangeBindOk: [],
+        ExchangeDeclare: [ExchangeDeclareOk],
+        ExchangeDelete: [ExchangeDeleteOk],
+        ExchangeDeclareOk: [],
+        ExchangeDeleteOk: [],
+        ExchangeUnbind: [ExchangeUnbindOk],
+        ExchangeUnbindOk: [],
+        QueueBind: [QueueBindOk],
+        QueueBindOk: [],
+        QueueDeclare: [QueueDeclareOk],
+        QueueDelete: [QueueDeleteOk],
+        QueueDeclareOk: [],
+        QueueDeleteOk: [],
+        QueuePurge: [QueuePurgeOk],
+        QueuePurgeOk: [],
+        QueueUnbind: [QueueUnbindOk],
+        QueueUnbindOk: [],
+        BasicAck: [],
+        BasicConsume: [BasicConsumeOk],
+        BasicCancel: [BasicCancelOk],
+        BasicConsumeOk: [],
+        BasicCancelOk: [],
+        BasicDeliver: [],
+        BasicGet: [BasicGetOk, BasicGetEmpty],
+        BasicGetOk: [],
+        BasicGetEmpty: [],
+        BasicNack: [],
+        BasicPublish: [],
+        BasicQos: [BasicQosOk],
+        BasicQosOk: [],
+        BasicReturn: [],
+        BasicReject: [],
+        BasicRecoverAsync: [],
+        BasicRecover: [],
+        BasicRecoverOk: [],
+        TxCommit: [TxCommitOk],
+        TxCommitOk: [],
+        TxRollback: [TxRollbackOk],
+        TxRollbackOk: [],
+        TxSelect: [TxSelectOk],
+        TxSelectOk: [],
+        ConfirmSelect: [ConfirmSelectOk],
+        ConfirmSelectOk: [],
+    }
+
+    return REPLIES_FOR
+
+
+# Method classes and tables that refer to them are made
+# upon first access, so that importing this module is fast
+_FACTORIES = {
+    u'ConnectionBlocked': _make_ConnectionBlocked,
+    u'ConnectionClose': _make_ConnectionClose,
+    u'ConnectionCloseOk': _make_ConnectionCloseOk,
+    u'ConnectionOpen': _make_ConnectionOpen,
+    u'ConnectionOpenOk': _make_ConnectionOpenOk,
+    u'ConnectionStart': _make_ConnectionStart,
+    u'ConnectionStartLazy': _make_ConnectionStartLazy,
+    u'ConnectionSecure': _make_ConnectionSecure,
+    u'ConnectionStartOk': _make_ConnectionStartOk,
+    u'ConnectionSecureOk': _make_ConnectionSecureOk,
+    u'ConnectionTune': _make_ConnectionTune,
+    u'ConnectionTuneOk': _make_ConnectionTuneOk,
+    u'ConnectionUnblocked': _make_ConnectionUnblocked,
+    u'ChannelClose': _make_ChannelClose,
+    u'ChannelCloseOk': _make_ChannelCloseOk,
+    u'ChannelFlow': _make_ChannelFlow,
+    u'ChannelFlowOk': _make_ChannelFlowOk,
+    u'ChannelOpen': _make_ChannelOpen,
+    u'ChannelOpenOk': _make_ChannelOpenOk,
+    u'ExchangeBind': _make_ExchangeBind,
+    u'ExchangeBindOk': _make_ExchangeBindOk,
+    u'ExchangeDeclare': _make_ExchangeDeclare,
+    u'ExchangeDelete': _make_ExchangeDelete,
+    u'ExchangeDeclareOk': _make_ExchangeDeclareOk,
+    u'ExchangeDeleteOk': _make_ExchangeDeleteOk,
+    u'ExchangeUnbind': _make_ExchangeUnbind,
+    u'ExchangeUnbindOk': _make_ExchangeUnbindOk,
+    u'QueueBind': _make_QueueBind,
+    u'QueueBindOk': _make_QueueBindOk,
+    u'QueueDeclare': _make_QueueDeclare,
+    u'QueueDelete': _make_QueueDelete,
+    u'QueueDeclareOk': _make_QueueDeclareOk,
+    u'QueueDeleteOk': _make_QueueDeleteOk,
+    u'QueuePurge': _make_QueuePurge,
+    u'QueuePurgeOk': _make_QueuePurgeOk,
+    u'QueueUnbind': _make_QueueUnbind,
+    u'QueueUnbindOk': _make_QueueUnbindOk,
+    u'BasicAck': _make_BasicAck,
+    u'BasicAckLazy': _make_BasicAckLazy,
+    u'BasicConsume': _make_BasicConsume,
+    u'BasicCancel': _make_BasicCancel,
+    u'BasicConsumeOk': _make_BasicConsumeOk,
+    u'BasicCancelOk': _make_BasicCancelOk,
+    u'BasicDeliver': _make_BasicDeliver,
+    u'BasicDeliverLazy': _make_BasicDeliverLazy,
+    u'BasicGet': _make_BasicGet,
+    u'BasicGetOk': _make_BasicGetOk,
+    u'BasicGetEmpty': _make_BasicGetEmpty,
+    u'BasicNack': _make_BasicNack,
+    u'BasicNackLazy': _make_BasicNackLazy,
+    u'BasicPublish': _make_BasicPublish,
+    u'BasicQos': _make_BasicQos,
+    u'BasicQosOk': _make_BasicQosOk,
+    u'BasicReturn': _make_BasicReturn,
+    u'BasicReturnLazy': _make_BasicReturnLazy,
+    u'BasicReject': _make_BasicReject,
+    u'BasicRecoverAsync': _make_BasicRecoverAsync,
+    u'BasicRecover': _make_BasicRecover,
+    u'BasicRecoverOk': _make_BasicRecoverOk,
+    u'TxCommit': _make_TxCommit,
+    u'TxCommitOk': _make_TxCommitOk,
+    u'TxRollback': _make_TxRollback,
+    u'TxRollbackOk': _make_TxRollbackOk,
+    u'TxSelect': _make_TxSelect,
+    u'TxSelectOk': _make_TxSelectOk,
+    u'ConfirmSelect': _make_ConfirmSelect,
+    u'ConfirmSelectOk': _make_ConfirmSelectOk,
+    u'REPLY_REASONS_FOR': _make_REPLY_REASONS_FOR,
+    u'REPLIES_FOR': _make_REPLIES_FOR,
 }
+_LOAD_LOCK = threading.RLock()
+
+
+def _load(name):  # type: (str) -> tp.Any
+    """
+    Return a lazily made attribute of this module, making it if it's the
+    first access
+
+    :raise KeyError: there's no such attribute
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+
+    factory = _FACTORIES[name]
+    with _LOAD_LOCK:
+        # someone might have beaten us to it
+        if name not in globals():
+            made = factory()
+            if isinstance(made, type):
+                made.__qualname__ = name
+            globals()[name] = made
+        return globals()[name]
+
+
+def __getattr__(name):
+    try:
+        return _load(name)
+    except KeyError:
+        raise AttributeError('module %s has no attribute %s' %
+                             (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_FACTORIES))
+
+
+IDENT_TO_METHOD = LazyDispatchTable(
+    _load, {
+        (10, 60): u'ConnectionBlocked',
+        (10, 50): u'ConnectionClose',
+        (10, 51): u'ConnectionCloseOk',
+        (10, 40): u'ConnectionOpen',
+        (10, 41): u'ConnectionOpenOk',
+        (10, 10): u'ConnectionStart',
+        (10, 20): u'ConnectionSecure',
+        (10, 11): u'ConnectionStartOk',
+        (10, 21): u'ConnectionSecureOk',
+        (10, 30): u'ConnectionTune',
+        (10, 31): u'ConnectionTuneOk',
+        (10, 61): u'ConnectionUnblocked',
+        (20, 40): u'ChannelClose',
+        (20, 41): u'ChannelCloseOk',
+        (20, 20): u'ChannelFlow',
+        (20, 21): u'ChannelFlowOk',
+        (20, 10): u'ChannelOpen',
+        (20, 11): u'ChannelOpenOk',
+        (40, 30): u'ExchangeBind',
+        (40, 31): u'ExchangeBindOk',
+        (40, 10): u'ExchangeDeclare',
+        (40, 20): u'ExchangeDelete',
+        (40, 11): u'ExchangeDeclareOk',
+        (40, 21): u'ExchangeDeleteOk',
+        (40, 40): u'ExchangeUnbind',
+        (40, 51): u'ExchangeUnbindOk',
+        (50, 20): u'QueueBind',
+        (50, 21): u'QueueBindOk',
+        (50, 10): u'QueueDeclare',
+        (50, 40): u'QueueDelete',
+        (50, 11): u'QueueDeclareOk',
+        (50, 41): u'QueueDeleteOk',
+        (50, 30): u'QueuePurge',
+        (50, 31): u'QueuePurgeOk',
+        (50, 50): u'QueueUnbind',
+        (50, 51): u'QueueUnbindOk',
+        (60, 80): u'BasicAck',
+        (60, 20): u'BasicConsume',
+        (60, 30): u'BasicCancel',
+        (60, 21): u'BasicConsumeOk',
+        (60, 31): u'BasicCancelOk',
+        (60, 60): u'BasicDeliver',
+        (60, 70): u'BasicGet',
+        (60, 71): u'BasicGetOk',
+        (60, 72): u'BasicGetEmpty',
+        (60, 120): u'BasicNack',
+        (60, 40): u'BasicPublish',
+        (60, 10): u'BasicQos',
+        (60, 11): u'BasicQosOk',
+        (60, 50): u'BasicReturn',
+        (60, 90): u'BasicReject',
+        (60, 100): u'BasicRecoverAsync',
+        (60, 110): u'BasicRecover',
+        (60, 111): u'BasicRecoverOk',
+        (90, 20): u'TxCommit',
+        (90, 21): u'TxCommitOk',
+        (90, 30): u'TxRollback',
+        (90, 31): u'TxRollbackOk',
+        (90, 10): u'TxSelect',
+        (90, 11): u'TxSelectOk',
+        (85, 10): u'ConfirmSelect',
+        (85, 11): u'ConfirmSelectOk',
+    })
+
+BINARY_HEADER_TO_METHOD = LazyDispatchTable(
+    _load, {
+        b'\x00\x0A\x00\x3C': u'ConnectionBlocked',
+        b'\x00\x0A\x00\x32': u'ConnectionClose',
+        b'\x00\x0A\x00\x33': u'ConnectionCloseOk',
+        b'\x00\x0A\x00\x28': u'ConnectionOpen',
+        b'\x00\x0A\x00\x29': u'ConnectionOpenOk',
+        b'\x00\x0A\x00\x0A': u'ConnectionStart',
+        b'\x00\x0A\x00\x14': u'ConnectionSecure',
+        b'\x00\x0A\x00\x0B': u'ConnectionStartOk',
+        b'\x00\x0A\x00\x15': u'ConnectionSecureOk',
+        b'\x00\x0A\x00\x1E': u'ConnectionTune',
+        b'\x00\x0A\x00\x1F': u'ConnectionTuneOk',
+        b'\x00\x0A\x00\x3D': u'ConnectionUnblocked',
+        b'\x00\x14\x00\x28': u'ChannelClose',
+        b'\x00\x14\x00\x29': u'ChannelCloseOk',
+        b'\x00\x14\x00\x14': u'ChannelFlow',
+        b'\x00\x14\x00\x15': u'ChannelFlowOk',
+        b'\x00\x14\x00\x0A': u'ChannelOpen',
+        b'\x00\x14\x00\x0B': u'ChannelOpenOk',
+        b'\x00\x28\x00\x1E': u'ExchangeBind',
+        b'\x00\x28\x00\x1F': u'ExchangeBindOk',
+        b'\x00\x28\x00\x0A': u'ExchangeDeclare',
+        b'\x00\x28\x00\x14': u'ExchangeDelete',
+        b'\x00\x28\x00\x0B': u'ExchangeDeclareOk',
+        b'\x00\x28\x00\x15': u'ExchangeDeleteOk',
+        b'\x00\x28\x00\x28': u'ExchangeUnbind',
+        b'\x00\x28\x00\x33': u'ExchangeUnbindOk',
+        b'\x00\x32\x00\x14': u'QueueBind',
+        b'\x00\x32\x00\x15': u'QueueBindOk',
+        b'\x00\x32\x00\x0A': u'QueueDeclare',
+        b'\x00\x32\x00\x28': u'QueueDelete',
+        b'\x00\x32\x00\x0B': u'QueueDeclareOk',
+        b'\x00\x32\x00\x29': u'QueueDeleteOk',
+        b'\x00\x32\x00\x1E': u'QueuePurge',
+        b'\x00\x32\x00\x1F': u'QueuePurgeOk',
+        b'\x00\x32\x00\x32': u'QueueUnbind',
+        b'\x00\x32\x00\x33': u'QueueUnbindOk',
+        b'\x00\x3C\x00\x50': u'BasicAck',
+        b'\x00\x3C\x00\x14': u'BasicConsume',
+        b'\x00\x3C\x00\x1E': u'BasicCancel',
+        b'\x00\x3C\x00\x15': u'BasicConsumeOk',
+        b'\x00\x3C\x00\x1F': u'BasicCancelOk',
+        b'\x00\x3C\x00\x3C': u'BasicDeliver',
+        b'\x00\x3C\x00\x46': u'BasicGet',
+        b'\x00\x3C\x00\x47': u'BasicGetOk',
+        b'\x00\x3C\x00\x48': u'BasicGetEmpty',
+        b'\x00\x3C\x00\x78': u'BasicNack',
+        b'\x00\x3C\x00\x28': u'BasicPublish',
+        b'\x00\x3C\x00\x0A': u'BasicQos',
+        b'\x00\x3C\x00\x0B': u'BasicQosOk',
+        b'\x00\x3C\x00\x32': u'BasicReturn',
+        b'\x00\x3C\x00\x5A': u'BasicReject',
+        b'\x00\x3C\x00\x64': u'BasicRecoverAsync',
+        b'\x00\x3C\x00\x6E': u'BasicRecover',
+        b'\x00\x3C\x00\x6F': u'BasicRecoverOk',
+        b'\x00\x5A\x00\x14': u'TxCommit',
+        b'\x00\x5A\x00\x15': u'TxCommitOk',
+        b'\x00\x5A\x00\x1E': u'TxRollback',
+        b'\x00\x5A\x00\x1F': u'TxRollbackOk',
+        b'\x00\x5A\x00\x0A': u'TxSelect',
+        b'\x00\x5A\x00\x0B': u'TxSelectOk',
+        b'\x00\x55\x00\x0A': u'ConfirmSelect',
+        b'\x00\x55\x00\x0B': u'ConfirmSelectOk',
+    })
+
+IDENT_TO_LAZY_METHOD = LazyDispatchTable(
+    _load, {
+        (10, 10): u'ConnectionStartLazy',
+        (60, 50): u'BasicReturnLazy',
+        (60, 60): u'BasicDeliverLazy',
+        (60, 80): u'BasicAckLazy',
+        (60, 120): u'BasicNackLazy',
+    })
 
 CLASS_ID_TO_CONTENT_PROPERTY_LIST = {
     60: BasicContentPropertyList,
 }
 
-# Methods that are sent as replies to other methods, ie. ConnectionOpenOk: ConnectionOpen
-# if a method is NOT a reply, it will not be in this dict
-# a method may be a reply for AT MOST one method
-REPLY_REASONS_FOR = {
-    ConnectionCloseOk: ConnectionClose,
-    ConnectionOpenOk: ConnectionOpen,
-    ConnectionStartOk: ConnectionStart,
-    ConnectionSecureOk: ConnectionSecure,
-    ConnectionTuneOk: ConnectionTune,
-    ChannelCloseOk: ChannelClose,
-    ChannelFlowOk: ChannelFlow,
-    ChannelOpenOk: ChannelOpen,
-    ExchangeBindOk: ExchangeBind,
-    ExchangeDeclareOk: ExchangeDeclare,
-    ExchangeDeleteOk: ExchangeDelete,
-    ExchangeUnbindOk: ExchangeUnbind,
-    QueueBindOk: QueueBind,
-    QueueDeclareOk: QueueDeclare,
-    QueueDeleteOk: QueueDelete,
-    QueuePurgeOk: QueuePurge,
-    QueueUnbindOk: QueueUnbind,
-    BasicConsumeOk: BasicConsume,
-    BasicCancelOk: BasicCancel,
-    BasicGetOk: BasicGet,
-    BasicGetEmpty: BasicGet,
-    BasicQosOk: BasicQos,
-    TxCommitOk: TxCommit,
-    TxRollbackOk: TxRollback,
-    TxSelectOk: TxSelect,
-    ConfirmSelectOk: ConfirmSelect,
-}
-
-# Methods that are replies for other, ie. ConnectionOpenOk: ConnectionOpen
-# a method may be a reply for ONE or NONE other methods
-# if a method has no replies, it will have an empty list as value here
-REPLIES_FOR = {
-    ConnectionBlocked: [],
-    ConnectionClose: [ConnectionCloseOk],
-    ConnectionCloseOk: [],
-    ConnectionOpen: [ConnectionOpenOk],
-    ConnectionOpenOk: [],
-    ConnectionStart: [ConnectionStartOk],
-    ConnectionSecure: [ConnectionSecureOk],
-    ConnectionStartOk: [],
-    ConnectionSecureOk: [],
-    ConnectionTune: [ConnectionTuneOk],
-    ConnectionTuneOk: [],
-    ConnectionUnblocked: [],
-    ChannelClose: [ChannelCloseOk],
-    ChannelCloseOk: [],
-    ChannelFlow: [ChannelFlowOk],
-    ChannelFlowOk: [],
-    ChannelOpen: [ChannelOpenOk],
-    ChannelOpenOk: [],
-    ExchangeBind: [ExchangeBindOk],
-    ExchangeBindOk: [],
-    ExchangeDeclare: [ExchangeDeclareOk],
-    ExchangeDelete: [ExchangeDeleteOk],
-    ExchangeDeclareOk: [],
-    ExchangeDeleteOk: [],
-    ExchangeUnbind: [ExchangeUnbindOk],
-    ExchangeUnbindOk: [],
-    QueueBind: [QueueBindOk],
-    QueueBindOk: [],
-    QueueDeclare: [QueueDeclareOk],
-    QueueDelete: [QueueDeleteOk],
-    QueueDeclareOk: [],
-    QueueDeleteOk: [],
-    QueuePurge: [QueuePurgeOk],
-    QueuePurgeOk: [],
-    QueueUnbind: [QueueUnbindOk],
-    QueueUnbindOk: [],
-    BasicAck: [],
-    BasicConsume: [BasicConsumeOk],
-    BasicCancel: [BasicCancelOk],
-    BasicConsumeOk: [],
-    BasicCancelOk: [],
-    BasicDeliver: [],
-    BasicGet: [BasicGetOk, BasicGetEmpty],
-    BasicGetOk: [],
-    BasicGetEmpty: [],
-    BasicNack: [],
-    BasicPublish: [],
-    BasicQos: [BasicQosOk],
-    BasicQosOk: [],
-    BasicReturn: [],
-    BasicReject: [],
-    BasicRecoverAsync: [],
-    BasicRecover: [],
-    BasicRecoverOk: [],
-    TxCommit: [TxCommitOk],
-    TxCommitOk: [],
-    TxRollback: [TxRollbackOk],
-    TxRollbackOk: [],
-    TxSelect: [TxSelectOk],
-    TxSelectOk: [],
-    ConfirmSelect: [ConfirmSelectOk],
-    ConfirmSelectOk: [],
-}
 STRUCT_B = struct.Struct("!B")
 STRUCT_HB = struct.Struct("!HB")
 STRUCT_HH = struct.Struct("!HH")
+STRUCT_2x = struct.Struct("!2x")
 STRUCT_BB = struct.Struct("!BB")
 STRUCT_I = struct.Struct("!I")
 STRUCT_L = struct.Struct("!L")
 STRUCT_HIH = struct.Struct("!HIH")
 STRUCT_2xB = struct.Struct("!2xB")
 STRUCT_II = struct.Struct("!II")
+STRUCT_Q = struct.Struct("!Q")
 STRUCT_QB = struct.Struct("!QB")
 STRUCT_QBB = struct.Struct("!QBB")
 STRUCT_IHB = struct.Struct("!IHB")
+
+# from ... import * has to make the lazy classes too
+__all__ = sorted(_name for _name in set(globals()) | set(_FACTORIES)
+                 if not _name.startswith('_'))
+
+if sys.version_info < (3, 7):
+    # module's __getattr__ is not supported, make everything right now
+    for _name in _FACTORIES:
+        _load(_name)
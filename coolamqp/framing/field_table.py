@@ -12,57 +12,61 @@ A table is of form ( (name1::bytes, fv1), (name2::bytes, fv2), ...)
 
 
 NOTE: it's not buffers, it's memoryview all along
+
+Every field type has a precompiled encoder, decoder and size in the dispatch
+tables below, so that a field costs a single lookup. Tables are encoded in
+a single pass, their length is known once they are done.
 """
 
+import functools
 import struct
-import io
-import six
-
 
-def _tobuf(buf, pattern, *vals):  # type: (io.BytesIO, str, *tp.Any) -> int
-    return buf.write(struct.pack(pattern, *vals))
+import six
 
+STRUCT_B = struct.Struct('!B')
+STRUCT_L = struct.Struct('!L')
+STRUCT_BI = struct.Struct('!BI')
+STRUCT_cB = struct.Struct('!cB')
+STRUCT_cL = struct.Struct('!cL')
+STRUCT_cBI = struct.Struct('!cBI')
 
-def _tobufv(buf, value, pattern, *vals):  # type: (io.BytesIO, bytes, str, *tp.Any) -> None
-    _tobuf(buf, pattern, *vals)
-    buf.write(value)
 
+def _decimal_to_scaled(v):  # type: (float) -> tp.Tuple[int, int]
+    for scale in six.moves.xrange(20):
+        k = v * (10 ** scale)
+        if abs(k - round(k)) < 0.00001:  # epsilon
+            return scale, int(round(k))
 
-def _frombuf(pattern, buf, offset):
-    return struct.unpack_from(pattern, buf, offset)
+    raise ValueError('Could not convert %s to decimal' % (v,))
 
 
 def enframe_decimal(buf, v):  # convert decimal to bytes
-    dps = 0
-    for k in six.moves.xrange(20):
-        k = v * (10 ** dps)
-        if abs(k - int(k)) < 0.00001:  # epsilon
-            return _tobuf(buf, '!BI', dps, k)
-
-    raise ValueError('Could not convert %s to decimal', v)
+    buf.write(STRUCT_BI.pack(*_decimal_to_scaled(v)))
 
 
 def deframe_decimal(buf, offset):
-    scale, val = _frombuf('!BI', buf, offset)
+    scale, val = STRUCT_BI.unpack_from(buf, offset)
     return val / (10 ** scale), 5
 
 
 def deframe_shortstr(buf, offset):  # -> value, bytes_eaten
-    ln, = _frombuf('!B', buf, offset)
+    ln, = STRUCT_B.unpack_from(buf, offset)
     return buf[offset + 1:offset + 1 + ln], 1 + ln
 
 
 def enframe_shortstr(buf, value):
-    _tobufv(buf, value, '!B', len(value))
+    buf.write(STRUCT_B.pack(len(value)))
+    buf.write(value)
 
 
 def deframe_longstr(buf, offset):  # -> value, bytes_eaten
-    ln, = _frombuf('!I', buf, offset)
+    ln, = STRUCT_L.unpack_from(buf, offset)
     return buf[offset + 4:offset + 4 + ln], 4 + ln
 
 
 def enframe_longstr(buf, value):
-    _tobufv(buf, value, '!I', len(value))
+    buf.write(STRUCT_L.pack(len(value)))
+    buf.write(value)
 
 
 def _c2none(buf, v):
@@ -104,63 +108,167 @@ if six.PY3:
 else:
     chrpy3 = lambda x: x
 
+# field type => callable(value) -> bytes, type octet included
+FIELD_ENCODERS = {}
+# field type octet, as indexing a buffer returns it =>
+#       callable(buffer, offset past the type octet) -> (field-value, offset)
+FIELD_DECODERS = {}
+# field type => length in bytes, type octet included, for fixed-size types
+FIELD_FIXED_SIZES = {}
+# field type => callable(value) -> length in bytes, type octet included
+FIELD_SIZERS = {}
 
-def enframe_field_value(buf, fv):
-    value, type = fv
-    buf.write(type.encode('utf8'))
 
-    opt = FIELD_TYPES[type]
+def _type_octet(field_type):  # type: (str) -> tp.Union[int, str]
+    return ord(field_type) if six.PY3 else field_type
 
-    if opt[1] is not None:
-        _tobuf(buf, opt[1], value)
-    else:
-        opt[2](buf, value)
 
+def _register_fixed(field_type, length, fmt):
+    unpack_from = struct.Struct(fmt).unpack_from
 
-def deframe_field_value(buf, offset):  # -> (value, type), bytes_consumed
-    start_offset = offset
-    field_type = chrpy3(buf[offset])
+    def decode(buf, offset):
+        return (unpack_from(buf, offset)[0], field_type), offset + length
+
+    FIELD_ENCODERS[field_type] = functools.partial(
+        struct.Struct('!c' + fmt[1:]).pack, field_type.encode('ascii'))
+    FIELD_DECODERS[_type_octet(field_type)] = decode
+    FIELD_FIXED_SIZES[field_type] = 1 + length
+
+
+for _field_type, _opt in FIELD_TYPES.items():
+    if _opt[1] is not None:
+        _register_fixed(_field_type, _opt[0], _opt[1])
+
+
+def _decode_decimal(buf, offset):
+    scale, val = STRUCT_BI.unpack_from(buf, offset)
+    return (val / (10 ** scale), 'D'), offset + 5
+
+
+def _decode_shortstr(buf, offset):
+    ln, = STRUCT_B.unpack_from(buf, offset)
     offset += 1
+    return (buf[offset:offset + ln], 's'), offset + ln
 
-    if field_type not in FIELD_TYPES.keys():
-        raise ValueError('Unknown field type %s!', (repr(field_type),))
 
-    opt = FIELD_TYPES[field_type]
+def _decode_longstr(buf, offset):
+    ln, = STRUCT_L.unpack_from(buf, offset)
+    offset += 4
+    return (buf[offset:offset + ln], 'S'), offset + ln
+
 
-    if opt[1] is not None:
-        field_val, = struct.unpack_from(FIELD_TYPES[field_type][1], buf,
-                                        offset)
-        offset += opt[0]
-    else:
-        field_val, delta = opt[3](buf, offset)
-        offset += delta
+def _decode_void(buf, offset):
+    return (None, 'V'), offset
 
-    return (field_val, field_type), offset - start_offset
+
+def _decode_array(buf, offset):
+    array, delta = deframe_array(buf, offset)
+    return (array, 'A'), offset + delta
+
+
+def _decode_table(buf, offset):
+    table, delta = deframe_table(buf, offset)
+    return (table, 'F'), offset + delta
+
+
+def _encode_array_items(array):  # type: (list) -> bytes
+    encoders = FIELD_ENCODERS
+    return b''.join([encoders[field_type](value)
+                     for value, field_type in array])
+
+
+def _encode_table_items(table):  # type: (list) -> bytes
+    encoders = FIELD_ENCODERS
+    pack = STRUCT_B.pack
+    data = []
+    for name, (value, field_type) in table:
+        data.append(pack(len(name)))
+        data.append(name)
+        data.append(encoders[field_type](value))
+    return b''.join(data)
+
+
+def _encode_array(array):
+    data = _encode_array_items(array)
+    return STRUCT_cL.pack(b'A', len(data)) + data
+
+
+def _encode_table(table):
+    data = _encode_table_items(table)
+    return STRUCT_cL.pack(b'F', len(data)) + data
+
+
+FIELD_ENCODERS.update({
+    'D': lambda value: STRUCT_cBI.pack(b'D', *_decimal_to_scaled(value)),
+    's': lambda value: STRUCT_cB.pack(b's', len(value)) + value,
+    'S': lambda value: STRUCT_cL.pack(b'S', len(value)) + value,
+    'V': lambda value: b'V',
+    'A': _encode_array,
+    'F': _encode_table,
+})
+FIELD_DECODERS.update({
+    _type_octet('D'): _decode_decimal,
+    _type_octet('s'): _decode_shortstr,
+    _type_octet('S'): _decode_longstr,
+    _type_octet('V'): _decode_void,
+    _type_octet('A'): _decode_array,
+    _type_octet('F'): _decode_table,
+})
+FIELD_FIXED_SIZES.update({'D': 6, 'V': 1})
+FIELD_SIZERS.update({
+    's': lambda value: 2 + len(value),
+    'S': lambda value: 5 + len(value),
+    'A': lambda value: 1 + frame_array_size(value),
+    'F': lambda value: 1 + frame_table_size(value),
+})
+
+
+def _unknown_field_type(buf, offset):  # type: (buffer, int) -> ValueError
+    return ValueError('Unknown field type %s!' % (repr(chrpy3(buf[offset])),))
+
+
+def enframe_field_value(buf, fv):
+    value, field_type = fv
+    buf.write(FIELD_ENCODERS[field_type](value))
+
+
+def deframe_field_value(buf, offset):  # -> (value, type), bytes_consumed
+    try:
+        decode = FIELD_DECODERS[buf[offset]]
+    except KeyError:
+        raise _unknown_field_type(buf, offset)
+
+    field_value, end = decode(buf, offset + 1)
+    return field_value, end - offset
 
 
 def deframe_array(buf, offset):
-    start_offset = offset
-    ln, = _frombuf('!I', buf, offset)
+    ln, = STRUCT_L.unpack_from(buf, offset)
     offset += 4
+    end = offset + ln
+    decoders = FIELD_DECODERS
 
     values = []
-    while offset < (start_offset + 1 + ln):
-        v, t, delta = deframe_field_value(buf, offset)
-        offset += delta
-        values.append((v, t))
-
-    if offset != start_offset + 4 + ln:
+    while offset < end:
+        try:
+            decode = decoders[buf[offset]]
+        except KeyError:
+            raise _unknown_field_type(buf, offset)
+        field_value, offset = decode(buf, offset + 1)
+        values.append(field_value)
+
+    if offset != end:
         raise ValueError(
-            'Array longer than expected, took %s, expected %s bytes',
-            (offset - (start_offset + ln + 4), ln + 4))
+            'Array longer than expected, took %s, expected %s bytes' %
+            (offset - end + ln + 4, ln + 4))
 
     return values, ln + 4
 
 
 def enframe_array(buf, array):
-    _tobuf(buf, '!I', frame_array_size(array) - 4)
-    for fv in array:
-        enframe_field_value(buf, fv)
+    data = _encode_array_items(array)
+    buf.write(STRUCT_L.pack(len(data)))
+    buf.write(data)
 
 
 def enframe_table(buf, table):  # type (tp.BinaryIO, table) -> None
@@ -170,54 +278,314 @@ def enframe_table(buf, table):  # type (tp.BinaryIO, table) -> None
     :param buf: target buffer to write to
     :param table: table to write
     """
-    _tobuf(buf, '!I', frame_table_size(table) - 4)
+    if isinstance(table, LazyTable):
+        buf.write(table.serialize())
+        return
 
-    for name, fv in table:
-        _tobufv(buf, name, '!B', len(name))
-        enframe_field_value(buf, fv)
+    if not table:
+        buf.write(b'\x00\x00\x00\x00')
+        return
+
+    data = _encode_table_items(table)
+    buf.write(STRUCT_L.pack(len(data)) + data)
+
+
+def enframe_table_into(buf, offset, table):
+    # type: (bytearray, int, table) -> int
+    """
+    Write AMQP table into a bytearray
 
+    :param buf: target bytearray, long enough to hold the table
+    :param offset: where to start writing
+    :param table: table to write
+    :return: offset just past the table
+    """
+    if isinstance(table, LazyTable):
+        data = table.serialize()
+        buf[offset:offset + len(data)] = data
+        return offset + len(data)
 
-def deframe_table(buf, start_offset):  # -> (table, bytes_consumed)
-    """:return: tuple (table, bytes consumed)"""
-    offset = start_offset
-    table_length, = struct.unpack_from('!L', buf, start_offset)
+    data = _encode_table_items(table) if table else b''
+    STRUCT_L.pack_into(buf, offset, len(data))
     offset += 4
+    buf[offset:offset + len(data)] = data
+    return offset + len(data)
 
-    # we will check if it's really so.
-    fields = []
 
-    while offset < (start_offset + table_length + 4):
-        field_name, ln = deframe_shortstr(buf, offset)
-        offset += ln
-        fv, delta = deframe_field_value(buf, offset)
-        offset += delta
-        fields.append((field_name.tobytes(), fv))
+def deframe_table(buf, start_offset, as_dict=False):
+    # type: (buffer, int, bool) -> tp.Tuple[tp.Union[list, dict], int]
+    """
+    Read AMQP table from buffer
+
+    :param buf: buffer to read from
+    :param start_offset: offset the table starts at
+    :param as_dict: return a dict of name => field-value instead of a list.
+        If a name repeats, the last value wins. Nested tables are still
+        returned as lists.
+    :return: tuple (table, bytes consumed)
+    """
+    table_length, = STRUCT_L.unpack_from(buf, start_offset)
+    offset = start_offset + 4
+    end = offset + table_length
+    decoders = FIELD_DECODERS
 
-    if offset > (start_offset + table_length + 4):
+    fields = []
+    while offset < end:
+        ln = buf[offset] if six.PY3 else ord(buf[offset])
+        offset += 1
+        field_name = buf[offset:offset + ln].tobytes()
+        offset += ln
+        try:
+            decode = decoders[buf[offset]]
+        except KeyError:
+            raise _unknown_field_type(buf, offset)
+        fv, offset = decode(buf, offset + 1)
+        fields.append((field_name, fv))
+
+    if offset > end:
         raise ValueError(
-            'Table turned out longer than expected! Found %s bytes expected %s',
-            (offset - start_offset, table_length))
+            'Table turned out longer than expected! Found %s bytes expected %s' %
+            (offset - start_offset, table_length + 4))
 
+    if as_dict:
+        return dict(fields), table_length + 4
     return fields, table_length + 4
 
 
+def deframe_lazy_table(buf, start_offset):
+    # type: (buffer, int) -> tp.Tuple[LazyTable, int]
+    """
+    Read AMQP table from buffer, without decoding it yet
+
+    :return: tuple (LazyTable, bytes consumed)
+    """
+    table_length, = STRUCT_L.unpack_from(buf, start_offset)
+    return LazyTable(buf[start_offset:start_offset + table_length + 4]), \
+        table_length + 4
+
+
+def _value_length(buf, offset):  # type: (buffer, int) -> int
+    """Length of the field value at offset, type octet included"""
+    field_type = buf[offset]
+    length = FIELD_FIXED_VALUE_SIZES.get(field_type)
+    if length is not None:
+        return length
+    if field_type == _SHORTSTR_OCTET:
+        return 2 + STRUCT_B.unpack_from(buf, offset + 1)[0]
+    if field_type in _LONG_PREFIXED_OCTETS:
+        return 5 + STRUCT_L.unpack_from(buf, offset + 1)[0]
+    raise _unknown_field_type(buf, offset)
+
+
+# field type octet => length of the value in bytes, type octet included
+FIELD_FIXED_VALUE_SIZES = dict((_type_octet(field_type), length)
+                               for field_type, length in
+                               FIELD_FIXED_SIZES.items())
+_SHORTSTR_OCTET = _type_octet('s')
+_LONG_PREFIXED_OCTETS = frozenset(_type_octet(field_type)
+                                  for field_type in 'SAF')
+
+
+class LazyTable(object):
+    """
+    A received table, decoded upon first access.
+
+    It can be used both as a list of (name, field-value) and, with names as
+    keys, as a mapping of name => field-value, eg. table[b'x-death']. If a
+    name repeats, the last value wins there.
+
+    Looking up a name scans the table for names once, and then decodes
+    only the value looked up. Since it keeps the buffer it was received in,
+    it's written back as-is, without encoding it again.
+
+    It supports list's methods, including the ones that change it. Changing
+    it decodes it whole and forgets the buffer, so it's encoded again when
+    sent. It's not a list though, so pass table.copy() to code that checks
+    for one, such as json.dumps.
+
+    :param data: the whole table, with its length
+    """
+    __slots__ = ('_data', '_fields', '_offsets')
+
+    def __init__(self, data):  # type: (memoryview) -> None
+        self._data = data  # type: tp.Optional[memoryview]
+        self._fields = None  # type: tp.Optional[list]
+        # name => offset of its value
+        self._offsets = None  # type: tp.Optional[tp.Dict[bytes, int]]
+
+    @property
+    def fields(self):  # type: () -> list
+        """The table as a list of (name, field-value)"""
+        if self._fields is None:
+            self._fields, consumed = deframe_table(self._data, 0)
+        return self._fields
+
+    def _changed_fields(self):  # type: () -> list
+        """The list of fields, about to be changed"""
+        fields = self.fields
+        self._data = None
+        self._offsets = None
+        return fields
+
+    def _get_offsets(self):  # type: () -> tp.Dict[bytes, int]
+        if self._offsets is None:
+            data = self._data
+            offsets = {}
+            offset = 4
+            while offset < len(data):
+                ln = data[offset] if six.PY3 else ord(data[offset])
+                offset += 1
+                name = data[offset:offset + ln].tobytes()
+                offset += ln
+                offsets[name] = offset
+                offset += _value_length(data, offset)
+            self._offsets = offsets
+        return self._offsets
+
+    def _names(self):  # type: () -> tp.Iterable[bytes]
+        if self._data is None:
+            return dict(self._fields).keys()
+        return self._get_offsets().keys()
+
+    def serialize(self):  # type: () -> memoryview
+        if self._data is None:
+            data = _encode_table_items(self._fields) if self._fields else b''
+            return memoryview(STRUCT_L.pack(len(data)) + data)
+        return self._data
+
+    def get_size(self):  # type: () -> int
+        if self._data is None:
+            return frame_table_size(self._fields)
+        return len(self._data)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._names()
+
+    def values(self):
+        return [self[name] for name in self._names()]
+
+    def items(self):
+        return [(name, self[name]) for name in self._names()]
+
+    def copy(self):  # type: () -> list
+        """:return: the table as a new list of (name, field-value)"""
+        return list(self.fields)
+
+    def index(self, *args):
+        return self.fields.index(*args)
+
+    def count(self, item):  # type: (tuple) -> int
+        return self.fields.count(item)
+
+    def append(self, item):  # type: (tuple) -> None
+        self._changed_fields().append(item)
+
+    def extend(self, items):
+        self._changed_fields().extend(items)
+
+    def insert(self, index, item):  # type: (int, tuple) -> None
+        self._changed_fields().insert(index, item)
+
+    def pop(self, *args):
+        return self._changed_fields().pop(*args)
+
+    def remove(self, item):  # type: (tuple) -> None
+        self._changed_fields().remove(item)
+
+    def reverse(self):  # type: () -> None
+        self._changed_fields().reverse()
+
+    def sort(self, *args, **kwargs):  # type: (...) -> None
+        self._changed_fields().sort(*args, **kwargs)
+
+    def __getitem__(self, key):
+        if isinstance(key, six.integer_types + (slice,)):
+            return self.fields[key]
+        if self._data is None:
+            return dict(self._fields)[key]
+        offset = self._get_offsets()[key]
+        try:
+            decode = FIELD_DECODERS[self._data[offset]]
+        except KeyError:
+            raise _unknown_field_type(self._data, offset)
+        return decode(self._data, offset + 1)[0]
+
+    def __setitem__(self, key, value):
+        self._changed_fields()[key] = value
+
+    def __delitem__(self, key):
+        del self._changed_fields()[key]
+
+    def __add__(self, other):  # type: (tp.Iterable[tuple]) -> list
+        return self.fields + list(other)
+
+    def __radd__(self, other):  # type: (tp.Iterable[tuple]) -> list
+        return list(other) + self.fields
+
+    def __iadd__(self, other):  # type: (tp.Iterable[tuple]) -> LazyTable
+        self.extend(other)
+        return self
+
+    def __contains__(self, item):
+        if isinstance(item, tuple):
+            return item in self.fields
+        return item in self._names()
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):  # type: () -> int
+        return len(self.fields)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyTable):
+            if self._data is not None and other._data is not None:
+                return self._data == other._data
+            return self.fields == other.fields
+        return self.fields == other
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    __hash__ = None
+
+    def __repr__(self):  # type: () -> str
+        return 'LazyTable(%r)' % (self.fields,)
+
+
 def frame_field_value_size(fv):
-    v, t = fv
-    if FIELD_TYPES[t][0] is None:
-        return FIELD_TYPES[t][4](v) + 1
-    else:
-        return FIELD_TYPES[t][0] + 1
+    value, field_type = fv
+    length = FIELD_FIXED_SIZES.get(field_type)
+    if length is None:
+        length = FIELD_SIZERS[field_type](value)
+    return length
 
 
 def frame_array_size(array):
-    return 4 + sum(frame_field_value_size(fv) for fv in array)
+    return 4 + sum([frame_field_value_size(fv) for fv in array])
 
 
 def frame_table_size(table):
     """
     :return: length of table representation, in bytes, INCLUDING length
      header"""
-    return 4 + sum(1 + len(k) + frame_field_value_size(fv) for k, fv in table)
+    if isinstance(table, LazyTable):
+        return table.get_size()
+
+    fixed_sizes = FIELD_FIXED_SIZES
+    size = 4
+    for name, (value, field_type) in table:
+        length = fixed_sizes.get(field_type)
+        if length is None:
+            length = FIELD_SIZERS[field_type](value)
+        size += 1 + len(name) + length
+    return size
 
 
 FIELD_TYPES['A'] = (None, None, enframe_array, deframe_array, frame_array_size)
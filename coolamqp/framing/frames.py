@@ -5,13 +5,15 @@ Concrete frame definitions
 from __future__ import absolute_import, division, print_function
 
 import struct
+import typing as tp
 
 import six
 
-from coolamqp.framing.base import AMQPFrame
+from coolamqp.framing.base import AMQPFrame, LazyDispatchTable
 from coolamqp.framing.definitions import FRAME_METHOD, FRAME_HEARTBEAT, \
     FRAME_BODY, FRAME_HEADER, FRAME_END, \
-    IDENT_TO_METHOD, CLASS_ID_TO_CONTENT_PROPERTY_LIST, FRAME_END_BYTE
+    IDENT_TO_METHOD, IDENT_TO_LAZY_METHOD, CLASS_ID_TO_CONTENT_PROPERTY_LIST, \
+    FRAME_END_BYTE
 
 STRUCT_BH = struct.Struct('!BH')
 STRUCT_BHL = struct.Struct('!BHL')
@@ -20,6 +22,36 @@ STRUCT_BHLHHQ = struct.Struct('!BHLHHQ')
 STRUCT_HHQ = struct.Struct('!HHQ')
 STRUCT_BHLB = struct.Struct('!BHLB')
 
+# (class ID, method ID) => class to decode a received method with. Classes
+# are made on first lookup, same as in IDENT_TO_METHOD.
+METHOD_DECODERS = LazyDispatchTable(IDENT_TO_METHOD.load,
+                                    dict(IDENT_TO_METHOD.names))
+
+
+def set_lazy_decoding(method, lazy=True):
+    # type: (tp.Type[coolamqp.framing.base.AMQPMethodPayload], bool) -> None
+    """
+    Choose whether a method received from the broker is decoded lazily.
+
+    A lazily decoded payload is cheaper to make, but reading its arguments
+    costs more than decoding them eagerly, save for tables, which it decodes
+    only when looked into. So this pays off for methods whose arguments are
+    mostly not read, and for these that carry tables. See
+    benchmarks/methods.py. All methods are decoded eagerly by default.
+
+    :param method: class of the method, eg. BasicNack
+    :param lazy: whether to decode its arguments upon first access
+    :raise ValueError: there's no lazy version of this method, see
+        IDENT_TO_LAZY_METHOD
+    """
+    if lazy:
+        try:
+            METHOD_DECODERS[method.INDEX] = IDENT_TO_LAZY_METHOD[method.INDEX]
+        except KeyError:
+            raise ValueError('%s cannot be decoded lazily' % (method.NAME,))
+    else:
+        METHOD_DECODERS[method.INDEX] = IDENT_TO_METHOD[method.INDEX]
+
 
 class AMQPMethodFrame(AMQPFrame):
     FRAME_TYPE = FRAME_METHOD
@@ -53,7 +85,7 @@ class AMQPMethodFrame(AMQPFrame):
         clsmet = STRUCT_HH.unpack_from(payload_as_buffer, 0)
 
         try:
-            method_payload_class = IDENT_TO_METHOD[clsmet]
+            method_payload_class = METHOD_DECODERS[clsmet]
             payload = method_payload_class.from_buffer(payload_as_buffer, 4)
         except KeyError:
             raise ValueError('Invalid class %s method %s' % clsmet)
@@ -88,11 +120,12 @@ class AMQPHeaderFrame(AMQPFrame):
         self.properties = properties
 
     def write_to(self, buf):
+        properties = self.properties.serialize()
         buf.write(STRUCT_BHLHHQ.pack(FRAME_HEADER, self.channel,
-                                     12 + self.properties.get_size(), self.class_id,
+                                     12 + len(properties), self.class_id,
                                      0,
                                      self.body_size))
-        self.properties.write_to(buf)
+        buf.write(properties)
         buf.write(FRAME_END_BYTE)
 
     @staticmethod
@@ -0,0 +1,143 @@
+# coding=UTF-8
+"""
+Frames that are serialized in advance, for things that are sent over and over
+again with just a few values changing.
+
+A template is made for a particular channel. It produces PreparedFrames, that
+can be passed to Connection.send() like AMQPFrames. They aren't AMQPFrames
+though, so they should not be used when frames are logged.
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+import struct
+import typing as tp
+
+from coolamqp.framing.definitions import FRAME_HEADER, FRAME_BODY, \
+    FRAME_END_BYTE, BasicPublish, Basic
+from coolamqp.framing.frames import AMQPMethodFrame, STRUCT_BHL
+
+# frame type, channel, size, class ID, weight - ie. a content header up to
+# body size
+STRUCT_BHLHH = struct.Struct('!BHLHH')
+STRUCT_BH = struct.Struct('!BH')
+
+# a delivery tag is right after frame header, class ID and method ID
+DELIVERY_TAG_OFFSET = 11
+
+
+class PreparedFrames(object):
+    """
+    Some data that makes up whole frames, optionally followed by a body and
+    a frame end. The body is not copied.
+    """
+    __slots__ = ('data', 'body')
+
+    def __init__(self, data, body=None):
+        # type: (bytes, tp.Optional[tp.Union[bytes, memoryview]]) -> None
+        self.data = data
+        self.body = body
+
+    def write_to(self, buf):
+        buf.write(self.data)
+        if self.body is not None:
+            buf.write(self.body)
+            buf.write(FRAME_END_BYTE)
+
+    def get_size(self):  # type: () -> int
+        if self.body is None:
+            return len(self.data)
+        return len(self.data) + len(self.body) + 1
+
+
+class PublishTemplate(object):
+    """
+    Frames that publish a message with particular exchange, routing key and
+    properties on a particular channel.
+
+    basic.publish and the content header are serialized once. For each
+    message only the body size and the size of the first body frame are
+    filled in, with a single struct.pack().
+
+    :param channel: channel ID
+    :param exchange: exchange name
+    :param routing_key: routing key
+    :param properties: properties of the messages
+    :type properties: coolamqp.framing.definitions.BasicContentPropertyList
+    """
+    __slots__ = ('channel', 'head', 'tail', 'struct', 'empty')
+
+    def __init__(self, channel, exchange, routing_key, properties):
+        # type: (int, bytes, bytes, coolamqp.framing.base.AMQPContentPropertyList) -> None
+        self.channel = channel
+
+        serialized = properties.serialize()
+
+        buf = io.BytesIO()
+        AMQPMethodFrame(channel, BasicPublish(exchange, routing_key, False,
+                                              False)).write_to(buf)
+        buf.write(STRUCT_BHLHH.pack(FRAME_HEADER, channel,
+                                    12 + len(serialized), Basic.INDEX, 0))
+        self.head = buf.getvalue()  # up to body size
+
+        # up to the size of first body frame
+        self.tail = serialized + FRAME_END_BYTE + STRUCT_BH.pack(FRAME_BODY,
+                                                                 channel)
+
+        self.struct = struct.Struct('!%dsQ%dsL' % (len(self.head),
+                                                   len(self.tail)))
+        # a message with an empty body has no body frames
+        self.empty = self.head + struct.pack('!Q', 0) + self.tail[:-3]
+
+    def frames_for(self, body, max_body_size):
+        # type: (tp.Union[bytes, memoryview], int) -> tp.List[PreparedFrames]
+        """
+        Return the frames that publish a message with this body.
+
+        :param body: message body
+        :param max_body_size: maximum length of data in a body frame
+        """
+        size = len(body)
+        if size == 0:
+            return [PreparedFrames(self.empty)]
+        elif size <= max_body_size:
+            return [PreparedFrames(self.struct.pack(self.head, size, self.tail,
+                                                    size), body)]
+
+        body = memoryview(body)
+        frames = [PreparedFrames(self.struct.pack(self.head, size, self.tail,
+                                                  max_body_size),
+                                 body[:max_body_size])]
+        for offset in range(max_body_size, size, max_body_size):
+            chunk = body[offset:offset + max_body_size]
+            frames.append(PreparedFrames(
+                STRUCT_BHL.pack(FRAME_BODY, self.channel, len(chunk)), chunk))
+        return frames
+
+
+class DeliveryTagTemplate(object):
+    """
+    A method frame on a particular channel, whose arguments are a delivery
+    tag followed by bits - ie. basic.ack, basic.reject or basic.nack.
+
+    :param channel: channel ID
+    :param payload: an example of the method, its bits will be used. Its
+        delivery tag doesn't matter.
+    """
+    __slots__ = ('channel', 'head', 'tail', 'struct')
+
+    def __init__(self, channel, payload):
+        # type: (int, coolamqp.framing.base.AMQPMethodPayload) -> None
+        self.channel = channel
+
+        buf = io.BytesIO()
+        AMQPMethodFrame(channel, payload).write_to(buf)
+        data = buf.getvalue()
+        self.head = data[:DELIVERY_TAG_OFFSET]
+        self.tail = data[DELIVERY_TAG_OFFSET + 8:]
+        self.struct = struct.Struct('!%dsQ%ds' % (len(self.head),
+                                                  len(self.tail)))
+
+    def frame_for(self, delivery_tag):  # type: (int) -> PreparedFrames
+        return PreparedFrames(self.struct.pack(self.head, delivery_tag,
+                                               self.tail))
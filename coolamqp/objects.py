@@ -3,14 +3,17 @@
 Core objects used in CoolAMQP
 """
 import logging
+import threading
 import typing as tp
 import uuid
+from concurrent.futures import Future
 
 import six
 
 from coolamqp.framing.base import AMQPFrame
 from coolamqp.framing.definitions import \
     BasicContentPropertyList as MessageProperties
+from coolamqp.utils import monotonic
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +68,16 @@ class Message(object):
     :param properties: AMQP properties to be sent along.
                        default is 'no properties at all'
                        You can pass a dict - it will be passed to
-                       MessageProperties,
-                       but it's slow - don't do that.
-    :type properties: MessageProperties instance, None or a dict (SLOW!)
+                       MessageProperties. If you publish many messages with
+                       the same properties, reuse a single MessageProperties
+                       instance instead, since it's serialized only once.
+    :type properties: MessageProperties instance, None or a dict
+
+    MessageProperties are immutable, setting their attributes raises
+    AttributeError - make new ones instead. Values passed to them must not be
+    changed either: once the properties are serialized, which happens when they
+    are first published, changing eg. a list of headers that was passed as
+    headers has no effect on messages that are published with them.
 
     """
     __slots__ = ('body', 'properties')
@@ -96,10 +106,220 @@ class Message(object):
             self.properties = properties
 
 
+class ConfirmBatch(object):
+    """
+    A token to publish a batch of messages with, if you only need to know
+    whether all of them were confirmed.
+
+    Pass it as batch= when publishing each of the size messages. Its .future
+    completes once the broker has confirmed or rejected all of them: with
+    None if all were confirmed, or with an exception if any was rejected.
+    This way you pay for a single Future per batch, instead of one for each
+    message.
+
+    >>> batch = ConfirmBatch(len(messages))
+    >>> for message in messages:
+    >>>     cluster.publish(message, routing_key=b'my_queue', batch=batch)
+    >>> batch.future.result()
+
+    :param size: number of messages in the batch
+    """
+    __slots__ = ('size', 'published', 'settled', 'rejected', 'future', 'lock')
+
+    def __init__(self, size):  # type: (int) -> None
+        self.size = size
+        self.published = 0  # messages published with this batch so far
+        self.settled = 0  # messages confirmed or rejected so far
+        self.rejected = 0  # messages rejected so far
+        self.future = Future()
+        self.future.set_running_or_notify_cancel()
+        self.lock = threading.Lock()
+
+    def add(self):  # type: () -> None
+        """
+        Called by the publisher for each message published with this batch.
+
+        :raise ValueError: there are already size messages in this batch
+        """
+        with self.lock:
+            if self.published >= self.size:
+                raise ValueError(u'This batch is full')
+            self.published += 1
+
+    def discard(self, count):  # type: (int) -> None
+        """
+        Called by the publisher for messages that were added to this batch,
+        but were not published after all.
+
+        :param count: number of such messages
+        """
+        with self.lock:
+            self.published -= count
+
+    def seal(self):  # type: () -> None
+        """
+        Shrink this batch to the messages published with it so far. No more
+        can be published with it, and it completes once these are settled.
+        """
+        with self.lock:
+            shrunk = self.published < self.size
+            self.size = self.published
+            if not shrunk or self.settled < self.size:
+                return
+        # last of these was settled before, when the batch was still larger
+        self._complete()
+
+    def confirm(self):  # type: () -> None
+        self._settle(False)
+
+    def reject(self):  # type: () -> None
+        self._settle(True)
+
+    def _settle(self, rejected):  # type: (bool) -> None
+        with self.lock:
+            self.settled += 1
+            if rejected:
+                self.rejected += 1
+            if self.settled != self.size:
+                return
+        self._complete()
+
+    def _complete(self):  # type: () -> None
+        if self.rejected == 0:
+            self.future.set_result(None)
+        else:
+            self.future.set_exception(Exception(
+                u'%s of %s messages were rejected' % (self.rejected, self.size)))
+
+
+class ConfirmWindow(object):
+    """
+    Limits how many messages published with confirms may be unconfirmed at
+    once, in number and in total size of their bodies. Messages that wait to
+    be sent count too. Once the window is full, further messages are let in
+    only as the broker confirms (or rejects) earlier ones, so a broker that
+    confirms slowly can't make the publisher hold unlimited amounts of
+    messages.
+
+    A single message larger than max_bytes is still let in, when the window
+    is otherwise empty.
+
+    Pass it to Cluster as confirm_window.
+
+    :param max_messages: maximum number of unconfirmed messages, or None for
+        no limit
+    :param max_bytes: maximum total size of bodies of unconfirmed messages,
+        or None for no limit
+    :param policy: what publish() does when the window is full. One of:
+        BLOCK - wait for room, at most timeout seconds, and then raise
+                PublishWindowFull
+        FAIL - raise PublishWindowFull at once
+        QUEUE - return at once, the message will be sent when there's room.
+                Note that this does not limit the memory used.
+    :param timeout: how long can BLOCK wait, in seconds. None is forever
+    :raise ValueError: invalid policy
+
+    Confirm callbacks are called by the listener thread, which is also the
+    one to receive confirms that make room in the window. So do not publish
+    from a callback with policy BLOCK - once the window is full, it will
+    wait for room that can never be made, for up to timeout seconds, and no
+    other connection will be served meanwhile.
+    """
+    BLOCK = 0
+    FAIL = 1
+    QUEUE = 2
+
+    __slots__ = ('max_messages', 'max_bytes', 'policy', 'timeout',
+                 'messages', 'bytes', 'condition')
+
+    def __init__(self, max_messages=None,  # type: tp.Optional[int]
+                 max_bytes=None,  # type: tp.Optional[int]
+                 policy=BLOCK,  # type: int
+                 timeout=None  # type: tp.Optional[float]
+                 ):
+        if policy not in (ConfirmWindow.BLOCK, ConfirmWindow.FAIL,
+                          ConfirmWindow.QUEUE):
+            raise ValueError(u'Invalid policy')
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.timeout = timeout
+        self.messages = 0  # messages in the window
+        self.bytes = 0  # total size of their bodies
+        self.condition = threading.Condition()
+
+    def _has_room(self, size):  # type: (int) -> bool
+        """Call with condition acquired"""
+        if self.messages == 0:
+            return True
+        if self.max_messages is not None and \
+                self.messages >= self.max_messages:
+            return False
+        return self.max_bytes is None or self.bytes + size <= self.max_bytes
+
+    def acquire(self, size, timeout=0):
+        # type: (int, tp.Optional[float]) -> bool
+        """
+        Let a message into the window.
+
+        :param size: size of the message's body
+        :param timeout: how long to wait for room, in seconds. 0 doesn't
+            wait, None waits forever
+        :return: whether the message was let in
+        """
+        with self.condition:
+            if not self._has_room(size):
+                if timeout == 0:
+                    return False
+                if timeout is not None:
+                    deadline = monotonic() + timeout
+                while not self._has_room(size):
+                    if timeout is None:
+                        self.condition.wait()
+                    else:
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            return False
+                        self.condition.wait(remaining)
+            self.messages += 1
+            self.bytes += size
+            return True
+
+    def release(self, size):  # type: (int) -> None
+        """
+        A message has left the window - it was confirmed, rejected, or won't
+        be sent after all.
+
+        :param size: size of the message's body
+        """
+        with self.condition:
+            self.messages -= 1
+            self.bytes -= size
+            self.condition.notify_all()
+
+
 def LAMBDA_NONE():
     pass
 
 
+class _CallbackSettler(object):
+    """
+    Settles a ReceivedMessage made with ack and nack callables, the way
+    a MessageReceiver would.
+    """
+    __slots__ = ('ack', 'nack')
+
+    def __init__(self, ack, nack):
+        self.ack = ack or LAMBDA_NONE
+        self.nack = nack or LAMBDA_NONE
+
+    def settle(self, delivery_tag, success):  # type: (int, bool) -> None
+        if success:
+            self.ack()
+        else:
+            self.nack()
+
+
 class ReceivedMessage(Message):
     """
     A message that was received from the AMQP broker.
@@ -109,17 +329,22 @@ class ReceivedMessage(Message):
 
     Note that if the consumer that generated this message was no_ack, .ack()
     and .nack() are no-ops.
+
+    Instead of a pair of callables per message, this refers to the
+    MessageReceiver that received it, which does the acking.
     """
-    __slots__ = ('delivery_tag', 'exchange_name', 'routing_key', '_ack', '_nack',
+    __slots__ = ('delivery_tag', 'exchange_name', 'routing_key', 'receiver',
                  'acked')
 
     def __init__(self, body,  # type: tp.Union[str, bytes, bytearray, tp.List[memoryview]]
-                 exchange_name,  # type: memoryview
-                 routing_key,  # type: memoryview
+                 exchange_name,  # type: bytes
+                 routing_key,  # type: bytes
                  properties=None,
                  delivery_tag=None,  # type: int
                  ack=None,  # type: tp.Callable[[], None]
-                 nack=None  # type: tp.Callable[[], None]
+                 nack=None,  # type: tp.Callable[[], None]
+                 receiver=None
+                 # type: tp.Optional[coolamqp.attaches.consumer.MessageReceiver]
                  ):
         """
         :param body: message body. A stream of octets.
@@ -137,6 +362,9 @@ class ReceivedMessage(Message):
         :param nack: a callable to call when you want to nack
             (via basic.reject) this message. None if received by the no-ack
              mechanism
+        :param receiver: MessageReceiver that received this message, and will
+            settle it, ie. have its settle(delivery_tag, success) called.
+            Overrides ack and nack. None if received by the no-ack mechanism
         """
         Message.__init__(self, body, properties=properties)
 
@@ -144,8 +372,20 @@ class ReceivedMessage(Message):
         self.exchange_name = exchange_name
         self.routing_key = routing_key
         self.acked = False
-        self._ack = ack or LAMBDA_NONE
-        self._nack = nack or LAMBDA_NONE
+        if receiver is None and (ack is not None or nack is not None):
+            receiver = _CallbackSettler(ack, nack)
+        self.receiver = receiver
+
+    @classmethod
+    def from_message(cls, msg):  # type: (ReceivedMessage) -> ReceivedMessage
+        """
+        Make a copy of a received message as this class, acking and nacking
+        the same message
+        """
+        copy = cls(msg.body, msg.exchange_name, msg.routing_key,
+                   msg.properties, msg.delivery_tag, receiver=msg.receiver)
+        copy.acked = msg.acked
+        return copy
 
     def ack(self):
         """
@@ -157,7 +397,8 @@ class ReceivedMessage(Message):
         """
         if self.acked:
             return
-        self._ack()
+        if self.receiver is not None:
+            self.receiver.settle(self.delivery_tag, True)
         self.acked = True
 
     def nack(self):
@@ -171,7 +412,8 @@ class ReceivedMessage(Message):
         """
         if self.acked:
             return
-        self._nack()
+        if self.receiver is not None:
+            self.receiver.settle(self.delivery_tag, False)
         self.acked = True
 
 
@@ -313,6 +555,13 @@ class NodeDefinition(object):
     Additional keyword parameters that can be specified:
         heartbeat - heartbeat interval in seconds
         port - TCP port to use. Default is 5672
+        write_batch_size - maximum amount of bytes to send to the socket in
+            a single write. Data from many publishes, acks and so on is
+            merged into writes of up to this size. Default is 128 KiB
+        write_linger - time, in seconds, that writes of less than
+            write_batch_size bytes may be held back, waiting for more data to
+            merge with. This trades latency for throughput with many small
+            messages. Default is 0, ie. don't wait
 
     :raise ValueError: invalid parameters
     """
@@ -320,6 +569,8 @@ class NodeDefinition(object):
     def __init__(self, *args, **kwargs):
         self.heartbeat = kwargs.pop('heartbeat', None)
         self.port = kwargs.pop('port', 5672)
+        self.write_batch_size = kwargs.pop('write_batch_size', 131072)
+        self.write_linger = kwargs.pop('write_linger', 0)
 
         if len(kwargs) > 0:
             # Prepare arguments for amqp.connection.Connection
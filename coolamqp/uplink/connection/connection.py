@@ -1,7 +1,6 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
-import collections
 import logging
 import socket
 import time
@@ -12,55 +11,21 @@ from coolamqp.utils import monotonic
 
 from coolamqp.exceptions import ConnectionDead
 from coolamqp.framing.base import AMQPMethodPayload
-from coolamqp.framing.definitions import ConnectionClose, ConnectionCloseOk
+from coolamqp.framing.definitions import ConnectionClose, ConnectionCloseOk, \
+    BasicDeliver, FRAME_HEADER, FRAME_BODY
 from coolamqp.framing.frames import AMQPMethodFrame
 from coolamqp.objects import Callable
 from coolamqp.uplink.connection.recv_framer import ReceivingFramer
 from coolamqp.uplink.connection.send_framer import SendingFramer
 from coolamqp.uplink.connection.states import ST_ONLINE, ST_OFFLINE, \
     ST_CONNECTING
+from coolamqp.uplink.connection.watch_registry import WatchRegistry
 from coolamqp.uplink.connection.watches import MethodWatch
 from coolamqp.uplink.handshake import Handshaker
 
 logger = logging.getLogger(__name__)
 
 
-def alert_watches(watches, trigger):
-    """
-    Notify all watches in this collection.
-
-    Return a list of alive watches.
-    :param watches: list of Watch
-    :return: tuple of (list of Watch, bool - was any watch fired?)
-    """
-    watch_handled = False
-    alive_watches = []
-    while len(watches) > 0:
-        watch = watches.pop()
-
-        if watch.cancelled:
-            continue
-
-        watch_triggered = watch.is_triggered_by(trigger)
-        watch_handled |= watch_triggered
-
-        if watch.cancelled:
-            continue
-
-        if not any((watch_triggered, watch.oneshot, watch.cancelled)):
-            # Watch remains alive if it was NOT triggered, or it's NOT a oneshot or it's not cancelled
-            alive_watches.append(watch)
-        elif not watch.oneshot and not watch.cancelled:
-            alive_watches.append(watch)
-        elif watch.oneshot and not watch_triggered:
-            alive_watches.append(watch)
-
-    if set(alive_watches) != set(watches):
-        for removed_watch in set(watches) - set(alive_watches):
-            logger.debug('Removing watch %s', repr(removed_watch))
-    return alive_watches, watch_handled
-
-
 class Connection(object):
     """
     An object that manages a connection in a comprehensive way.
@@ -69,8 +34,9 @@ class Connection(object):
     listen for eg. frame on particular channel, frame on any channel, or connection teardown.
     Watches will also get a callback for connection being non-operational (eg. torn down).
 
-    WARNING: Thread-safety of watch operation hinges on atomicity
-    of .append and .pop.
+    Watches are kept in a WatchRegistry, so that a frame is shown only to
+    watches that can be triggered by it. Deliveries on consuming channels
+    skip watches altogether, see .receive_deliveries().
 
     Lifecycle of connection is such:
 
@@ -103,9 +69,11 @@ class Connection(object):
         self.name = name or 'CoolAMQP'
         self.recvf = ReceivingFramer(self.on_frame)
         self.extra_properties = extra_properties
-        # todo a list doesn't seem like a very strong atomicity guarantee
-        self.watches = {}  # channel => list of [Watch instance]
-        self.any_watches = []  # list of Watches that should check everything
+        self.watches = WatchRegistry()
+        self.receivers = {}  # channel => MessageReceiver
+        if log_frames is None:
+            # frames have to reach .on_frame to be logged
+            self.recvf.receivers = self.receivers
 
         self.finalize = Callable(oneshots=True)  #: public
 
@@ -190,8 +158,10 @@ class Connection(object):
         # be a race condition that ConnectionStart has arrived before there could
         # be a watch for it set
         self.listener_socket = self.listener_thread.register(sock,
-                                                             on_read=self.recvf.put,
+                                                             receiver=self.recvf,
                                                              on_fail=self.on_fail)
+        self.listener_socket.write_batch_size = self.node_definition.write_batch_size
+        self.listener_socket.write_linger = self.node_definition.write_linger
         self.sendf = SendingFramer(self.listener_socket.send)
         Handshaker(self, self.node_definition, self.on_connected, self.extra_properties)
         self.listener_thread.activate(self.listener_socket)
@@ -214,19 +184,8 @@ class Connection(object):
 
         self.state = ST_OFFLINE  # Update state
 
-        watchlists = [self.watches[channel] for channel in self.watches]
-
-        for watchlist in watchlists:  # Run all watches - failed
-            for watch in watchlist:
-                if not watch.cancelled:
-                    watch.failed()
-
-        for watch in self.any_watches:
-            if not watch.cancelled:
-                watch.failed()
-
-        self.watches = {}  # Clear the watch list
-        self.any_watches = []
+        self.receivers.clear()
+        self.watches.fail_all()  # Run all watches - failed
 
         # call finalizers
         self.finalize()
@@ -283,33 +242,19 @@ class Connection(object):
         if self.log_frames is not None:
             self.log_frames.on_frame(monotonic(), frame, 'to_client')
 
-        watch_handled = False  # True if ANY watch handled this
+        receiver = self.receivers.get(frame.channel)
+        if receiver is not None:
+            if frame.FRAME_TYPE == FRAME_BODY:
+                receiver.on_body(frame.data)
+                return
+            elif frame.FRAME_TYPE == FRAME_HEADER:
+                receiver.on_head(frame)
+                return
+            elif isinstance(frame.payload, BasicDeliver):
+                receiver.on_basic_deliver(frame.payload)
+                return
 
-        # ==================== process per-channel watches
-        #
-        #   Note that new watches may arrive while we process existing watches.
-        #   Therefore, we need to copy watches and zero the list before we proceed
-        if frame.channel in self.watches:
-            watches = self.watches[frame.channel]  # a list
-            self.watches[frame.channel] = []
-
-            alive_watches, f = alert_watches(watches, frame)
-            watch_handled |= f
-
-            if frame.channel in self.watches:
-                # unwatch_all might have gotten called, check that
-                for watch in alive_watches:
-                    self.watches[frame.channel].append(watch)
-
-        # ==================== process "any" watches
-        any_watches = self.any_watches
-        self.any_watches = []
-        alive_watches, f = alert_watches(any_watches, frame)
-
-        watch_handled |= f
-
-        for watch in alive_watches:
-            self.any_watches.append(watch)
+        watch_handled = self.watches.dispatch(frame)
 
         if not watch_handled:
             if isinstance(frame, AMQPMethodFrame):
@@ -327,17 +272,40 @@ class Connection(object):
 
         This is necessary to implement timeout detection when setting up the connection
         and heartbeat is not yet configured.
+
+        :return: a TimerHandle that can .cancel() the watchdog, or None
         """
         try:
-            self.listener_socket.oneshot(delay, callback)
+            return self.listener_socket.oneshot(delay, callback)
         except AttributeError:
             pass  # print(dir(self))
 
     def unwatch_all(self, channel_id):
         """
-        Remove all watches from specified channel
+        Remove all watches, and the receiver of deliveries, from specified
+        channel
         """
-        self.watches.pop(channel_id, None)
+        self.receivers.pop(channel_id, None)
+        self.watches.remove_channel(channel_id)
+
+    def receive_deliveries(self, channel_id,  # type: int
+                           receiver  # type: coolamqp.attaches.consumer.MessageReceiver
+                           ):  # type: (...) -> None
+        """
+        Pass basic.deliver's, content headers and bodies received on
+        a channel directly to receiver, instead of going through watches.
+
+        These are recognized by the ReceivingFramer, so no frame objects are
+        made for them, and they do not count as unhandled frames.
+
+        :param receiver: object with .on_basic_deliver(payload),
+            .on_head(AMQPHeaderFrame) and .on_body(memoryview)
+        """
+        self.receivers[channel_id] = receiver
+
+    def stop_receiving_deliveries(self, channel_id):  # type: (int) -> None
+        """Undo .receive_deliveries()"""
+        self.receivers.pop(channel_id, None)
 
     def watch(self, watch):
         """
@@ -345,12 +313,7 @@ class Connection(object):
         :param watch: Watch to register
         """
         assert self.state != ST_OFFLINE
-        if watch.channel is None:
-            self.any_watches.append(watch)
-        elif watch.channel not in self.watches:
-            self.watches[watch.channel] = collections.deque([watch])
-        else:
-            self.watches[watch.channel].append(watch)
+        self.watches.add(watch)
 
     def watch_for_method(self, channel,  # type: int
                          method,  # type: AMQPMethodPayload
@@ -1,16 +1,10 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
-import collections
-import io
-import struct
-
-import six
-
 from coolamqp.framing.definitions import FRAME_HEADER, FRAME_HEARTBEAT, \
-    FRAME_END, FRAME_METHOD, FRAME_BODY
+    FRAME_END, FRAME_METHOD, FRAME_BODY, BasicDeliver
 from coolamqp.framing.frames import AMQPBodyFrame, AMQPHeaderFrame, \
-    AMQPHeartbeatFrame, AMQPMethodFrame
+    AMQPHeartbeatFrame, AMQPMethodFrame, STRUCT_BHL, METHOD_DECODERS
 
 FRAME_TYPES = {
     FRAME_HEADER: AMQPHeaderFrame,
@@ -18,151 +12,230 @@ FRAME_TYPES = {
     FRAME_METHOD: AMQPMethodFrame
 }
 
-ordpy2 = ord if six.PY2 else lambda x: x
+VALID_FRAME_TYPES = (FRAME_HEARTBEAT, FRAME_HEADER, FRAME_METHOD, FRAME_BODY)
+
+# type(1) + channel(2) + size(4)
+FRAME_HEADER_LENGTH = 7
+
+# Slab sizing. A slab is never smaller than MIN_SLAB_SIZE, and is sized so that
+# roughly FRAMES_PER_SLAB frames of average observed size fit into it.
+MIN_SLAB_SIZE = 16384
+MAX_SLAB_SIZE = 1048576
+FRAMES_PER_SLAB = 64
+
+# basic.deliver is recognized by its class and method ID, which both fit in
+# the lower byte
+DELIVER_CLASS_ID, DELIVER_METHOD_ID = BasicDeliver.INDEX
+
+# If there is less free space than this at the end of the slab, begin a new one
+# instead of issuing a tiny read
+MIN_READ_SIZE = 1024
 
 
 class ReceivingFramer(object):
     """
     Assembles AMQP framing from received data.
 
-    Just call with .put(data) upon receiving,
-    and on_frame will be called with fresh frames.
+    Received data lands in a slab - a preallocated bytearray that the socket
+    recv_into()'s directly. Frames are parsed in place, so their payloads are
+    memoryviews of the slab. Once a slab fills up, a new one is allocated and
+    the bytes of a partially received frame are moved there. A slab is never
+    written to again after it is abandoned, since memoryviews that frames hold
+    may keep it alive for as long as the user wishes.
 
-    Not thread safe.
+    Content headers are copied out of the slab before they are parsed, since
+    they are small, and message properties, eg. a correlation ID, should be
+    hashable - a memoryview of a bytearray is not. They also don't keep the
+    slab alive then.
+
+    Frames larger than .max_frame_size are rejected as soon as their header
+    is seen, before any room is made for them. It should be set to the
+    negotiated frame_max.
+
+    Since a frame is always kept contiguous within a slab, parsing is a single
+    loop that decodes the 7-byte frame header with one unpack_from() and
+    slices the payload. A frame that is not yet fully received just stays in
+    the slab until enough data arrives, there's no per-byte state to keep.
 
-    State machine
-        (frame_type is None)  and has_bytes(1)        ->
-                (frame_type <- bytes(1))
+    Call .get_buffer() to obtain a writable memoryview, receive into it, and
+    then call .commit() with the number of bytes received. Alternatively, call
+    .put(data) with some bytes received elsewhere.
 
-        (frame_type is HEARTBEAT) and has_bytes(AMQPHeartbeatFrame.LENGTH-1)
-                      ->          (output_frame, frame_type <- None)
-        (frame_type is not HEARTBEAT and not None) and has_bytes(6)  ->
-                                       (frame_channel <- bytes(2),
-                                         frame_size <- bytes(4))
+    on_frame will be called with fresh frames.
 
-        (frame_size is not None) and has_bytes(frame_size+1)    ->
-                    (output_frame,
+    Deliveries on channels that have an entry in .receivers skip on_frame.
+    A receiver is an object with methods .on_basic_deliver(payload),
+    .on_head(AMQPHeaderFrame) and .on_body(memoryview). Basic.deliver is
+    recognized by its class and method ID, and body frames are passed without
+    making frame objects. Other frames on these channels go to on_frame.
 
-                                    frame_type <- None
-                                    frame_size < None)
+    Not thread safe.
     """
 
     def __init__(self, on_frame=lambda frame: None):
-        self.chunks = collections.deque()  # all received data
-        self.total_data_len = 0
+        self.buffer = bytearray(MIN_SLAB_SIZE)  # current slab
+        self.view = memoryview(self.buffer)
+        self.start = 0  # offset of first byte that was not parsed yet
+        self.end = 0  # offset of first byte that was not received yet
+
+        # statistics used to size the next slab
+        self.frames_in_slab = 0
 
-        self.frame_type = None
-        self.frame_channel = None
-        self.frame_size = None
+        # largest frame, including its header and frame end, to accept
+        self.max_frame_size = MAX_SLAB_SIZE
 
-        self.bytes_needed = None  # bytes needed for a new frame
         self.on_frame = on_frame
+        self.receivers = {}  # channel => receiver of deliveries
+        self.delivery_frames = 0  # frames that were given to receivers
 
-    def put(self, data):
+    def _bytes_needed(self):  # type: () -> int
         """
-        Called upon receiving data.
-
-        May result in any number of .on_frame() calls
-        :param data: received data
+        Return how many bytes, counting from .start, have to be present in
+        a slab for the frame that is being received right now to be parsed.
         """
-        self.total_data_len += len(data)
-        self.chunks.append(memoryview(data))
-
-        while self._statemachine():
-            pass
+        if self.end - self.start >= FRAME_HEADER_LENGTH:
+            return FRAME_HEADER_LENGTH + STRUCT_BHL.unpack_from(
+                self.buffer, self.start)[2] + 1
+        return AMQPHeartbeatFrame.LENGTH
 
-    def _extract_single_byte(self):
-        return ordpy2(self._extract(1)[0])
-
-    def _extract(self, up_to):
+    def _new_slab(self):
         """
-        return up to up_to bytes from current chunk, switch if necessary
+        Begin a new slab, moving everything not yet parsed into it.
         """
-        assert self.total_data_len >= up_to, \
-            'Tried to extract %s but %s remaining' % (
-                up_to, self.total_data_len)
-        if up_to >= len(self.chunks[0]):
-            q = self.chunks.popleft()
-        else:
-            q = self.chunks[0][:up_to]
-            self.chunks[0] = self.chunks[0][up_to:]
-
-        self.total_data_len -= len(q)
-        assert len(q) <= up_to, 'extracted %s but %s was requested' % (
-            len(q), up_to)
-        return q
-
-    def _statemachine(self):
-        # state rule 1
-        if self.frame_type is None and self.total_data_len > 0:
-            self.frame_type = self._extract_single_byte()
-
-            if self.frame_type not in (
-                    FRAME_HEARTBEAT, FRAME_HEADER, FRAME_METHOD, FRAME_BODY):
-                raise ValueError('Invalid frame')
-
-            return True
+        pending = self.end - self.start
 
-        # state rule 2
-        elif (self.frame_type == FRAME_HEARTBEAT) and (
-                self.total_data_len >= AMQPHeartbeatFrame.LENGTH - 1):
-            data = b''
-            while len(data) < AMQPHeartbeatFrame.LENGTH - 1:
-                data = data + self._extract(
-                    AMQPHeartbeatFrame.LENGTH - 1 - len(data)).tobytes()
+        if self.frames_in_slab > 0:
+            average = self.start // self.frames_in_slab
+        else:
+            average = len(self.buffer) // FRAMES_PER_SLAB
+        size = min(max(MIN_SLAB_SIZE, average * FRAMES_PER_SLAB),
+                   MAX_SLAB_SIZE)
+        size = max(size, 2 * self._bytes_needed())
 
-            if data != AMQPHeartbeatFrame.DATA[1:]:
-                # Invalid heartbeat frame!
-                raise ValueError('Invalid AMQP heartbeat')
+        buffer = bytearray(size)
+        buffer[:pending] = self.view[self.start:self.end]
 
-            self.on_frame(AMQPHeartbeatFrame())
-            self.frame_type = None
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.start = 0
+        self.end = pending
+        self.frames_in_slab = 0
 
-            return True
+    def get_buffer(self):  # type: () -> memoryview
+        """
+        Return a writable memoryview to receive data into.
 
-        # state rule 3
-        elif (self.frame_type != FRAME_HEARTBEAT) and (
-                self.frame_type is not None) and (
-                self.frame_size is None) and (
-                self.total_data_len > 6):
-            hdr = b''
-            while len(hdr) < 6:
-                hdr = hdr + self._extract(6 - len(hdr)).tobytes()
+        Receive the data, and then call .commit() with the amount of bytes
+        that were written to the beginning of this memoryview.
+        """
+        if (len(self.buffer) - self.end < MIN_READ_SIZE) or \
+                (self.start + self._bytes_needed() > len(self.buffer)):
+            self._new_slab()
+        return self.view[self.end:]
 
-            self.frame_channel, self.frame_size = struct.unpack('!HI', hdr)
+    def commit(self, length):  # type: (int) -> None
+        """
+        Called upon receiving data into the buffer returned by .get_buffer().
 
-            return True
+        May result in any number of .on_frame() calls
 
-        # state rule 4
-        elif (self.frame_size is not None) and (
-                self.total_data_len >= (self.frame_size + 1)):
+        :param length: amount of bytes that were received
+        :raise ValueError: invalid frame was received
+        """
+        self.end += length
+        self._parse()
 
-            if len(self.chunks[0]) >= self.frame_size:
-                # We can subslice it - it's very fast
-                payload = self._extract(self.frame_size)
-            else:
-                # Construct a separate buffer :(
-                payload = io.BytesIO()
-                while payload.tell() < self.frame_size:
-                    payload.write(
-                        self._extract(self.frame_size - payload.tell()))
+    def put(self, data):
+        """
+        Called upon receiving data.
 
-                assert payload.tell() <= self.frame_size
+        This copies the data into the slab.
 
-                payload = memoryview(payload.getvalue())
+        May result in any number of .on_frame() calls
+        :param data: received data
+        """
+        data = memoryview(data)
+        while len(data) > 0:
+            buf = self.get_buffer()
+            length = min(len(buf), len(data))
+            buf[:length] = data[:length]
+            data = data[length:]
+            self.commit(length)
+
+    def _parse(self):
+        """
+        Emit every complete frame between .start and .end
 
-            if self._extract_single_byte() != FRAME_END:
+        :raise ValueError: invalid frame was received
+        """
+        buffer = self.buffer
+        view = self.view
+        start = self.start
+        end = self.end
+        on_frame = self.on_frame
+        receivers = self.receivers
+        basic_deliver = METHOD_DECODERS[BasicDeliver.INDEX]
+        unpack_from = STRUCT_BHL.unpack_from
+        max_size = self.max_frame_size - AMQPHeartbeatFrame.LENGTH
+
+        # the shortest possible frame is a heartbeat, 8 bytes
+        while end - start >= AMQPHeartbeatFrame.LENGTH:
+            frame_type, channel, size = unpack_from(buffer, start)
+            if size > max_size:
+                raise ValueError('Frame too large')
+            payload_at = start + FRAME_HEADER_LENGTH
+            frame_end_at = payload_at + size
+            if frame_end_at >= end:
+                break  # not complete yet
+
+            if buffer[frame_end_at] != FRAME_END:
                 raise ValueError('Invalid frame end')
 
-            try:
-                frame = FRAME_TYPES[self.frame_type].unserialize(
-                    self.frame_channel, payload)
-            except ValueError:
-                raise
+            start = frame_end_at + 1
+            self.start = start
+            self.frames_in_slab += 1
+
+            if frame_type == FRAME_HEARTBEAT:
+                if size != 0:
+                    raise ValueError('Invalid AMQP heartbeat')
+                on_frame(AMQPHeartbeatFrame())
+                continue
+
+            receiver = receivers.get(channel)
+            if receiver is not None:
+                if frame_type == FRAME_BODY:
+                    self.delivery_frames += 1
+                    receiver.on_body(view[payload_at:frame_end_at])
+                    continue
+                elif frame_type == FRAME_HEADER:
+                    self.delivery_frames += 1
+                    receiver.on_head(AMQPHeaderFrame.unserialize(
+                        channel, memoryview(
+                            view[payload_at:frame_end_at].tobytes())))
+                    continue
+                elif frame_type == FRAME_METHOD and size > 4 and \
+                        buffer[payload_at + 1] == DELIVER_CLASS_ID and \
+                        buffer[payload_at + 3] == DELIVER_METHOD_ID and \
+                        buffer[payload_at] == 0 and buffer[payload_at + 2] == 0:
+                    self.delivery_frames += 1
+                    receiver.on_basic_deliver(
+                        basic_deliver.from_buffer(view, payload_at + 4))
+                    continue
 
-            self.on_frame(frame)
-            self.frame_type = None
-            self.frame_size = None
+            try:
+                frame_class = FRAME_TYPES[frame_type]
+            except KeyError:
+                raise ValueError('Invalid frame')
+            if frame_type == FRAME_HEADER:
+                payload = memoryview(view[payload_at:frame_end_at].tobytes())
+            else:
+                payload = view[payload_at:frame_end_at]
+            on_frame(frame_class.unserialize(channel, payload))
 
-            return True
-        return False
+        # reject garbage as soon as it's seen, don't wait for a full header
+        if start < end:
+            if buffer[start] not in VALID_FRAME_TYPES:
+                raise ValueError('Invalid frame')
+            if end - start >= FRAME_HEADER_LENGTH and \
+                    unpack_from(buffer, start)[2] > max_size:
+                raise ValueError('Frame too large')
@@ -1,47 +1,63 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
-import io
+import typing as tp
 
+# Writes at least this long will be referenced and not copied
+GATHER_THRESHOLD = 4096
 
-class SendingFramer(object):
+
+class GatherWriter(object):
+    """
+    A file-like object that AMQPFrame.write_to's write into.
+
+    Instead of copying everything into a single buffer, this builds a list of
+    buffers to be handed to sendmsg(). Short writes, such as frame headers,
+    are coalesced into bytearrays, while long writes - ie. message bodies -
+    are kept as references to the data passed.
     """
-    Assembles AMQP framing from received data and orchestrates their upload via a socket.
+    __slots__ = ('buffers', 'current')
 
-    Just call with .put(data) and get framing by iterator .framing().
+    def __init__(self):
+        self.buffers = []  # type: tp.List[tp.Union[bytes, bytearray, memoryview]]
+        self.current = None  # type: tp.Optional[bytearray]
 
-    Not thread safe.
+    def write(self, data):  # type: (tp.Union[bytes, bytearray, memoryview]) -> None
+        if len(data) >= GATHER_THRESHOLD:
+            self.buffers.append(data)
+            self.current = None
+        elif self.current is None:
+            self.current = bytearray(data)
+            self.buffers.append(self.current)
+        else:
+            self.current.extend(data)
 
-    State machine
-        (frame_type is None)  and has_bytes(1)        ->          (frame_type <- bytes(1))
 
-        (frame_type is HEARTBEAT) and has_bytes(3)  ->          (output_frame, frame_type <- None)
-        (frame_type is not HEARTBEAT and not None) and has_bytes(6)  ->      (frame_channel <- bytes(2),
-                                                                 frame_size <- bytes(4))
+class SendingFramer(object):
+    """
+    Serializes AMQP frames and orchestrates their upload via a socket.
 
-        (frame_size is not None) and has_bytes(frame_size+1)    ->  (output_frame,
-                                                                            frame_type <- None
-                                                                            frame_size < None)
+    Not thread safe.
     """
 
     def __init__(self, on_send=lambda data: None):
         """
         :param on_send: a callable(data, priority=False) that can be called with some data to send
-            data will always be entire AMQP frames!
+            data will always be a list of buffers, that hold entire AMQP frames!
         """
         self.on_send = on_send
 
     def send(self, frames, priority=False):
         """
         Schedule to send some frames.
+
+        Message bodies are not copied, they will be sent from the very
+        buffers they were given in.
+
         :param frames: list of AMQPFrame instances
         :param priority: preempty existing frames
         """
-        length = sum(frame.get_size() for frame in frames)
-        buf = io.BytesIO(bytearray(length))
-
+        writer = GatherWriter()
         for frame in frames:
-            frame.write_to(buf)
-
-        q = buf.getvalue()
-        self.on_send(q, priority)
+            frame.write_to(writer)
+        self.on_send(writer.buffers, priority)
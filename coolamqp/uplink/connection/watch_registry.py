@@ -0,0 +1,154 @@
+# coding=UTF-8
+from __future__ import absolute_import, division, print_function
+
+import logging
+import threading
+import typing as tp
+
+import six
+
+from coolamqp.framing.definitions import FRAME_METHOD
+
+logger = logging.getLogger(__name__)
+
+
+class WatchRegistry(object):
+    """
+    Watches registered with a Connection, indexed by what can trigger them.
+
+    Watches placed on a channel are kept in buckets, keyed by what
+    Watch.get_frame_keys() says - a method's INDEX or a frame type. Watches
+    that can be triggered by any frame go into a generic bucket of their
+    channel, and watches with a channel of None into a bucket of their own.
+    A frame is thus shown only to the watches that care about it: first these
+    in its bucket, then the generic ones of its channel, then the channel-less
+    ones. Within a bucket, newest watches go first.
+
+    Buckets are tuples, replaced (under a lock) whenever a watch is added or
+    removed, so dispatching a frame needs neither locks nor copies. Watches
+    added while a frame is being dispatched won't see that frame.
+
+    Cancelling a watch just marks it, it's removed from its buckets the next
+    time these are dispatched to or written. A oneshot watch is marked
+    cancelled after it's triggered.
+    """
+
+    def __init__(self):
+        # channel => key => tuple of Watch. Key of None is the generic bucket
+        self.channels = {}  # type: tp.Dict[int, tp.Dict[tp.Any, tp.Tuple[Watch, ...]]]
+        self.any_watches = ()  # type: tp.Tuple[Watch, ...]
+        self.lock = threading.Lock()
+
+    def add(self, watch):  # type: (Watch) -> None
+        """
+        Register a watch. Safe to call from any thread.
+        """
+        keys = watch.get_frame_keys() if watch.channel is not None else None
+        with self.lock:
+            if watch.channel is None:
+                self.any_watches = (watch,) + _alive(self.any_watches)
+                return
+
+            buckets = self.channels.setdefault(watch.channel, {})
+            for key in keys or (None,):
+                buckets[key] = (watch,) + _alive(buckets.get(key, ()))
+
+    def remove_channel(self, channel):  # type: (int) -> None
+        """Remove all watches placed on a channel"""
+        with self.lock:
+            self.channels.pop(channel, None)
+
+    def dispatch(self, frame):  # type: (AMQPFrame) -> bool
+        """
+        Show a frame to the watches that can be triggered by it.
+
+        :return: whether any watch was triggered
+        """
+        watch_handled = False
+
+        buckets = self.channels.get(frame.channel)
+        if buckets is not None:
+            if frame.FRAME_TYPE == FRAME_METHOD:
+                key = frame.payload.INDEX
+            else:
+                key = frame.FRAME_TYPE
+
+            watches = buckets.get(key)
+            if watches is not None:
+                watch_handled = self._alert(watches, frame, buckets, key)
+
+            watches = buckets.get(None)
+            if watches is not None:
+                watch_handled |= self._alert(watches, frame, buckets, None)
+
+        if len(self.any_watches) > 0:
+            watch_handled |= self._alert(self.any_watches, frame)
+
+        return watch_handled
+
+    def _alert(self, watches, frame, buckets=None, key=None):
+        """
+        Show a frame to watches from a bucket, and purge the bucket of watches
+        that are gone.
+
+        :param buckets: buckets of the channel, or None if these are the
+            channel-less watches
+        :return: whether any watch was triggered
+        """
+        watch_handled = False
+        watch_removed = False
+        for watch in watches:
+            if watch.cancelled:
+                watch_removed = True
+                continue
+
+            if watch.is_triggered_by(frame):
+                watch_handled = True
+                if watch.oneshot:
+                    watch.cancelled = True
+
+            if watch.cancelled:
+                logger.debug('Removing watch %s', watch)
+                watch_removed = True
+
+        if watch_removed:
+            with self.lock:
+                if buckets is None:
+                    self.any_watches = _alive(self.any_watches)
+                else:
+                    alive_watches = _alive(buckets.get(key, ()))
+                    if alive_watches:
+                        buckets[key] = alive_watches
+                    else:
+                        buckets.pop(key, None)
+
+        return watch_handled
+
+    def fail_all(self):  # type: () -> None
+        """
+        Remove all watches, calling .failed() on each of them that is not
+        cancelled, exactly once.
+        """
+        with self.lock:
+            channels, self.channels = self.channels, {}
+            any_watches, self.any_watches = self.any_watches, ()
+
+        failed_watches = set()
+        for buckets in six.itervalues(channels):
+            for watches in six.itervalues(buckets):
+                for watch in watches:
+                    if not watch.cancelled and watch not in failed_watches:
+                        failed_watches.add(watch)
+                        watch.failed()
+
+        for watch in any_watches:
+            if not watch.cancelled:
+                watch.failed()
+
+
+def _alive(watches):  # type: (tp.Tuple[Watch, ...]) -> tp.Tuple[Watch, ...]
+    """Return the watches that were not cancelled"""
+    for watch in watches:
+        if watch.cancelled:
+            return tuple(watch for watch in watches if not watch.cancelled)
+    return watches
@@ -4,6 +4,7 @@ from __future__ import absolute_import, division, print_function
 import logging
 
 from coolamqp.framing.base import AMQPMethodPayload
+from coolamqp.framing.definitions import FRAME_HEADER, FRAME_BODY
 from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
     AMQPBodyFrame
 
@@ -39,6 +40,17 @@ class Watch(object):
         """
         raise Exception('Abstract method')
 
+    def get_frame_keys(self):
+        """
+        Return what can trigger this watch, so that it's shown only such frames.
+
+        A key is either a method's INDEX (a tuple of class ID and method ID),
+        or a frame type (for frames other than method frames).
+
+        :return: a tuple of keys, or None if any frame can trigger this watch
+        """
+        return None
+
     def failed(self):
         """
         This watch will process things no more, because underlying
@@ -105,6 +117,9 @@ class HeaderOrBodyWatch(Watch):
         Watch.__init__(self, channel, False)
         self.callable = callable
 
+    def get_frame_keys(self):
+        return FRAME_HEADER, FRAME_BODY
+
     def is_triggered_by(self, frame):
         if not (isinstance(frame, (AMQPHeaderFrame, AMQPBodyFrame))):
             return False
@@ -141,6 +156,12 @@ class MethodWatch(Watch):
         if self.on_end is not None:
             self.on_end()
 
+    def get_frame_keys(self):
+        try:
+            return tuple(method.INDEX for method in self.methods)
+        except AttributeError:  # not a particular method, eg. AMQPMethodPayload
+            return None
+
     def is_triggered_by(self, frame):
 
         if not isinstance(frame, AMQPMethodFrame):
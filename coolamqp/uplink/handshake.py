@@ -11,6 +11,7 @@ import logging
 from coolamqp.framing.definitions import ConnectionStart, ConnectionStartOk, \
     ConnectionTune, ConnectionTuneOk, ConnectionOpen, ConnectionOpenOk
 from coolamqp.framing.frames import AMQPMethodFrame
+from coolamqp.uplink.connection.recv_framer import MAX_SLAB_SIZE
 from coolamqp.uplink.connection.states import ST_ONLINE
 from coolamqp.uplink.heartbeat import Heartbeater
 from coolamqp import __version__
@@ -117,7 +118,11 @@ class Handshaker(object):
 
     def on_connection_tune(self, payload  # type: coolamqp.framing.base.AMQPPayload
                            ):
-        self.connection.frame_max = payload.frame_max
+        # 0 means no limit, but a limit is needed to know how large the
+        # frames we receive can be, and to split message bodies
+        frame_max = payload.frame_max or MAX_SLAB_SIZE
+        self.connection.frame_max = frame_max
+        self.connection.recvf.max_frame_size = frame_max
         self.connection.heartbeat = min(payload.heartbeat, self.heartbeat)
         self.connection.free_channels.extend(six.moves.xrange(1, (
             65535 if payload.channel_max == 0 else payload.channel_max) + 1))
@@ -126,7 +131,7 @@ class Handshaker(object):
                                          self.on_connection_open_ok)
         self.connection.send([
             AMQPMethodFrame(0, ConnectionTuneOk(payload.channel_max,
-                                                payload.frame_max,
+                                                frame_max,
                                                 self.connection.heartbeat)),
             AMQPMethodFrame(0, ConnectionOpen(self.virtual_host))
         ])
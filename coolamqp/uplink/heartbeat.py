@@ -21,6 +21,8 @@ class Heartbeater(object):
         self.heartbeat_interval = heartbeat_interval
 
         self.last_heartbeat_on = monotonic()  # last heartbeat from server
+        # deliveries that skip watches, see Connection.receive_deliveries()
+        self.delivery_frames = connection.recvf.delivery_frames
 
         self.connection.watchdog(self.heartbeat_interval, self.on_timer)
         self.connection.watch(AnyWatch(self.on_heartbeat))
@@ -47,6 +49,11 @@ class Heartbeater(object):
         """Timer says we should send a heartbeat"""
         self.connection.send([AMQPHeartbeatFrame()], priority=True)
 
+        delivery_frames = self.connection.recvf.delivery_frames
+        if delivery_frames != self.delivery_frames:
+            self.delivery_frames = delivery_frames
+            self.on_any_frame()
+
         if (
                 monotonic() - self.last_heartbeat_on) > 2 * self.heartbeat_interval:
             # closing because of heartbeat
@@ -1,51 +1,172 @@
 from abc import ABCMeta, abstractmethod
 import heapq
+import itertools
+import threading
 import typing as tp
 import six
+from six.moves._thread import get_ident
 from coolamqp.utils import monotonic
 
+# Rebuild the heap once cancelled timers make up more than half of it, and
+# there's at least that many of them
+COMPACT_AFTER_CANCELLED = 64
+
+
+class TimerHandle(object):
+    """
+    A handle to a timer event, as returned by BaseListener.oneshot().
+
+    Cancelling a timer just marks it as such. The listener discards cancelled
+    timers when they reach the top of the heap, or en masse if there are
+    too many of them.
+    """
+    __slots__ = ('listener', 'deadline', 'fd', 'callback', 'cancelled')
+
+    def __init__(self, listener, deadline, fd, callback):
+        self.listener = listener  # type: BaseListener
+        self.deadline = deadline  # type: float
+        self.fd = fd  # type: int
+        self.callback = callback  # type: tp.Callable[[], None]
+        self.cancelled = False
+
+    def cancel(self):  # type: () -> None
+        """
+        Prevent this timer from firing. Does nothing if it has already fired
+        or was cancelled.
+        """
+        self.listener.cancel_timer(self)
+
 
 class BaseListener(object):
     __metaclass__ = ABCMeta
 
+    # Can .wakeup() make a blocked .wait() return?
+    WAKES_UP = False
+
     def __init__(self):
         self.fd_to_sock = {}    # type: tp.Dict[int, BaseSocket]
-        self.time_events = []  # type: tp.List[tp.Tuple[float, int, tp.Callable[[], None]]]
+        # heap of (deadline, sequence number, TimerHandle)
+        self.time_events = []  # type: tp.List[tp.Tuple[float, int, TimerHandle]]
+        self.fd_to_timers = {}  # type: tp.Dict[int, tp.Set[TimerHandle]]
+        self.cancelled_timers = 0
+        self.timer_sequence = itertools.count()
+        # timers are scheduled from other threads too
+        self.timer_lock = threading.Lock()
+        self.loop_thread_id = None  # type: tp.Optional[int]
+
+    def is_loop_thread(self):  # type: () -> bool
+        """Is this called from the thread that runs the loop?"""
+        return self.loop_thread_id == get_ident()
+
+    def wakeup(self):  # type: () -> None
+        """
+        Make a blocked .wait() return as soon as possible.
+
+        Safe to call from any thread. Listeners that can't do that just wait
+        for their timeout.
+        """
+
+    def _drop_cancelled_timers(self):  # type: () -> None
+        """Pop cancelled timers off the top of the heap. Call with timer_lock"""
+        while len(self.time_events) > 0 and self.time_events[0][2].cancelled:
+            heapq.heappop(self.time_events)
+            self.cancelled_timers -= 1
+
+    def get_timeout(self, timeout):  # type: (float) -> float
+        """
+        Return how long can the loop block, so that it doesn't delay any
+        timer events.
+
+        :param timeout: longest time to block for
+        """
+        with self.timer_lock:
+            self._drop_cancelled_timers()
+            if len(self.time_events) > 0:
+                return max(0, min(timeout, self.time_events[0][0] - monotonic()))
+        return timeout
 
     def do_timer_events(self):
         # Timer events
         mono = monotonic()
-        while len(self.time_events) > 0 and (self.time_events[0][0] < mono):
-            ts, fd, callback = heapq.heappop(self.time_events)
-            callback()
+        while True:
+            with self.timer_lock:
+                self._drop_cancelled_timers()
+                if len(self.time_events) == 0 or self.time_events[0][0] > mono:
+                    return
+                handle = heapq.heappop(self.time_events)[2]
+                handle.cancelled = True     # so that it's not cancelled later on
+                self._forget_timer(handle)
+            handle.callback()
 
     def oneshot(self, sock, delta, callback):
+        # type: (BaseSocket, float, tp.Callable[[], None]) -> tp.Optional[TimerHandle]
         """
         A socket registers a time callback
         :param sock: BaseSocket instance
         :param delta: "this seconds after now"
         :param callback: callable/0
+        :return: a TimerHandle, or None if the socket is not active
         """
-        if sock.fileno() in self.fd_to_sock:
-            heapq.heappush(self.time_events, (monotonic() + delta,
-                                              sock.fileno(),
-                                              callback
-                                              ))
+        fd = sock.fileno()
+        if fd not in self.fd_to_sock:
+            return None
+
+        handle = TimerHandle(self, monotonic() + delta, fd, callback)
+        with self.timer_lock:
+            heapq.heappush(self.time_events,
+                           (handle.deadline, next(self.timer_sequence), handle))
+            self.fd_to_timers.setdefault(fd, set()).add(handle)
+            is_nearest = self.time_events[0][2] is handle
+
+        if is_nearest:
+            # it's the nearest deadline now, the loop has to notice
+            self.wakeup()
+        return handle
+
+    def cancel_timer(self, handle):  # type: (TimerHandle) -> None
+        """Cancel a timer. Use TimerHandle.cancel() instead"""
+        with self.timer_lock:
+            self._cancel_timer(handle)
+
+    def _forget_timer(self, handle):  # type: (TimerHandle) -> None
+        """Remove a timer from its socket's timers. Call with timer_lock"""
+        timers = self.fd_to_timers.get(handle.fd)
+        if timers is not None:
+            timers.discard(handle)
+            if len(timers) == 0:
+                del self.fd_to_timers[handle.fd]
+
+    def _cancel_timer(self, handle):  # type: (TimerHandle) -> None
+        """Call with timer_lock"""
+        if handle.cancelled:
+            return
+        handle.cancelled = True
+        self._forget_timer(handle)
+        self.cancelled_timers += 1
+
+        if self.cancelled_timers > COMPACT_AFTER_CANCELLED and \
+                self.cancelled_timers * 2 > len(self.time_events):
+            self.time_events = [event for event in self.time_events
+                                if not event[2].cancelled]
+            heapq.heapify(self.time_events)
+            self.cancelled_timers = 0
 
     def noshot(self, sock):     # type: (BaseSocket) -> None
         """
         Clear all one-shots for a socket
         :param sock: BaseSocket instance
         """
-        fd = sock.fileno()
-        self.time_events = [q for q in self.time_events if q[1] != fd]
+        with self.timer_lock:
+            for handle in list(self.fd_to_timers.pop(sock.fileno(), ())):
+                self._cancel_timer(handle)
 
     @abstractmethod
     def wait(self, timeout=1):
         """
         This will be executed in a loop.
 
-        This must call .do_timer_events()
+        This must call .do_timer_events(), and should block no longer than
+        .get_timeout(timeout) says.
         """
 
     def close_socket(self, sock):   # type: (BaseSocket) -> None
@@ -61,39 +182,29 @@ class BaseListener(object):
 
         This object is unusable after this call.
         """
-        self.time_events = []
+        with self.timer_lock:
+            self.time_events = []
+            self.fd_to_timers = {}
+            self.cancelled_timers = 0
         for sock in list(six.itervalues(self.fd_to_sock)):
             sock.on_fail()
             sock.close()
 
         self.fd_to_sock = {}
 
-    def oneshot(self, sock, delta, callback):
-        """
-        A socket registers a time callback
-        :param sock: BaseSocket instance
-        :param delta: "this seconds after now"
-        :param callback: callable/0
-        """
-        if sock.fileno() in self.fd_to_sock:
-            heapq.heappush(self.time_events, (monotonic() + delta,
-                                              sock.fileno(),
-                                              callback
-                                              ))
-
     def activate(self, sock):  # type: (BaseSocket) -> None
         self.fd_to_sock[sock.fileno()] = sock
 
     @abstractmethod
     def register(self, sock,                    # type: socket.socket
-                 on_read=lambda data: None,     # type: tp.Callable[[bytearray], None]
+                 receiver,          # type: coolamqp.uplink.connection.recv_framer.ReceivingFramer
                  on_fail=lambda: None         # type: tp.Callable[[], None]
                  ):                     # type: () -> BaseSocket
         """
         This has to return a particular Socket instance, adapted to the needs of the listener.
 
         :param sock: a socket instance (as returned by socket module)
-        :param on_read: callable(data) to be called with received data
+        :param receiver: object to receive data into, see BaseSocket
         :param on_fail: callable() to be called when socket fails
 
         :return: a BaseSocket's subclass instance to use instead of this socket
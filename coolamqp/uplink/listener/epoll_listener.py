@@ -1,12 +1,16 @@
 # coding=UTF-8
 from __future__ import absolute_import, division, print_function
 
+import collections
+import errno
 import logging
+import os
 import select
 import socket
 import threading
+import typing as tp
 
-import six
+from six.moves._thread import get_ident
 
 from coolamqp.uplink.listener.socket import SocketFailed, BaseSocket
 from coolamqp.uplink.listener.base_listener import BaseListener
@@ -17,50 +21,177 @@ logger = logging.getLogger(__name__)
 try:
     RO = select.EPOLLIN | select.EPOLLHUP | select.EPOLLERR
     RW = RO | select.EPOLLOUT
+    ET = select.EPOLLET
 except AttributeError:
     # epoll listener will be unusable anyway
     RO = 0
     RW = 1
+    ET = 0
 
 
 class EpollSocket(BaseSocket):
+    """
+    A socket that is registered for EPOLLOUT only while it has data to send.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(EpollSocket, self).__init__(*args, **kwargs)
+        self.write_armed = False  # is EPOLLOUT registered? Touched only by the loop
+        self.arm_requested = False  # did another thread ask the loop to arm this?
 
     def send(self, data, priority=False):
         """
         This can actually get called not by ListenerThread.
         """
         BaseSocket.send(self, data, priority=priority)
+        if not self.write_armed:
+            self.listener.arm_write(self)
+
+    def on_linger_expired(self):  # type: () -> None
+        self.listener.arm_write(self)
+
+
+def set_nonblocking(fd):  # type: (int) -> None
+    import fcntl
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+
+class Waker(object):
+    """
+    A descriptor that can be made readable from any thread, to wake up
+    a thread blocked in epoll.
+
+    This is an eventfd, or a pipe where eventfd is not available.
+    """
+
+    def __init__(self):
+        self.is_eventfd = hasattr(os, 'eventfd')
+        if self.is_eventfd:
+            self.read_fd = self.write_fd = os.eventfd(
+                0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        else:
+            self.read_fd, self.write_fd = os.pipe()
+            for fd in (self.read_fd, self.write_fd):
+                set_nonblocking(fd)
+        self.is_pending = False
+
+    def fileno(self):  # type: () -> int
+        return self.read_fd
+
+    def wake(self):  # type: () -> None
+        if self.is_pending:
+            return  # the loop will wake up anyway
+        self.is_pending = True
+        try:
+            if self.is_eventfd:
+                os.eventfd_write(self.write_fd, 1)
+            else:
+                os.write(self.write_fd, b'\x00')
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise   # if it's full, the loop will wake up anyway
+
+    def clear(self):  # type: () -> None
+        """Called by the loop thread after waking up, before looking for work"""
+        self.is_pending = False
         try:
-            self.listener.epoll.modify(self, RW)
-        except socket.error:
-            # silence. If there are errors, it's gonna get nuked soon.
-            pass
+            while os.read(self.read_fd, 4096):
+                pass
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def close(self):  # type: () -> None
+        self.is_pending = True  # so that nobody writes to a closed descriptor
+        os.close(self.read_fd)
+        if self.write_fd != self.read_fd:
+            os.close(self.write_fd)
 
 
 class EpollListener(BaseListener):
     """
     A listener using epoll.
+
+    It blocks in epoll no longer than until the nearest timer event, and can
+    be woken up with .wakeup() at any time.
+
+    A socket is registered for EPOLLOUT only while it has data to send, so the
+    registration changes only when a socket's send queue goes from empty to
+    non-empty and back. By default sockets are registered edge-triggered.
+
+    :param edge_triggered: whether to use EPOLLET. By default it's used,
+        unless COOLAMQP_EPOLL_LEVEL_TRIGGERED environment variable is set
     """
+    WAKES_UP = True
 
-    def __init__(self):
+    def __init__(self, edge_triggered=None):  # type: (tp.Optional[bool]) -> None
+        if edge_triggered is None:
+            edge_triggered = 'COOLAMQP_EPOLL_LEVEL_TRIGGERED' not in os.environ
+        self.flags = ET if edge_triggered else 0
         self.epoll = select.epoll()
         self.socket_activation_lock = threading.Lock()
         self.sockets_to_activate = []
+        self.sockets_to_arm = collections.deque()  # type: tp.Deque[EpollSocket]
+        self.waker = Waker()
+        self.epoll.register(self.waker.fileno(), select.EPOLLIN)
         super(EpollListener, self).__init__()
 
+    def wakeup(self):  # type: () -> None
+        if not self.is_loop_thread():
+            self.waker.wake()
+
+    def arm_write(self, sock):  # type: (EpollSocket) -> None
+        """
+        Make the loop call sock.on_write() as soon as the socket is writable.
+
+        Safe to call from any thread. Only the loop thread touches the epoll
+        registration, other threads ask it to do so.
+        """
+        if self.is_loop_thread():
+            if not sock.write_armed:
+                sock.write_armed = True
+                try:
+                    self.epoll.modify(sock.fileno(), RW | self.flags)
+                except (IOError, OSError, socket.error):
+                    # silence. If there are errors, it's gonna get nuked soon.
+                    pass
+        elif not sock.arm_requested:
+            sock.arm_requested = True
+            self.sockets_to_arm.append(sock)
+            self.wakeup()
+
     def wait(self, timeout=1):
+        self.loop_thread_id = get_ident()
+
+        events = self.epoll.poll(timeout=self.get_timeout(timeout))
+
+        for fd, event in events:
+            if fd == self.waker.fileno():
+                self.waker.clear()
+
         with self.socket_activation_lock:
             for socket_to_activate in self.sockets_to_activate:
                 logger.debug('Activating fd %s', (socket_to_activate.fileno(),))
-                self.epoll.register(socket_to_activate.fileno(), RW)
+                socket_to_activate.write_armed = True
+                self.epoll.register(socket_to_activate.fileno(), RW | self.flags)
             self.sockets_to_activate = []
 
-        events = self.epoll.poll(timeout=timeout)
+        while len(self.sockets_to_arm) > 0:
+            sock = self.sockets_to_arm.popleft()
+            sock.arm_requested = False
+            if sock.fileno() in self.fd_to_sock and sock.wants_to_send_data():
+                self.arm_write(sock)
 
         self.do_timer_events()
 
         for fd, event in events:
-            sock = self.fd_to_sock[fd]
+            if fd == self.waker.fileno():
+                continue
+
+            sock = self.fd_to_sock.get(fd)
+            if sock is None:
+                continue    # closed while handling this batch of events
 
             # Errors
             try:
@@ -72,20 +203,29 @@ class EpollListener(BaseListener):
                     sock.on_read()
 
                 if event & select.EPOLLOUT:
-                    sock.on_write()
-                    # I'm done with sending for now
-                    if len(sock.data_to_send) == 0 and len(
-                            sock.priority_queue) == 0:
-                        self.epoll.modify(sock.fileno(), RO)
+                    self.on_writable(sock)
 
             except SocketFailed as e:
                 logger.debug('Socket %s has raised %s', fd, e)
                 self.close_socket(sock)
 
-        # Do any of the sockets want to send data Re-register them
-        for sock in six.itervalues(self.fd_to_sock):
-            if sock.wants_to_send_data():
-                self.epoll.modify(sock.fileno(), RW)
+    def on_writable(self, sock):  # type: (EpollSocket) -> None
+        """
+        Send as much as possible, and stop waiting for EPOLLOUT if that's
+        everything.
+
+        :raise SocketFailed: socket has failed
+        """
+        while sock.on_write():
+            # I'm done with sending for now. Unarm before checking, so that
+            # another thread that sends right now will ask to arm again.
+            sock.write_armed = False
+            if not sock.wants_to_send_data():
+                self.epoll.modify(sock.fileno(), RO | self.flags)
+                return
+            # Data slipped in meanwhile. In edge-triggered mode no new event
+            # will come for it, so send it right away.
+            sock.write_armed = True
 
     def close_socket(self, sock):  # type: (BaseSocket) -> None
         self.epoll.unregister(sock.fileno())
@@ -100,23 +240,24 @@ class EpollListener(BaseListener):
         """
         super(EpollListener, self).shutdown()
         self.epoll.close()
+        self.waker.close()
 
     def activate(self, sock):  # type: (BaseSocket) -> None
         super(EpollListener, self).activate(sock)
         with self.socket_activation_lock:
             self.sockets_to_activate.append(sock)
+        self.wakeup()
 
-    def register(self, sock, on_read=lambda data: None,
-                 on_fail=lambda: None):
+    def register(self, sock, receiver, on_fail=lambda: None):
         """
         Add a socket to be listened for by the loop.
 
         Please note that .activate() will be later called on this socket.
 
         :param sock: a socket instance (as returned by socket module)
-        :param on_read: callable(data) to be called with received data
+        :param receiver: object to receive data into, see BaseSocket
         :param on_fail: callable() to be called when socket fails
 
         :return: a BaseSocket instance to use instead of this socket
         """
-        return EpollSocket(sock, on_read, on_fail=on_fail, listener=self)
+        return EpollSocket(sock, receiver, on_fail=on_fail, listener=self)
@@ -26,10 +26,9 @@ class SelectListener(BaseListener):
             if sock.wants_to_send_data():
                 wrs.append(sock)
 
-        self.do_timer_events()
-
         try:
-            rds, wrs, exs = select.select(rds_and_exs, wrs, rds_and_exs, timeout)
+            rds, wrs, exs = select.select(rds_and_exs, wrs, rds_and_exs,
+                                          self.get_timeout(timeout))
         except (select.error, socket.error, IOError):
             for sock in rds_and_exs:
                 try:
@@ -40,6 +39,8 @@ class SelectListener(BaseListener):
             else:
                 return
 
+        self.do_timer_events()
+
         for sock_rd in rds:
             try:
                 sock_rd.on_read()
@@ -58,15 +59,14 @@ class SelectListener(BaseListener):
             except SocketFailed:
                 return self.close_socket(sock_ex)
 
-    def register(self, sock, on_read=lambda data: None,
-                 on_fail=lambda: None):
+    def register(self, sock, receiver, on_fail=lambda: None):
         """
         Add a socket to be listened for by the loop.
 
         :param sock: a socket instance (as returned by socket module)
-        :param on_read: callable(data) to be called with received data
+        :param receiver: object to receive data into, see BaseSocket
         :param on_fail: callable() to be called when socket fails
 
         :return: a BaseSocket instance to use instead of this socket
         """
-        return BaseSocket(sock, on_read, on_fail=on_fail, listener=self)
+        return BaseSocket(sock, receiver, on_fail=on_fail, listener=self)
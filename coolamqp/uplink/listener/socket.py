@@ -2,13 +2,29 @@
 from __future__ import absolute_import, division, print_function
 
 import collections
+import errno
 import logging
 from abc import ABCMeta, abstractmethod
 import socket
+import typing as tp
+
+import six
+
+from coolamqp.utils import monotonic
 
 logger = logging.getLogger(__name__)
 
 
+# errnos that mean "no more data to read right now" on a non-blocking socket
+WOULD_BLOCK = (errno.EAGAIN, errno.EWOULDBLOCK)
+
+# Maximum amount of buffers passed to a single sendmsg(). Linux's IOV_MAX is 1024.
+MAX_IOVECS = 512
+
+# Default maximum amount of bytes to send in a single write
+DEFAULT_WRITE_BATCH_SIZE = 131072
+
+
 class SocketFailed(IOError):
     """Failure during socket operation. It needs to be discarded."""
 
@@ -23,16 +39,17 @@ class BaseSocket(object):
     """
     __metaclass__ = ABCMeta
 
-    def __init__(self, sock, on_read=lambda data: None,
+    def __init__(self, sock, receiver,
                  on_time=lambda: None,
                  on_fail=lambda: None,
                  listener=None):
         """
 
         :param sock: socketobject
-        :param on_read: callable(data) to be called when data is read.
+        :param receiver: object to receive data into, having .get_buffer()
+            and .commit(length) - see ReceivingFramer.
             Listener thread context
-            Raises ValueError on socket should be closed
+            .commit() raises ValueError on socket should be closed
         :param on_time: callable() when time provided by socket expires
         :param on_fail: callable() when socket is dead and to be discarded.
             Listener thread context.
@@ -44,11 +61,23 @@ class BaseSocket(object):
         self.sock = sock
         self.data_to_send = collections.deque()
         self.priority_queue = collections.deque()  # when a piece of data is finished, this queue is checked first
-        self.my_on_read = on_read
+        self.head_in_progress = False  # was data_to_send[0] partially sent?
+        self.receiver = receiver
         self._on_fail = on_fail
         self.on_time = on_time
         self.is_failed = False
         self.listener = listener
+        # sendmsg() is not available on Python 2 and on Windows
+        self.has_sendmsg = hasattr(sock, 'sendmsg')
+
+        # Write coalescing, public. Pending data is sent in writes of up to
+        # write_batch_size bytes. If write_linger is set, writing less than
+        # write_batch_size bytes is held back for up to write_linger seconds,
+        # waiting for more data to appear. Priority data is never held back.
+        self.write_batch_size = DEFAULT_WRITE_BATCH_SIZE
+        self.write_linger = 0
+        self.linger_until = None  # type: tp.Optional[float]
+        self.linger_timer = None  # type: tp.Optional[coolamqp.uplink.listener.base_listener.TimerHandle]
 
     def on_fail(self):
         self.is_failed = True
@@ -58,8 +87,9 @@ class BaseSocket(object):
         """
         Schedule to send some data.
 
-        :param data: data to send, or None to terminate this socket.
+        :param data: list of buffers to send, or None to terminate this socket.
             Note that data will be sent atomically, ie. without interruptions.
+            The list, and the buffers, must not be touched after this call.
         :param priority: preempt other datas. Property of sending data atomically will be maintained.
         """
         if self.is_failed: return
@@ -68,6 +98,7 @@ class BaseSocket(object):
             # THE POPE OF NOPE
             self.priority_queue = collections.deque()
             self.data_to_send = collections.deque([None])
+            self.head_in_progress = False
             return
 
         if priority:
@@ -80,8 +111,10 @@ class BaseSocket(object):
         Set to fire a callable N seconds after
         :param seconds_after: seconds after this
         :param callable: callable/0
+        :return: a TimerHandle, that can .cancel() this, or None if this
+            socket is not active
         """
-        self.listener.oneshot(self, seconds_after, callable)
+        return self.listener.oneshot(self, seconds_after, callable)
 
     def noshot(self):
         """
@@ -92,29 +125,119 @@ class BaseSocket(object):
         self.listener.noshot(self)
 
     def on_read(self):      # type: () -> None
-        """Socket is readable, called by Listener"""
-        if self.is_failed:
-            return
-        try:
-            data = self.sock.recv(2048)
-        except (IOError, socket.error) as e:
-            raise SocketFailed(repr(e))
+        """
+        Socket is readable, called by Listener
 
-        if len(data) == 0:
-            raise SocketFailed('connection gracefully closed')
+        This will receive directly into receiver's buffer, for as long as
+        there is data available.
+        """
+        while not self.is_failed:
+            buf = self.receiver.get_buffer()
+            try:
+                length = self.sock.recv_into(buf)
+            except (IOError, socket.error) as e:
+                if e.errno in WOULD_BLOCK:
+                    return
+                raise SocketFailed(repr(e))
 
-        try:
-            self.my_on_read(data)
-        except ValueError as e:
-            raise SocketFailed(repr(e))
+            if length == 0:
+                raise SocketFailed('connection gracefully closed')
+
+            try:
+                self.receiver.commit(length)
+            except ValueError as e:
+                raise SocketFailed(repr(e))
+
+            if length < len(buf):
+                # Kernel buffer was drained, no need to wait for EAGAIN
+                return
 
     def wants_to_send_data(self):  # type: () -> bool
-        return not (len(self.data_to_send) == 0 and len(self.priority_queue) == 0)
+        if len(self.data_to_send) == 0 and len(self.priority_queue) == 0:
+            return False
+        return self.linger_until is None or self.linger_until <= monotonic()
+
+    def on_linger_expired(self):  # type: () -> None
+        """
+        Called by the listener when held back data should be sent. Listener
+        thread context.
+
+        This sends it right away. Whatever could not be sent is sent when the
+        socket becomes writable, as usual.
+        """
+        self.linger_timer = None
+        try:
+            self.on_write()
+        except SocketFailed:
+            self.listener.close_socket(self)
+
+    def _splice_priority_data(self):  # type: () -> None
+        """
+        Move data from priority_queue to the front of data_to_send, or right
+        behind data_to_send[0] if that is partially sent already.
+        """
+        priority_data = []
+        while len(self.priority_queue) > 0:
+            priority_data.append(self.priority_queue.popleft())
+
+        if self.head_in_progress:
+            head = self.data_to_send.popleft()
+            self.data_to_send.extendleft(reversed(priority_data))
+            self.data_to_send.appendleft(head)
+        else:
+            self.data_to_send.extendleft(reversed(priority_data))
+
+    def _gather(self):  # type: () -> tp.Tuple[tp.List[tp.Union[bytes, memoryview]], int]
+        """
+        Collect buffers to be sent in a single write.
+
+        :return: a tuple of (list of buffers, their total length)
+        """
+        max_iovecs = MAX_IOVECS if self.has_sendmsg else 1
+        iovecs = []
+        size = 0
+        queue = self.data_to_send
+        # Only this thread pops from the queue, so it's safe to index it
+        # while other threads append
+        for i in six.moves.xrange(len(queue)):
+            buffers = queue[i]
+            if buffers is None:
+                break
+            for buf in buffers:
+                iovecs.append(buf)
+                size += len(buf)
+                if len(iovecs) >= max_iovecs or size >= self.write_batch_size:
+                    return iovecs, size
+        return iovecs, size
+
+    def _should_linger(self):  # type: () -> bool
+        """
+        Should writing be held back in anticipation of more data?
+        """
+        if self.write_linger <= 0:
+            return False
+
+        iovecs, size = self._gather()
+        if size >= self.write_batch_size or len(iovecs) >= MAX_IOVECS:
+            return False
+
+        now = monotonic()
+        if self.linger_until is None:
+            self.linger_until = now + self.write_linger
+            self.linger_timer = self.oneshot(self.write_linger,
+                                             self.on_linger_expired)
+            return True
+        return now < self.linger_until
 
     def on_write(self):      # type: () -> None
         """
         Socket is writable, called by Listener
 
+        Pending data, no matter from how many .send() calls, is sent in as
+        few writes as possible. Each piece of data still reaches the wire
+        uninterrupted, and priority data still preempts all data whose
+        sending hasn't begun yet.
+
         :raises SocketFailed: on socket error
 
         :return: True if I'm done sending shit for now
@@ -122,34 +245,68 @@ class BaseSocket(object):
         if self.is_failed:
             return False
 
+        if len(self.priority_queue) == 0 and self._should_linger():
+            return True
+
         while True:
-            if len(self.data_to_send) == 0:
-                if len(self.priority_queue) == 0:
-                    return True
-                else:
-                    self.data_to_send.appendleft(self.priority_queue.popleft())
+            if len(self.priority_queue) > 0:
+                self._splice_priority_data()
 
-            assert len(self.data_to_send) > 0
+            if len(self.data_to_send) == 0:
+                self.linger_until = None
+                if self.linger_timer is not None:
+                    self.linger_timer.cancel()
+                    self.linger_timer = None
+                return True
 
             if self.data_to_send[0] is None:
                 raise SocketFailed()  # We should terminate the connection!
 
+            iovecs, size = self._gather()
+
             try:
-                sent = self.sock.send(self.data_to_send[0])
-            except (IOError, socket.error):
-                raise SocketFailed()
+                if self.has_sendmsg:
+                    sent = self.sock.sendmsg(iovecs)
+                else:
+                    sent = self.sock.send(iovecs[0])
+            except (IOError, socket.error) as e:
+                if e.errno in WOULD_BLOCK:
+                    return False
+                raise SocketFailed(repr(e))
+
+            is_short_write = sent < size
+
+            # Drop everything that was sent
+            while len(self.data_to_send) > 0 and self.data_to_send[0] is not None:
+                buffers = self.data_to_send[0]
+
+                sent_buffers = 0
+                for buf in buffers:
+                    if sent < len(buf):
+                        break
+                    sent -= len(buf)
+                    sent_buffers += 1
+                del buffers[:sent_buffers]
+
+                if len(buffers) > 0:
+                    if sent > 0:
+                        # Not everything could be sent
+                        buffers[0] = memoryview(buffers[0])[sent:]
+                    if sent > 0 or sent_buffers > 0:
+                        self.head_in_progress = True
+                    break
 
-            if sent < len(self.data_to_send[0]):
-                # Not everything could be sent
-                self.data_to_send[0] = self.data_to_send[0][sent:]
-                return False
-            else:
                 # Looks like everything has been sent
                 self.data_to_send.popleft()  # mark as sent
+                self.head_in_progress = False
 
-                if len(self.priority_queue) > 0:
-                    # We can send a priority pack
-                    self.data_to_send.appendleft(self.priority_queue.popleft())
+                if len(self.priority_queue) > 0 and sent == 0:
+                    # We can send a priority pack, since the next piece of
+                    # data was not begun yet
+                    self._splice_priority_data()
+
+            if is_short_write:
+                return False
 
     def fileno(self):  # type: () -> int
         """Return descriptor number"""
@@ -44,6 +44,11 @@ class ListenerThread(threading.Thread):
     A thread that does the listening.
 
     It automatically picks the best listener for given platform.
+
+    Loop hooks are callables/0 that are called by this thread once every
+    loop iteration, after I/O and timer events are processed. Use them to
+    process work that other threads queue up, in batches. Other threads
+    can make the loop iterate with .wakeup().
     """
 
     def __init__(self, name=None):  # type: (tp.Optional[str])
@@ -53,6 +58,35 @@ class ListenerThread(threading.Thread):
         self.terminating = False
         self._call_next_io_event = Callable(oneshots=True)
         self.listener = None        # type: BaseListener
+        self.loop_hooks = ()        # type: tp.Tuple[tp.Callable[[], None], ...]
+        self.loop_hooks_lock = threading.Lock()
+
+    def add_loop_hook(self, callable):  # type: (tp.Callable[[], None]) -> None
+        """
+        Have callable called once every loop iteration.
+
+        :param callable: callable/0
+        """
+        with self.loop_hooks_lock:
+            self.loop_hooks = self.loop_hooks + (callable, )
+
+    def remove_loop_hook(self, callable):  # type: (tp.Callable[[], None]) -> None
+        """Undo .add_loop_hook()"""
+        with self.loop_hooks_lock:
+            self.loop_hooks = tuple(hook for hook in self.loop_hooks
+                                    if hook != callable)
+
+    def wakeup(self):  # type: () -> None
+        """
+        Make the loop iterate as soon as possible. Safe to call from any
+        thread. Does nothing if the listener is unable to do that, see
+        BaseListener.WAKES_UP.
+        """
+        self.listener.wakeup()
+
+    def is_loop_thread(self):  # type: () -> bool
+        """Is this called from this thread?"""
+        return self.listener.is_loop_thread()
 
     def call_next_io_event(self, callable):
         """
@@ -68,6 +102,8 @@ class ListenerThread(threading.Thread):
 
     def terminate(self):
         self.terminating = True
+        if self.listener is not None:
+            self.listener.wakeup()
 
     def init(self):
         """Called before start. It is not safe to fork after this"""
@@ -83,21 +119,24 @@ class ListenerThread(threading.Thread):
 
         while not self.terminating:
             self.listener.wait()
+            for hook in self.loop_hooks:
+                hook()
             self._call_next_io_event()
 
         self.listener.shutdown()
 
     def register(self, sock,  # type: socket.socket
-                 on_read=lambda data: None,  # type: tp.Callable[[bytes], None]
+                 receiver,  # type: coolamqp.uplink.connection.recv_framer.ReceivingFramer
                  on_fail=lambda: None      # type: tp.Callable[[], None]
                  ):
         """
         Add a socket to be listened for by the loop.
 
         :param sock: a socket instance (as returned by socket module)
-        :param on_read: callable(data) to be called with received data
+        :param receiver: object to receive data into, having .get_buffer()
+            and .commit(length)
         :param on_fail: callable() to be called when socket fails
 
         :return: a BaseSocket instance to use instead of this socket
         """
-        return self.listener.register(sock, on_read, on_fail)
+        return self.listener.register(sock, receiver, on_fail)
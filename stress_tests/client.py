@@ -99,7 +99,7 @@ class ConnectAndDisconnectThread(TerminableThread):
             evt = self.amqp.drain(max(0.0, 1 - (time.monotonic() - started_at)))
 
             if isinstance(evt, ReceivedMessage):
-                routing_key = evt.routing_key.tobytes().decode('utf8')
+                routing_key = evt.routing_key.decode('utf8')
                 if routing_key in self.connections:
                     self.connections[routing_key].on_message(evt)
                 if evt.ack is not None:
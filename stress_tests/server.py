@@ -19,7 +19,7 @@ class Server(TerminableThread):
     def loop(self):
         evt = self.amqp.drain(timeout=1.0)
         if isinstance(evt, ReceivedMessage):
-            routing_key = evt.routing_key.tobytes().decode('utf8').replace('-repl', '')
+            routing_key = evt.routing_key.decode('utf8').replace('-repl', '')
             self.amqp.publish(Message(evt.body), routing_key=routing_key)
 
 
@@ -1,10 +1,22 @@
 # coding=UTF-8
 from __future__ import print_function, absolute_import, division
 
+import threading
+import typing as tp
 import unittest
 
 from coolamqp.attaches import Consumer
-from coolamqp.objects import Queue
+from coolamqp.attaches.channeler import ST_ONLINE
+from coolamqp.attaches.consumer import MessageReceiver
+from coolamqp.clustering.events import MessageReceived
+from coolamqp.framing.definitions import BasicDeliver, BasicAck, \
+    BasicReject, Basic
+from coolamqp.framing.frames import AMQPHeaderFrame
+from coolamqp.objects import Queue, NodeDefinition, ReceivedMessage, \
+    EMPTY_PROPERTIES
+from coolamqp.uplink.connection import Connection
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+from coolamqp.uplink.connection.send_framer import SendingFramer
 
 
 class TestConsumer(unittest.TestCase):
@@ -12,3 +24,142 @@ class TestConsumer(unittest.TestCase):
         """Support for passing qos as int"""
         cons = Consumer(Queue('wtf'), lambda msg: None, qos=25)
         self.assertEquals(cons.qos, (0, 25))
+
+    def test_ack_batch(self):
+        cons = Consumer(Queue('wtf'), lambda msg: None, ack_batch=100)
+        self.assertEqual(cons.ack_batch, (100, 1.0))
+        cons = Consumer(Queue('wtf'), lambda msg: None, ack_batch=(10, 0.1))
+        self.assertEqual(cons.ack_batch, (10, 0.1))
+
+
+class TestMessageReceiver(unittest.TestCase):
+    def setUp(self, **kwargs):
+        self.sent = []
+        self.received = []
+        connection = Connection(NodeDefinition('127.0.0.1', 'guest', 'guest'),
+                                None, {})
+        connection.sendf = SendingFramer(
+            lambda buffers, priority: self.sent.extend(buffers))
+        self.consumer = Consumer(Queue(b'queue'), self.received.append,
+                                 no_ack=False, message_class=MessageReceived,
+                                 **kwargs)
+        self.consumer.connection = connection
+        self.consumer.channel_id = 1
+        self.receiver = self.consumer.receiver = MessageReceiver(self.consumer)
+        self.timers = []
+
+        def watchdog(delay, callback):  # not started, just cancellable
+            self.timers.append(threading.Timer(delay, callback))
+            return self.timers[-1]
+
+        connection.watchdog = watchdog
+
+    def deliver(self, delivery_tag):  # type: (int) -> ReceivedMessage
+        self.receiver.on_basic_deliver(BasicDeliver(
+            b'amq.ctag', delivery_tag, False, b'exchange', b'routing.key'))
+        self.receiver.on_head(AMQPHeaderFrame(1, Basic.INDEX, 0, 4,
+                                              EMPTY_PROPERTIES))
+        self.receiver.on_body(memoryview(b'body'))
+        return self.received[-1]
+
+    def test_ack(self):
+        first, second = self.deliver(1), self.deliver(2)
+        self.assertIsInstance(first, MessageReceived)
+        self.assertEqual(first.body, b'body')
+        self.assertIs(first.routing_key, second.routing_key)
+        self.assertEqual(first.exchange_name, b'exchange')
+
+        self.assertEqual(self.consumer.get_unacked_count(), 2)
+        second.nack()
+        first.ack()
+        first.ack()
+        self.assertEqual(self.consumer.get_unacked_count(), 0)
+        frames = []
+        framer = ReceivingFramer(frames.append)
+        for data in self.sent:
+            framer.put(data)
+        self.assertEqual([(type(frame.payload), frame.payload.delivery_tag)
+                          for frame in frames],
+                         [(BasicReject, 2), (BasicAck, 1)])
+
+    def sent_frames(self):  # type: () -> tp.List[tp.Tuple[type, int, bool]]
+        frames = []
+        framer = ReceivingFramer(frames.append)
+        for data in self.sent:
+            framer.put(data)
+        del self.sent[:]
+        return [(type(frame.payload), frame.payload.delivery_tag,
+                 getattr(frame.payload, 'multiple', False))
+                for frame in frames
+                if isinstance(frame.payload, (BasicAck, BasicReject))]
+
+    def test_ack_batch(self):
+        self.consumer.ack_batch = (3, None)
+        messages = [self.deliver(tag) for tag in range(1, 8)]
+        messages[1].ack()
+        messages[0].ack()
+        self.assertEqual(self.sent_frames(), [])
+        messages[2].ack()
+        self.assertEqual(self.sent_frames(), [(BasicAck, 3, True)])
+
+        # out of order acks are sent singly, held ones before a reject
+        messages[4].ack()
+        messages[5].ack()
+        messages[4].ack()
+        messages[3].nack()
+        self.assertEqual(self.sent_frames(), [(BasicAck, 5, False),
+                                              (BasicAck, 6, False),
+                                              (BasicReject, 4, False)])
+
+        messages[6].ack()
+        self.consumer.state = ST_ONLINE
+        self.consumer.cancel()
+        self.assertEqual(self.sent_frames(), [(BasicAck, 7, True)])
+        messages[6].ack()
+        self.assertEqual(self.sent_frames(), [])
+
+    def test_ack_batch_timer(self):
+        self.consumer.ack_batch = (100, 0.5)
+        timers = self.timers
+        first, second = self.deliver(1), self.deliver(2)
+        second.ack()
+        first.ack()
+        self.assertEqual(len(timers), 1)
+        self.assertEqual(timers[0].interval, 0.5)
+        timers[0].function()
+        self.assertEqual(self.sent_frames(), [(BasicAck, 2, True)])
+
+    def test_ack_batch_above_qos(self):
+        self.setUp(qos=10, ack_batch=100)
+        messages = [self.deliver(tag) for tag in range(1, 11)]
+        for message in messages[:-1]:
+            message.ack()
+        self.assertEqual(self.sent_frames(), [])
+        # the broker won't deliver more until these are acked
+        messages[-1].ack()
+        self.assertEqual(self.sent_frames(), [(BasicAck, 10, True)])
+        self.assertEqual(self.timers[0].interval, 1.0)
+
+    def test_from_message(self):
+        acks = []
+        message = ReceivedMessage(b'body', b'exchange', b'key',
+                                  delivery_tag=5,
+                                  ack=lambda: acks.append(True),
+                                  nack=lambda: acks.append(False))
+        copy = MessageReceived.from_message(message)
+        copy.nack()
+        copy.ack()
+        self.assertEqual(acks, [False])
+        self.assertEqual(copy.delivery_tag, 5)
+
+    def test_message_received_of_message(self):
+        acks = []
+        message = ReceivedMessage(b'body', b'exchange', b'key',
+                                  delivery_tag=5,
+                                  ack=lambda: acks.append(True))
+        event = MessageReceived(message)
+        self.assertEqual((event.body, event.exchange_name, event.routing_key,
+                          event.delivery_tag), (b'body', b'exchange', b'key', 5))
+        event.ack()
+        event.ack()
+        self.assertEqual(acks, [True])
@@ -0,0 +1,268 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import unittest
+
+from coolamqp.attaches import Publisher
+from coolamqp.attaches.channeler import ST_ONLINE
+from coolamqp.attaches.utils import AtomicTagger, \
+    CallbackConfirmableRejectable, WindowedConfirmableRejectable
+from coolamqp.exceptions import PublishWindowFull
+from coolamqp.framing.definitions import BasicPublish
+from coolamqp.objects import ConfirmWindow, ConfirmBatch, Message, NodeDefinition
+from coolamqp.uplink.connection import Connection
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+from coolamqp.uplink.connection.send_framer import SendingFramer
+from coolamqp.uplink.listener.thread import ListenerThread
+
+
+def make_online(publisher):
+    """
+    Make publisher believe it's online, on a connection that was never
+    started. Return a list that gets the frames sent, one list per send.
+    """
+    sent = []
+
+    def on_send(buffers, priority):
+        frames = []
+        framer = ReceivingFramer(frames.append)
+        for buffer in buffers:
+            framer.put(buffer)
+        sent.append(frames)
+
+    connection = Connection(NodeDefinition('127.0.0.1', 'guest', 'guest'),
+                            None, {})
+    connection.sendf = SendingFramer(on_send)
+    connection.frame_max = 131072
+    publisher.connection = connection
+    publisher.channel_id = 1
+    publisher.state = ST_ONLINE
+    publisher.tagger = AtomicTagger()
+    return sent
+
+
+class TestConfirmWindow(unittest.TestCase):
+    """Publishers here are never attached, so messages just wait to be sent"""
+
+    def test_noack_refuses_window(self):
+        self.assertRaises(ValueError, Publisher, Publisher.MODE_NOACK,
+                          window=ConfirmWindow(max_messages=1))
+
+    def test_fail(self):
+        pub = Publisher(Publisher.MODE_CNPUB,
+                        window=ConfirmWindow(max_messages=2,
+                                             policy=ConfirmWindow.FAIL))
+        pub.publish(Message(b'a'), routing_key=b'q')
+        pub.publish(Message(b'b'), routing_key=b'q')
+        self.assertRaises(PublishWindowFull, pub.publish, Message(b'c'),
+                          routing_key=b'q')
+        self.assertEqual(len(pub.messages), 2)
+
+    def test_block_times_out(self):
+        window = ConfirmWindow(max_bytes=3, policy=ConfirmWindow.BLOCK,
+                               timeout=0.05)
+        pub = Publisher(Publisher.MODE_CNPUB, window=window)
+        pub.publish(Message(b'abc'), routing_key=b'q')
+        self.assertRaises(PublishWindowFull, pub.publish, Message(b'd'),
+                          routing_key=b'q')
+        self.assertEqual(window.bytes, 3)
+
+    def test_queue(self):
+        window = ConfirmWindow(max_messages=1, policy=ConfirmWindow.QUEUE)
+        pub = Publisher(Publisher.MODE_CNPUB, window=window)
+        fut1 = pub.publish(Message(b'a'), routing_key=b'q')
+        fut2 = pub.publish(Message(b'b'), routing_key=b'q')
+        self.assertFalse(fut2.done())
+        self.assertEqual(len(pub.messages), 1)
+        self.assertEqual(len(pub.held), 1)
+
+        # the first message gets confirmed
+        window.release(1)
+        with pub.get_monitor_lock():
+            pub._admit_held()
+        self.assertEqual(len(pub.held), 0)
+        self.assertEqual(len(pub.messages), 2)
+
+    def test_confirm_releases(self):
+        window = ConfirmWindow(max_messages=1)
+        window.acquire(5)
+        results = []
+        tagger = AtomicTagger()
+        tagger.deposit(tagger.get_key(), WindowedConfirmableRejectable(
+            CallbackConfirmableRejectable(results.append), window, 5))
+        tagger.nack(1, False)
+        self.assertEqual(results, [False])
+        self.assertEqual((window.messages, window.bytes), (0, 0))
+
+    def test_failing_callback_releases(self):
+        window = ConfirmWindow(max_messages=2)
+        results = []
+
+        def callback(result):
+            results.append(result)
+            raise RuntimeError('user code failed')
+
+        tagger = AtomicTagger()
+        for i in range(2):
+            window.acquire(1)
+            tagger.deposit(tagger.get_key(), WindowedConfirmableRejectable(
+                CallbackConfirmableRejectable(callback), window, 1))
+        tagger.ack(2, True)
+        self.assertEqual(results, [True, True])
+        self.assertEqual((window.messages, window.bytes), (0, 0))
+
+
+class TestPublishMany(unittest.TestCase):
+    def test_sends_at_once(self):
+        pub = Publisher(Publisher.MODE_CNPUB)
+        sent = make_online(pub)
+        futures = pub.publish_many([(Message(b'a'), b'', b'q'),
+                                    (Message(b''), u'xchg', u'q'),
+                                    (Message(b'c'), b'', b'q')])
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(len(sent[0]), 8)   # the empty body has no frame
+        self.assertEqual(sent[0][3].payload.exchange.tobytes(), b'xchg')
+
+        pub.tagger.ack(2, True)
+        self.assertEqual([fut.done() for fut in futures], [True, True, False])
+
+    def test_batch(self):
+        pub = Publisher(Publisher.MODE_CNPUB)
+        make_online(pub)
+        fut = pub.publish_many([(Message(b'a'), b'', b'q')] * 3, batch=True)
+        pub.tagger.ack(3, True)
+        self.assertIsNone(fut.result(timeout=0))
+
+    def test_noack(self):
+        pub = Publisher(Publisher.MODE_NOACK)
+        sent = make_online(pub)
+        self.assertIsNone(pub.publish_many([(Message(b'a'), b'', b'q')] * 2))
+        self.assertEqual(len(sent), 1)
+        self.assertIsInstance(sent[0][3].payload, BasicPublish)
+        self.assertRaises(ValueError, pub.publish_many, [], batch=True)
+
+    def test_window_parts(self):
+        window = ConfirmWindow(max_messages=2, policy=ConfirmWindow.FAIL)
+        pub = Publisher(Publisher.MODE_CNPUB, window=window)
+        sent = make_online(pub)
+        self.assertRaises(PublishWindowFull, pub.publish_many,
+                          [(Message(b'a'), b'', b'q')] * 3)
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(window.messages, 2)
+        pub.tagger.ack(2, True)
+        self.assertEqual(window.messages, 0)
+
+    def test_window_full_tells_what_was_sent(self):
+        window = ConfirmWindow(max_messages=2, policy=ConfirmWindow.FAIL)
+        pub = Publisher(Publisher.MODE_CNPUB, window=window)
+        make_online(pub)
+        try:
+            pub.publish_many([(Message(b'a'), b'', b'q')] * 3)
+        except PublishWindowFull as e:
+            self.assertEqual(e.sent, 2)
+            self.assertEqual(len(e.futures), 2)
+            self.assertIsNone(e.batch)
+        else:
+            self.fail('PublishWindowFull not raised')
+        pub.tagger.ack(2, True)
+
+        try:
+            pub.publish_many([(Message(b'a'), b'', b'q')] * 3, batch=True)
+        except PublishWindowFull as e:
+            self.assertEqual((e.sent, e.futures), (2, []))
+            batch = e.batch
+        else:
+            self.fail('PublishWindowFull not raised')
+        self.assertEqual(batch.size, 2)
+        pub.tagger.ack(4, True)
+        self.assertIsNone(batch.future.result(timeout=0))
+
+    def test_batch_sealed_after_settling(self):
+        batch = ConfirmBatch(3)
+        batch.add()
+        batch.confirm()
+        self.assertFalse(batch.future.done())
+        batch.seal()
+        self.assertIsNone(batch.future.result(timeout=0))
+
+    def test_batch_discarded_on_error(self):
+        pub = Publisher(Publisher.MODE_CNPUB)
+        make_online(pub)
+        batch = ConfirmBatch(2)
+        batch.add()
+        # the batch is filled by someone else in the meantime
+        self.assertRaises(ValueError, pub._publish_many,
+                          [(Message(b'a'), b'', b'q')] * 2, None, batch, False)
+        self.assertEqual(batch.published, 1)
+
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self):
+        # a loop that's never started, .wait() is called by hand
+        self.loop = ListenerThread(name='test')
+        self.loop.init()
+        if not self.loop.listener.WAKES_UP:
+            self.loop.listener.shutdown()
+            self.skipTest('this listener cannot be woken up')
+
+    def tearDown(self):
+        self.loop.listener.shutdown()
+
+    def test_drained_at_once(self):
+        pub = Publisher(Publisher.MODE_CNPUB, coalesce=True)
+        sent = make_online(pub)
+        pub.loop = self.loop
+        pub.loop.add_loop_hook(pub._drain_inbox)
+
+        futures = [pub.publish(Message(b'a'), routing_key=b'q')
+                   for i in range(3)]
+        self.assertEqual(len(pub.inbox), 3)
+        self.assertEqual(sent, [])
+
+        self.loop.listener.wait(0)
+        for hook in self.loop.loop_hooks:
+            hook()
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(len(sent[0]), 9)
+
+        pub.tagger.ack(3, True)
+        self.assertTrue(all(fut.done() for fut in futures))
+
+
+class TestPreparedPublish(unittest.TestCase):
+    def test_noack(self):
+        pub = Publisher(Publisher.MODE_NOACK)
+        sent = make_online(pub)
+        handle = pub.prepare(u'xchg', u'q', {'content_type': b'text/plain'})
+        handle.send(b'hello')
+        handle.send(b'')
+        self.assertEqual(len(sent), 2)
+        publish, header, body = sent[0]
+        self.assertEqual(publish.payload.exchange.tobytes(), b'xchg')
+        self.assertEqual(publish.payload.routing_key.tobytes(), b'q')
+        self.assertEqual(header.body_size, 5)
+        self.assertEqual(header.properties.content_type, b'text/plain')
+        self.assertEqual(bytes(body.data), b'hello')
+        self.assertEqual(len(sent[1]), 2)   # the empty body has no frame
+
+    def test_cnpub(self):
+        pub = Publisher(Publisher.MODE_CNPUB)
+        sent = make_online(pub)
+        handle = pub.prepare(b'', b'q')
+        fut = handle.send(b'a')
+        calls = []
+        handle.send(b'b', callback=calls.append)
+        self.assertEqual(len(sent), 2)
+
+        pub.tagger.ack(2, True)
+        self.assertIsNone(fut.result(timeout=0))
+        self.assertEqual(calls, [True])
+
+    def test_channel_changes(self):
+        pub = Publisher(Publisher.MODE_NOACK)
+        sent = make_online(pub)
+        handle = pub.prepare(b'', b'q')
+        handle.send(b'a')
+        pub.channel_id = 2
+        handle.send(b'a')
+        self.assertEqual([frame.channel for frame in sent[1]], [2, 2, 2])
@@ -0,0 +1,148 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import unittest
+
+from coolamqp.attaches.utils import AtomicTagger, ConfirmableRejectable, \
+    CallbackConfirmableRejectable, BytesInterner, TagRanges
+
+
+class Recorder(ConfirmableRejectable):
+    __slots__ = ('tag', 'log')
+
+    def __init__(self, tag, log):
+        self.tag = tag
+        self.log = log
+
+    def confirm(self):
+        self.log.append(('ack', self.tag))
+
+    def reject(self):
+        self.log.append(('nack', self.tag))
+
+
+class TestAtomicTagger(unittest.TestCase):
+    def setUp(self):
+        self.tagger = AtomicTagger()
+        self.log = []
+
+    def deposit(self, count):
+        for i in range(count):
+            tag = self.tagger.get_key()
+            self.tagger.deposit(tag, Recorder(tag, self.log))
+
+    def test_single(self):
+        self.deposit(5)
+        self.tagger.ack(3, False)
+        self.tagger.nack(1, False)
+        self.tagger.ack(3, False)   # a no-op
+        self.assertEqual(self.log, [('ack', 3), ('nack', 1)])
+        self.assertEqual(sorted(self.tagger.tags), [2, 4, 5])
+
+    def test_multiple(self):
+        self.deposit(10)
+        self.tagger.ack(2, False)
+        self.tagger.ack(5, True)
+        self.assertEqual(self.log, [('ack', 2), ('ack', 1), ('ack', 3),
+                                    ('ack', 4), ('ack', 5)])
+        self.tagger.nack(100, True)
+        self.assertEqual([tag for _, tag in self.log[5:]], [6, 7, 8, 9, 10])
+        self.assertEqual(self.tagger.tags, {})
+
+    def test_everything(self):
+        self.deposit(3)
+        self.tagger.ack(2, False)
+        self.tagger.ack(0, True)
+        self.assertEqual(self.log, [('ack', 2), ('ack', 1), ('ack', 3)])
+
+    def test_out_of_order(self):
+        self.deposit(6)
+        for tag in (2, 3, 5, 1):
+            self.tagger.ack(tag, False)
+        self.assertEqual(self.tagger.low_watermark, 4)
+        self.tagger.ack(6, True)
+        self.assertEqual([tag for _, tag in self.log], [2, 3, 5, 1, 4, 6])
+
+    def test_late_deposit(self):
+        tags = [self.tagger.get_key() for i in range(3)]
+        self.tagger.deposit(tags[2], Recorder(tags[2], self.log))
+        self.tagger.ack(tags[2], False)
+        self.tagger.deposit(tags[0], Recorder(tags[0], self.log))
+        self.tagger.ack(tags[2], True)
+        self.assertEqual(self.log, [('ack', 3), ('ack', 1)])
+
+    def test_callbacks(self):
+        for tag in (1, 2):
+            self.tagger.deposit(tag, CallbackConfirmableRejectable(self.log.append))
+        self.tagger.nack(1, False)
+        self.tagger.ack(2, False)
+        self.assertEqual(self.log, [False, True])
+
+    def test_deposit_range(self):
+        self.deposit(1)
+        first = self.tagger.deposit_range(
+            [(Recorder(tag, self.log), None) for tag in (2, 3, 4)])
+        self.assertEqual(first, 2)
+        self.assertEqual(self.tagger.get_key(), 5)
+        self.tagger.ack(3, True)
+        self.assertEqual(self.log, [('ack', 1), ('ack', 2), ('ack', 3)])
+        self.tagger.nack(4, False)
+        self.assertEqual(self.log[-1], ('nack', 4))
+
+
+class TestBytesInterner(unittest.TestCase):
+    def test_intern(self):
+        interner = BytesInterner(capacity=2)
+        key = interner.intern(memoryview(bytearray(b'key')))
+        self.assertEqual(key, b'key')
+        self.assertIs(interner.intern(memoryview(bytearray(b'key'))), key)
+        interner.intern(b'other')
+        interner.intern(key)
+        interner.intern(b'third')
+        self.assertEqual(list(interner.cache), [b'key', b'third'])
+
+
+class TestTagRanges(unittest.TestCase):
+    def test_in_order(self):
+        tags = TagRanges()
+        for tag in range(1, 1001):
+            tags.add(tag)
+        self.assertEqual(len(tags.starts), 1)
+        self.assertEqual(len(tags), 1000)
+        self.assertTrue(tags.discard(1))
+        self.assertFalse(tags.discard(1))
+        self.assertEqual(tags.lowest(), 2)
+        self.assertNotIn(1, tags)
+        self.assertIn(1000, tags)
+        self.assertNotIn(1001, tags)
+
+    def test_holes(self):
+        tags = TagRanges()
+        for tag in range(1, 11):
+            tags.add(tag)
+        for tag in (5, 7, 6, 10):
+            self.assertTrue(tags.discard(tag))
+        self.assertEqual(list(tags), [1, 2, 3, 4, 8, 9])
+        self.assertEqual(repr(tags), 'TagRanges(1-4, 8-9)')
+
+        for tag in (6, 5, 7, 6):
+            tags.add(tag)
+        self.assertEqual(list(tags), [1, 2, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(len(tags.starts), 1)
+        self.assertEqual(len(tags), 9)
+
+    def test_against_a_set(self):
+        import random
+        rand = random.Random(7)
+        tags, expected = TagRanges(), set()
+        for i in range(2000):
+            tag = rand.randint(1, 100)
+            if rand.random() < 0.5:
+                tags.add(tag)
+                expected.add(tag)
+            else:
+                self.assertEqual(tags.discard(tag), tag in expected)
+                expected.discard(tag)
+            self.assertEqual(len(tags), len(expected))
+        self.assertEqual(list(tags), sorted(expected))
+        self.assertEqual(tags.lowest(), min(expected) if expected else None)
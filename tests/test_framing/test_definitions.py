@@ -0,0 +1,99 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import pickle
+import subprocess
+import sys
+import unittest
+
+from coolamqp.framing import definitions
+from coolamqp.framing.base import LazyDispatchTable
+
+
+class TestLazyDefinitions(unittest.TestCase):
+    def test_not_made_on_import(self):
+        source = ('import coolamqp.framing.frames, coolamqp.framing.definitions as d; '
+                  'print("BasicRecover" in vars(d))')
+        output = subprocess.check_output([sys.executable, '-c', source])
+        self.assertEqual(output.strip(), b'True' if sys.version_info < (3, 7) else b'False')
+
+    def test_made_once(self):
+        cls = definitions.TxSelectOk
+        self.assertIs(definitions.TxSelectOk, cls)
+        self.assertIs(definitions.IDENT_TO_METHOD[cls.INDEX], cls)
+        self.assertIs(definitions.BINARY_HEADER_TO_METHOD[cls.BINARY_HEADER], cls)
+        self.assertEqual(cls.__qualname__, 'TxSelectOk')
+        self.assertIs(definitions.REPLY_REASONS_FOR[cls], definitions.TxSelect)
+
+    def test_unknown(self):
+        self.assertRaises(AttributeError, getattr, definitions, 'NoSuchMethod')
+        self.assertFalse(hasattr(definitions, 'NoSuchMethod'))
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from coolamqp.framing.definitions import *', namespace)
+        self.assertIs(namespace['BasicRecoverOk'], definitions.BasicRecoverOk)
+
+    def test_pickle(self):
+        ack = pickle.loads(pickle.dumps(definitions.BasicAck(5, True)))
+        self.assertIsInstance(ack, definitions.BasicAck)
+        self.assertEqual(ack.delivery_tag, 5)
+
+
+class TestSerializers(unittest.TestCase):
+    def test_write_into(self):
+        for payload in (definitions.BasicPublish(b'exch', b'key', True, False),
+                        definitions.QueueDeclare(b'queue', False, True, False,
+                                                 False, True,
+                                                 [(b'x-max-length', (5, 'I'))]),
+                        definitions.BasicAck(2 ** 40, True)):
+            buf = io.BytesIO()
+            payload.write_arguments(buf)
+            data = bytearray(b'\xFF' * (payload.get_size() + 3))
+            self.assertEqual(payload.write_into(data, 1),
+                             1 + payload.get_size())
+            self.assertEqual(bytes(data[1:-2]), buf.getvalue())
+            self.assertEqual(data[-2:], b'\xFF\xFF')
+
+    def test_bits(self):
+        buf = io.BytesIO()
+        definitions.BasicNack(1, False, True).write_arguments(buf)
+        nack = definitions.BasicNack.from_buffer(buf.getvalue(), 0)
+        self.assertFalse(nack.multiple)
+        self.assertTrue(nack.requeue)
+
+
+class TestLazyDispatchTable(unittest.TestCase):
+    def setUp(self):
+        self.made = []
+
+        def load(name):
+            self.made.append(name)
+            return name.upper()
+
+        self.table = LazyDispatchTable(load, {1: 'a', 2: 'b'})
+
+    def test_lookup(self):
+        self.assertIn(1, self.table)
+        self.assertNotIn(3, self.table)
+        self.assertEqual(self.made, [])
+        self.assertEqual(self.table[1], 'A')
+        self.assertEqual(self.table.get(1), 'A')
+        self.assertIsNone(self.table.get(3))
+        self.assertRaises(KeyError, lambda: self.table[3])
+        self.assertEqual(self.made, ['a'])
+
+    def test_copy(self):
+        self.table[1]
+        table = self.table.copy()
+        table[1] = 'C'
+        self.assertEqual(self.made, ['a'])
+        self.assertEqual(self.table[1], 'A')
+        self.assertEqual(sorted(table.items()), [(1, 'C'), (2, 'B')])
+
+    def test_iteration(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(sorted(self.table), [1, 2])
+        self.assertEqual(sorted(self.table.values()), ['A', 'B'])
+        self.assertEqual(sorted(self.made), ['a', 'b'])
@@ -0,0 +1,128 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import unittest
+
+from coolamqp.framing.field_table import enframe_table, deframe_table, \
+    frame_table_size, enframe_table_into, deframe_lazy_table
+
+X_DEATH = [
+    (b'x-death', ([([(b'count', (3, 'L')),
+                     (b'reason', (b'rejected', 'S')),
+                     (b'routing-keys', ([(b'orders', 'S')], 'A'))], 'F')],
+                  'A')),
+    (b'x-first-death-reason', (b'rejected', 'S')),
+]
+
+
+def tobytes(value):
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return type(value)(tobytes(item) for item in value)
+    return value
+
+
+def enframe(table):  # type: (list) -> memoryview
+    buf = io.BytesIO()
+    enframe_table(buf, table)
+    return memoryview(buf.getvalue())
+
+
+class TestFieldTable(unittest.TestCase):
+    def test_round_trip(self):
+        table = X_DEATH + [(b'flag', (True, 't')), (b'none', (None, 'V')),
+                           (b'price', (2.25, 'D')), (b'delta', (-3, 'l')),
+                           (b'tag', (b'short', 's'))]
+        data = enframe(table)
+        self.assertEqual(frame_table_size(table), len(data))
+        decoded, consumed = deframe_table(data, 0)
+        self.assertEqual(consumed, len(data))
+        self.assertEqual(tobytes(decoded), table)
+
+    def test_empty(self):
+        self.assertEqual(enframe([]).tobytes(), b'\x00\x00\x00\x00')
+        self.assertEqual(frame_table_size([]), 4)
+        self.assertEqual(deframe_table(memoryview(b'\x00\x00\x00\x00'), 0),
+                         ([], 4))
+
+    def test_as_dict(self):
+        data = enframe(X_DEATH + [(b'x-first-death-reason', (b'expired', 'S'))])
+        decoded, consumed = deframe_table(data, 0, as_dict=True)
+        self.assertEqual(consumed, len(data))
+        self.assertEqual(tobytes(decoded[b'x-death']), X_DEATH[0][1])
+        self.assertEqual(tobytes(decoded[b'x-first-death-reason']),
+                         (b'expired', 'S'))
+
+    def test_into(self):
+        data = enframe(X_DEATH)
+        buf = bytearray(len(data) + 2)
+        self.assertEqual(enframe_table_into(buf, 1, X_DEATH), len(data) + 1)
+        self.assertEqual(bytes(buf[1:-1]), data.tobytes())
+
+    def test_unknown_type(self):
+        data = memoryview(b'\x00\x00\x00\x03\x01a?')
+        self.assertRaises(ValueError, deframe_table, data, 0)
+
+
+class TestLazyTable(unittest.TestCase):
+    def setUp(self):
+        self.data = enframe(X_DEATH)
+        self.table, consumed = deframe_lazy_table(self.data, 0)
+        self.assertEqual(consumed, len(self.data))
+
+    def test_mapping(self):
+        self.assertIn(b'x-death', self.table)
+        self.assertNotIn(b'x-last-death', self.table)
+        self.assertEqual(tobytes(self.table[b'x-first-death-reason']),
+                         (b'rejected', 'S'))
+        self.assertIsNone(self.table.get(b'x-last-death'))
+        self.assertRaises(KeyError, lambda: self.table[b'x-last-death'])
+        self.assertEqual(tobytes(self.table[b'x-death']), X_DEATH[0][1])
+        self.assertEqual(sorted(self.table.keys()),
+                         [b'x-death', b'x-first-death-reason'])
+
+    def test_repeated_name(self):
+        table = deframe_lazy_table(enframe(X_DEATH + [(b'x-death', (1, 'I'))]),
+                                   0)[0]
+        self.assertEqual(table[b'x-death'], (1, 'I'))
+        self.assertEqual(len(table), 3)
+
+    def test_list(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(tobytes(list(self.table)), X_DEATH)
+        self.assertEqual(tobytes(self.table[1]), X_DEATH[1])
+        self.assertEqual(tobytes(self.table.fields), X_DEATH)
+
+    def test_written_as_received(self):
+        self.assertEqual(frame_table_size(self.table), len(self.data))
+        self.assertEqual(enframe(self.table), self.data)
+        buf = bytearray(len(self.data))
+        self.assertEqual(enframe_table_into(buf, 0, self.table), len(self.data))
+        self.assertEqual(bytes(buf), self.data.tobytes())
+        self.assertEqual(self.table, deframe_lazy_table(self.data, 0)[0])
+
+    def test_works_as_list(self):
+        extra = [(b'attempt', (2, 'I'))]
+        self.assertEqual(tobytes(self.table + extra), X_DEATH + extra)
+        self.assertEqual(tobytes(extra + self.table), extra + X_DEATH)
+        copied = self.table.copy()
+        self.assertIsInstance(copied, list)
+        self.assertEqual(tobytes(copied), X_DEATH)
+
+    def test_changed(self):
+        self.table.append((b'attempt', (2, 'I')))
+        self.assertEqual(self.table[b'attempt'], (2, 'I'))
+        self.assertEqual(tobytes(self.table[b'x-first-death-reason']),
+                         (b'rejected', 'S'))
+        self.assertEqual(sorted(self.table.keys()),
+                         [b'attempt', b'x-death', b'x-first-death-reason'])
+        del self.table[0]
+        expected = X_DEATH[1:] + [(b'attempt', (2, 'I'))]
+        self.assertEqual(tobytes(self.table.fields), expected)
+
+        data = enframe(expected)
+        self.assertEqual(frame_table_size(self.table), len(data))
+        self.assertEqual(enframe(self.table), data)
+        self.assertEqual(self.table, deframe_lazy_table(data, 0)[0])
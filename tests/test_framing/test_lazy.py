@@ -0,0 +1,69 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import unittest
+
+from coolamqp.framing.definitions import BasicDeliver, BasicDeliverLazy, \
+    BasicAck, BasicNack, BasicPublish, ConnectionStart, IDENT_TO_LAZY_METHOD
+from coolamqp.framing.field_table import LazyTable
+from coolamqp.framing.frames import AMQPMethodFrame, set_lazy_decoding
+
+SERVER_PROPERTIES = [(b'product', (b'RabbitMQ', 'S')),
+                     (b'version', (b'3.8.14', 'S'))]
+
+
+def serialize(payload):
+    buf = io.BytesIO()
+    AMQPMethodFrame(1, payload).write_to(buf)
+    return memoryview(buf.getvalue())[7:-1]  # just the frame's payload
+
+
+class TestLazyPayloads(unittest.TestCase):
+    def tearDown(self):
+        set_lazy_decoding(BasicDeliver, False)
+
+    def assertDecodesTheSame(self, payload):
+        data = serialize(payload)
+        eager = AMQPMethodFrame.unserialize(1, data).payload
+        lazy = IDENT_TO_LAZY_METHOD[payload.INDEX].from_buffer(data, 4)
+        self.assertIsInstance(lazy, type(payload))
+        self.assertEqual(repr(lazy), repr(eager))
+
+    def test_same_as_eager(self):
+        self.assertDecodesTheSame(BasicDeliver(b'ctag', 5, True, b'exchange',
+                                               b'key'))
+        self.assertDecodesTheSame(BasicAck(2 ** 40, True))
+        self.assertDecodesTheSame(BasicNack(7, False, True))
+
+    def test_only_chosen_methods(self):
+        self.assertEqual(sorted(IDENT_TO_LAZY_METHOD.names),
+                         [(10, 10), (60, 50), (60, 60), (60, 80), (60, 120)])
+
+    def test_decodes_once(self):
+        payload = BasicDeliverLazy.from_buffer(
+            serialize(BasicDeliver(b'ctag', 5, False, b'', b'key')), 4)
+        self.assertEqual(payload.delivery_tag, 5)
+        self.assertIsNone(payload._buf)
+        self.assertEqual(payload.routing_key.tobytes(), b'key')
+
+    def test_tables_are_lazy(self):
+        payload = IDENT_TO_LAZY_METHOD[ConnectionStart.INDEX].from_buffer(
+            serialize(ConnectionStart(0, 9, SERVER_PROPERTIES, b'PLAIN',
+                                      b'en_US')), 4)
+        self.assertEqual(payload.version_minor, 9)
+        self.assertIsInstance(payload.server_properties, LazyTable)
+        self.assertEqual(payload.server_properties[b'version'][0].tobytes(),
+                         b'3.8.14')
+
+    def test_set_lazy_decoding(self):
+        data = serialize(BasicDeliver(b'ctag', 5, False, b'', b'key'))
+        set_lazy_decoding(BasicDeliver)
+        self.assertIsInstance(AMQPMethodFrame.unserialize(1, data).payload,
+                              BasicDeliverLazy)
+        set_lazy_decoding(BasicDeliver, False)
+        self.assertNotIsInstance(AMQPMethodFrame.unserialize(1, data).payload,
+                                 BasicDeliverLazy)
+
+    def test_no_lazy_version(self):
+        self.assertRaises(ValueError, lambda: set_lazy_decoding(BasicPublish))
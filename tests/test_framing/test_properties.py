@@ -0,0 +1,98 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import unittest
+
+from coolamqp.framing.definitions import BasicContentPropertyList, Basic
+from coolamqp.framing.frames import AMQPHeaderFrame
+
+HEADERS = [(b'attempt', (1, 'I')), (b'source', (b'tests', 'S'))]
+
+
+class TestContentPropertyList(unittest.TestCase):
+    def test_serialized_once(self):
+        props = BasicContentPropertyList(content_type=b'text/plain',
+                                         headers=HEADERS)
+        data = props.serialize()
+        self.assertIs(props.serialize(), data)
+        self.assertEqual(props.get_size(), len(data))
+
+        buf = io.BytesIO()
+        props.write_fields_to(buf)
+        self.assertEqual(buf.getvalue(), data)
+
+    def test_round_trip(self):
+        props = BasicContentPropertyList(content_type=b'text/plain',
+                                         headers=HEADERS, expiration=b'10')
+        buf = io.BytesIO()
+        AMQPHeaderFrame(1, Basic.INDEX, 0, 5, props).write_to(buf)
+        received = AMQPHeaderFrame.unserialize(
+            1, memoryview(buf.getvalue())[7:-1]).properties
+        self.assertEqual(received.content_type.tobytes(), b'text/plain')
+        self.assertEqual(received.expiration.tobytes(), b'10')
+        self.assertEqual(received.headers, HEADERS)
+        self.assertEqual(received.headers[b'source'][0].tobytes(), b'tests')
+        self.assertEqual(received.serialize(), props.serialize())
+
+    def test_immutable(self):
+        props = BasicContentPropertyList(content_type=b'text/plain')
+        self.assertRaises(AttributeError, setattr, props, 'content_type', b'a')
+        self.assertEqual(props.get('delivery_mode', 1), 1)
+
+    def test_classes_by_fields(self):
+        props = BasicContentPropertyList(content_type=b'a', delivery_mode=2)
+        self.assertIs(BasicContentPropertyList.FIELDS_TO_CLASSES[
+                          frozenset(['content_type', 'delivery_mode'])],
+                      type(props))
+        self.assertIs(type(BasicContentPropertyList(delivery_mode=1,
+                                                    content_type=b'b')),
+                      type(props))
+
+    def test_typize(self):
+        cls = BasicContentPropertyList.typize('expiration', 'priority')
+        self.assertEqual(cls.ZERO_PROPERTY_FLAGS, b'\x09\x00')
+        props = cls(5, b'10')
+        self.assertEqual(props.expiration, b'10')
+        self.assertIs(type(BasicContentPropertyList(expiration=b'1',
+                                                    priority=1)), cls)
+
+    def test_invalid_field_not_remembered(self):
+        self.assertRaises(TypeError, BasicContentPropertyList,
+                          content_type=b'a', no_such_field=1)
+        self.assertNotIn(frozenset(['content_type', 'no_such_field']),
+                         BasicContentPropertyList.FIELDS_TO_CLASSES)
+
+
+class TestPrecompiled(unittest.TestCase):
+    def test_same_as_compiled(self):
+        from coolamqp.framing.compilation import \
+            compile_particular_content_property_list_class
+
+        props = BasicContentPropertyList(content_type=b'text/plain',
+                                         delivery_mode=2, headers=HEADERS)
+        self.assertEqual(type(props).__module__,
+                         'coolamqp.framing.definitions')
+
+        compiled = compile_particular_content_property_list_class(
+            type(props).ZERO_PROPERTY_FLAGS, BasicContentPropertyList.FIELDS)
+        self.assertEqual(compiled(b'text/plain', HEADERS, 2).serialize(),
+                         props.serialize())
+
+    def test_prewarm(self):
+        from coolamqp.clustering import Cluster
+        from coolamqp.objects import NodeDefinition
+
+        node = NodeDefinition('127.0.0.1', 'guest', 'guest')
+        self.assertRaises(ValueError, Cluster, node,
+                          prewarm_properties=[('content_type', 'type')])
+        names = ('app_id', 'type_', 'user_id')
+        zpf = b'\x00\x38'     # flags of type_, user_id and app_id
+        BasicContentPropertyList.PARTICULAR_CLASSES.pop(zpf, None)
+        BasicContentPropertyList.FIELDS_TO_CLASSES.pop(frozenset(names), None)
+
+        cluster = Cluster(node, prewarm_properties=[names])
+        self.assertNotIn(zpf, BasicContentPropertyList.PARTICULAR_CLASSES)
+        cluster._prewarm()      # what start() does before connecting
+        self.assertIs(BasicContentPropertyList.PARTICULAR_CLASSES[zpf],
+                      BasicContentPropertyList.typize(*names))
@@ -0,0 +1,56 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import unittest
+
+from coolamqp.framing.definitions import BasicAck, BasicReject, \
+    BasicPublish, BasicContentPropertyList, Basic
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
+    AMQPBodyFrame
+from coolamqp.framing.templates import PublishTemplate, DeliveryTagTemplate
+
+
+def serialize(frames):
+    buf = io.BytesIO()
+    for frame in frames:
+        frame.write_to(buf)
+    return buf.getvalue()
+
+
+class TestPublishTemplate(unittest.TestCase):
+    def setUp(self):
+        self.properties = BasicContentPropertyList(content_type=b'text/plain',
+                                                   delivery_mode=2)
+        self.template = PublishTemplate(3, b'xchg', b'key', self.properties)
+
+    def assertSameAsFrames(self, body, max_body_size):
+        frames = [AMQPMethodFrame(3, BasicPublish(b'xchg', b'key', False, False)),
+                  AMQPHeaderFrame(3, Basic.INDEX, 0, len(body), self.properties)]
+        for offset in range(0, len(body), max_body_size):
+            frames.append(AMQPBodyFrame(3, body[offset:offset + max_body_size]))
+
+        self.assertEqual(serialize(self.template.frames_for(body, max_body_size)),
+                         serialize(frames))
+
+    def test_single_frame(self):
+        self.assertSameAsFrames(b'hello world', 100)
+        self.assertSameAsFrames(b'x' * 100, 100)
+
+    def test_empty(self):
+        self.assertSameAsFrames(b'', 100)
+
+    def test_many_frames(self):
+        self.assertSameAsFrames(b'x' * 250, 100)
+        self.assertSameAsFrames(b'x' * 300, 100)
+        self.assertEqual(len(self.template.frames_for(b'x' * 250, 100)), 3)
+
+
+class TestDeliveryTagTemplate(unittest.TestCase):
+    def test_same_as_frames(self):
+        for payload in (BasicAck(0, False), BasicAck(0, True),
+                        BasicReject(0, True), BasicReject(0, False)):
+            template = DeliveryTagTemplate(5, payload)
+            payload.delivery_tag = 2 ** 40 + 7
+            self.assertEqual(serialize([template.frame_for(2 ** 40 + 7)]),
+                             serialize([AMQPMethodFrame(5, payload)]))
@@ -1,9 +1,11 @@
 # coding=UTF-8
 from __future__ import print_function, absolute_import, division
 
+import threading
 import unittest
 
-from coolamqp.objects import NodeDefinition, MessageProperties
+from coolamqp.objects import NodeDefinition, MessageProperties, ConfirmBatch, \
+    ConfirmWindow
 
 
 class TestObjects(unittest.TestCase):
@@ -30,3 +32,46 @@ class TestObjects(unittest.TestCase):
 
         self.assertIsNone(empty_p_msg.get('content_encoding'), None)
         self.assertEquals(ce_p_msg.get('content_encoding', b'wtf'), b'wtf')
+
+    def test_confirm_batch(self):
+        batch = ConfirmBatch(3)
+        for i in range(3):
+            batch.add()
+        self.assertRaises(ValueError, batch.add)
+
+        batch.confirm()
+        batch.confirm()
+        self.assertFalse(batch.future.done())
+        batch.confirm()
+        self.assertIsNone(batch.future.result(timeout=0))
+
+    def test_confirm_batch_rejected(self):
+        batch = ConfirmBatch(2)
+        batch.reject()
+        batch.confirm()
+        self.assertIsNotNone(batch.future.exception(timeout=0))
+        self.assertEqual(batch.rejected, 1)
+
+    def test_confirm_window(self):
+        window = ConfirmWindow(max_messages=2, max_bytes=10)
+        self.assertTrue(window.acquire(4))
+        self.assertTrue(window.acquire(4))
+        self.assertFalse(window.acquire(1))     # too many messages
+        window.release(4)
+        self.assertFalse(window.acquire(7))     # too many bytes
+        self.assertTrue(window.acquire(6))
+        window.release(4)
+        window.release(6)
+        self.assertTrue(window.acquire(100))    # fits, since the window is empty
+        self.assertEqual(window.messages, 1)
+
+    def test_confirm_window_blocks(self):
+        window = ConfirmWindow(max_messages=1)
+        window.acquire(1)
+        self.assertFalse(window.acquire(1, 0.05))
+
+        releaser = threading.Timer(0.05, lambda: window.release(1))
+        releaser.start()
+        self.assertTrue(window.acquire(1, None))
+        releaser.join()
+        self.assertEqual(window.messages, 1)
@@ -0,0 +1,101 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import socket
+import threading
+import unittest
+
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer
+from coolamqp.uplink.listener.thread import get_listener_class, ListenerThread
+from coolamqp.utils import monotonic
+
+
+class TestListener(unittest.TestCase):
+    def setUp(self):
+        self.listener = get_listener_class()()
+        self.a, self.b = socket.socketpair()
+        self.a.setblocking(False)
+        self.sock = self.listener.register(self.a, ReceivingFramer())
+        self.listener.activate(self.sock)
+        self.listener.wait(0)   # process the activation, become the loop thread
+
+    def tearDown(self):
+        self.listener.shutdown()
+        self.b.close()
+
+    def test_timer_wakes_up_the_loop(self):
+        fired = []
+        self.sock.oneshot(0.05, lambda: fired.append(monotonic()))
+        started_at = monotonic()
+        while not fired and monotonic() - started_at < 2:
+            self.listener.wait(timeout=5)
+
+        self.assertTrue(fired)
+        self.assertLess(fired[0] - started_at, 0.5)
+
+    def test_wakeup_from_another_thread(self):
+        if not hasattr(self.listener, 'waker'):
+            self.skipTest('this listener cannot be woken up')
+        threading.Timer(0.05, self.listener.wakeup).start()
+        started_at = monotonic()
+        self.listener.wait(timeout=5)
+        self.assertLess(monotonic() - started_at, 1)
+
+    def test_send_from_another_thread(self):
+        thread = threading.Thread(target=lambda: self.sock.send([b'hello']))
+        thread.start()
+        thread.join()
+
+        self.b.settimeout(2)
+        started_at = monotonic()
+        while monotonic() - started_at < 2:
+            self.listener.wait(timeout=5)
+            try:
+                self.assertEqual(self.b.recv(100, socket.MSG_DONTWAIT), b'hello')
+                return
+            except socket.error:
+                pass
+        self.fail('data was not sent')
+
+    def test_large_send_from_another_thread(self):
+        data = b'x' * 4000000
+        received = bytearray()
+
+        def receive():
+            self.b.settimeout(5)
+            while len(received) < len(data):
+                received.extend(self.b.recv(1000000))
+
+        receiver = threading.Thread(target=receive)
+        receiver.start()
+        sender = threading.Thread(target=lambda: self.sock.send([memoryview(data)]))
+        sender.start()
+        sender.join()
+
+        started_at = monotonic()
+        while receiver.is_alive() and monotonic() - started_at < 5:
+            self.listener.wait(timeout=0.1)
+        receiver.join()
+        self.assertEqual(len(received), len(data))
+
+
+class TestListenerThread(unittest.TestCase):
+    def test_loop_hooks(self):
+        thread = ListenerThread(name='test')
+        thread.init()
+        if not thread.listener.WAKES_UP:
+            thread.listener.shutdown()
+            self.skipTest('this listener cannot be woken up')
+
+        called = threading.Event()
+        thread.add_loop_hook(called.set)
+        thread.start()
+        try:
+            thread.wakeup()
+            self.assertTrue(called.wait(2))
+        finally:
+            thread.terminate()
+            thread.join()
+
+        thread.remove_loop_hook(called.set)
+        self.assertEqual(thread.loop_hooks, ())
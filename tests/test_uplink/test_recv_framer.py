@@ -0,0 +1,171 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import socket
+import struct
+import unittest
+
+from coolamqp.framing.definitions import BasicDeliver, \
+    BasicContentPropertyList, BasicCancel, FRAME_BODY
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
+    AMQPBodyFrame, AMQPHeartbeatFrame
+from coolamqp.uplink.connection.recv_framer import ReceivingFramer, \
+    MIN_SLAB_SIZE
+from coolamqp.uplink.listener.socket import BaseSocket
+
+
+def serialize(frames):
+    buf = io.BytesIO()
+    for frame in frames:
+        frame.write_to(buf)
+    return buf.getvalue()
+
+
+def make_delivery(body, channel=1):
+    return [AMQPMethodFrame(channel, BasicDeliver(b'consumer', 1, False,
+                                                  b'exchange', b'routing')),
+            AMQPHeaderFrame(channel, 60, 0, len(body),
+                            BasicContentPropertyList(content_type=b'text/plain')),
+            AMQPBodyFrame(channel, body)]
+
+
+class TestReceivingFramer(unittest.TestCase):
+    def setUp(self):
+        self.frames = []
+        self.framer = ReceivingFramer(self.frames.append)
+
+    def test_many_frames_at_once(self):
+        frames = make_delivery(b'hello world') + [AMQPHeartbeatFrame()]
+        self.framer.put(serialize(frames * 10))
+
+        self.assertEqual(len(self.frames), 40)
+        self.assertIsInstance(self.frames[0].payload, BasicDeliver)
+        self.assertEqual(self.frames[0].payload.routing_key.tobytes(), b'routing')
+        self.assertEqual(self.frames[2].data.tobytes(), b'hello world')
+        self.assertIsInstance(self.frames[3], AMQPHeartbeatFrame)
+
+    def test_byte_by_byte(self):
+        data = serialize(make_delivery(b'hello world') + [AMQPHeartbeatFrame()])
+        for i in range(len(data)):
+            self.framer.put(data[i:i + 1])
+
+        self.assertEqual(len(self.frames), 4)
+        self.assertEqual(self.frames[2].data.tobytes(), b'hello world')
+
+    def test_frames_larger_than_a_slab(self):
+        body = b'x' * (3 * MIN_SLAB_SIZE)
+        data = serialize(make_delivery(body) * 3)
+        for i in range(0, len(data), 1000):
+            self.framer.put(data[i:i + 1000])
+
+        self.assertEqual(len(self.frames), 9)
+        for frame in self.frames[2::3]:
+            self.assertEqual(frame.data.tobytes(), body)
+
+    def test_payloads_survive_new_slabs(self):
+        data = serialize(make_delivery(b'hello world'))
+        for i in range(2 * MIN_SLAB_SIZE // len(data)):
+            self.framer.put(data)
+
+        for frame in self.frames[2::3]:
+            self.assertEqual(frame.data.tobytes(), b'hello world')
+
+    def test_invalid_frame(self):
+        self.assertRaises(ValueError, lambda: self.framer.put(b'\x09\x00\x00'))
+
+    def test_invalid_frame_end(self):
+        data = bytearray(serialize([AMQPHeartbeatFrame()] + make_delivery(b'hello')))
+        data[-1] = 0
+        self.assertRaises(ValueError, lambda: self.framer.put(data))
+        self.assertIsInstance(self.frames[0], AMQPHeartbeatFrame)
+
+    def test_frame_too_large(self):
+        header = struct.pack('!BHL', FRAME_BODY, 1, 0xFFFFFFFF)
+        self.assertRaises(ValueError, lambda: self.framer.put(header[:7]))
+        self.assertEqual(len(self.framer.buffer), MIN_SLAB_SIZE)
+
+        framer = ReceivingFramer(self.frames.append)
+        framer.max_frame_size = 4096
+        body = serialize([AMQPBodyFrame(1, b'x' * 4088)])
+        framer.put(body)
+        self.assertRaises(ValueError, lambda: framer.put(
+            serialize([AMQPBodyFrame(1, b'x' * 4089)])[:20]))
+
+    def test_properties_are_hashable(self):
+        self.framer.put(serialize([AMQPHeaderFrame(
+            1, 60, 0, 0, BasicContentPropertyList(correlation_id=b'rpc-1'))]))
+        correlation_id = self.frames[0].properties.correlation_id
+        self.assertEqual({b'rpc-1': 1}[correlation_id], 1)
+
+    def test_header_straddles_chunks(self):
+        data = serialize(make_delivery(b'hello world') * 2)
+        self.framer.put(data[:3])
+        self.framer.put(data[3:50])
+        self.framer.put(data[50:])
+
+        self.assertEqual(len(self.frames), 6)
+        self.assertEqual(self.frames[5].data.tobytes(), b'hello world')
+
+
+class RecordingReceiver(object):
+    def __init__(self):
+        self.calls = []
+
+    def on_basic_deliver(self, payload):
+        self.calls.append(payload)
+
+    def on_head(self, frame):
+        self.calls.append(frame)
+
+    def on_body(self, data):
+        self.calls.append(data.tobytes())
+
+
+class TestDeliveryReceivers(unittest.TestCase):
+    def setUp(self):
+        self.frames = []
+        self.framer = ReceivingFramer(self.frames.append)
+        self.receiver = RecordingReceiver()
+        self.framer.receivers[1] = self.receiver
+
+    def test_deliveries_go_to_receiver(self):
+        self.framer.put(serialize(make_delivery(b'hello', channel=1) +
+                                  make_delivery(b'world', channel=2)))
+
+        deliver, head, body = self.receiver.calls
+        self.assertIsInstance(deliver, BasicDeliver)
+        self.assertEqual(deliver.routing_key.tobytes(), b'routing')
+        self.assertEqual(head.body_size, 5)
+        self.assertEqual(body, b'hello')
+        self.assertEqual(self.framer.delivery_frames, 3)
+
+        self.assertEqual(len(self.frames), 3)
+        self.assertTrue(all(frame.channel == 2 for frame in self.frames))
+
+    def test_other_methods_go_to_on_frame(self):
+        self.framer.put(serialize([AMQPMethodFrame(1, BasicCancel(b'consumer', False)),
+                                   AMQPHeartbeatFrame()]))
+
+        self.assertEqual(self.receiver.calls, [])
+        self.assertIsInstance(self.frames[0].payload, BasicCancel)
+        self.assertIsInstance(self.frames[1], AMQPHeartbeatFrame)
+
+
+class TestSocketReceive(unittest.TestCase):
+    def test_reads_until_drained(self):
+        frames = []
+        framer = ReceivingFramer(frames.append)
+        a, b = socket.socketpair()
+        try:
+            b.setblocking(False)
+            data = serialize(make_delivery(b'x' * 1000) * 100)
+            a.sendall(data)
+
+            sock = BaseSocket(b, framer)
+            sock.on_read()
+
+            self.assertEqual(len(frames), 300)
+        finally:
+            a.close()
+            b.close()
@@ -0,0 +1,167 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import io
+import socket
+import time
+import unittest
+
+from coolamqp.framing.definitions import BasicPublish, BasicContentPropertyList
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPHeaderFrame, \
+    AMQPBodyFrame, AMQPHeartbeatFrame
+from coolamqp.uplink.connection.send_framer import SendingFramer, GatherWriter
+from coolamqp.uplink.listener.select_listener import SelectListener
+from coolamqp.uplink.listener.socket import BaseSocket
+
+
+def make_publish(body, channel=1):
+    return [AMQPMethodFrame(channel, BasicPublish(b'exchange', b'routing', False, False)),
+            AMQPHeaderFrame(channel, 60, 0, len(body),
+                            BasicContentPropertyList(content_type=b'text/plain')),
+            AMQPBodyFrame(channel, memoryview(body))]
+
+
+def serialize(frames):
+    buf = io.BytesIO()
+    for frame in frames:
+        frame.write_to(buf)
+    return buf.getvalue()
+
+
+class TestSendingFramer(unittest.TestCase):
+    def test_small_writes_coalesced(self):
+        writer = GatherWriter()
+        for frame in make_publish(b'hello') + [AMQPHeartbeatFrame()]:
+            frame.write_to(writer)
+
+        self.assertEqual(len(writer.buffers), 1)
+        self.assertEqual(bytes(writer.buffers[0]),
+                         serialize(make_publish(b'hello') + [AMQPHeartbeatFrame()]))
+
+    def test_body_not_copied(self):
+        body = b'x' * 100000
+        sent = []
+        SendingFramer(lambda data, priority: sent.append(data)).send(make_publish(body))
+
+        buffers = sent[0]
+        self.assertEqual(len(buffers), 3)
+        self.assertIs(buffers[1].obj, body)
+        self.assertEqual(b''.join(bytes(buf) for buf in buffers),
+                         serialize(make_publish(body)))
+
+
+class TestSocketSend(unittest.TestCase):
+    def setUp(self):
+        self.a, self.b = socket.socketpair()
+        self.a.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        self.a.setblocking(False)
+        self.sock = BaseSocket(self.a, None)
+
+    def tearDown(self):
+        self.a.close()
+        self.b.close()
+
+    def flush(self):
+        received = bytearray()
+        self.b.settimeout(1)
+        while not self.sock.on_write():
+            received.extend(self.b.recv(1000000))
+        self.a.shutdown(socket.SHUT_WR)
+        while True:
+            data = self.b.recv(1000000)
+            if not data:
+                return bytes(received)
+            received.extend(data)
+
+    def test_partial_writes(self):
+        body = bytes(bytearray(i % 256 for i in range(300000)))
+        self.sock.send([b'abc', memoryview(body), b'def'])
+        self.sock.send([b'ghi'])
+
+        self.assertEqual(self.flush(), b'abc' + body + b'defghi')
+
+    def test_priority_does_not_split_data(self):
+        body = b'x' * 300000
+        self.sock.send([b'abc', memoryview(body)])
+        self.assertFalse(self.sock.on_write())
+        self.sock.send([b'priority'], priority=True)
+
+        self.assertEqual(self.flush(), b'abc' + body + b'priority')
+
+    def test_without_sendmsg(self):
+        self.sock.has_sendmsg = False
+        body = b'x' * 300000
+        self.sock.send([b'abc', memoryview(body), b'def'])
+
+        self.assertEqual(self.flush(), b'abc' + body + b'def')
+
+
+class RecordingSocket(object):
+    """A socket that accepts up to limit bytes per write, and records writes"""
+
+    def __init__(self, limit=1000000):
+        self.limit = limit
+        self.writes = []
+
+    def sendmsg(self, buffers):
+        data = b''.join(bytes(buf) for buf in buffers)[:self.limit]
+        self.writes.append(data)
+        return len(data)
+
+    def fileno(self):
+        return -1
+
+
+class TestWriteCoalescing(unittest.TestCase):
+    def test_many_sends_single_write(self):
+        sock = BaseSocket(RecordingSocket(), None)
+        for i in range(100):
+            sock.send([b'ack%d' % (i,)])
+
+        self.assertTrue(sock.on_write())
+        self.assertEqual(len(sock.sock.writes), 1)
+        self.assertEqual(sock.sock.writes[0], b''.join(b'ack%d' % (i,) for i in range(100)))
+
+    def test_batch_size(self):
+        sock = BaseSocket(RecordingSocket(), None)
+        sock.write_batch_size = 10
+        for i in range(10):
+            sock.send([b'12345'])
+
+        self.assertTrue(sock.on_write())
+        self.assertEqual(sock.sock.writes, [b'1234512345'] * 5)
+
+    def test_priority_preempts_unsent_data_only(self):
+        sock = BaseSocket(RecordingSocket(limit=4), None)
+        sock.send([b'abc', b'def'])
+        sock.send([b'ghi'])
+        self.assertFalse(sock.on_write())   # sent abcd
+        sock.send([b'PRIO'], priority=True)
+        sock.sock.limit = 1000
+
+        self.assertTrue(sock.on_write())
+        self.assertEqual(b''.join(sock.sock.writes), b'abcdefPRIOghi')
+
+    def test_priority_after_completed_data(self):
+        sock = BaseSocket(RecordingSocket(limit=6), None)
+        sock.send([b'abc', b'def'])
+        sock.send([b'ghi'])
+        self.assertFalse(sock.on_write())   # sent abcdef
+        sock.send([b'PRIO'], priority=True)
+        sock.sock.limit = 1000
+
+        self.assertTrue(sock.on_write())
+        self.assertEqual(b''.join(sock.sock.writes), b'abcdefPRIOghi')
+
+    def test_linger_expired_sends(self):
+        listener = SelectListener()
+        sock = BaseSocket(RecordingSocket(), None, listener=listener)
+        listener.activate(sock)
+        sock.write_linger = 0.01
+        sock.send([b'ack'], priority=False)
+
+        self.assertTrue(sock.on_write())
+        self.assertEqual(sock.sock.writes, [])
+        time.sleep(0.02)
+        listener.do_timer_events()
+        self.assertEqual(sock.sock.writes, [b'ack'])
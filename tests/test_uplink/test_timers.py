@@ -0,0 +1,82 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import time
+import unittest
+
+from coolamqp.uplink.listener.base_listener import COMPACT_AFTER_CANCELLED
+from coolamqp.uplink.listener.select_listener import SelectListener
+
+
+class FakeSocket(object):
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+
+class TestTimers(unittest.TestCase):
+    def setUp(self):
+        self.listener = SelectListener()
+        self.sock_a = FakeSocket(1)
+        self.sock_b = FakeSocket(2)
+        self.listener.activate(self.sock_a)
+        self.listener.activate(self.sock_b)
+        self.fired = []
+
+    def fire(self, value):
+        return lambda: self.fired.append(value)
+
+    def test_fires_in_order(self):
+        self.listener.oneshot(self.sock_a, 0.02, self.fire(2))
+        self.listener.oneshot(self.sock_b, 0.01, self.fire(1))
+        self.listener.oneshot(self.sock_a, 10, self.fire(3))
+        time.sleep(0.03)
+        self.listener.do_timer_events()
+
+        self.assertEqual(self.fired, [1, 2])
+        self.assertGreater(self.listener.get_timeout(60), 5)
+
+    def test_cancel(self):
+        handle = self.listener.oneshot(self.sock_a, 0, self.fire(1))
+        self.listener.oneshot(self.sock_a, 0, self.fire(2))
+        handle.cancel()
+        handle.cancel()
+        time.sleep(0.01)
+        self.listener.do_timer_events()
+
+        self.assertEqual(self.fired, [2])
+        self.assertEqual(self.listener.get_timeout(60), 60)
+
+    def test_noshot(self):
+        self.listener.oneshot(self.sock_a, 0, self.fire(1))
+        self.listener.oneshot(self.sock_b, 0, self.fire(2))
+        self.listener.oneshot(self.sock_a, 0, self.fire(3))
+        self.listener.noshot(self.sock_a)
+        time.sleep(0.01)
+        self.listener.do_timer_events()
+
+        self.assertEqual(self.fired, [2])
+        self.assertEqual(self.listener.fd_to_timers, {})
+
+    def test_inactive_socket(self):
+        self.assertIsNone(self.listener.oneshot(FakeSocket(3), 0, self.fire(1)))
+
+    def test_compaction(self):
+        handles = [self.listener.oneshot(self.sock_a, 10, self.fire(i))
+                   for i in range(COMPACT_AFTER_CANCELLED * 4)]
+        for handle in handles[:-1]:
+            handle.cancel()
+
+        self.assertLess(len(self.listener.time_events), COMPACT_AFTER_CANCELLED * 2)
+        self.assertLess(self.listener.get_timeout(60), 11)
+
+    def test_nearest_timer_wakes_the_loop(self):
+        wakeups = []
+        self.listener.wakeup = lambda: wakeups.append(True)
+        self.listener.oneshot(self.sock_a, 10, self.fire(1))
+        self.listener.oneshot(self.sock_a, 20, self.fire(2))
+        self.listener.oneshot(self.sock_a, 5, self.fire(3))
+
+        self.assertEqual(len(wakeups), 2)
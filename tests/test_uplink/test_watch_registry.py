@@ -0,0 +1,129 @@
+# coding=UTF-8
+from __future__ import print_function, absolute_import, division
+
+import unittest
+
+from coolamqp.framing.definitions import BasicAck, BasicNack, ChannelClose, \
+    ChannelCloseOk
+from coolamqp.framing.frames import AMQPMethodFrame, AMQPBodyFrame, \
+    AMQPHeartbeatFrame
+from coolamqp.uplink.connection.watch_registry import WatchRegistry
+from coolamqp.uplink.connection.watches import MethodWatch, AnyWatch, \
+    FailWatch, HeaderOrBodyWatch, Watch
+
+
+class RecordingWatch(Watch):
+    """A generic watch that's triggered by any frame"""
+
+    def __init__(self, channel, oneshot, log):
+        super(RecordingWatch, self).__init__(channel, oneshot)
+        self.log = log
+
+    def is_triggered_by(self, frame):
+        self.log.append(self)
+        return True
+
+
+class TestWatchRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = WatchRegistry()
+        self.calls = []
+
+    def method_watch(self, channel, methods, name):
+        watch = MethodWatch(channel, methods,
+                            lambda payload: self.calls.append((name, payload)),
+                            on_end=lambda: self.calls.append((name, 'failed')))
+        self.registry.add(watch)
+        return watch
+
+    def test_only_matching_watches_are_asked(self):
+        self.method_watch(1, ChannelClose, 'close')
+        asked = []
+        self.registry.add(RecordingWatch(2, False, asked))
+
+        self.assertTrue(self.registry.dispatch(AMQPMethodFrame(1, ChannelClose(0, b'', 0, 0))))
+        self.assertFalse(self.registry.dispatch(AMQPMethodFrame(1, BasicAck(1, False))))
+        self.assertEqual([name for name, _ in self.calls], ['close'])
+        self.assertEqual(asked, [])
+
+    def test_oneshot_fires_once(self):
+        self.method_watch(1, (ChannelClose, ChannelCloseOk), 'close')
+        self.assertTrue(self.registry.dispatch(AMQPMethodFrame(1, ChannelCloseOk())))
+        self.assertFalse(self.registry.dispatch(AMQPMethodFrame(1, ChannelClose(0, b'', 0, 0))))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.registry.channels[1], {})
+
+    def test_multishot_stays(self):
+        watch = self.method_watch(1, (BasicAck, BasicNack), 'confirm')
+        watch.oneshot = False
+        for tag in range(3):
+            self.registry.dispatch(AMQPMethodFrame(1, BasicAck(tag, False)))
+        self.registry.dispatch(AMQPMethodFrame(1, BasicNack(3, False, False)))
+        self.assertEqual(len(self.calls), 4)
+
+    def test_newest_first(self):
+        self.method_watch(1, BasicAck, 'first').oneshot = False
+        self.method_watch(1, BasicAck, 'second').oneshot = False
+        self.registry.dispatch(AMQPMethodFrame(1, BasicAck(1, False)))
+        self.assertEqual([name for name, _ in self.calls], ['second', 'first'])
+
+    def test_specific_then_generic_then_any(self):
+        log = []
+        generic = RecordingWatch(1, False, log)
+        self.registry.add(generic)
+        any_watch = RecordingWatch(None, False, log)
+        self.registry.add(any_watch)
+        bodies = []
+        self.registry.add(HeaderOrBodyWatch(1, bodies.append))
+        self.registry.add(HeaderOrBodyWatch(1, lambda frame: log.append('body')))
+
+        self.registry.dispatch(AMQPBodyFrame(1, b'hello'))
+        self.assertEqual(log, ['body', generic, any_watch])
+        self.assertEqual(len(bodies), 1)
+
+    def test_cancel(self):
+        watch = self.method_watch(1, BasicAck, 'ack')
+        watch.oneshot = False
+        watch.cancel()
+        self.assertFalse(self.registry.dispatch(AMQPMethodFrame(1, BasicAck(1, False))))
+        self.assertNotIn(BasicAck.INDEX, self.registry.channels[1])
+
+    def test_watch_added_while_dispatching(self):
+        def on_ack(payload):
+            self.calls.append(('outer', payload))
+            self.method_watch(1, BasicAck, 'inner')
+
+        self.registry.add(MethodWatch(1, BasicAck, on_ack))
+        self.registry.dispatch(AMQPMethodFrame(1, BasicAck(1, False)))
+        self.assertEqual([name for name, _ in self.calls], ['outer'])
+        self.registry.dispatch(AMQPMethodFrame(1, BasicAck(2, False)))
+        self.assertEqual([name for name, _ in self.calls], ['outer', 'inner'])
+
+    def test_remove_channel_while_dispatching(self):
+        self.registry.add(MethodWatch(1, ChannelClose,
+                                      lambda payload: self.registry.remove_channel(1)))
+        self.method_watch(1, BasicAck, 'ack')
+        self.registry.dispatch(AMQPMethodFrame(1, ChannelClose(0, b'', 0, 0)))
+        self.assertFalse(self.registry.dispatch(AMQPMethodFrame(1, BasicAck(1, False))))
+        self.assertNotIn(1, self.registry.channels)
+
+    def test_any_watches(self):
+        frames = []
+        self.registry.add(AnyWatch(frames.append))
+        self.assertTrue(self.registry.dispatch(AMQPHeartbeatFrame()))
+        self.assertTrue(self.registry.dispatch(AMQPBodyFrame(5, b'')))
+        self.assertEqual(len(frames), 2)
+
+    def test_fail_all(self):
+        self.method_watch(1, (BasicAck, BasicNack), 'confirm')
+        self.method_watch(2, BasicAck, 'cancelled').cancel()
+        failed = []
+        self.registry.add(FailWatch(lambda: failed.append(True)))
+
+        self.registry.fail_all()
+        self.assertEqual(self.calls, [('confirm', 'failed')])
+        self.assertEqual(failed, [True])
+
+        self.registry.fail_all()
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(failed, [True])